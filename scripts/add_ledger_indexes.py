@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Add the ledger history and queue indexes to an existing database.
+
+Creates every index declared on the models that the database is missing
+(swaps/deposits/withdrawals by user and date, pending and confirming
+withdrawals, active deposit addresses). Run once per deploy, after
+scripts/migrate.py; the application itself only creates tables.
+
+On PostgreSQL indexes are built with CREATE INDEX CONCURRENTLY IF NOT
+EXISTS, so writes continue while they build. A build that fails leaves
+an INVALID index behind: drop it and run the script again. Safe to run
+more than once.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from swaperex.ledger.database import close_db, ensure_indexes
+
+
+async def main():
+    """Create missing indexes."""
+    try:
+        created = await ensure_indexes()
+        if created:
+            for name in created:
+                print(f"Created index {name}")
+        else:
+            print("All indexes already exist")
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
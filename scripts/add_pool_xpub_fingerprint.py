@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Add the xpub_fingerprint column to the HD address pool.
+
+Pooled addresses created before this column existed have no fingerprint;
+they are never claimed and the next refill replaces them. Safe to run
+more than once.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlalchemy import inspect, text
+
+from swaperex.ledger.database import close_db, get_engine
+
+
+def _has_column(sync_conn) -> bool:
+    columns = inspect(sync_conn).get_columns("hd_address_pool")
+    return any(column["name"] == "xpub_fingerprint" for column in columns)
+
+
+async def main():
+    """Add xpub_fingerprint to hd_address_pool if it doesn't exist."""
+    engine = get_engine()
+    try:
+        async with engine.begin() as conn:
+            if await conn.run_sync(_has_column):
+                print("Column xpub_fingerprint already exists in hd_address_pool")
+                return
+            await conn.execute(
+                text("ALTER TABLE hd_address_pool ADD COLUMN xpub_fingerprint VARCHAR(16)")
+            )
+            print("Column xpub_fingerprint added to hd_address_pool")
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Compare ledger throughput with a default and a tuned SQLite engine.
+
+Runs concurrent balance writers (like webhook/scanner credits) and history
+readers (like the bot) against a fresh SQLite file, first with a default
+engine, then with the tuned EngineProfile (WAL, synchronous=NORMAL, busy
+timeout, pool sizing). Reports operations per second and failed ops.
+
+Usage:
+    python scripts/db_load_test.py [--writers 16] [--readers 16] [--ops 50]
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from swaperex.ledger.engine import EngineProfile, create_engine
+from swaperex.ledger.models import Base
+from swaperex.ledger.repository import LedgerRepository
+
+
+async def run(engine, writers: int, readers: int, ops: int) -> tuple[float, int, int]:
+    """Run the workload; returns (seconds, completed ops, failed ops)."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        repo = LedgerRepository(session)
+        users = [
+            (await repo.get_or_create_user(telegram_id=1_000 + i)).id
+            for i in range(writers)
+        ]
+        await session.commit()
+
+    completed = failed = 0
+
+    async def writer(user_id: int) -> None:
+        nonlocal completed, failed
+        for _ in range(ops):
+            try:
+                async with factory() as session:
+                    repo = LedgerRepository(session)
+                    await repo.credit_balance(user_id, "BTC", Decimal("0.001"))
+                    await repo.create_deposit(user_id, "BTC", Decimal("0.001"), "addr")
+                    await session.commit()
+                completed += 1
+            except OperationalError:
+                failed += 1
+
+    async def reader(user_id: int) -> None:
+        nonlocal completed, failed
+        for _ in range(ops):
+            try:
+                async with factory() as session:
+                    repo = LedgerRepository(session)
+                    await repo.get_user_deposits(user_id)
+                    await repo.get_all_balances(user_id)
+                completed += 1
+            except OperationalError:
+                failed += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(writer(users[i % len(users)]) for i in range(writers)),
+        *(reader(users[i % len(users)]) for i in range(readers)),
+    )
+    elapsed = time.perf_counter() - start
+    await engine.dispose()
+    return elapsed, completed, failed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writers", type=int, default=16)
+    parser.add_argument("--readers", type=int, default=16)
+    parser.add_argument("--ops", type=int, default=50, help="Operations per task")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engines = {
+            # sqlite3's default 5s lock wait, rollback journal, FULL sync, 5+10 pool
+            "default": create_async_engine(f"sqlite+aiosqlite:///{tmp}/default.db"),
+            "tuned": create_engine(f"sqlite:///{tmp}/tuned.db", EngineProfile()),
+        }
+        for name, engine in engines.items():
+            elapsed, completed, failed = await run(engine, args.writers, args.readers, args.ops)
+            print(
+                f"{name:>8}: {completed / elapsed:8.1f} ops/s "
+                f"({completed} ok, {failed} failed in {elapsed:.2f}s)"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
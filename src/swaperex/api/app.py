@@ -8,39 +8,22 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from swaperex.config import get_settings
-from swaperex.ledger.database import close_db, get_db, init_db
+from swaperex.ledger.database import close_db, init_db
+from swaperex.prices import get_price_oracle
+from swaperex.utils.http import close_http_clients
+from swaperex.web.services.quote_stream import close_quote_stream_hub
 
 logger = logging.getLogger(__name__)
 
 
 async def load_xpubs_from_db():
-    """Load stored xpubs from database and set as environment variables.
-
-    This ensures HD wallets use persistent xpubs after service restart.
-    """
-    from swaperex.crypto import decrypt_xpub
-    from swaperex.hdwallet.factory import reset_wallet_cache
-    from swaperex.ledger.repository import LedgerRepository
+    """Preload stored xpubs so HD wallets use them after a restart."""
+    from swaperex.hdwallet.factory import preload_xpubs
 
     try:
-        async with get_db() as session:
-            repo = LedgerRepository(session)
-            xpubs = await repo.get_all_xpubs()
-
-            for xpub_record in xpubs:
-                # Decrypt if encrypted
-                xpub_value = decrypt_xpub(xpub_record.encrypted_xpub)
-
-                # Set environment variable
-                env_key = f"XPUB_{xpub_record.asset.upper()}"
-                os.environ[env_key] = xpub_value
-                logger.info(f"Loaded xpub for {xpub_record.asset} from database")
-
-            # Reset wallet cache so new xpubs are picked up
-            if xpubs:
-                reset_wallet_cache()
-                logger.info(f"Loaded {len(xpubs)} xpubs from database")
-
+        count = await preload_xpubs()
+        if count:
+            logger.info(f"Loaded {count} xpubs from database")
     except Exception as e:
         logger.warning(f"Failed to load xpubs from database: {e}")
 
@@ -51,8 +34,14 @@ async def lifespan(app: FastAPI):
     # Startup
     await init_db()
     await load_xpubs_from_db()
+    oracle = get_price_oracle()
+    if oracle.sources:
+        await oracle.start()
     yield
     # Shutdown
+    await close_quote_stream_hub()
+    await oracle.stop()
+    await close_http_clients()
     await close_db()
 
 
@@ -9,9 +9,10 @@ from pydantic import BaseModel, Field
 from sqlalchemy import func, select
 
 from swaperex.config import get_settings
-from swaperex.ledger.database import get_db
+from swaperex.ledger.database import get_db, get_read_db
 from swaperex.ledger.models import Balance, Deposit, Swap, User, Withdrawal, WithdrawalStatus
 from swaperex.ledger.repository import LedgerRepository
+from swaperex.prices import get_price_oracle
 from swaperex.providers import get_provider
 
 logger = logging.getLogger(__name__)
@@ -63,6 +64,7 @@ class BalanceSummary(BaseModel):
     asset: str
     total: float
     user_count: int
+    usd_value: Optional[float] = None
 
 
 class SystemStats(BaseModel):
@@ -76,18 +78,32 @@ class SystemStats(BaseModel):
     dry_run: bool
 
 
+class RoutingProviderHealth(BaseModel):
+    """Circuit breaker state and health score of a routing provider."""
+
+    name: str
+    state: str
+    score: float
+    calls: int
+    error_rate: float
+    median_latency_seconds: Optional[float]
+    cooldown_seconds: float
+    skipped: int
+
+
 class ProviderStatus(BaseModel):
     """Provider status."""
 
     name: str
     configured: bool
     valid: bool
+    routing: list[RoutingProviderHealth] = Field(default_factory=list)
 
 
 @router.get("/balances", response_model=list[BalanceSummary])
 async def get_balances(_: bool = Depends(require_admin_token)) -> list[BalanceSummary]:
     """Get aggregated balances per asset."""
-    async with get_db() as session:
+    async with get_read_db() as session:
         # Aggregate balances by asset
         result = await session.execute(
             select(
@@ -98,14 +114,19 @@ async def get_balances(_: bool = Depends(require_admin_token)) -> list[BalanceSu
         )
         rows = result.all()
 
-        return [
-            BalanceSummary(
-                asset=row.asset,
-                total=float(row.total),
-                user_count=row.user_count,
+        oracle = get_price_oracle()
+        summaries = []
+        for row in rows:
+            usd_value = oracle.usd_value(row.asset, row.total)
+            summaries.append(
+                BalanceSummary(
+                    asset=row.asset,
+                    total=float(row.total),
+                    user_count=row.user_count,
+                    usd_value=float(usd_value) if usd_value is not None else None,
+                )
             )
-            for row in rows
-        ]
+        return summaries
 
 
 @router.get("/stats", response_model=SystemStats)
@@ -113,7 +134,7 @@ async def get_stats(_: bool = Depends(require_admin_token)) -> SystemStats:
     """Get system statistics."""
     settings = get_settings()
 
-    async with get_db() as session:
+    async with get_read_db() as session:
         user_count = await session.scalar(select(func.count(User.id))) or 0
         deposit_count = await session.scalar(select(func.count(Deposit.id))) or 0
         swap_count = await session.scalar(select(func.count(Swap.id))) or 0
@@ -131,7 +152,9 @@ async def get_stats(_: bool = Depends(require_admin_token)) -> SystemStats:
 
 @router.get("/provider", response_model=ProviderStatus)
 async def get_provider_status(_: bool = Depends(require_admin_token)) -> ProviderStatus:
-    """Get provider configuration status."""
+    """Get provider configuration status and routing provider health."""
+    from swaperex.routing.health import all_provider_health
+
     provider = get_provider()
     valid = await provider.validate_config()
 
@@ -139,9 +162,63 @@ async def get_provider_status(_: bool = Depends(require_admin_token)) -> Provide
         name=provider.name,
         configured=True,
         valid=valid,
+        routing=[RoutingProviderHealth(**h.to_dict()) for h in all_provider_health()],
     )
 
 
+@router.get("/routing/cache")
+async def get_quote_cache_stats(_: bool = Depends(require_admin_token)) -> dict:
+    """Get quote cache hit/miss/coalesce counters."""
+    from swaperex.routing.cache import get_quote_cache
+
+    cache = get_quote_cache()
+    return {
+        "enabled": cache.enabled,
+        "ttl_seconds": cache.ttl_seconds,
+        **cache.stats.to_dict(),
+    }
+
+
+@router.get("/routing/providers")
+async def get_routing_providers(_: bool = Depends(require_admin_token)) -> dict:
+    """Get the shared routing providers and aggregators."""
+    from swaperex.routing.registry import get_provider_registry
+
+    return get_provider_registry().stats()
+
+
+@router.get("/routing/ladder")
+async def get_quote_ladders(_: bool = Depends(require_admin_token)) -> dict:
+    """Get the precomputed quote ladders and their age."""
+    from swaperex.routing.ladder import get_quote_ladder
+
+    return get_quote_ladder().stats()
+
+
+@router.post("/routing/reload")
+async def reload_routing_providers(_: bool = Depends(require_admin_token)) -> dict:
+    """Re-read settings and rebuild routing providers on next use."""
+    from swaperex.routing.registry import get_provider_registry
+
+    registry = get_provider_registry()
+    registry.reload()
+    return {"success": True, **registry.stats()}
+
+
+@router.get("/prices")
+async def get_prices(_: bool = Depends(require_admin_token)) -> dict:
+    """Get oracle prices with their source, age and staleness."""
+    oracle = get_price_oracle()
+    prices = oracle.staleness()
+    return {
+        "sources": [source.name for source in oracle.sources],
+        "running": oracle.running,
+        "max_age_seconds": oracle.max_age,
+        "stale": sum(1 for p in prices if p["stale"]),
+        "prices": prices,
+    }
+
+
 @router.get("/users")
 async def list_users(
     limit: int = 50,
@@ -149,7 +226,7 @@ async def list_users(
     _: bool = Depends(require_admin_token),
 ) -> dict:
     """List users with their balances."""
-    async with get_db() as session:
+    async with get_read_db() as session:
         # Get users
         result = await session.execute(
             select(User).order_by(User.created_at.desc()).limit(limit).offset(offset)
@@ -356,7 +433,7 @@ async def list_all_withdrawals(
     _: bool = Depends(require_admin_token),
 ) -> dict:
     """List all withdrawals with optional status filter."""
-    async with get_db() as session:
+    async with get_read_db() as session:
         stmt = select(Withdrawal).order_by(Withdrawal.created_at.desc())
 
         if status:
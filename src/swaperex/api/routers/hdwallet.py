@@ -6,9 +6,14 @@ from fastapi import APIRouter, Depends, Header, HTTPException
 from pydantic import BaseModel
 
 from swaperex.config import get_settings
-from swaperex.hdwallet import get_hd_wallet, get_supported_assets
+from swaperex.hdwallet import get_current_hd_wallet, get_supported_assets
 from swaperex.ledger.database import get_db
 from swaperex.ledger.repository import LedgerRepository
+from swaperex.services.address_pool import (
+    address_pool_enabled,
+    refill_address_pool,
+    schedule_address_pool_refill,
+)
 
 router = APIRouter(prefix="/api/v1/hd", tags=["HD Wallet"])
 
@@ -73,7 +78,7 @@ async def get_supported() -> dict:
 @router.get("/{asset}/info", response_model=WalletInfoResponse)
 async def get_wallet_info(asset: str) -> WalletInfoResponse:
     """Get HD wallet info for an asset."""
-    wallet = get_hd_wallet(asset)
+    wallet = await get_current_hd_wallet(asset)
 
     return WalletInfoResponse(
         asset=asset.upper(),
@@ -94,24 +99,21 @@ async def register_xpub(
 ) -> XpubRegisterResponse:
     """Register an xpub for HD wallet derivation.
 
-    Stores the xpub in the database (encrypted if MASTER_KEY is set).
-    Also sets runtime environment variable for immediate use.
+    Stores the xpub in the database (encrypted if MASTER_KEY is set) and
+    updates the in-memory xpubs used by the wallet factory.
     """
-    import os
     from swaperex.crypto import encrypt_xpub
+    from swaperex.hdwallet.factory import WALLET_CLASSES, set_stored_xpub
 
     # Validate xpub format first
-    try:
-        wallet = get_hd_wallet(asset)
-        # Temporarily set for validation
-        os.environ[f"XPUB_{asset.upper()}"] = request.xpub
-        from swaperex.hdwallet.factory import reset_wallet_cache
-        reset_wallet_cache()
-        wallet = get_hd_wallet(asset)
-        if hasattr(wallet, '_validate_xpub'):
-            wallet._validate_xpub()
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    wallet_class = WALLET_CLASSES.get(asset.upper())
+    if wallet_class is not None:
+        try:
+            wallet = wallet_class(xpub=request.xpub, testnet=not get_settings().is_production)
+            if hasattr(wallet, '_validate_xpub'):
+                wallet._validate_xpub()
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
     # Determine key type and testnet from prefix
     xpub = request.xpub
@@ -137,6 +139,10 @@ async def register_xpub(
             key_type=key_type,
             is_testnet=is_testnet,
         )
+        # Pooled addresses were derived from the previous xpub
+        await repo.discard_pooled_addresses(asset)
+
+    set_stored_xpub(asset, xpub)
 
     persistence = "encrypted in DB" if encrypted else "stored in DB (unencrypted - set MASTER_KEY for encryption)"
 
@@ -171,6 +177,25 @@ async def get_stored_xpub(
         }
 
 
+@router.delete("/{asset}/xpub")
+async def delete_stored_xpub(
+    asset: str,
+    _: bool = Depends(require_admin_token),
+) -> dict:
+    """Delete the stored xpub for an asset (admin only)."""
+    from swaperex.hdwallet.factory import invalidate_xpub
+
+    async with get_db() as session:
+        repo = LedgerRepository(session)
+        if not await repo.delete_xpub(asset):
+            raise HTTPException(status_code=404, detail=f"No xpub stored for {asset}")
+        # Pooled addresses were derived from the deleted xpub
+        await repo.discard_pooled_addresses(asset)
+
+    invalidate_xpub(asset)
+    return {"ok": True, "asset": asset.upper()}
+
+
 @router.get("/{asset}/address", response_model=AddressResponse)
 async def get_or_create_address(
     asset: str,
@@ -210,28 +235,40 @@ async def get_or_create_address(
                 is_new=False,
             )
 
-        # Derive new address
-        hd_wallet = get_hd_wallet(asset)
-        index = await repo.get_next_hd_index(asset)
-        addr_info = hd_wallet.derive_address(index)
+        # Take a pre-derived address from the pool, or derive one now
+        hd_wallet = await get_current_hd_wallet(asset)
+        pooled = None
+        if address_pool_enabled():
+            pooled = await repo.claim_pooled_address(asset, hd_wallet.xpub_fingerprint)
+        if pooled:
+            address = pooled.address
+            derivation_path = pooled.derivation_path
+            index = pooled.derivation_index
+        else:
+            index = await repo.get_next_hd_index(asset)
+            addr_info = hd_wallet.derive_address(index)
+            address = addr_info.address
+            derivation_path = addr_info.derivation_path
 
         # Store address
         await repo.create_deposit_address(
             user_id=user_id,
             asset=asset,
-            address=addr_info.address,
-            derivation_path=addr_info.derivation_path,
+            address=address,
+            derivation_path=derivation_path,
             derivation_index=index,
         )
 
-        return AddressResponse(
-            user_id=user_id,
-            asset=asset.upper(),
-            address=addr_info.address,
-            derivation_path=addr_info.derivation_path,
-            derivation_index=index,
-            is_new=True,
-        )
+    schedule_address_pool_refill(asset)
+
+    return AddressResponse(
+        user_id=user_id,
+        asset=asset.upper(),
+        address=address,
+        derivation_path=derivation_path,
+        derivation_index=index,
+        is_new=True,
+    )
 
 
 @router.get("/{asset}/derive")
@@ -246,7 +283,7 @@ async def derive_address_at_index(
     Does NOT store the address - just returns the derivation result.
     Useful for verifying deterministic derivation.
     """
-    hd_wallet = get_hd_wallet(asset)
+    hd_wallet = await get_current_hd_wallet(asset)
     addr_info = hd_wallet.derive_address(index, change)
 
     return {
@@ -260,6 +297,20 @@ async def derive_address_at_index(
     }
 
 
+@router.post("/{asset}/pool/refill")
+async def refill_pool(
+    asset: str,
+    _: bool = Depends(require_admin_token),
+) -> dict:
+    """Pre-derive addresses into the pool now (admin)."""
+    added = await refill_address_pool(asset, force=True)
+
+    async with get_db() as session:
+        available = await LedgerRepository(session).count_pooled_addresses(asset)
+
+    return {"asset": asset.upper(), "added": added, "available": available}
+
+
 @router.get("/{asset}/state")
 async def get_wallet_state(
     asset: str,
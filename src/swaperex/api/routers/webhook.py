@@ -17,7 +17,8 @@ from pydantic import BaseModel
 from swaperex.config import get_settings
 from swaperex.ledger.database import get_db
 from swaperex.ledger.models import DepositStatus
-from swaperex.ledger.repository import LedgerRepository
+from swaperex.ledger.repository import IngestedDeposit, LedgerRepository
+from swaperex.scanner.base import TransactionInfo
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +98,8 @@ async def handle_deposit_webhook(
     4. Creates deposit record and credits balance
     5. Logs raw payload for audit
 
+    Steps 2-5 run through the same batch ingestion as the deposit scanner.
+
     Provider integrations should send data to this endpoint.
     """
     settings = get_settings()
@@ -109,102 +112,65 @@ async def handle_deposit_webhook(
             logger.warning(f"Invalid webhook signature for tx {payload.tx_hash}")
             raise HTTPException(status_code=401, detail="Invalid signature")
 
+    # Determine minimum confirmations required
+    min_confirmations = {
+        "BTC": 2,
+        "ETH": 12,
+        "TRX": 19,
+        "LTC": 6,
+    }.get(payload.chain.upper(), 2)
+
+    tx = TransactionInfo(
+        txid=payload.tx_hash,
+        asset=payload.chain,
+        to_address=payload.to_address,
+        amount=Decimal(payload.amount),
+        confirmations=payload.confirmations,
+        block_height=payload.block_height,
+        from_address=payload.from_address,
+        tx_index=payload.tx_index,
+    )
+
+    # Idempotency check, address lookup, deposit record and credit in one
+    # batch; unknown addresses are still marked processed to prevent
+    # repeated lookups
     async with get_db() as session:
         repo = LedgerRepository(session)
-
-        # Check idempotency - was this transaction already processed?
-        if await repo.is_transaction_processed(
+        [result] = await repo.ingest_deposits(
+            [tx],
+            source="webhook",
             chain=payload.chain,
-            tx_hash=payload.tx_hash,
-            tx_index=payload.tx_index,
-        ):
-            logger.info(f"Transaction {payload.tx_hash} already processed, skipping")
-            existing = await repo.get_processed_transaction(
-                payload.chain, payload.tx_hash, payload.tx_index
-            )
-            return WebhookResponse(
-                success=True,
-                message="Transaction already processed",
-                deposit_id=existing.deposit_id if existing else None,
-            )
-
-        # Find user by deposit address
-        addr_record = await repo.get_deposit_address_record(payload.to_address)
-        if not addr_record:
-            logger.warning(f"Unknown deposit address: {payload.to_address}")
-            # Still mark as processed to prevent repeated lookups
-            await repo.mark_transaction_processed(
-                chain=payload.chain,
-                tx_hash=payload.tx_hash,
-                amount=Decimal(payload.amount),
-                to_address=payload.to_address,
-                source="webhook",
-                tx_index=payload.tx_index,
-                raw_payload=json.dumps(payload.model_dump()),
-            )
-            return WebhookResponse(
-                success=False,
-                message="Unknown deposit address",
-            )
-
-        user_id = addr_record.user_id
-        asset = addr_record.asset
-        amount = Decimal(payload.amount)
-
-        # Determine minimum confirmations required
-        min_confirmations = {
-            "BTC": 2,
-            "ETH": 12,
-            "TRX": 19,
-            "LTC": 6,
-        }.get(payload.chain.upper(), 2)
-
-        # Determine deposit status based on confirmations
-        if payload.confirmations >= min_confirmations:
-            status = DepositStatus.CONFIRMED
-        else:
-            status = DepositStatus.PENDING
-
-        # Create deposit record
-        deposit = await repo.create_deposit(
-            user_id=user_id,
-            asset=asset,
-            amount=amount,
-            to_address=payload.to_address,
-            tx_hash=payload.tx_hash,
-            from_address=payload.from_address,
-            status=status,
+            min_confirmations=min_confirmations,
+            record_unknown=True,
+            raw_payloads=[json.dumps(payload.model_dump())],
         )
 
-        # If confirmed, credit balance
-        if status == DepositStatus.CONFIRMED:
-            await repo.credit_balance(user_id, asset, amount)
-            logger.info(f"Deposit confirmed: {amount} {asset} to user {user_id}")
-
-        # Mark transaction as processed
-        await repo.mark_transaction_processed(
-            chain=payload.chain,
-            tx_hash=payload.tx_hash,
-            amount=amount,
-            to_address=payload.to_address,
-            source="webhook",
-            tx_index=payload.tx_index,
-            deposit_id=deposit.id,
-            raw_payload=json.dumps(payload.model_dump()),
+    if result.status == IngestedDeposit.DUPLICATE:
+        logger.info(f"Transaction {payload.tx_hash} already processed, skipping")
+        return WebhookResponse(
+            success=True,
+            message="Transaction already processed",
+            deposit_id=result.deposit_id,
         )
 
-        # Send notification to user (async, don't wait)
-        # This could be done via a background task queue
-        if status == DepositStatus.CONFIRMED:
-            # TODO: Send Telegram notification
-            pass
-
+    if result.status == IngestedDeposit.UNKNOWN_ADDRESS:
+        logger.warning(f"Unknown deposit address: {payload.to_address}")
         return WebhookResponse(
-            success=True,
-            message=f"Deposit {'confirmed' if status == DepositStatus.CONFIRMED else 'pending'}",
-            deposit_id=deposit.id,
+            success=False,
+            message="Unknown deposit address",
         )
 
+    confirmed = result.status == IngestedDeposit.CREDITED
+    if confirmed:
+        logger.info(f"Deposit confirmed: {tx.amount} {result.asset} to user {result.user_id}")
+        # TODO: Send Telegram notification (via a background task queue)
+
+    return WebhookResponse(
+        success=True,
+        message=f"Deposit {'confirmed' if confirmed else 'pending'}",
+        deposit_id=result.deposit_id,
+    )
+
 
 @router.post("/deposit/confirm/{tx_hash}")
 async def confirm_deposit_manual(
@@ -8,7 +8,10 @@ from aiogram.fsm.storage.memory import MemoryStorage
 
 from swaperex.bot.handlers import setup_routers
 from swaperex.config import get_settings
+from swaperex.hdwallet.factory import preload_xpubs
 from swaperex.ledger.database import init_db
+from swaperex.prices import get_price_oracle
+from swaperex.routing.ladder import get_quote_ladder
 from swaperex.services.deposit_sweeper import run_sweeper_loop
 
 logger = logging.getLogger(__name__)
@@ -54,6 +57,14 @@ async def run_bot() -> None:
     await init_db()
     logger.info("Database initialized")
 
+    # HD wallets only see xpubs stored in the database once preloaded
+    try:
+        count = await preload_xpubs()
+        if count:
+            logger.info(f"Loaded {count} xpubs from database")
+    except Exception as e:
+        logger.warning(f"Failed to load xpubs: {e}")
+
     # Create bot
     bot, dp = create_bot()
 
@@ -61,6 +72,16 @@ async def run_bot() -> None:
     sweeper_task = asyncio.create_task(run_sweeper_loop(interval_seconds=300))
     logger.info("Deposit sweeper started (interval: 5 min)")
 
+    # Prices for fallback quotes and the ladder come from the oracle
+    oracle = get_price_oracle()
+    if oracle.sources:
+        await oracle.start()
+
+    # Keep quote ladders for popular pairs warm
+    ladder = get_quote_ladder()
+    if settings.quote_ladder_enabled:
+        ladder.start()
+
     try:
         # Delete webhook if any and start polling
         await bot.delete_webhook(drop_pending_updates=True)
@@ -68,6 +89,8 @@ async def run_bot() -> None:
         await dp.start_polling(bot)
     finally:
         sweeper_task.cancel()
+        await ladder.stop()
+        await oracle.stop()
         await bot.session.close()
 
 
@@ -18,7 +18,9 @@ from swaperex.bot.keyboards import (
 )
 from swaperex.ledger.database import get_db
 from swaperex.ledger.repository import LedgerRepository
-from swaperex.routing.factory import create_chain_aggregator
+from swaperex.routing.base import Quote
+from swaperex.routing.ladder import get_quote_ladder, is_ladder_estimate
+from swaperex.routing.registry import get_chain_aggregator
 from swaperex.services.swap_executor import execute_swap
 from swaperex.services.balance_sync import get_all_chain_balances_with_addresses
 
@@ -27,6 +29,20 @@ logger = logging.getLogger(__name__)
 router = Router()
 
 
+def _quote_data(q: Quote) -> dict:
+    """Quote fields kept in FSM state until confirmation."""
+    return {
+        "provider": q.provider,
+        "to_amount": str(q.to_amount),
+        "fee_amount": str(q.fee_amount),
+        "fee_asset": q.fee_asset,
+        "slippage_percent": str(q.slippage_percent),
+        "estimated_time": q.estimated_time_seconds,
+        "is_simulated": getattr(q, 'is_simulated', True),
+        "estimate": (q.route_details or {}).get("estimate"),
+    }
+
+
 class SwapStates(StatesGroup):
     """FSM states for swap flow."""
 
@@ -259,9 +275,17 @@ async def handle_swap_amount(message: Message, state: FSMContext) -> None:
     if available_normalized == amount_normalized:
         amount = available
 
-    # Get quotes from chain-specific providers
-    aggregator = create_chain_aggregator(chain)
-    quotes = await aggregator.get_all_quotes(from_asset, to_asset, amount)
+    # Popular pairs are answered instantly from the precomputed quote ladder;
+    # the firm quote is fetched at confirmation. Otherwise quote live.
+    timed_out: list[str] = []
+    estimate = get_quote_ladder().estimate(chain, from_asset, to_asset, amount)
+    if estimate is not None:
+        quotes = [estimate]
+    else:
+        aggregator = get_chain_aggregator(chain)
+        result = await aggregator.collect_quotes(from_asset, to_asset, amount)
+        quotes = result.quotes
+        timed_out = result.timed_out
 
     if not quotes:
         await message.answer(
@@ -278,18 +302,7 @@ async def handle_swap_amount(message: Message, state: FSMContext) -> None:
     # Store quotes for confirmation
     await state.update_data(
         amount=str(amount),
-        quotes=[
-            {
-                "provider": q.provider,
-                "to_amount": str(q.to_amount),
-                "fee_amount": str(q.fee_amount),
-                "fee_asset": q.fee_asset,
-                "slippage_percent": str(q.slippage_percent),
-                "estimated_time": q.estimated_time_seconds,
-                "is_simulated": getattr(q, 'is_simulated', True),
-            }
-            for q in quotes
-        ],
+        quotes=[_quote_data(q) for q in quotes],
         selected_quote_index=0,
     )
     await state.set_state(SwapStates.confirming)
@@ -304,13 +317,18 @@ async def handle_swap_amount(message: Message, state: FSMContext) -> None:
         best_marker = "[BEST] " if i == 0 else "       "
         lines.append(
             f"{best_marker}{q.provider}\n"
-            f"   Receive: {q.to_amount:.8f} {to_asset}\n"
+            f"   Receive: {'~' if estimate else ''}{q.to_amount:.8f} {to_asset}\n"
             f"   Fee: ${q.fee_amount:.2f}\n"
             f"   Slippage: {q.slippage_percent:.2f}%\n"
             f"   Time: ~{q.estimated_time_seconds}s\n"
         )
 
+    if timed_out:
+        lines.append(f"\nNo response in time from: {', '.join(timed_out)}")
+
     lines.append("\nBest rate selected automatically.")
+    if estimate:
+        lines.append("Indicative rate - the final quote is fetched when you confirm.")
     # Show if real or simulated
     if best_quote.is_simulated:
         lines.append("(Simulated quote - PoC)")
@@ -340,6 +358,39 @@ async def handle_confirm_swap(callback: CallbackQuery, state: FSMContext) -> Non
         return
 
     selected_quote = quotes[0]  # Best quote
+
+    # Ladder quotes are estimates: get a firm quote before executing
+    if is_ladder_estimate(selected_quote):
+        firm_quote = await get_chain_aggregator(chain).get_best_quote(
+            from_asset, to_asset, amount
+        )
+        if firm_quote is None:
+            await callback.message.edit_text(
+                f"No routes available for {from_asset} -> {to_asset} right now.\n"
+                "Please start again with /swap"
+            )
+            await state.clear()
+            await callback.answer()
+            return
+
+        estimated_to_amount = Decimal(selected_quote["to_amount"])
+        tolerance = Decimal(selected_quote["slippage_percent"]) / 100
+        selected_quote = _quote_data(firm_quote)
+        await state.update_data(quotes=[selected_quote])
+
+        # Ask again if the firm rate is worse than the estimate beyond slippage
+        if firm_quote.to_amount < estimated_to_amount * (1 - tolerance):
+            await callback.message.edit_text(
+                f"Rate changed\n\n"
+                f"{amount} {from_asset} -> {firm_quote.to_amount:.8f} {to_asset}\n"
+                f"(estimated {estimated_to_amount:.8f})\n\n"
+                f"Route: {firm_quote.provider}\n\n"
+                f"Confirm the updated quote?",
+                reply_markup=confirm_swap_keyboard("best"),
+            )
+            await callback.answer()
+            return
+
     is_simulated = selected_quote.get('is_simulated', True)
 
     # Check if user has enough native token for gas/energy fees (for real swaps)
@@ -1,7 +1,6 @@
 """Wallet and balance handlers."""
 
 import logging
-import os
 from aiogram import F, Router
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
@@ -10,11 +9,12 @@ from aiogram.types import CallbackQuery, Message
 
 from swaperex.bot.keyboards import back_keyboard, deposit_chain_keyboard, deposit_asset_keyboard
 from swaperex.config import get_settings
-from swaperex.hdwallet import get_hd_wallet
+from swaperex.hdwallet import get_current_hd_wallet
 from swaperex.ledger.database import get_db
 from swaperex.ledger.models import DepositStatus, SwapStatus
 from swaperex.ledger.repository import LedgerRepository
 from swaperex.services.balance_sync import get_all_chain_balances_with_addresses
+from swaperex.services.key_store import get_configured_seed_phrase, get_key_store
 
 logger = logging.getLogger(__name__)
 
@@ -30,31 +30,14 @@ class DepositStates(StatesGroup):
 
 async def get_bsc_address() -> str:
     """Get BSC wallet address from seed phrase."""
-    seed_phrase = (
-        os.environ.get("SEED_PHRASE")
-        or os.environ.get("WALLET_SEED_PHRASE")
-        or os.environ.get("MNEMONIC")
-    )
+    seed_phrase = get_configured_seed_phrase()
 
     if not seed_phrase:
         raise ValueError("No seed phrase configured")
 
     try:
-        from bip_utils import Bip39SeedGenerator, Bip32Secp256k1
-        from bip_utils import EthAddrEncoder
-
-        # Generate seed from mnemonic
-        seed = Bip39SeedGenerator(seed_phrase).Generate()
-        bip32_ctx = Bip32Secp256k1.FromSeed(seed)
-
         # Standard path: m/44'/60'/0'/0/0
-        path = "44'/60'/0'/0/0"
-        account_ctx = bip32_ctx.DerivePath(path)
-
-        # Get address
-        pubkey = account_ctx.PublicKey().RawUncompressed().ToBytes()
-        address = EthAddrEncoder.EncodeKey(pubkey)
-        return address
+        return get_key_store(seed_phrase).evm_address(0)
     except Exception as e:
         raise ValueError(f"Failed to derive address: {e}")
 
@@ -144,7 +127,6 @@ async def cmd_addresses(message: Message) -> None:
     if not message.from_user:
         return
 
-    import os
     from swaperex.services.balance_sync import (
         derive_solana_address,
         derive_tron_address,
@@ -153,11 +135,7 @@ async def cmd_addresses(message: Message) -> None:
         derive_near_address,
     )
 
-    seed_phrase = (
-        os.environ.get("SEED_PHRASE")
-        or os.environ.get("WALLET_SEED_PHRASE")
-        or os.environ.get("MNEMONIC")
-    )
+    seed_phrase = get_configured_seed_phrase()
 
     if not seed_phrase:
         await message.answer("❌ No seed phrase configured")
@@ -167,12 +145,7 @@ async def cmd_addresses(message: Message) -> None:
 
     # EVM address
     try:
-        from bip_utils import Bip39SeedGenerator, Bip32Secp256k1, EthAddrEncoder
-        seed = Bip39SeedGenerator(seed_phrase).Generate()
-        bip32_ctx = Bip32Secp256k1.FromSeed(seed)
-        account_ctx = bip32_ctx.DerivePath("44'/60'/0'/0/0")
-        pubkey = account_ctx.PublicKey().RawUncompressed().ToBytes()
-        evm_address = EthAddrEncoder.EncodeKey(pubkey)
+        evm_address = get_key_store(seed_phrase).evm_address(0)
         lines.append(f"🔵 EVM (BSC/ETH/Polygon/Avax):\n`{evm_address}`\n")
     except Exception as e:
         lines.append(f"❌ EVM: {e}\n")
@@ -293,7 +266,7 @@ async def handle_deposit_asset(callback: CallbackQuery, state: FSMContext) -> No
     settings = get_settings()
 
     # Get HD wallet for this asset
-    hd_wallet = get_hd_wallet(asset)
+    hd_wallet = await get_current_hd_wallet(asset)
 
     async with get_db() as session:
         repo = LedgerRepository(session)
@@ -40,6 +40,37 @@ class Settings(BaseSettings):
         description="Database connection URL",
     )
 
+    database_read_url: Optional[str] = Field(
+        default=None,
+        description="Read-only database (e.g. replica) for reporting queries (default: primary)",
+    )
+    db_pool_size: int = Field(default=10, description="Connections kept in the database pool")
+    db_max_overflow: int = Field(
+        default=20, description="Extra connections opened above the pool size under load"
+    )
+    db_pool_timeout: float = Field(
+        default=30.0, description="Seconds to wait for a free pooled connection"
+    )
+    db_pool_recycle: int = Field(
+        default=1800, description="Seconds after which pooled connections are replaced"
+    )
+    db_pool_pre_ping: bool = Field(
+        default=True, description="Check pooled connections are alive before use"
+    )
+    db_statement_cache_size: int = Field(
+        default=100,
+        description="asyncpg prepared statements cached per connection (0 behind pgbouncer)",
+    )
+    sqlite_journal_mode: str = Field(
+        default="WAL", description="SQLite journal mode (WAL lets readers run during writes)"
+    )
+    sqlite_synchronous: str = Field(
+        default="NORMAL", description="SQLite synchronous level (NORMAL is durable with WAL)"
+    )
+    sqlite_busy_timeout_ms: int = Field(
+        default=5000, description="Milliseconds SQLite waits for a lock before failing"
+    )
+
     # API
     api_host: str = Field(default="0.0.0.0", description="API server host")
     api_port: int = Field(default=8000, description="API server port")
@@ -57,6 +88,165 @@ class Settings(BaseSettings):
     thorchain_api_url: Optional[str] = Field(default=None, description="THORChain API URL")
     dex_aggregator_api_url: Optional[str] = Field(default=None, description="DEX aggregator URL")
     mm2_rpc_url: Optional[str] = Field(default=None, description="MM2 RPC URL")
+    quote_provider_timeout: float = Field(
+        default=8.0, description="Seconds to wait for a single provider quote"
+    )
+    quote_total_timeout: float = Field(
+        default=12.0, description="Seconds to wait for all provider quotes in a fan-out"
+    )
+    quote_cache_ttl: float = Field(
+        default=10.0, description="Seconds to reuse an identical provider quote (0 = disabled)"
+    )
+    quote_cache_amount_precision: int = Field(
+        default=6, description="Significant digits of the amount used in quote cache keys"
+    )
+    pool_snapshot_refresh_interval: float = Field(
+        default=30.0, description="Seconds before a DEX pool snapshot is refreshed in the background"
+    )
+    pool_snapshot_max_age: float = Field(
+        default=300.0, description="Seconds after which a DEX pool snapshot is no longer used"
+    )
+    pool_snapshot_dir: str = Field(
+        default="./data/pool_snapshots",
+        description="Directory for persisted DEX pool snapshots (empty = memory only)",
+    )
+    hedge_quantile: float = Field(
+        default=0.95, description="Latency quantile after which a hedged backup request starts"
+    )
+    hedge_min_delay: float = Field(default=0.05, description="Minimum hedge delay (seconds)")
+    hedge_max_delay: float = Field(default=2.0, description="Maximum hedge delay (seconds)")
+    breaker_window_seconds: float = Field(
+        default=60.0, description="Rolling window for routing provider error rates"
+    )
+    breaker_min_calls: int = Field(
+        default=5, description="Calls in the window before a provider circuit can open"
+    )
+    breaker_error_threshold: float = Field(
+        default=0.5, description="Error rate (0.5 = 50%) that opens a provider circuit"
+    )
+    breaker_cooldown_seconds: float = Field(
+        default=30.0, description="Seconds a provider circuit stays open before a probe"
+    )
+    breaker_max_cooldown_seconds: float = Field(
+        default=300.0, description="Upper bound for the doubling circuit cooldown"
+    )
+    route_multi_hop: bool = Field(
+        default=True, description="Choose the live-quoted provider by multi-hop pool estimates"
+    )
+    route_max_hops: int = Field(default=3, description="Longest multi-hop path considered")
+    routing_reload_check_seconds: float = Field(
+        default=5.0,
+        description="How often the provider registry checks the environment and .env for changes",
+    )
+    quote_ladder_enabled: bool = Field(
+        default=True, description="Precompute quote ladders for popular pairs in the bot"
+    )
+    quote_ladder_top_pairs: int = Field(
+        default=10, description="Pairs kept on a quote ladder (most swapped first)"
+    )
+    quote_ladder_tiers_usd: str = Field(
+        default="10,50,100,500,1000,5000,10000",
+        description="Comma-separated ladder rung sizes in USD",
+    )
+    quote_ladder_seed_pairs: str = Field(
+        default="pancakeswap:BNB/USDT,uniswap:ETH/USDT,jupiter:SOL/USDC",
+        description="Pairs laddered even without swap history (chain:FROM/TO)",
+    )
+    quote_ladder_refresh_interval: float = Field(
+        default=30.0, description="Seconds between quote ladder refreshes"
+    )
+    quote_ladder_max_age: float = Field(
+        default=120.0, description="Seconds after which a ladder is not used for display"
+    )
+    quote_ladder_lookback_days: int = Field(
+        default=7, description="Days of swap history used to rank pairs"
+    )
+
+    # Price oracle
+    price_sources: str = Field(
+        default="binance,coingecko,ref_finance,sunio",
+        description="Comma-separated USD price sources (empty = seed prices only)",
+    )
+    price_refresh_interval: float = Field(
+        default=60.0, description="Seconds between price source polls"
+    )
+    price_max_age: float = Field(
+        default=300.0, description="Seconds after which a price is reported stale"
+    )
+    price_push_enabled: bool = Field(
+        default=True, description="Stream prices from sources with push support"
+    )
+
+    # Batch quotes
+    batch_quote_max_items: int = Field(
+        default=200, description="Most pair/amount requests accepted in one batch"
+    )
+    batch_quote_concurrency: int = Field(
+        default=16, description="Max upstream quote calls in flight per batch"
+    )
+    batch_quote_rate: float = Field(
+        default=50.0, description="Upstream quote calls per second across all batches"
+    )
+
+    # Quote subscriptions (WebSocket/SSE)
+    quote_stream_interval: float = Field(
+        default=5.0, description="Seconds between refreshes of a subscribed quote"
+    )
+    quote_stream_max_subscriptions: int = Field(
+        default=20, description="Most quote subscriptions per WebSocket connection"
+    )
+    quote_stream_max_topics: int = Field(
+        default=500, description="Most distinct quote subscriptions (refresh loops) per process"
+    )
+    quote_stream_heartbeat: float = Field(
+        default=15.0, description="Seconds of silence before an SSE keep-alive comment"
+    )
+
+    # Outbound HTTP connection pooling
+    http_max_connections: int = Field(
+        default=100, description="Max pooled connections per upstream origin"
+    )
+    http_max_keepalive_connections: int = Field(
+        default=20, description="Max idle keep-alive connections per upstream origin"
+    )
+    http_keepalive_expiry: float = Field(
+        default=30.0, description="Seconds an idle pooled connection is kept open"
+    )
+    http2_enabled: bool = Field(
+        default=True, description="Use HTTP/2 for pooled clients when h2 is installed"
+    )
+
+    # HD wallet address pool
+    hd_address_pool_size: int = Field(
+        default=100, description="Pre-derived unassigned addresses to keep per asset (0 = disabled)"
+    )
+    hd_address_pool_low_watermark: int = Field(
+        default=20, description="Refill the address pool when fewer addresses remain"
+    )
+    hd_xpub_refresh_seconds: float = Field(
+        default=5.0,
+        description="How often to check the database for xpubs changed by other processes",
+    )
+
+    # Deposit scanning
+    scanner_concurrency: int = Field(
+        default=8, description="Max concurrent address lookups per scan cycle"
+    )
+    scanner_rate_limits: str = Field(
+        default="",
+        description="Per-backend request rate overrides, e.g. 'etherscan=10,trongrid_key=30'",
+    )
+    scanner_mode: str = Field(
+        default="address",
+        description="Deposit detection: 'address' (poll each address) or 'blocks' (walk blocks)",
+    )
+    scanner_max_blocks_per_cycle: int = Field(
+        default=50, description="Max blocks walked per cycle in block scanner mode"
+    )
+    btc_node_rpc_url: Optional[str] = Field(
+        default=None,
+        description="Bitcoin Core RPC URL for block scanning (default: Blockstream Esplora)",
+    )
 
     # Deposit Provider (Stage 2)
     deposit_webhook_secret: Optional[str] = Field(
@@ -74,6 +264,18 @@ class Settings(BaseSettings):
     # Admin API
     admin_token: str = Field(default="", description="Admin API token for protected endpoints")
 
+    # Per-user balance locks
+    balance_lock_backend: str = Field(
+        default="local",
+        description="Balance lock backend: local (one process), postgres or redis (shared)",
+    )
+    balance_lock_redis_url: str = Field(
+        default="redis://localhost:6379/0", description="Redis URL for the redis lock backend"
+    )
+    balance_lock_lease: float = Field(
+        default=30.0, description="Seconds a redis balance lock lives without renewal"
+    )
+
     # Safety guards
     dry_run: bool = Field(default=True, description="Enable dry-run mode (no real transactions)")
     hot_wallet_threshold: float = Field(
@@ -145,6 +347,9 @@ class Settings(BaseSettings):
             "thorchain_api_url": self.thorchain_api_url or "(not set)",
             "dex_aggregator_api_url": self.dex_aggregator_api_url or "(not set)",
             "mm2_rpc_url": self.mm2_rpc_url or "(not set)",
+            "quote_provider_timeout": self.quote_provider_timeout,
+            "quote_total_timeout": self.quote_total_timeout,
+            "quote_cache_ttl": self.quote_cache_ttl,
         }
         return data
 
@@ -1,11 +1,12 @@
 """HD Wallet module for deterministic address generation."""
 
 from swaperex.hdwallet.base import AddressInfo, HDWalletProvider
-from swaperex.hdwallet.factory import get_hd_wallet, get_supported_assets
+from swaperex.hdwallet.factory import get_current_hd_wallet, get_hd_wallet, get_supported_assets
 
 __all__ = [
     "HDWalletProvider",
     "AddressInfo",
+    "get_current_hd_wallet",
     "get_hd_wallet",
     "get_supported_assets",
 ]
@@ -101,7 +101,7 @@ class XRPHDWallet(HDWalletProvider):
     def _derive_with_bip32(self, index: int, change: int) -> AddressInfo:
         from bip_utils import XrpAddrEncoder
 
-        child = self._bip32_ctx.DerivePath(f"{change}/{index}")
+        child = self._derive_child(change, index)
         pubkey = child.PublicKey().RawCompressed().ToBytes()
 
         address = XrpAddrEncoder.EncodeKey(pubkey)
@@ -526,7 +526,7 @@ class KASHDWallet(HDWalletProvider):
         return self._derive_simulated(index, change)
 
     def _derive_with_bip32(self, index: int, change: int) -> AddressInfo:
-        child = self._bip32_ctx.DerivePath(f"{change}/{index}")
+        child = self._derive_child(change, index)
         pubkey = child.PublicKey().RawCompressed().ToBytes()
 
         # Kaspa uses blake2b hash and bech32 encoding
@@ -1066,7 +1066,7 @@ class VETHDWallet(HDWalletProvider):
     def _derive_with_bip32(self, index: int, change: int) -> AddressInfo:
         from bip_utils import EthAddrEncoder
 
-        child = self._bip32_ctx.DerivePath(f"{change}/{index}")
+        child = self._derive_child(change, index)
         pubkey = child.PublicKey().RawUncompressed().ToBytes()
 
         # VET uses same address format as ETH
@@ -1170,7 +1170,7 @@ class FTMHDWallet(HDWalletProvider):
     def _derive_with_bip32(self, index: int, change: int) -> AddressInfo:
         from bip_utils import EthAddrEncoder
 
-        child = self._bip32_ctx.DerivePath(f"{change}/{index}")
+        child = self._derive_child(change, index)
         pubkey = child.PublicKey().RawUncompressed().ToBytes()
 
         address = EthAddrEncoder.EncodeKey(pubkey)
@@ -7,10 +7,26 @@ using BIP32/BIP44/BIP84 derivation paths.
 Security: Only xpub is used - private keys are NEVER stored or transmitted.
 """
 
+import hashlib
+import logging
+import multiprocessing
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
+# Ranges at least this large are derived across a process pool
+PARALLEL_DERIVATION_THRESHOLD = 1000
+
+# Smallest chunk handed to a worker process
+MIN_DERIVATION_CHUNK = 250
+
+# Derivation contexts are rebuilt from the xpub after pickling
+_CONTEXT_ATTRS = ("_bip32_ctx", "_bip84_ctx")
+
 
 @dataclass
 class AddressInfo:
@@ -33,6 +49,7 @@ class HDWalletProvider(ABC):
     Usage:
         wallet = BTCHDWallet(xpub="xpub...")
         addr = wallet.derive_address(index=0)
+        pool = wallet.derive_range(start=0, count=100)
     """
 
     def __init__(self, xpub: str, testnet: bool = False):
@@ -51,6 +68,11 @@ class HDWalletProvider(ABC):
         """Validate the xpub format for this chain."""
         pass
 
+    @property
+    def xpub_fingerprint(self) -> str:
+        """Short digest of the xpub, stored with pooled addresses derived from it."""
+        return hashlib.sha256(self.xpub.encode()).hexdigest()[:16]
+
     @property
     @abstractmethod
     def asset(self) -> str:
@@ -76,6 +98,73 @@ class HDWalletProvider(ABC):
         """
         pass
 
+    def derive_range(
+        self,
+        start: int,
+        count: int,
+        change: int = 0,
+        processes: Optional[int] = None,
+    ) -> list[AddressInfo]:
+        """Derive ``count`` consecutive addresses starting at ``start``.
+
+        The change node is derived once and each address is a single child
+        derivation from it. Ranges of PARALLEL_DERIVATION_THRESHOLD or more
+        addresses are split into chunks and derived in a process pool.
+
+        Args:
+            start: First child index
+            count: Number of addresses to derive
+            change: 0 for receiving addresses, 1 for change addresses
+            processes: Worker processes (None = CPU count, 1 = in-process)
+
+        Returns:
+            AddressInfo list ordered by index
+        """
+        if count <= 0:
+            return []
+
+        if processes == 1 or count < PARALLEL_DERIVATION_THRESHOLD:
+            return self._derive_range_serial(start, count, change)
+
+        try:
+            return _derive_range_parallel(self, start, count, change, processes)
+        except Exception as e:
+            logger.warning(f"Parallel derivation failed, deriving in-process: {e}")
+            return self._derive_range_serial(start, count, change)
+
+    def _derive_range_serial(self, start: int, count: int, change: int) -> list[AddressInfo]:
+        """Derive a range in the current process."""
+        return [self.derive_address(index, change) for index in range(start, start + count)]
+
+    def _derive_child(self, change: int, index: int):
+        """Derive change/index below the account node.
+
+        The change node is cached per account context, so a new xpub
+        (which replaces ``_bip32_ctx``) never reuses a stale node.
+        """
+        ctx = self._bip32_ctx
+        cache = self.__dict__.setdefault("_change_nodes", {})
+        entry = cache.get(change)
+        if entry is None or entry[0] is not ctx:
+            entry = (ctx, ctx.ChildKey(change))
+            cache[change] = entry
+        return entry[1].ChildKey(index)
+
+    def __getstate__(self) -> dict:
+        """Pickle without derivation contexts (for process-pool derivation)."""
+        state = dict(self.__dict__)
+        for attr in _CONTEXT_ATTRS:
+            if attr in state:
+                state[attr] = None
+        state.pop("_change_nodes", None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore and rebuild derivation contexts from the xpub."""
+        self.__dict__.update(state)
+        if getattr(self, "_xpub", None):
+            self._validate_xpub()
+
     def derive_receiving_address(self, index: int) -> AddressInfo:
         """Derive a receiving address (change=0)."""
         return self.derive_address(index, change=0)
@@ -98,6 +187,41 @@ class HDWalletProvider(ABC):
         pass
 
 
+def _derive_chunk(
+    wallet: HDWalletProvider, start: int, count: int, change: int
+) -> list[AddressInfo]:
+    """Process-pool worker: derive one chunk of a range."""
+    return wallet._derive_range_serial(start, count, change)
+
+
+def _derive_range_parallel(
+    wallet: HDWalletProvider,
+    start: int,
+    count: int,
+    change: int,
+    processes: Optional[int] = None,
+) -> list[AddressInfo]:
+    """Split a range into chunks and derive them across worker processes."""
+    workers = processes or os.cpu_count() or 1
+    chunk_size = max(MIN_DERIVATION_CHUNK, -(-count // workers))
+    end = start + count
+
+    # Spawned, not forked: callers run this from worker threads (the address
+    # pool uses asyncio.to_thread), and forking a multithreaded process can
+    # copy locks held by other threads into the children.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [
+            pool.submit(_derive_chunk, wallet, chunk_start, min(chunk_size, end - chunk_start), change)
+            for chunk_start in range(start, end, chunk_size)
+        ]
+        addresses: list[AddressInfo] = []
+        for future in futures:
+            addresses.extend(future.result())
+
+    return addresses
+
+
 class SimulatedHDWallet(HDWalletProvider):
     """Simulated HD wallet for testing (no real derivation)."""
 
@@ -151,3 +275,13 @@ class SimulatedHDWallet(HDWalletProvider):
             change=change,
             script_type="simulated",
         )
+
+    def derive_range(
+        self,
+        start: int,
+        count: int,
+        change: int = 0,
+        processes: Optional[int] = None,
+    ) -> list[AddressInfo]:
+        """Generate simulated addresses in-process (no EC math to parallelize)."""
+        return self._derive_range_serial(start, count, change) if count > 0 else []
@@ -147,7 +147,7 @@ class BTCHDWallet(HDWalletProvider):
     def _derive_with_bip32(self, index: int, change: int) -> AddressInfo:
         """Derive address using raw BIP32 for vpub/zpub keys."""
         # Derive change/index path
-        child = self._bip32_ctx.DerivePath(f"{change}/{index}")
+        child = self._derive_child(change, index)
         pubkey = child.PublicKey().RawCompressed().ToBytes()
 
         # Generate bech32 address
@@ -312,7 +312,7 @@ class LTCHDWallet(HDWalletProvider):
 
     def _derive_with_bip32(self, index: int, change: int) -> AddressInfo:
         """Derive address using raw BIP32."""
-        child = self._bip32_ctx.DerivePath(f"{change}/{index}")
+        child = self._derive_child(change, index)
         pubkey = child.PublicKey().RawCompressed().ToBytes()
 
         # LTC uses ltc1 for mainnet, tltc1 for testnet (bech32)
@@ -424,7 +424,7 @@ class DASHHDWallet(HDWalletProvider):
 
     def _derive_with_bip32(self, index: int, change: int) -> AddressInfo:
         """Derive address using raw BIP32."""
-        child = self._bip32_ctx.DerivePath(f"{change}/{index}")
+        child = self._derive_child(change, index)
         pubkey = child.PublicKey().RawCompressed().ToBytes()
 
         # DASH uses P2PKH addresses
@@ -168,7 +168,7 @@ class CosmosBaseWallet(HDWalletProvider):
         """Derive address using BIP32 and bech32 encoding."""
         from bip_utils import AtomAddrEncoder
 
-        child = self._bip32_ctx.DerivePath(f"{change}/{index}")
+        child = self._derive_child(change, index)
         pubkey = child.PublicKey().RawCompressed().ToBytes()
 
         # Cosmos uses RIPEMD160(SHA256(pubkey)) for address
@@ -133,7 +133,7 @@ class ETHHDWallet(HDWalletProvider):
     def _derive_with_bip32(self, index: int, change: int) -> AddressInfo:
         """Derive address using raw BIP32 and ETH address encoding."""
         # Derive child key: change/index
-        child = self._bip32_ctx.DerivePath(f"{change}/{index}")
+        child = self._derive_child(change, index)
 
         # Get uncompressed public key (ETH uses uncompressed)
         pubkey = child.PublicKey().RawUncompressed().ToBytes()
@@ -268,7 +268,7 @@ class TRXHDWallet(HDWalletProvider):
         from bip_utils import TrxAddrEncoder
 
         # Derive child key: change/index
-        child = self._bip32_ctx.DerivePath(f"{change}/{index}")
+        child = self._derive_child(change, index)
 
         # Get uncompressed public key (TRX uses same as ETH)
         pubkey = child.PublicKey().RawUncompressed().ToBytes()
@@ -4,13 +4,21 @@ This module provides a factory function to create HD wallet instances
 based on asset type and configuration.
 
 Supports:
+- Xpubs stored in the database (xpub_keys table), preloaded with preload_xpubs()
 - Individual xpub configuration (XPUB_BTC, XPUB_ETH, etc.)
 - Seed phrase configuration (SEED_PHRASE) for deriving all xpubs
+
+Stored xpubs are decrypted once at startup and served from memory, so
+get_hd_wallet never touches the database. Call set_stored_xpub() or
+invalidate_xpub() when the table changes. Other processes (API workers,
+the bot) pick the change up through refresh_xpubs(), which async callers
+run via get_current_hd_wallet().
 """
 
 from typing import Optional
 import os
 import logging
+import time
 
 # Load .env file into os.environ for seed phrase access
 try:
@@ -201,6 +209,13 @@ _wallet_cache: dict[str, HDWalletProvider] = {}
 # Cache for xpubs derived from seed phrase
 _xpub_cache: dict[str, str] = {}
 
+# Decrypted xpubs from the database, keyed by asset (see preload_xpubs)
+_db_xpubs: dict[str, str] = {}
+
+# Version of the loaded xpubs and when it was last compared with the database
+_db_xpubs_version: Optional[str] = None
+_db_xpubs_checked_at = 0.0
+
 
 def get_supported_assets() -> list[str]:
     """Get list of supported HD wallet assets."""
@@ -441,7 +456,7 @@ def _get_xpub_for_asset(asset: str, settings) -> Optional[str]:
     """Get xpub for a specific asset.
 
     Priority:
-    1. Database (encrypted xpub_keys table)
+    1. Database (xpub_keys table, preloaded by preload_xpubs)
     2. Environment variables (XPUB_BTC, etc.)
     3. Derive from seed phrase (SEED_PHRASE env var)
     """
@@ -484,44 +499,108 @@ def _get_xpub_for_asset(asset: str, settings) -> Optional[str]:
 
 
 def _load_xpub_from_db(asset: str) -> Optional[str]:
-    """Load and decrypt xpub from database.
+    """Get a stored xpub from the preloaded in-memory copy."""
+    return _db_xpubs.get(asset.upper())
+
+
+async def preload_xpubs(session=None) -> int:
+    """Load and decrypt all stored xpubs into memory.
+
+    Call at startup (after init_db). Replaces any previously loaded xpubs
+    and clears the wallet cache.
+
+    Args:
+        session: Database session to read with (a new one if omitted)
 
-    Uses synchronous database access for compatibility with factory pattern.
+    Returns:
+        Number of xpubs loaded
     """
-    import asyncio
+    from swaperex.crypto import decrypt_xpub
+    from swaperex.ledger.database import get_db
+    from swaperex.ledger.repository import LedgerRepository, xpub_version
+
+    global _db_xpubs_version, _db_xpubs_checked_at
+
+    if session is None:
+        async with get_db() as session:
+            records = await LedgerRepository(session).get_all_xpubs()
+    else:
+        records = await LedgerRepository(session).get_all_xpubs()
+
+    xpubs = {record.asset.upper(): decrypt_xpub(record.encrypted_xpub) for record in records}
+    _db_xpubs.clear()
+    _db_xpubs.update(xpubs)
+    _db_xpubs_version = xpub_version((r.asset, r.encrypted_xpub) for r in records)
+    _db_xpubs_checked_at = time.monotonic()
+    reset_wallet_cache()
+    for asset in xpubs:
+        logger.info(f"Loaded xpub for {asset} from database")
+    return len(xpubs)
+
+
+async def refresh_xpubs(max_age: Optional[float] = None, session=None) -> bool:
+    """Reload stored xpubs if the table changed since they were loaded.
 
+    Another API worker or the bot may have registered or deleted an xpub.
+    The check is one small query, made at most every ``max_age`` seconds
+    (``hd_xpub_refresh_seconds`` by default).
+
+    Args:
+        max_age: Seconds a previous check stays valid (0 = always check)
+        session: Database session to read with (a new one if omitted)
+
+    Returns:
+        True if the xpubs were reloaded
+    """
+    from swaperex.ledger.database import get_db
+    from swaperex.ledger.repository import LedgerRepository
+
+    global _db_xpubs_checked_at
+
+    if max_age is None:
+        max_age = get_settings().hd_xpub_refresh_seconds
+    now = time.monotonic()
+    if _db_xpubs_version is not None and now - _db_xpubs_checked_at < max_age:
+        return False
+
+    if session is None:
+        async with get_db() as session:
+            return await refresh_xpubs(max_age=0, session=session)
+
+    version = await LedgerRepository(session).get_xpub_version()
+    _db_xpubs_checked_at = now
+    if version == _db_xpubs_version:
+        return False
+    count = await preload_xpubs(session)
+    logger.info(f"Stored xpubs changed, reloaded {count}")
+    return True
+
+
+async def get_current_hd_wallet(asset: str) -> HDWalletProvider:
+    """get_hd_wallet, after picking up xpub changes made by other processes."""
     try:
-        from swaperex.crypto import decrypt_xpub
-        from swaperex.ledger.database import get_engine
-        from sqlalchemy import text
-
-        async def fetch_xpub():
-            engine = get_engine()
-            async with engine.connect() as conn:
-                result = await conn.execute(
-                    text("SELECT encrypted_xpub FROM xpub_keys WHERE asset = :asset"),
-                    {"asset": asset.upper()}
-                )
-                row = result.fetchone()
-                if row:
-                    return decrypt_xpub(row[0])
-            return None
-
-        # Run async function
-        try:
-            loop = asyncio.get_running_loop()
-            # If we're already in an async context, create a task
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                future = pool.submit(asyncio.run, fetch_xpub())
-                return future.result(timeout=5)
-        except RuntimeError:
-            # No running loop, safe to use asyncio.run
-            return asyncio.run(fetch_xpub())
-
-    except Exception:
-        # If anything fails, return None and fall back to env vars
-        return None
+        await refresh_xpubs()
+    except Exception as e:
+        logger.warning(f"Failed to check stored xpubs: {e}")
+    return get_hd_wallet(asset)
+
+
+def set_stored_xpub(asset: str, xpub: str) -> None:
+    """Record a newly stored (decrypted) xpub and drop affected wallets."""
+    global _db_xpubs_checked_at
+    _db_xpubs[asset.upper()] = xpub
+    # Family fallbacks (e.g. USDT -> ETH) mean other wallets may change too
+    reset_wallet_cache()
+    # Re-sync the version on the next refresh_xpubs call
+    _db_xpubs_checked_at = 0.0
+
+
+def invalidate_xpub(asset: str) -> None:
+    """Forget a deleted xpub and drop affected wallets."""
+    global _db_xpubs_checked_at
+    _db_xpubs.pop(asset.upper(), None)
+    reset_wallet_cache()
+    _db_xpubs_checked_at = 0.0
 
 
 def reset_wallet_cache() -> None:
@@ -105,7 +105,7 @@ class UTXOBaseWallet(HDWalletProvider):
 
     def _derive_with_bip32(self, index: int, change: int) -> AddressInfo:
         """Derive address using raw BIP32."""
-        child = self._bip32_ctx.DerivePath(f"{change}/{index}")
+        child = self._derive_child(change, index)
         pubkey = child.PublicKey().RawCompressed().ToBytes()
 
         net_ver = self.TESTNET_VERSION if self._testnet else self.MAINNET_VERSION
@@ -182,7 +182,7 @@ class ZECHDWallet(UTXOBaseWallet):
 
     def _derive_with_bip32(self, index: int, change: int) -> AddressInfo:
         """Derive ZEC address (uses 2-byte version)."""
-        child = self._bip32_ctx.DerivePath(f"{change}/{index}")
+        child = self._derive_child(change, index)
         pubkey = child.PublicKey().RawCompressed().ToBytes()
 
         # ZEC uses 2-byte version prefix
@@ -401,7 +401,7 @@ class FIOHDWallet(HDWalletProvider):
         """Derive FIO public key."""
         import base58
 
-        child = self._bip32_ctx.DerivePath(f"{change}/{index}")
+        child = self._derive_child(change, index)
         pubkey = child.PublicKey().RawCompressed().ToBytes()
 
         # FIO uses FIO + base58 encoded pubkey with checksum
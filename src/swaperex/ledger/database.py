@@ -1,11 +1,15 @@
 """Database connection and session management."""
 
+import logging
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import Index, inspect, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.schema import CreateIndex
 
 from swaperex.config import get_settings
+from swaperex.ledger.engine import EngineProfile, create_engine
 
 # Import all models to ensure they're registered with Base.metadata
 from swaperex.ledger.models import (  # noqa: F401
@@ -14,35 +18,52 @@ from swaperex.ledger.models import (  # noqa: F401
     Deposit,
     DepositAddress,
     HDWalletState,
+    PooledAddress,
     ProcessedTransaction,
+    ScanCursor,
     Swap,
     User,
+    Withdrawal,
     XpubKey,
 )
 
+logger = logging.getLogger(__name__)
+
 # Global engine and session factory
 _engine = None
 _session_factory = None
 
+# Read-only engine for reporting queries (a replica when DATABASE_READ_URL is set)
+_read_engine = None
+_read_session_factory = None
+
 
 def get_engine():
     """Get or create the database engine."""
     global _engine
     if _engine is None:
         settings = get_settings()
-        # Convert sqlite:/// to sqlite+aiosqlite:/// if needed
-        db_url = settings.database_url
-        if db_url.startswith("sqlite:///") and "aiosqlite" not in db_url:
-            db_url = db_url.replace("sqlite:///", "sqlite+aiosqlite:///")
-
-        _engine = create_async_engine(
-            db_url,
-            echo=settings.debug and not settings.is_production,
-            future=True,
-        )
+        _engine = create_engine(settings.database_url, EngineProfile.from_settings(settings))
     return _engine
 
 
+def get_read_engine():
+    """Get the engine for reporting queries.
+
+    Uses DATABASE_READ_URL (e.g. a streaming replica) when set, otherwise
+    the primary engine.
+    """
+    global _read_engine
+    if _read_engine is None:
+        settings = get_settings()
+        if not settings.database_read_url:
+            return get_engine()
+        _read_engine = create_engine(
+            settings.database_read_url, EngineProfile.from_settings(settings)
+        )
+    return _read_engine
+
+
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     """Get or create the session factory."""
     global _session_factory
@@ -56,6 +77,19 @@ def get_session_factory() -> async_sessionmaker[AsyncSession]:
     return _session_factory
 
 
+def get_read_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get or create the session factory for reporting queries."""
+    global _read_session_factory
+    if _read_session_factory is None:
+        _read_session_factory = async_sessionmaker(
+            bind=get_read_engine(),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+        )
+    return _read_session_factory
+
+
 @asynccontextmanager
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Get a database session context manager."""
@@ -69,8 +103,74 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+@asynccontextmanager
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Get a session for reporting queries (never committed).
+
+    May read from a replica, so results can lag slightly behind writes.
+    """
+    session_factory = get_read_session_factory()
+    async with session_factory() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+
+
+def _missing_indexes(sync_conn) -> list[Index]:
+    """Model indexes that existing tables don't have yet."""
+    inspector = inspect(sync_conn)
+    missing = []
+    for table in Base.metadata.sorted_tables:
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        missing.extend(
+            index
+            for index in sorted(table.indexes, key=lambda ix: ix.name)
+            if index.name not in existing
+        )
+    return missing
+
+
+def _create_index_sql(index: Index, dialect) -> str:
+    """CREATE INDEX IF NOT EXISTS, built CONCURRENTLY on PostgreSQL."""
+    sql = str(CreateIndex(index, if_not_exists=True).compile(dialect=dialect))
+    if dialect.name == "postgresql":
+        # CREATE [UNIQUE] INDEX CONCURRENTLY IF NOT EXISTS ...
+        sql = sql.replace("INDEX ", "INDEX CONCURRENTLY ", 1)
+    return sql
+
+
+async def ensure_indexes(engine: Optional[AsyncEngine] = None) -> list[str]:
+    """Add indexes declared on the models to an existing database.
+
+    ``create_all`` only creates indexes together with their table, so
+    indexes added to a model later are created here. This is a deploy
+    step (``scripts/add_ledger_indexes.py``), not part of ``init_db``:
+    on PostgreSQL each index is built with ``CREATE INDEX CONCURRENTLY``
+    outside a transaction, so writes to the table are not blocked.
+
+    Args:
+        engine: Engine to use (default: the primary engine)
+
+    Returns:
+        Names of the indexes created
+    """
+    engine = engine or get_engine()
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        missing = await conn.run_sync(_missing_indexes)
+        for index in missing:
+            await conn.execute(text(_create_index_sql(index, conn.dialect)))
+            logger.info(f"Created index {index.name}")
+    return [index.name for index in missing]
+
+
 async def init_db() -> None:
-    """Initialize the database by creating all tables."""
+    """Initialize the database by creating all tables.
+
+    Indexes added to models after their table exists are created by
+    ``ensure_indexes`` (run once per deploy), not here.
+    """
     engine = get_engine()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -78,7 +178,11 @@ async def init_db() -> None:
 
 async def close_db() -> None:
     """Close database connections."""
-    global _engine, _session_factory
+    global _engine, _session_factory, _read_engine, _read_session_factory
+    if _read_engine is not None:
+        await _read_engine.dispose()
+        _read_engine = None
+    _read_session_factory = None
     if _engine is not None:
         await _engine.dispose()
         _engine = None
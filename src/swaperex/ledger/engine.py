@@ -0,0 +1,122 @@
+"""Database engine construction with per-dialect tuning.
+
+``EngineProfile`` collects the pool, SQLite and asyncpg settings; the
+parts that apply to a URL's dialect are turned into engine options:
+
+- all pooled dialects: pool size/overflow/timeout/recycle and pre-ping
+- SQLite: WAL journal, ``synchronous=NORMAL`` and a busy timeout on every
+  connection, so concurrent writers wait instead of failing with
+  ``database is locked`` (in-memory databases keep their single
+  connection and skip pool options)
+- asyncpg: size of the prepared statement cache per connection
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EngineProfile:
+    """Tuning applied to database engines."""
+
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
+    statement_cache_size: int = 100
+    echo: bool = False
+
+    @classmethod
+    def from_settings(cls, settings) -> "EngineProfile":
+        return cls(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+            pool_pre_ping=settings.db_pool_pre_ping,
+            sqlite_journal_mode=settings.sqlite_journal_mode,
+            sqlite_synchronous=settings.sqlite_synchronous,
+            sqlite_busy_timeout_ms=settings.sqlite_busy_timeout_ms,
+            statement_cache_size=settings.db_statement_cache_size,
+            echo=settings.debug and not settings.is_production,
+        )
+
+
+def normalize_url(database_url: str) -> URL:
+    """Parse a database URL, using async drivers for bare sqlite/postgresql."""
+    url = make_url(database_url)
+    if url.drivername == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    elif url.drivername in ("postgresql", "postgres"):
+        url = url.set(drivername="postgresql+asyncpg")
+    return url
+
+
+def _is_memory_sqlite(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def engine_options(url: URL, profile: EngineProfile) -> tuple[URL, dict[str, Any]]:
+    """Engine URL and ``create_async_engine`` options for a profile."""
+    options: dict[str, Any] = {"echo": profile.echo, "future": True}
+    backend = url.get_backend_name()
+
+    if not _is_memory_sqlite(url):
+        options.update(
+            pool_size=profile.pool_size,
+            max_overflow=profile.max_overflow,
+            pool_timeout=profile.pool_timeout,
+            pool_recycle=profile.pool_recycle,
+            pool_pre_ping=profile.pool_pre_ping,
+        )
+
+    if backend == "sqlite":
+        # sqlite3's own wait, in seconds, before PRAGMA busy_timeout is set
+        options["connect_args"] = {"timeout": profile.sqlite_busy_timeout_ms / 1000}
+    elif url.get_driver_name() == "asyncpg" and "prepared_statement_cache_size" not in url.query:
+        url = url.update_query_dict(
+            {"prepared_statement_cache_size": str(profile.statement_cache_size)}
+        )
+
+    return url, options
+
+
+def _apply_sqlite_pragmas(engine: AsyncEngine, profile: EngineProfile, url: URL) -> None:
+    pragmas = [f"PRAGMA busy_timeout={int(profile.sqlite_busy_timeout_ms)}"]
+    if profile.sqlite_synchronous:
+        pragmas.append(f"PRAGMA synchronous={profile.sqlite_synchronous}")
+    if profile.sqlite_journal_mode and not _is_memory_sqlite(url):
+        pragmas.append(f"PRAGMA journal_mode={profile.sqlite_journal_mode}")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def create_engine(
+    database_url: str, profile: Optional[EngineProfile] = None
+) -> AsyncEngine:
+    """Create an async engine tuned for the URL's dialect."""
+    profile = profile or EngineProfile()
+    url, options = engine_options(normalize_url(database_url), profile)
+    engine = create_async_engine(url, **options)
+    if url.get_backend_name() == "sqlite":
+        _apply_sqlite_pragmas(engine, profile, url)
+    logger.debug(f"Created {url.get_backend_name()} engine with {options}")
+    return engine
@@ -14,10 +14,19 @@ from sqlalchemy import (
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
+def partial_index_where(condition: str) -> dict:
+    """Index kwargs restricting an index to rows matching ``condition``.
+
+    Applies on PostgreSQL and SQLite; other dialects index every row.
+    """
+    return {"postgresql_where": text(condition), "sqlite_where": text(condition)}
+
+
 class Base(DeclarativeBase):
     """Base class for all models."""
 
@@ -113,7 +122,17 @@ class DepositAddress(Base):
     """
 
     __tablename__ = "deposit_addresses"
-    __table_args__ = (Index("ix_deposit_addresses_user_asset", "user_id", "asset", unique=True),)
+    __table_args__ = (
+        Index("ix_deposit_addresses_user_asset", "user_id", "asset", unique=True),
+        # Scanner address index (get_all_active_deposit_addresses)
+        Index(
+            "ix_deposit_addresses_active_asset",
+            "status",
+            "asset",
+            "id",
+            **partial_index_where("status = 'active'"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
@@ -153,10 +172,40 @@ class HDWalletState(Base):
     )
 
 
+class PooledAddress(Base):
+    """Pre-derived HD address waiting to be assigned to a user.
+
+    Filled in bulk in the background so deposit address requests can be
+    served without deriving keys on the request path.
+    """
+
+    __tablename__ = "hd_address_pool"
+    __table_args__ = (
+        Index("ix_hd_address_pool_asset_status_index", "asset", "status", "derivation_index"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    asset: Mapped[str] = mapped_column(String(20), nullable=False)
+    address: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    derivation_path: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    derivation_index: Mapped[int] = mapped_column(nullable=False)
+    change: Mapped[int] = mapped_column(default=0)
+    status: Mapped[str] = mapped_column(String(20), default="available")  # available, assigned
+    # HDWalletProvider.xpub_fingerprint of the xpub the address came from
+    xpub_fingerprint: Mapped[Optional[str]] = mapped_column(String(16), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+
 class Deposit(Base):
     """Record of a deposit transaction."""
 
     __tablename__ = "deposits"
+    __table_args__ = (
+        # Deposit history (get_user_deposits)
+        Index("ix_deposits_user_created", "user_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
@@ -223,10 +272,37 @@ class ProcessedTransaction(Base):
     )
 
 
+class ScanCursor(Base):
+    """Last scanned position of a deposit scanner for one address.
+
+    Lets scanners fetch only activity newer than ``block_height`` and
+    survive restarts without re-reading history. In block scanner mode a
+    single row with address ``@block`` holds the last walked block.
+    """
+
+    __tablename__ = "scan_cursors"
+    __table_args__ = (Index("ix_scan_cursors_asset_address", "asset", "address", unique=True),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    asset: Mapped[str] = mapped_column(String(20), nullable=False)
+    address: Mapped[str] = mapped_column(String(255), nullable=False)
+    block_height: Mapped[int] = mapped_column(BigInteger, default=0)  # Fully scanned up to here
+    last_txid: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
 class Swap(Base):
     """Record of a swap transaction."""
 
     __tablename__ = "swaps"
+    __table_args__ = (
+        # Swap history (get_user_swaps)
+        Index("ix_swaps_user_created", "user_id", "created_at"),
+        # Covers pair ranking over a time window (get_popular_swap_pairs)
+        Index("ix_swaps_created_pair", "created_at", "from_asset", "to_asset", "route"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
@@ -257,6 +333,24 @@ class Withdrawal(Base):
     """Record of a withdrawal transaction."""
 
     __tablename__ = "withdrawals"
+    __table_args__ = (
+        # Withdrawal history (get_user_withdrawals)
+        Index("ix_withdrawals_user_created", "user_id", "created_at"),
+        # Processing queue (get_pending_withdrawals)
+        Index(
+            "ix_withdrawals_pending_created",
+            "status",
+            "created_at",
+            **partial_index_where("status = 'pending'"),
+        ),
+        # Confirmation tracking, in broadcast order (get_confirming_withdrawals)
+        Index(
+            "ix_withdrawals_confirming_broadcast",
+            "broadcast_at",
+            "status",
+            **partial_index_where("status IN ('broadcast', 'confirming')"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
@@ -2,11 +2,14 @@
 
 import hashlib
 import secrets
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, case, delete, func, insert, literal, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from swaperex.ledger.models import (
@@ -15,7 +18,9 @@ from swaperex.ledger.models import (
     DepositAddress,
     DepositStatus,
     HDWalletState,
+    PooledAddress,
     ProcessedTransaction,
+    ScanCursor,
     Swap,
     SwapStatus,
     User,
@@ -24,6 +29,60 @@ from swaperex.ledger.models import (
     XpubKey,
 )
 
+if TYPE_CHECKING:
+    from swaperex.scanner.base import TransactionInfo
+
+# Values per IN (...) list or multi-row VALUES chunk, well below SQLite's
+# bound parameter limit
+BATCH_CHUNK_SIZE = 500
+
+
+def _chunked(values: Iterable, size: int = BATCH_CHUNK_SIZE) -> Iterator[list]:
+    chunk = []
+    for value in values:
+        chunk.append(value)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _inline(value):
+    """Render a status constant (or list of them) inline in the SQL.
+
+    Partial indexes only match when the planner can see the value; a bound
+    parameter hides it (SQLite ``IN`` lists, PostgreSQL generic plans).
+    """
+    if isinstance(value, (list, tuple)):
+        return bindparam(None, list(value), expanding=True, literal_execute=True)
+    return literal(value, literal_execute=True)
+
+
+def xpub_version(rows: Iterable[tuple[str, str]]) -> str:
+    """Digest of (asset, encrypted_xpub) pairs identifying one set of stored xpubs."""
+    digest = hashlib.sha256()
+    for asset, encrypted_xpub in sorted(rows):
+        digest.update(f"{asset}\0{encrypted_xpub}\0".encode())
+    return digest.hexdigest()
+
+
+@dataclass
+class IngestedDeposit:
+    """Outcome of one transaction passed to ``ingest_deposits``."""
+
+    CREDITED = "credited"  # recorded confirmed and credited
+    PENDING = "pending"  # recorded, below the confirmation threshold
+    DUPLICATE = "duplicate"  # already processed or recorded
+    UNKNOWN_ADDRESS = "unknown_address"
+
+    tx: "TransactionInfo"
+    status: str
+    deposit_id: Optional[int] = None
+    user_id: Optional[int] = None
+    telegram_id: Optional[int] = None
+    asset: Optional[str] = None  # ledger asset of the deposit address
+
 
 class LedgerRepository:
     """Repository for all ledger-related database operations."""
@@ -75,51 +134,121 @@ class LedgerRepository:
 
     async def get_or_create_balance(self, user_id: int, asset: str) -> Balance:
         """Get or create a balance record for user/asset."""
-        balance = await self.get_balance(user_id, asset)
-        if balance is None:
-            balance = Balance(user_id=user_id, asset=asset.upper(), amount=Decimal("0"))
-            self.session.add(balance)
-            await self.session.flush()
-        return balance
+        return await self._upsert_balance(user_id, asset, Decimal("0"))
+
+    # Balance mutations are single UPDATE/INSERT ... RETURNING statements, so
+    # the check and the change happen atomically in the database and stay
+    # correct with several processes sharing it.
+
+    def _balance_upsert(self, rows: list[dict]):
+        """INSERT ... ON CONFLICT adding ``amount`` to existing balances."""
+        dialect = self.session.get_bind().dialect.name
+        dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = dialect_insert(Balance).values(
+            [{**row, "asset": row["asset"].upper(), "locked_amount": Decimal("0")} for row in rows]
+        )
+        return stmt.on_conflict_do_update(
+            index_elements=[Balance.user_id, Balance.asset],
+            set_={"amount": Balance.amount + stmt.excluded.amount, "updated_at": func.now()},
+        ).returning(Balance)
+
+    async def _upsert_balance(self, user_id: int, asset: str, delta: Decimal) -> Balance:
+        """Add ``delta`` to a balance, creating the row if needed."""
+        stmt = self._balance_upsert([{"user_id": user_id, "asset": asset, "amount": delta}])
+        result = await self.session.execute(
+            stmt, execution_options={"populate_existing": True}
+        )
+        return result.scalar_one()
+
+    async def credit_balances(self, credits: dict[tuple[int, str], Decimal]) -> list[Balance]:
+        """Add amounts to many balances, one multi-row upsert per chunk.
+
+        Args:
+            credits: (user_id, asset) -> amount
+        """
+        # Sorted so concurrent batches touch rows in the same order
+        rows = [
+            {"user_id": user_id, "asset": asset, "amount": amount}
+            for (user_id, asset), amount in sorted(credits.items())
+        ]
+        balances = []
+        for chunk in _chunked(rows):
+            result = await self.session.execute(
+                self._balance_upsert(chunk), execution_options={"populate_existing": True}
+            )
+            balances.extend(result.scalars().all())
+        return balances
+
+    async def _update_balance_where(
+        self, user_id: int, asset: str, values: dict, *conditions
+    ) -> Optional[Balance]:
+        """Apply ``values`` to a balance if ``conditions`` hold (None otherwise)."""
+        stmt = (
+            update(Balance)
+            .where(Balance.user_id == user_id, Balance.asset == asset.upper(), *conditions)
+            .values(updated_at=func.now(), **values)
+            .returning(Balance)
+        )
+        result = await self.session.execute(
+            stmt, execution_options={"populate_existing": True, "synchronize_session": False}
+        )
+        return result.scalar_one_or_none()
 
     async def credit_balance(self, user_id: int, asset: str, amount: Decimal) -> Balance:
         """Add amount to user balance."""
-        balance = await self.get_or_create_balance(user_id, asset)
-        balance.amount += amount
-        await self.session.flush()
-        return balance
+        return await self._upsert_balance(user_id, asset, amount)
 
     async def debit_balance(self, user_id: int, asset: str, amount: Decimal) -> Balance:
         """Subtract amount from user balance. Raises ValueError if insufficient."""
-        balance = await self.get_or_create_balance(user_id, asset)
-        if balance.available < amount:
+        balance = await self._update_balance_where(
+            user_id,
+            asset,
+            {"amount": Balance.amount - amount},
+            Balance.amount - Balance.locked_amount >= amount,
+        )
+        if balance is None:
+            available = await self._available(user_id, asset)
             raise ValueError(
-                f"Insufficient balance: have {balance.available} {asset}, need {amount}"
+                f"Insufficient balance: have {available} {asset}, need {amount}"
             )
-        balance.amount -= amount
-        await self.session.flush()
         return balance
 
     async def lock_balance(self, user_id: int, asset: str, amount: Decimal) -> Balance:
         """Lock amount for pending swap. Raises ValueError if insufficient."""
-        balance = await self.get_or_create_balance(user_id, asset)
-        if balance.available < amount:
+        balance = await self._update_balance_where(
+            user_id,
+            asset,
+            {"locked_amount": Balance.locked_amount + amount},
+            Balance.amount - Balance.locked_amount >= amount,
+        )
+        if balance is None:
+            available = await self._available(user_id, asset)
             raise ValueError(
-                f"Insufficient available balance: have {balance.available} {asset}, need {amount}"
+                f"Insufficient available balance: have {available} {asset}, need {amount}"
             )
-        balance.locked_amount += amount
-        await self.session.flush()
         return balance
 
     async def unlock_balance(self, user_id: int, asset: str, amount: Decimal) -> Balance:
         """Unlock previously locked amount."""
-        balance = await self.get_balance(user_id, asset)
+        balance = await self._update_balance_where(
+            user_id,
+            asset,
+            {
+                "locked_amount": case(
+                    (Balance.locked_amount > amount, Balance.locked_amount - amount),
+                    else_=Decimal("0"),
+                )
+            },
+        )
         if balance is None:
             raise ValueError(f"No balance found for {asset}")
-        balance.locked_amount = max(Decimal("0"), balance.locked_amount - amount)
-        await self.session.flush()
         return balance
 
+    async def _available(self, user_id: int, asset: str) -> Decimal:
+        """Available balance, for error messages after a refused mutation."""
+        balance = await self.get_balance(user_id, asset)
+        return balance.available if balance is not None else Decimal("0")
+
     # Deposit address operations
     async def get_deposit_address(self, user_id: int, asset: str) -> Optional[DepositAddress]:
         """Get deposit address for user/asset."""
@@ -167,11 +296,37 @@ class LedgerRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_deposit_address_record(self, address: str) -> Optional[DepositAddress]:
-        """Get deposit address record by address string."""
-        stmt = select(DepositAddress).where(DepositAddress.address == address)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+    async def get_deposit_address_record(
+        self, address: str, case_insensitive: bool = False
+    ) -> Optional[DepositAddress]:
+        """Get deposit address record by address string.
+
+        ``case_insensitive`` matches hex/bech32 addresses reported in a
+        different case than stored (e.g. lowercase vs EIP-55 checksum).
+        """
+        if case_insensitive:
+            condition = func.lower(DepositAddress.address) == address.lower()
+        else:
+            condition = DepositAddress.address == address
+        result = await self.session.execute(select(DepositAddress).where(condition))
+        return result.scalars().first()
+
+    async def get_deposit_address_records(
+        self, addresses: Iterable[str], case_insensitive: bool = False
+    ) -> dict[str, DepositAddress]:
+        """Get deposit address records for many addresses, one query per chunk.
+
+        Keyed by address as stored, or lowercased with ``case_insensitive``.
+        """
+        records: dict[str, DepositAddress] = {}
+        wanted = {a.lower() for a in addresses} if case_insensitive else set(addresses)
+        column = func.lower(DepositAddress.address) if case_insensitive else DepositAddress.address
+        for chunk in _chunked(wanted):
+            result = await self.session.execute(select(DepositAddress).where(column.in_(chunk)))
+            for record in result.scalars():
+                key = record.address.lower() if case_insensitive else record.address
+                records.setdefault(key, record)
+        return records
 
     def _generate_simulated_address(self, user_id: int, asset: str) -> str:
         """Generate a simulated deposit address (PoC only)."""
@@ -266,6 +421,168 @@ class LedgerRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def ingest_deposits(
+        self,
+        txs: Sequence["TransactionInfo"],
+        source: str = "scanner",
+        chain: Optional[str] = None,
+        min_confirmations: int = 0,
+        record_unknown: bool = False,
+        raw_payloads: Optional[Sequence[Optional[str]]] = None,
+    ) -> list[IngestedDeposit]:
+        """Record a batch of detected deposits and credit the confirmed ones.
+
+        Deposit addresses (with their users), processed transactions and
+        recorded deposits are each looked up with one ``IN`` query; new
+        deposits and processed-transaction rows are written with multi-row
+        inserts and confirmed amounts are credited with one upsert summed
+        per (user, asset). Nothing is committed, so the whole batch lands
+        in the caller's transaction.
+
+        A transaction is a duplicate if its (chain, txid) was processed or a
+        deposit with its txid and address exists; only the first of repeated
+        transactions in ``txs`` is recorded.
+
+        Args:
+            txs: Detected transactions
+            source: Processed-transaction source (scanner, webhook)
+            chain: Chain recorded for idempotency (default: each tx's asset)
+            min_confirmations: Below this a deposit is recorded pending, uncredited
+            record_unknown: Also mark transactions to unknown addresses processed
+            raw_payloads: Audit payloads stored with the processed rows, aligned with ``txs``
+
+        Returns:
+            One result per transaction, in input order
+        """
+        results = [IngestedDeposit(tx=tx, status=IngestedDeposit.DUPLICATE) for tx in txs]
+        if not txs:
+            return results
+        payloads = list(raw_payloads) if raw_payloads is not None else [None] * len(txs)
+        txids = {tx.txid for tx in txs}
+
+        owners: dict[str, tuple[int, int, str]] = {}
+        for chunk in _chunked({tx.to_address for tx in txs}):
+            rows = await self.session.execute(
+                select(
+                    DepositAddress.address,
+                    DepositAddress.user_id,
+                    User.telegram_id,
+                    DepositAddress.asset,
+                )
+                .join(User, User.id == DepositAddress.user_id)
+                .where(DepositAddress.address.in_(chunk))
+            )
+            for address, user_id, telegram_id, asset in rows:
+                owners.setdefault(address, (user_id, telegram_id, asset))
+
+        processed: dict[tuple[str, str], Optional[int]] = {}
+        recorded: dict[tuple[str, str], int] = {}
+        for chunk in _chunked(txids):
+            rows = await self.session.execute(
+                select(
+                    ProcessedTransaction.chain,
+                    ProcessedTransaction.tx_hash,
+                    ProcessedTransaction.deposit_id,
+                ).where(ProcessedTransaction.tx_hash.in_(chunk))
+            )
+            processed.update(((c, h), deposit_id) for c, h, deposit_id in rows)
+            rows = await self.session.execute(
+                select(Deposit.tx_hash, Deposit.to_address, Deposit.id).where(
+                    Deposit.tx_hash.in_(chunk)
+                )
+            )
+            recorded.update(((h, address), deposit_id) for h, address, deposit_id in rows)
+
+        # (chain, txid) and (txid, address) of each transaction recorded now
+        first: dict[tuple[str, str], IngestedDeposit] = {}
+        repeats: list[tuple[IngestedDeposit, IngestedDeposit]] = []
+        new: list[tuple[IngestedDeposit, Optional[str]]] = []
+        for result, payload in zip(results, payloads):
+            tx = result.tx
+            key = ((chain or tx.asset).upper(), tx.txid)
+            owner = owners.get(tx.to_address)
+            if owner is not None:
+                result.user_id, result.telegram_id, result.asset = owner
+
+            output = (tx.txid, tx.to_address)
+            if key in processed or output in recorded:
+                result.deposit_id = processed.get(key) or recorded.get(output)
+            elif key in first or output in first:
+                repeats.append((result, first.get(key) or first[output]))
+            else:
+                first[key] = first[output] = result
+                if owner is None:
+                    result.status = IngestedDeposit.UNKNOWN_ADDRESS
+                    if record_unknown:
+                        new.append((result, payload))
+                else:
+                    confirmed = tx.confirmations >= min_confirmations
+                    result.status = (
+                        IngestedDeposit.CREDITED if confirmed else IngestedDeposit.PENDING
+                    )
+                    new.append((result, payload))
+
+        deposits = [(r, p) for r, p in new if r.status != IngestedDeposit.UNKNOWN_ADDRESS]
+        now = datetime.utcnow()
+        for chunk in _chunked(deposits):
+            # Matched back by (txid, address): asking for parameter order
+            # would make SQLite insert row by row. render_nulls keeps rows
+            # with and without confirmed_at/from_address in one statement.
+            rows = await self.session.execute(
+                insert(Deposit).returning(Deposit.tx_hash, Deposit.to_address, Deposit.id),
+                [
+                    {
+                        "user_id": r.user_id,
+                        "asset": r.asset.upper(),
+                        "amount": r.tx.amount,
+                        "to_address": r.tx.to_address,
+                        "tx_hash": r.tx.txid,
+                        "from_address": r.tx.from_address,
+                        "confirmations": r.tx.confirmations,
+                        "status": DepositStatus.CONFIRMED
+                        if r.status == IngestedDeposit.CREDITED
+                        else DepositStatus.PENDING,
+                        "confirmed_at": now if r.status == IngestedDeposit.CREDITED else None,
+                    }
+                    for r, _ in chunk
+                ],
+                execution_options={"render_nulls": True},
+            )
+            ids = {(h, address): deposit_id for h, address, deposit_id in rows}
+            for r, _ in chunk:
+                r.deposit_id = ids[(r.tx.txid, r.tx.to_address)]
+
+        if new:
+            await self.session.execute(
+                insert(ProcessedTransaction),
+                [
+                    {
+                        "chain": (chain or r.tx.asset).upper(),
+                        "tx_hash": r.tx.txid,
+                        "tx_index": r.tx.tx_index,
+                        "source": source,
+                        "amount": r.tx.amount,
+                        "to_address": r.tx.to_address,
+                        "deposit_id": r.deposit_id,
+                        "raw_payload": payload,
+                    }
+                    for r, payload in new
+                ],
+                execution_options={"render_nulls": True},
+            )
+
+        credits: dict[tuple[int, str], Decimal] = {}
+        for r, _ in deposits:
+            if r.status == IngestedDeposit.CREDITED:
+                key = (r.user_id, r.asset.upper())
+                credits[key] = credits.get(key, Decimal("0")) + r.tx.amount
+        if credits:
+            await self.credit_balances(credits)
+
+        for result, original in repeats:
+            result.deposit_id = original.deposit_id
+        return results
+
     # Swap operations
     async def create_swap(
         self,
@@ -389,6 +706,30 @@ class LedgerRepository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_popular_swap_pairs(
+        self, since: Optional[datetime] = None, limit: int = 10
+    ) -> list[tuple[str, str, str, int]]:
+        """Most swapped pairs per route.
+
+        Args:
+            since: Only count swaps created after this time
+            limit: Max rows
+
+        Returns:
+            (from_asset, to_asset, route, swap_count) rows, most swapped first
+        """
+        count = func.count(Swap.id).label("swap_count")
+        stmt = select(Swap.from_asset, Swap.to_asset, Swap.route, count)
+        if since is not None:
+            stmt = stmt.where(Swap.created_at >= since)
+        stmt = (
+            stmt.group_by(Swap.from_asset, Swap.to_asset, Swap.route)
+            .order_by(count.desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return [tuple(row) for row in result.all()]
+
     async def get_swap_by_id(self, swap_id: int) -> Optional[Swap]:
         """Get a swap by ID."""
         stmt = select(Swap).where(Swap.id == swap_id)
@@ -422,19 +763,183 @@ class LedgerRepository:
             await self.session.flush()
             return next_index
 
+    async def reserve_hd_index_range(self, asset: str, count: int) -> int:
+        """Reserve ``count`` consecutive HD indexes for an asset.
+
+        Advances the same counter as get_next_hd_index, so addresses
+        derived from the reserved range never collide with on-demand ones.
+
+        Returns:
+            First reserved index
+        """
+        state = await self.get_hd_wallet_state(asset)
+
+        if state is None:
+            state = HDWalletState(asset=asset.upper(), last_index=count - 1)
+            self.session.add(state)
+            await self.session.flush()
+            return 0
+
+        start = state.last_index + 1
+        state.last_index = state.last_index + count
+        await self.session.flush()
+        return start
+
+    # Address pool operations
+    async def add_pooled_addresses(
+        self, asset: str, addresses: list, xpub_fingerprint: str
+    ) -> int:
+        """Store pre-derived addresses (AddressInfo-like objects) in the pool.
+
+        ``xpub_fingerprint`` identifies the xpub they were derived from
+        (``HDWalletProvider.xpub_fingerprint``).
+        """
+        rows = [
+            PooledAddress(
+                asset=asset.upper(),
+                address=info.address,
+                derivation_path=info.derivation_path,
+                derivation_index=info.index,
+                change=info.change,
+                xpub_fingerprint=xpub_fingerprint,
+            )
+            for info in addresses
+        ]
+        self.session.add_all(rows)
+        await self.session.flush()
+        return len(rows)
+
+    async def claim_pooled_address(
+        self, asset: str, xpub_fingerprint: str
+    ) -> Optional[PooledAddress]:
+        """Take the lowest-index available pooled address for an asset.
+
+        Picks and marks the row in one ``UPDATE ... RETURNING`` statement,
+        so two concurrent claimers can never be handed the same address.
+        Only addresses derived from the current xpub (``xpub_fingerprint``)
+        are handed out; ones a refill stored after a key rotation are not.
+        """
+        next_available = (
+            select(PooledAddress.id)
+            .where(
+                PooledAddress.asset == asset.upper(),
+                PooledAddress.status == "available",
+                PooledAddress.xpub_fingerprint == xpub_fingerprint,
+            )
+            .order_by(PooledAddress.derivation_index)
+            .limit(1)
+        )
+
+        dialect = self.session.bind.dialect.name if self.session.bind else "sqlite"
+        if dialect == "postgresql":
+            # Concurrent claimers skip rows another transaction is taking
+            next_available = next_available.with_for_update(skip_locked=True)
+
+        stmt = (
+            update(PooledAddress)
+            .where(
+                PooledAddress.id == next_available.scalar_subquery(),
+                PooledAddress.status == "available",
+            )
+            .values(status="assigned")
+            .returning(PooledAddress)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def count_pooled_addresses(
+        self, asset: str, xpub_fingerprint: Optional[str] = None
+    ) -> int:
+        """Count available pooled addresses for an asset (from one xpub, if given)."""
+        stmt = select(func.count()).select_from(PooledAddress).where(
+            PooledAddress.asset == asset.upper(), PooledAddress.status == "available"
+        )
+        if xpub_fingerprint is not None:
+            stmt = stmt.where(PooledAddress.xpub_fingerprint == xpub_fingerprint)
+        result = await self.session.execute(stmt)
+        return int(result.scalar_one())
+
+    async def discard_pooled_addresses(
+        self, asset: str, keep_fingerprint: Optional[str] = None
+    ) -> int:
+        """Drop unassigned pooled addresses (e.g. after the xpub changes).
+
+        With ``keep_fingerprint``, addresses derived from that xpub are kept.
+        """
+        stmt = delete(PooledAddress).where(
+            PooledAddress.asset == asset.upper(), PooledAddress.status == "available"
+        )
+        if keep_fingerprint is not None:
+            stmt = stmt.where(
+                or_(
+                    PooledAddress.xpub_fingerprint.is_(None),
+                    PooledAddress.xpub_fingerprint != keep_fingerprint,
+                )
+            )
+        result = await self.session.execute(stmt)
+        await self.session.flush()
+        return result.rowcount or 0
+
     async def get_all_active_deposit_addresses(
-        self, asset: Optional[str] = None
+        self, asset: Optional[str] = None, after_id: Optional[int] = None
     ) -> list[DepositAddress]:
         """Get all active deposit addresses, optionally filtered by asset.
 
         Used by the deposit scanner to monitor for incoming transactions.
+        ``after_id`` limits the result to rows inserted after that id, for
+        incremental refreshes of the scanner's address index.
         """
-        stmt = select(DepositAddress).where(DepositAddress.status == "active")
+        stmt = select(DepositAddress).where(DepositAddress.status == _inline("active"))
         if asset:
             stmt = stmt.where(DepositAddress.asset == asset.upper())
+        if after_id is not None:
+            stmt = stmt.where(DepositAddress.id > after_id).order_by(DepositAddress.id)
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    # Scanner cursor operations
+    async def get_scan_cursors(self, asset: str) -> dict[str, ScanCursor]:
+        """Get all scan cursors for an asset, keyed by address."""
+        stmt = select(ScanCursor).where(ScanCursor.asset == asset.upper())
+        result = await self.session.execute(stmt)
+        return {cursor.address: cursor for cursor in result.scalars().all()}
+
+    async def save_scan_cursors(
+        self, asset: str, positions: dict[str, tuple[int, Optional[str]]]
+    ) -> None:
+        """Create or advance scan cursors.
+
+        Args:
+            asset: Scanner asset
+            positions: address -> (block_height, last_txid)
+        """
+        if not positions:
+            return
+
+        stmt = select(ScanCursor).where(
+            ScanCursor.asset == asset.upper(),
+            ScanCursor.address.in_(list(positions)),
+        )
+        result = await self.session.execute(stmt)
+        existing = {cursor.address: cursor for cursor in result.scalars().all()}
+
+        for address, (block_height, last_txid) in positions.items():
+            cursor = existing.get(address)
+            if cursor is None:
+                self.session.add(ScanCursor(
+                    asset=asset.upper(),
+                    address=address,
+                    block_height=block_height,
+                    last_txid=last_txid,
+                ))
+            elif block_height >= cursor.block_height:
+                cursor.block_height = block_height
+                if last_txid:
+                    cursor.last_txid = last_txid
+
+        await self.session.flush()
+
     # Xpub Key operations
     async def store_xpub(
         self,
@@ -477,6 +982,12 @@ class LedgerRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_xpub_version(self) -> str:
+        """Digest of the stored xpubs, to notice changes made by other processes."""
+        stmt = select(XpubKey.asset, XpubKey.encrypted_xpub).order_by(XpubKey.asset)
+        result = await self.session.execute(stmt)
+        return xpub_version(result.all())
+
     async def get_all_xpubs(self) -> list[XpubKey]:
         """Get all stored xpub keys."""
         stmt = select(XpubKey).order_by(XpubKey.asset)
@@ -501,8 +1012,6 @@ class LedgerRepository:
         Uses SELECT FOR UPDATE to prevent race conditions.
         For SQLite, falls back to regular select (SQLite has implicit locking).
         """
-        from sqlalchemy.dialects import postgresql
-
         # Check if we're using PostgreSQL
         dialect = self.session.bind.dialect.name if self.session.bind else "sqlite"
 
@@ -572,6 +1081,23 @@ class LedgerRepository:
         await self.session.flush()
         return processed
 
+    async def get_processed_tx_hashes(
+        self, chain: str, limit: Optional[int] = None
+    ) -> list[str]:
+        """Get processed transaction hashes for a chain, newest first.
+
+        Used to warm the scanners' in-memory seen-transaction set.
+        """
+        stmt = (
+            select(ProcessedTransaction.tx_hash)
+            .where(ProcessedTransaction.chain == chain.upper())
+            .order_by(ProcessedTransaction.id.desc())
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def get_processed_transaction(
         self, chain: str, tx_hash: str, tx_index: int = 0
     ) -> Optional[ProcessedTransaction]:
@@ -587,12 +1113,13 @@ class LedgerRepository:
     # Balance update (for withdrawals)
     async def update_balance(self, user_id: int, asset: str, delta: Decimal) -> Balance:
         """Update balance by delta (positive for credit, negative for debit)."""
-        balance = await self.get_or_create_balance(user_id, asset)
-        new_amount = balance.amount + delta
-        if new_amount < 0:
+        if delta >= 0:
+            return await self._upsert_balance(user_id, asset, delta)
+        balance = await self._update_balance_where(
+            user_id, asset, {"amount": Balance.amount + delta}, Balance.amount + delta >= 0
+        )
+        if balance is None:
             raise ValueError(f"Insufficient balance for {asset}")
-        balance.amount = new_amount
-        await self.session.flush()
         return balance
 
     # Withdrawal operations
@@ -745,7 +1272,7 @@ class LedgerRepository:
         """Get all pending withdrawals (for processing)."""
         stmt = (
             select(Withdrawal)
-            .where(Withdrawal.status == WithdrawalStatus.PENDING)
+            .where(Withdrawal.status == _inline(WithdrawalStatus.PENDING.value))
             .order_by(Withdrawal.created_at)
         )
         result = await self.session.execute(stmt)
@@ -756,10 +1283,10 @@ class LedgerRepository:
         stmt = (
             select(Withdrawal)
             .where(
-                Withdrawal.status.in_([
-                    WithdrawalStatus.BROADCAST,
-                    WithdrawalStatus.CONFIRMING,
-                ])
+                Withdrawal.status.in_(_inline([
+                    WithdrawalStatus.BROADCAST.value,
+                    WithdrawalStatus.CONFIRMING.value,
+                ]))
             )
             .order_by(Withdrawal.broadcast_at)
         )
@@ -13,7 +13,9 @@ from swaperex.api.app import create_app
 from swaperex.bot.bot import create_bot
 from swaperex.config import get_settings, ExecutionMode
 from swaperex.ledger.database import close_db, init_db
+from swaperex.routing.ladder import get_quote_ladder
 from swaperex.safety import print_startup_banner, setup_safety_guards
+from swaperex.utils.http import close_http_clients
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +54,9 @@ class Application:
         # Load xpubs from database BEFORE starting services
         await self._load_xpubs()
 
+        # Derive wallet keys once up front instead of on the first request
+        self._warm_key_store()
+
         # Create tasks for bot and API
         tasks = []
 
@@ -60,6 +65,10 @@ class Application:
             self.bot, self.dp = create_bot()
             tasks.append(asyncio.create_task(self._run_bot()))
             logger.info("Bot task created")
+
+            # Keep quote ladders for popular pairs warm for the bot
+            if self.settings.quote_ladder_enabled:
+                get_quote_ladder().start()
         else:
             logger.warning("TELEGRAM_BOT_TOKEN not set - bot disabled")
 
@@ -112,30 +121,28 @@ class Application:
             raise
 
     async def _load_xpubs(self):
-        """Load xpubs from database into environment variables."""
-        import os
-        from swaperex.crypto import decrypt_xpub
-        from swaperex.hdwallet.factory import reset_wallet_cache
-        from swaperex.ledger.database import get_db
-        from swaperex.ledger.repository import LedgerRepository
+        """Preload and decrypt xpubs from the database."""
+        from swaperex.hdwallet.factory import preload_xpubs
 
         try:
-            async with get_db() as session:
-                repo = LedgerRepository(session)
-                xpubs = await repo.get_all_xpubs()
-
-                for xpub_record in xpubs:
-                    xpub_value = decrypt_xpub(xpub_record.encrypted_xpub)
-                    env_key = f"XPUB_{xpub_record.asset.upper()}"
-                    os.environ[env_key] = xpub_value
-                    logger.info(f"Loaded xpub for {xpub_record.asset}")
-
-                if xpubs:
-                    reset_wallet_cache()
-                    logger.info(f"Loaded {len(xpubs)} xpubs from database")
+            count = await preload_xpubs()
+            if count:
+                logger.info(f"Loaded {count} xpubs from database")
         except Exception as e:
             logger.warning(f"Failed to load xpubs: {e}")
 
+    def _warm_key_store(self):
+        """Build the cached key store (custodial mode only)."""
+        if not self.settings.is_custodial_mode:
+            return
+
+        from swaperex.services.key_store import warm_key_store
+
+        try:
+            warm_key_store()
+        except Exception as e:
+            logger.warning(f"Failed to initialize key store: {e}")
+
     async def _cleanup(self):
         """Cleanup resources."""
         logger.info("Cleaning up...")
@@ -143,6 +150,14 @@ class Application:
         if self.bot:
             await self.bot.session.close()
 
+        await get_quote_ladder().stop()
+
+        if self.settings.is_custodial_mode:
+            from swaperex.services.key_store import wipe_key_stores
+
+            wipe_key_stores()
+
+        await close_http_clients()
         await close_db()
         logger.info("Cleanup complete")
 
@@ -0,0 +1,22 @@
+"""Shared USD price oracle."""
+
+from swaperex.prices.oracle import (
+    PriceEntry,
+    PriceOracle,
+    PriceView,
+    get_price_oracle,
+    reset_price_oracle,
+)
+from swaperex.prices.seed import SEED_PRICES_USD
+from swaperex.prices.sources import PriceSource, create_price_sources
+
+__all__ = [
+    "PriceEntry",
+    "PriceOracle",
+    "PriceView",
+    "PriceSource",
+    "SEED_PRICES_USD",
+    "create_price_sources",
+    "get_price_oracle",
+    "reset_price_oracle",
+]
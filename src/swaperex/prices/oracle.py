@@ -0,0 +1,330 @@
+"""Shared in-memory USD price table.
+
+PriceOracle holds one ``PriceEntry`` per symbol and answers lookups from
+memory, so quoting, balance totals and admin reports never wait on a
+price API. The table is kept current in the background:
+
+- every ``refresh_interval`` seconds all configured sources are polled
+  concurrently;
+- sources that can push (``PriceSource.supports_push``) also stream
+  updates as they happen, and are not polled while their stream is live.
+
+Each entry records its source and update time, so callers can ask for a
+price no older than some age, and admins can see which symbols are stale.
+The table starts filled with ``SEED_PRICES_USD``, marked as never
+updated (always stale).
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Iterator, Optional
+
+from swaperex.prices.seed import SEED_PRICES_USD
+from swaperex.prices.sources import PriceSource
+
+logger = logging.getLogger(__name__)
+
+SEED_SOURCE = "seed"
+
+# Symbols quoted under more than one name
+SYMBOL_ALIASES = {
+    "BSC": "BNB",
+    "POL": "MATIC",
+    "WETH": "ETH",
+    "WBTC": "BTC",
+    "BTCB": "BTC",
+    "WBNB": "BNB",
+    "WMATIC": "MATIC",
+    "USDC.AXL": "USDC",
+}
+
+
+@dataclass
+class PriceEntry:
+    """Latest USD price of one symbol."""
+
+    symbol: str
+    price_usd: Decimal
+    source: str
+    updated_at: float  # epoch seconds; 0 for seed prices
+
+    @property
+    def age(self) -> float:
+        """Seconds since the price was updated."""
+        return time.time() - self.updated_at
+
+    def to_dict(self, max_age: float) -> dict:
+        return {
+            "symbol": self.symbol,
+            "price_usd": str(self.price_usd),
+            "source": self.source,
+            "age_seconds": round(self.age, 1) if self.updated_at else None,
+            "stale": self.age > max_age,
+        }
+
+
+class PriceOracle:
+    """Background-refreshed USD price table."""
+
+    def __init__(
+        self,
+        sources: Optional[list[PriceSource]] = None,
+        refresh_interval: float = 60.0,
+        max_age: float = 300.0,
+        push: bool = True,
+        seed: Optional[dict[str, Decimal]] = None,
+    ):
+        """Initialize the table.
+
+        Args:
+            sources: Price sources, polled concurrently
+            refresh_interval: Seconds between polls
+            max_age: Age after which a price counts as stale
+            push: Run streaming updates for sources that support them
+            seed: Initial (stale) prices; defaults to SEED_PRICES_USD
+        """
+        self.sources = sources or []
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.push = push
+        self._prices: dict[str, PriceEntry] = {}
+        self._last_push: dict[str, float] = {}
+        self._tasks: list[asyncio.Task] = []
+        for symbol, price in (SEED_PRICES_USD if seed is None else seed).items():
+            self._prices[symbol.upper()] = PriceEntry(symbol.upper(), price, SEED_SOURCE, 0.0)
+
+    # ----- lookups -----
+
+    def _key(self, symbol: str) -> str:
+        symbol = symbol.upper()
+        if symbol not in self._prices:
+            symbol = SYMBOL_ALIASES.get(symbol, symbol)
+        return symbol
+
+    def get(self, symbol: str) -> Optional[PriceEntry]:
+        """Entry for a symbol (aliases resolved), if any."""
+        return self._prices.get(self._key(symbol))
+
+    def get_price(self, symbol: str, max_age: Optional[float] = None) -> Optional[Decimal]:
+        """USD price of a symbol.
+
+        Args:
+            symbol: Asset symbol
+            max_age: Only return prices updated within this many seconds
+                (None = any price, including seed values)
+        """
+        entry = self.get(symbol)
+        if entry is None or (max_age is not None and entry.age > max_age):
+            return None
+        return entry.price_usd
+
+    def get_fresh_price(self, symbol: str) -> Optional[Decimal]:
+        """USD price updated within ``max_age``."""
+        return self.get_price(symbol, max_age=self.max_age)
+
+    def usd_value(
+        self, symbol: str, amount: Decimal, max_age: Optional[float] = None
+    ) -> Optional[Decimal]:
+        """USD value of an amount (None if the price is unknown)."""
+        price = self.get_price(symbol, max_age)
+        return amount * price if price is not None else None
+
+    def is_stale(self, symbol: str) -> bool:
+        entry = self.get(symbol)
+        return entry is None or entry.age > self.max_age
+
+    def symbols(self) -> list[str]:
+        """Symbols with a price, in insertion order."""
+        return list(self._prices)
+
+    def __contains__(self, symbol: object) -> bool:
+        return isinstance(symbol, str) and self.get(symbol) is not None
+
+    def staleness(self) -> list[dict]:
+        """Per-symbol source, age and staleness (for admin reports)."""
+        return [entry.to_dict(self.max_age) for entry in self._prices.values()]
+
+    # ----- updates -----
+
+    def update(
+        self,
+        symbol: str,
+        price: Decimal,
+        source: str,
+        timestamp: Optional[float] = None,
+    ) -> bool:
+        """Store a price unless it is invalid or older than the current one.
+
+        Returns:
+            Whether the table changed
+        """
+        if price is None or price <= 0:
+            return False
+        symbol = symbol.upper()
+        timestamp = time.time() if timestamp is None else timestamp
+        current = self._prices.get(symbol)
+        if current is not None and current.updated_at > timestamp:
+            return False
+        self._prices[symbol] = PriceEntry(symbol, price, source, timestamp)
+        return True
+
+    def update_many(
+        self, prices: dict[str, Decimal], source: str, timestamp: Optional[float] = None
+    ) -> int:
+        """Store several prices from one source; returns how many changed."""
+        return sum(self.update(s, p, source, timestamp) for s, p in prices.items())
+
+    async def refresh(self) -> int:
+        """Poll every source once (skipping live push streams).
+
+        Returns:
+            Number of prices updated
+        """
+        now = time.time()
+        polled = [
+            source for source in self.sources
+            if now - self._last_push.get(source.name, 0) > self.refresh_interval
+        ]
+        results = await asyncio.gather(*(s.fetch() for s in polled), return_exceptions=True)
+
+        updated = 0
+        for source, result in zip(polled, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Price source {source.name} failed: {result}")
+                continue
+            updated += self.update_many(result, source.name)
+        logger.debug(f"Price refresh updated {updated} prices from {len(polled)} sources")
+        return updated
+
+    def _on_push(self, source: PriceSource):
+        def publish(prices: dict[str, Decimal]) -> None:
+            self._last_push[source.name] = time.time()
+            self.update_many(prices, source.name)
+
+        return publish
+
+    # ----- background tasks -----
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    async def start(self) -> None:
+        """Start background polling (and push streams); returns after the first poll."""
+        if self.running:
+            return
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.warning(f"Initial price refresh failed: {e}")
+        self._tasks.append(asyncio.create_task(self._poll_loop()))
+        if self.push:
+            for source in self.sources:
+                if source.supports_push:
+                    self._tasks.append(asyncio.create_task(self._stream_loop(source)))
+        logger.info(
+            f"Price oracle started with {', '.join(s.name for s in self.sources) or 'no'} sources"
+        )
+
+    async def stop(self) -> None:
+        """Cancel background tasks."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _poll_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"Price refresh failed: {e}")
+
+    async def _stream_loop(self, source: PriceSource) -> None:
+        """Keep a push stream connected, reconnecting with backoff."""
+        backoff = 1.0
+        while True:
+            connected_at = time.monotonic()
+            try:
+                await source.stream(self._on_push(source))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Price stream {source.name} disconnected: {e}")
+            self._last_push.pop(source.name, None)  # poll it until the stream is back
+            if time.monotonic() - connected_at > 60:
+                backoff = 1.0
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 60.0)
+
+
+class PriceView:
+    """Mapping-style view of the oracle with local overrides.
+
+    Lets code that used to hold its own price dict (the dry-run routers)
+    read the shared table while keeping per-instance ``set_price``.
+    """
+
+    def __init__(self, oracle: Optional[PriceOracle] = None):
+        self._oracle = oracle
+        self._overrides: dict[str, Decimal] = {}
+
+    @property
+    def oracle(self) -> PriceOracle:
+        return self._oracle if self._oracle is not None else get_price_oracle()
+
+    def get(self, symbol: str, default: Optional[Decimal] = None) -> Optional[Decimal]:
+        symbol = symbol.upper()
+        if symbol in self._overrides:
+            return self._overrides[symbol]
+        price = self.oracle.get_price(symbol)
+        return price if price is not None else default
+
+    def __getitem__(self, symbol: str) -> Decimal:
+        price = self.get(symbol)
+        if price is None:
+            raise KeyError(symbol)
+        return price
+
+    def __setitem__(self, symbol: str, price: Decimal) -> None:
+        self._overrides[symbol.upper()] = price
+
+    def __contains__(self, symbol: object) -> bool:
+        return isinstance(symbol, str) and self.get(symbol) is not None
+
+    def keys(self) -> list[str]:
+        symbols = self.oracle.symbols()
+        return symbols + [s for s in self._overrides if s not in symbols]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+
+_oracle: Optional[PriceOracle] = None
+
+
+def get_price_oracle() -> PriceOracle:
+    """Get the process-wide price oracle, configured from settings."""
+    global _oracle
+    if _oracle is None:
+        from swaperex.config import get_settings
+        from swaperex.prices.sources import create_price_sources
+
+        settings = get_settings()
+        _oracle = PriceOracle(
+            sources=create_price_sources(settings.price_sources),
+            refresh_interval=settings.price_refresh_interval,
+            max_age=settings.price_max_age,
+            push=settings.price_push_enabled,
+        )
+    return _oracle
+
+
+def reset_price_oracle() -> None:
+    """Drop the oracle (useful for testing)."""
+    global _oracle
+    _oracle = None
@@ -0,0 +1,128 @@
+"""Seed USD prices for the price oracle.
+
+Approximate December 2024 values. They fill the price table before any
+live source has answered and are reported as stale from the start, so
+dry-run quotes work offline. Not for real trading.
+"""
+
+from decimal import Decimal
+
+SEED_PRICES_USD: dict[str, Decimal] = {
+    # ========== Major Cryptocurrencies ==========
+    "BTC": Decimal("100000.00"),
+    "ETH": Decimal("3900.00"),
+    "LTC": Decimal("115.00"),
+    "DASH": Decimal("48.00"),
+    "BCH": Decimal("480.00"),
+    "DOGE": Decimal("0.42"),
+    "ZEC": Decimal("62.00"),
+    "XMR": Decimal("195.00"),
+
+    # ========== Layer 1 Blockchains ==========
+    "SOL": Decimal("225.00"),
+    "TRX": Decimal("0.27"),
+    "BNB": Decimal("710.00"),
+    "BSC": Decimal("710.00"),  # Alias for BNB
+    "AVAX": Decimal("52.00"),
+    "DOT": Decimal("9.50"),
+    "MATIC": Decimal("0.62"),
+    "POL": Decimal("0.62"),  # Polygon renamed
+    "FTM": Decimal("1.05"),
+    "NEAR": Decimal("7.20"),
+    "ALGO": Decimal("0.45"),
+    "ATOM": Decimal("12.50"),
+    "XRP": Decimal("2.35"),
+    "XLM": Decimal("0.45"),
+    "TON": Decimal("6.80"),
+    "KAS": Decimal("0.15"),
+    "ICP": Decimal("13.50"),
+    "EGLD": Decimal("48.00"),
+    "HBAR": Decimal("0.29"),
+    "VET": Decimal("0.052"),
+    "ROSE": Decimal("0.12"),
+
+    # ========== Stablecoins ==========
+    "USDT": Decimal("1.00"),
+    "USDC": Decimal("1.00"),
+    "BUSD": Decimal("1.00"),
+    "DAI": Decimal("1.00"),
+    "TUSD": Decimal("1.00"),
+    "USDJ": Decimal("1.00"),
+    "FDUSD": Decimal("1.00"),
+
+    # ========== DeFi & Ecosystem Tokens ==========
+    "RUNE": Decimal("6.80"),
+    "LINK": Decimal("28.00"),
+    "UNI": Decimal("17.50"),
+    "AAVE": Decimal("185.00"),
+    "MKR": Decimal("1850.00"),
+    "COMP": Decimal("95.00"),
+    "SNX": Decimal("3.20"),
+    "CRV": Decimal("1.10"),
+    "SUSHI": Decimal("1.85"),
+    "1INCH": Decimal("0.52"),
+    "GRT": Decimal("0.32"),
+    "ENS": Decimal("38.00"),
+    "LDO": Decimal("2.40"),
+    "YFI": Decimal("9500.00"),
+    "BAL": Decimal("3.80"),
+    "OMG": Decimal("0.65"),
+
+    # ========== BNB Chain (PancakeSwap) Tokens ==========
+    "CAKE": Decimal("2.80"),
+    "BTCB": Decimal("100000.00"),
+    "XVS": Decimal("8.50"),
+    "ALPACA": Decimal("0.22"),
+    "FLOKI": Decimal("0.00022"),
+    "BABYDOGE": Decimal("0.0000000028"),
+    "GMT": Decimal("0.22"),
+    "SFP": Decimal("0.85"),
+
+    # ========== Solana (Jupiter) Tokens ==========
+    "RAY": Decimal("5.20"),
+    "SRM": Decimal("0.035"),
+    "ORCA": Decimal("4.80"),
+    "JUP": Decimal("1.25"),
+    "BONK": Decimal("0.000035"),
+    "WIF": Decimal("3.20"),
+    "PYTH": Decimal("0.48"),
+    "SAMO": Decimal("0.028"),
+    "MNDE": Decimal("0.15"),
+    "HNT": Decimal("8.50"),
+
+    # ========== Cosmos (Osmosis) Tokens ==========
+    "OSMO": Decimal("1.15"),
+    "JUNO": Decimal("0.45"),
+    "SCRT": Decimal("0.52"),
+    "INJ": Decimal("42.00"),
+    "TIA": Decimal("8.50"),
+    "STARS": Decimal("0.015"),
+    "AKT": Decimal("3.50"),
+
+    # ========== Tron (SunSwap) Tokens ==========
+    "BTT": Decimal("0.0000012"),
+    "JST": Decimal("0.038"),
+    "SUN": Decimal("0.022"),
+    "WIN": Decimal("0.00012"),
+    "NFT": Decimal("0.0000005"),
+
+    # ========== Meme & Other Tokens ==========
+    "PEPE": Decimal("0.000022"),
+    "SHIB": Decimal("0.000028"),
+    "LRC": Decimal("0.28"),
+    "BAT": Decimal("0.28"),
+    "ZRX": Decimal("0.62"),
+    "WBTC": Decimal("100000.00"),
+
+    # ========== UTXO Coins ==========
+    "DGB": Decimal("0.018"),
+    "RVN": Decimal("0.028"),
+    "BTG": Decimal("32.00"),
+    "NMC": Decimal("1.80"),
+    "VIA": Decimal("0.35"),
+    "SYS": Decimal("0.15"),
+    "KMD": Decimal("0.38"),
+    "XEC": Decimal("0.000048"),
+    "MONA": Decimal("0.62"),
+    "FIO": Decimal("0.032"),
+}
@@ -0,0 +1,236 @@
+"""Upstream USD price sources for the price oracle.
+
+Each source returns every price it knows in one request (``fetch``), so a
+refresh costs one call per source rather than one per symbol per quote.
+Sources with a streaming API also implement ``stream``.
+"""
+
+import json
+import logging
+from abc import ABC, abstractmethod
+from decimal import Decimal, InvalidOperation
+from typing import Callable, Optional
+
+from swaperex.utils.http import pooled_client
+
+logger = logging.getLogger(__name__)
+
+PricePublisher = Callable[[dict[str, Decimal]], None]
+
+USD_STABLES = {"USDT", "USDC", "BUSD", "DAI", "TUSD", "USDJ", "FDUSD"}
+
+
+def _decimal(value) -> Optional[Decimal]:
+    try:
+        price = Decimal(str(value))
+    except (InvalidOperation, TypeError, ValueError):
+        return None
+    return price if price > 0 else None
+
+
+class PriceSource(ABC):
+    """Source of USD prices keyed by symbol."""
+
+    supports_push = False
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Source name (recorded on each price)."""
+        pass
+
+    @abstractmethod
+    async def fetch(self) -> dict[str, Decimal]:
+        """Fetch all current prices."""
+        pass
+
+    async def stream(self, publish: PricePublisher) -> None:
+        """Push price updates until the connection drops.
+
+        Only called when ``supports_push`` is set.
+        """
+        raise NotImplementedError
+
+
+class CoinGeckoSource(PriceSource):
+    """CoinGecko simple price API."""
+
+    IDS = {
+        "BTC": "bitcoin",
+        "ETH": "ethereum",
+        "LTC": "litecoin",
+        "DASH": "dash",
+        "BCH": "bitcoin-cash",
+        "DOGE": "dogecoin",
+        "SOL": "solana",
+        "TRX": "tron",
+        "BNB": "binancecoin",
+        "AVAX": "avalanche-2",
+        "DOT": "polkadot",
+        "MATIC": "matic-network",
+        "ATOM": "cosmos",
+        "OSMO": "osmosis",
+        "NEAR": "near",
+        "TON": "the-open-network",
+        "RUNE": "thorchain",
+        "XRP": "ripple",
+        "ADA": "cardano",
+        "LINK": "chainlink",
+        "UNI": "uniswap",
+        "USDT": "tether",
+        "USDC": "usd-coin",
+        "DAI": "dai",
+    }
+
+    def __init__(self, base_url: str = "https://api.coingecko.com/api/v3"):
+        self.base_url = base_url
+
+    @property
+    def name(self) -> str:
+        return "coingecko"
+
+    async def fetch(self) -> dict[str, Decimal]:
+        async with pooled_client(timeout=10.0) as client:
+            response = await client.get(
+                f"{self.base_url}/simple/price",
+                params={"ids": ",".join(self.IDS.values()), "vs_currencies": "usd"},
+            )
+        response.raise_for_status()
+        data = response.json()
+
+        prices = {}
+        for symbol, coin_id in self.IDS.items():
+            price = _decimal(data.get(coin_id, {}).get("usd"))
+            if price is not None:
+                prices[symbol] = price
+        return prices
+
+
+class BinanceSource(PriceSource):
+    """Binance spot prices of USDT pairs, with websocket push.
+
+    Pushing needs the ``websockets`` package; without it the source is
+    polled like any other.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://api.binance.com",
+        stream_url: str = "wss://stream.binance.com:9443/ws/!miniTicker@arr",
+    ):
+        self.base_url = base_url
+        self.stream_url = stream_url
+        try:
+            import websockets  # noqa: F401
+
+            self.supports_push = True
+        except ImportError:
+            self.supports_push = False
+
+    @property
+    def name(self) -> str:
+        return "binance"
+
+    @staticmethod
+    def _parse(pairs: list[tuple[str, object]]) -> dict[str, Decimal]:
+        prices = {}
+        for pair, value in pairs:
+            if not pair.endswith("USDT") or len(pair) <= 4:
+                continue
+            price = _decimal(value)
+            if price is not None:
+                prices[pair[:-4]] = price
+        if prices:
+            prices["USDT"] = Decimal("1")
+        return prices
+
+    async def fetch(self) -> dict[str, Decimal]:
+        async with pooled_client(timeout=10.0) as client:
+            response = await client.get(f"{self.base_url}/api/v3/ticker/price")
+        response.raise_for_status()
+        return self._parse([(t.get("symbol", ""), t.get("price")) for t in response.json()])
+
+    async def stream(self, publish: PricePublisher) -> None:
+        import websockets
+
+        async with websockets.connect(self.stream_url, ping_interval=20) as ws:
+            logger.info("Binance price stream connected")
+            async for message in ws:
+                tickers = json.loads(message)
+                prices = self._parse([(t.get("s", ""), t.get("c")) for t in tickers])
+                if prices:
+                    publish(prices)
+
+
+class RefFinanceSource(PriceSource):
+    """Ref Finance indexer token prices (NEAR ecosystem)."""
+
+    def __init__(self, base_url: str = "https://indexer.ref.finance"):
+        self.base_url = base_url
+
+    @property
+    def name(self) -> str:
+        return "ref_finance"
+
+    async def fetch(self) -> dict[str, Decimal]:
+        from swaperex.routing.ref_finance import NEAR_TOKENS
+
+        async with pooled_client(timeout=10.0) as client:
+            response = await client.get(f"{self.base_url}/list-token-price")
+        response.raise_for_status()
+        data = response.json()
+
+        prices = {}
+        for symbol, token_id in NEAR_TOKENS.items():
+            price = _decimal(data.get(token_id, {}).get("price"))
+            if price is not None:
+                prices[symbol] = price
+        return prices
+
+
+class SunIoTickerSource(PriceSource):
+    """Sun.io market tickers quoted in USDT (Tron ecosystem)."""
+
+    def __init__(self, base_url: str = "https://api.sun.io"):
+        self.base_url = base_url
+
+    @property
+    def name(self) -> str:
+        return "sunio"
+
+    async def fetch(self) -> dict[str, Decimal]:
+        async with pooled_client(timeout=10.0) as client:
+            response = await client.get(f"{self.base_url}/v1/market/tickers")
+        response.raise_for_status()
+        tickers = response.json().get("data", {}).get("tickers", [])
+
+        prices = {}
+        for ticker in tickers:
+            if ticker.get("quote_currency", "").upper() != "USDT":
+                continue
+            price = _decimal(ticker.get("last_price"))
+            if price is not None:
+                prices[ticker.get("base_currency", "").upper()] = price
+        return prices
+
+
+SOURCES: dict[str, type[PriceSource]] = {
+    "binance": BinanceSource,
+    "coingecko": CoinGeckoSource,
+    "ref_finance": RefFinanceSource,
+    "sunio": SunIoTickerSource,
+}
+
+
+def create_price_sources(names: str) -> list[PriceSource]:
+    """Build sources from a comma-separated list of names."""
+    sources = []
+    for name in (n.strip().lower() for n in names.split(",")):
+        if not name:
+            continue
+        source_cls = SOURCES.get(name)
+        if source_cls is None:
+            logger.warning(f"Unknown price source: {name}")
+            continue
+        sources.append(source_cls())
+    return sources
@@ -1,10 +1,9 @@
 """CryptoAPIs deposit address provider."""
 
-import httpx
-
 from swaperex.config import get_settings
 from swaperex.providers.base import Address, ProviderAdapter
 from swaperex.providers.dryrun import DryRunProvider
+from swaperex.utils.http import pooled_client
 
 
 class CryptoAPIsProvider(ProviderAdapter):
@@ -51,7 +50,7 @@ class CryptoAPIsProvider(ProviderAdapter):
             return False
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client(timeout=5.0) as client:
                 response = await client.get(
                     f"{self.base_url}/v2/market-data/assets",
                     headers={"X-API-Key": self.api_key},
@@ -87,7 +86,7 @@ class CryptoAPIsProvider(ProviderAdapter):
         blockchain, network = chain_map[asset_upper]
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client(timeout=5.0) as client:
                 # Generate new address
                 # Note: CryptoAPIs requires a wallet ID - this is simplified
                 url = f"{self.base_url}/v2/wallet-as-a-service/wallets/generate-deposit-address"
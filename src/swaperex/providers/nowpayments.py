@@ -1,10 +1,9 @@
 """NOWPayments deposit address provider."""
 
-import httpx
-
 from swaperex.config import get_settings
 from swaperex.providers.base import Address, ProviderAdapter
 from swaperex.providers.dryrun import DryRunProvider
+from swaperex.utils.http import pooled_client
 
 
 class NowPaymentsProvider(ProviderAdapter):
@@ -34,7 +33,7 @@ class NowPaymentsProvider(ProviderAdapter):
             return False
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client(timeout=5.0) as client:
                 response = await client.get(
                     f"{self.base_url}/status",
                     headers={"x-api-key": self.api_key},
@@ -64,7 +63,7 @@ class NowPaymentsProvider(ProviderAdapter):
             return await self._fallback.create_deposit_address(user_id, asset)
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with pooled_client(timeout=5.0) as client:
                 # Create payment/deposit address
                 url = f"{self.base_url}/payment"
                 response = await client.post(
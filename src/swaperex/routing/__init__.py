@@ -1,15 +1,28 @@
 """Routing module for swap quote aggregation."""
 
-from swaperex.routing.base import Quote, RouteAggregator, RouteProvider, SwapRoute
+from swaperex.routing.base import (
+    Quote,
+    QuoteCollection,
+    RouteAggregator,
+    RouteProvider,
+    SwapRoute,
+)
+from swaperex.routing.cache import QuoteCache, get_quote_cache
 from swaperex.routing.dry_run import DryRunRouter
 from swaperex.routing.factory import create_aggregator, create_production_aggregator
+from swaperex.routing.registry import get_chain_aggregator, get_provider_registry
 
 __all__ = [
     "Quote",
+    "QuoteCollection",
     "SwapRoute",
     "RouteProvider",
     "RouteAggregator",
+    "QuoteCache",
+    "get_quote_cache",
     "DryRunRouter",
     "create_aggregator",
     "create_production_aggregator",
+    "get_chain_aggregator",
+    "get_provider_registry",
 ]
@@ -1,9 +1,21 @@
 """Abstract routing interface for swap providers."""
 
+import asyncio
+import logging
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+from swaperex.routing.health import CircuitOpenError, get_provider_health
+
+if TYPE_CHECKING:
+    from swaperex.routing.cache import QuoteCache
+    from swaperex.routing.graph import LiquidityGraph, RoutePlan
+    from swaperex.routing.pools import PoolState
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -35,6 +47,25 @@ class Quote:
         return self.route_details.get("fee_usd") if self.route_details else None
 
 
+class ProviderUnavailableError(Exception):
+    """Raised by ``get_quote`` when the provider's upstream could not answer.
+
+    Covers transport errors, rate limiting and 5xx responses, as opposed to
+    a clean "no route" (``None``), so the circuit breaker can count them.
+    Providers that can still estimate a quote without their upstream pass
+    it as ``fallback``; the aggregator records the failure and uses it.
+    """
+
+    def __init__(self, message: str, fallback: Optional[Quote] = None):
+        super().__init__(message)
+        self.fallback = fallback
+
+
+def is_unavailable_status(status_code: int) -> bool:
+    """Whether an HTTP status means the upstream, not the request, failed."""
+    return status_code == 429 or status_code >= 500
+
+
 @dataclass
 class SwapRoute:
     """A selected swap route with execution details."""
@@ -95,6 +126,9 @@ class RouteProvider(ABC):
 
         Returns:
             Quote if swap is possible, None otherwise
+
+        Raises:
+            ProviderUnavailableError: If the upstream failed to answer
         """
         pass
 
@@ -116,12 +150,77 @@ class RouteProvider(ABC):
         assets = self.supported_assets
         return from_asset.upper() in assets and to_asset.upper() in assets
 
+    async def get_liquidity_pools(self) -> Optional[list["PoolState"]]:
+        """Cached pools for multi-hop route search, keyed by symbol.
 
-class RouteAggregator:
-    """Aggregates quotes from multiple providers to find the best route."""
+        Reserves are in human units. Providers without local pool data
+        return None and are always asked for a live quote.
+        """
+        return None
+
+
+@dataclass
+class QuoteCollection:
+    """Result of fanning a quote request out to several providers.
+
+    Holds the quotes that arrived in time plus the names of providers
+    that missed their deadline or raised, so callers can surface partial
+    results instead of waiting on the slowest upstream.
+    """
+
+    quotes: list[Quote] = field(default_factory=list)
+    timed_out: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)  # circuit open
+    elapsed_seconds: float = 0.0
+
+    @property
+    def is_partial(self) -> bool:
+        """True if any eligible provider did not return a result."""
+        return bool(self.timed_out or self.failed or self.skipped)
 
-    def __init__(self, providers: Optional[list[RouteProvider]] = None):
+
+class RouteAggregator:
+    """Aggregates quotes from multiple providers to find the best route.
+
+    By default providers are queried concurrently. Each provider call is
+    bounded by ``provider_timeout`` and the whole fan-out by
+    ``total_timeout``; providers still running when a deadline passes are
+    cancelled and reported as timed out. Pass ``concurrent=False`` to query
+    providers one after another (deadlines still apply per provider).
+
+    When a ``quote_cache`` is given, provider quotes are served from it and
+    concurrent identical requests share one upstream call.
+
+    Every provider call goes through the provider's circuit breaker (see
+    ``swaperex.routing.health``): providers with an open circuit are
+    skipped without waiting, and the rest are queried healthiest first.
+
+    With ``multi_hop`` enabled, ``get_best_quote`` first estimates each
+    pool-backed provider's best 1-``max_hops`` path over its cached pools
+    (see ``swaperex.routing.graph``) and asks only the provider with the
+    best estimate for a live quote; providers without pool data are
+    queried as before. The estimate only picks the provider: the live
+    quote comes from the provider's own router and is what gets executed.
+    """
+
+    def __init__(
+        self,
+        providers: Optional[list[RouteProvider]] = None,
+        provider_timeout: Optional[float] = None,
+        total_timeout: Optional[float] = None,
+        concurrent: bool = True,
+        quote_cache: Optional["QuoteCache"] = None,
+        multi_hop: bool = False,
+        max_hops: int = 3,
+    ):
         self.providers: list[RouteProvider] = providers or []
+        self.provider_timeout = provider_timeout
+        self.total_timeout = total_timeout
+        self.concurrent = concurrent
+        self.quote_cache = quote_cache
+        self.multi_hop = multi_hop
+        self.max_hops = max_hops
 
     def add_provider(self, provider: RouteProvider) -> None:
         """Add a routing provider."""
@@ -137,9 +236,42 @@ class RouteAggregator:
         """
         Get the best quote across all providers.
 
-        Returns the quote with the highest to_amount (best rate).
+        Returns the quote with the highest to_amount (best rate). With
+        ``multi_hop``, providers with pool data compete on their planned
+        route and only the winner is quoted live, concurrently with the
+        fan-out to the remaining providers. Planning, confirmation and the
+        fan-out all share one ``total_timeout`` counted from entry.
         """
-        quotes = await self.get_all_quotes(from_asset, to_asset, amount, slippage_tolerance)
+        started = time.monotonic()
+        eligible = self._eligible(from_asset, to_asset)
+        steps = []
+
+        if self.multi_hop and eligible:
+            plans = await self._plan_routes(eligible, from_asset, to_asset, amount, started)
+            if plans:
+                planned = {plan.provider for plan in plans}
+                steps.append(self._confirm_planned(
+                    plans, [p for p in eligible if p.name in planned],
+                    from_asset, to_asset, amount, slippage_tolerance, started,
+                ))
+                eligible = [p for p in eligible if p.name not in planned]
+
+        if eligible:
+            steps.append(self._collect_from(
+                eligible, from_asset, to_asset, amount, slippage_tolerance, started
+            ))
+
+        if self.concurrent:
+            outcomes = await asyncio.gather(*steps)
+        else:
+            outcomes = [await step for step in steps]
+
+        quotes: list[Quote] = []
+        for outcome in outcomes:
+            if isinstance(outcome, QuoteCollection):
+                quotes.extend(outcome.quotes)
+            elif outcome is not None:
+                quotes.append(outcome)
 
         if not quotes:
             return None
@@ -147,6 +279,106 @@ class RouteAggregator:
         # Sort by to_amount descending (best rate first)
         return max(quotes, key=lambda q: q.to_amount)
 
+    async def get_liquidity_graph(self) -> Optional["LiquidityGraph"]:
+        """Graph over the cached pools of providers that expose them."""
+        from swaperex.routing.graph import get_liquidity_graph
+
+        async def pools_of(provider: RouteProvider):
+            return await asyncio.wait_for(
+                provider.get_liquidity_pools(), timeout=self.provider_timeout
+            )
+
+        outcomes = await asyncio.gather(
+            *(pools_of(p) for p in self.providers), return_exceptions=True
+        )
+        pools_by_provider = {}
+        for provider, outcome in zip(self.providers, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning(f"Pools from {provider.name} unavailable: {outcome}")
+            elif outcome:
+                pools_by_provider[provider.name] = outcome
+
+        if not pools_by_provider:
+            return None
+        return get_liquidity_graph(pools_by_provider)
+
+    async def _plan_routes(
+        self,
+        providers: list[RouteProvider],
+        from_asset: str,
+        to_asset: str,
+        amount: Decimal,
+        started: float,
+    ) -> list["RoutePlan"]:
+        """Best estimated path per pool-backed provider, best first.
+
+        The graph lookup is bounded by what is left of ``total_timeout``.
+        """
+        try:
+            graph = await asyncio.wait_for(
+                self.get_liquidity_graph(), timeout=self._remaining_total(started)
+            )
+        except Exception as e:
+            logger.warning(f"Liquidity graph unavailable: {e!r}")
+            return []
+        if graph is None:
+            return []
+
+        names = {p.name for p in providers}
+        return graph.plan(
+            from_asset, to_asset, amount,
+            providers=[name for name in graph.providers if name in names],
+            max_hops=self.max_hops,
+        )
+
+    async def _confirm_planned(
+        self,
+        plans: list["RoutePlan"],
+        providers: list[RouteProvider],
+        from_asset: str,
+        to_asset: str,
+        amount: Decimal,
+        slippage_tolerance: Decimal,
+        started: float,
+    ) -> Optional[Quote]:
+        """Quote pool-backed providers live, best estimate first.
+
+        Providers are asked one at a time until one returns a quote, within
+        what is left of ``total_timeout``. The live quote is the provider's
+        own route; the plan is only recorded in ``route_details`` as the
+        reason it was picked.
+        """
+        by_name = {p.name: p for p in providers}
+        for plan in plans:
+            timeout = self._remaining_total(started)
+            if timeout is not None and timeout <= 0:
+                logger.warning(f"Deadline passed before confirming a {from_asset}->{to_asset} route")
+                break
+
+            provider = by_name[plan.provider]
+            try:
+                quote = await self._quote_with_deadline(
+                    provider, from_asset, to_asset, amount, slippage_tolerance, timeout
+                )
+            except CircuitOpenError:
+                continue
+            except Exception as e:
+                logger.warning(f"Confirming {plan.provider} route failed: {e}")
+                continue
+            if quote is None:
+                continue
+
+            details = dict(quote.route_details or {})
+            details["route_plan"] = plan.to_dict()
+            quote.route_details = details
+            logger.debug(
+                f"Route {from_asset}->{to_asset} via {plan.provider}: {plan.hops} hop(s), "
+                f"estimated {plan.amount_out}, live {quote.to_amount}"
+            )
+            return quote
+
+        return None
+
     async def get_all_quotes(
         self,
         from_asset: str,
@@ -155,18 +387,213 @@ class RouteAggregator:
         slippage_tolerance: Decimal = Decimal("0.01"),
     ) -> list[Quote]:
         """Get quotes from all providers that support the pair."""
-        quotes = []
+        result = await self.collect_quotes(from_asset, to_asset, amount, slippage_tolerance)
+        return result.quotes
 
-        for provider in self.providers:
-            if provider.supports_pair(from_asset, to_asset):
-                try:
-                    quote = await provider.get_quote(
-                        from_asset, to_asset, amount, slippage_tolerance
-                    )
-                    if quote:
-                        quotes.append(quote)
-                except Exception:
-                    # Log error but continue with other providers
-                    continue
+    async def collect_quotes(
+        self,
+        from_asset: str,
+        to_asset: str,
+        amount: Decimal,
+        slippage_tolerance: Decimal = Decimal("0.01"),
+    ) -> QuoteCollection:
+        """Fan a quote request out to every provider that supports the pair.
+
+        Returns:
+            QuoteCollection with quotes in provider order plus the names of
+            providers that timed out or failed
+        """
+        eligible = self._eligible(from_asset, to_asset)
+        return await self._collect_from(
+            eligible, from_asset, to_asset, amount, slippage_tolerance
+        )
+
+    def _eligible(self, from_asset: str, to_asset: str) -> list[RouteProvider]:
+        """Providers supporting the pair, healthiest first."""
+        providers = [p for p in self.providers if p.supports_pair(from_asset, to_asset)]
+        return sorted(providers, key=lambda p: get_provider_health(p.name).score, reverse=True)
 
-        return quotes
+    async def _collect_from(
+        self,
+        eligible: list[RouteProvider],
+        from_asset: str,
+        to_asset: str,
+        amount: Decimal,
+        slippage_tolerance: Decimal,
+        started: Optional[float] = None,
+    ) -> QuoteCollection:
+        """Fan a quote request out to the given providers.
+
+        ``total_timeout`` counts from ``started`` (default: now), so callers
+        that already spent part of the budget pass their own start time.
+        """
+        if started is None:
+            started = time.monotonic()
+        result = QuoteCollection()
+
+        if self.concurrent:
+            outcomes = await self._fan_out(
+                eligible, started, from_asset, to_asset, amount, slippage_tolerance
+            )
+        else:
+            outcomes = await self._query_sequential(
+                eligible, started, from_asset, to_asset, amount, slippage_tolerance
+            )
+
+        for provider, outcome in zip(eligible, outcomes):
+            if isinstance(outcome, Quote):
+                result.quotes.append(outcome)
+            elif isinstance(outcome, CircuitOpenError):
+                result.skipped.append(provider.name)
+            elif isinstance(outcome, (asyncio.TimeoutError, asyncio.CancelledError)):
+                result.timed_out.append(provider.name)
+            elif isinstance(outcome, Exception):
+                # Log error but continue with other providers
+                logger.warning(f"Quote from {provider.name} failed: {outcome}")
+                result.failed.append(provider.name)
+
+        result.elapsed_seconds = time.monotonic() - started
+        if result.timed_out:
+            logger.warning(
+                f"Quote {from_asset}->{to_asset}: providers timed out after "
+                f"{result.elapsed_seconds:.2f}s: {', '.join(result.timed_out)}"
+            )
+        return result
+
+    async def _quote_with_deadline(
+        self,
+        provider: RouteProvider,
+        from_asset: str,
+        to_asset: str,
+        amount: Decimal,
+        slippage_tolerance: Decimal,
+        timeout: Optional[float],
+    ) -> Optional[Quote]:
+        """Call a provider's get_quote (through the cache, if any) bounded by a deadline.
+
+        Provider health is recorded around the upstream call itself, so
+        cache hits neither count as successes nor use up a half-open probe.
+        The upstream call is bounded by ``provider_timeout``, and running
+        into it is a failure. ``timeout`` is the caller's own deadline (what
+        is left of ``total_timeout``); a call cancelled by it or by shutdown
+        gives back a half-open probe without recording an outcome.
+
+        Raises:
+            CircuitOpenError: If the provider's circuit breaker is open
+        """
+
+        async def fetch() -> Optional[Quote]:
+            health = get_provider_health(provider.name)
+            if not health.allow_request():
+                raise CircuitOpenError(provider.name)
+
+            started = time.monotonic()
+            try:
+                quote = await asyncio.wait_for(
+                    provider.get_quote(from_asset, to_asset, amount, slippage_tolerance),
+                    timeout=self.provider_timeout,
+                )
+            except ProviderUnavailableError as e:
+                health.record_failure(time.monotonic() - started)
+                if e.fallback is None:
+                    raise
+                logger.warning(f"{provider.name} unavailable, using fallback quote: {e}")
+                return e.fallback
+            except Exception:
+                # Includes asyncio.TimeoutError from provider_timeout above
+                health.record_failure(time.monotonic() - started)
+                raise
+            except BaseException:
+                # Cancelled by the caller's deadline or shutdown: not the provider's fault
+                health.release_probe()
+                raise
+            health.record_success(time.monotonic() - started)
+            return quote
+
+        if self.quote_cache is not None:
+            call = self.quote_cache.get_or_fetch(
+                provider.name, from_asset, to_asset, amount, slippage_tolerance, fetch
+            )
+        else:
+            call = fetch()
+
+        return await asyncio.wait_for(call, timeout=timeout)
+
+    async def _fan_out(
+        self,
+        providers: list[RouteProvider],
+        started: float,
+        from_asset: str,
+        to_asset: str,
+        amount: Decimal,
+        slippage_tolerance: Decimal,
+    ) -> list:
+        """Query providers concurrently, cancelling stragglers at the global deadline."""
+        if not providers:
+            return []
+
+        tasks = [
+            asyncio.create_task(
+                self._quote_with_deadline(
+                    provider, from_asset, to_asset, amount, slippage_tolerance, None
+                )
+            )
+            for provider in providers
+        ]
+
+        remaining = self._remaining_total(started)
+        if remaining is not None:
+            remaining = max(0.0, remaining)
+        _, pending = await asyncio.wait(tasks, timeout=remaining)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        outcomes = []
+        for task in tasks:
+            if task in pending or task.cancelled():
+                outcomes.append(asyncio.TimeoutError())
+            elif task.exception() is not None:
+                outcomes.append(task.exception())
+            else:
+                outcomes.append(task.result())
+        return outcomes
+
+    def _remaining_total(self, started: float) -> Optional[float]:
+        """What is left of total_timeout since ``started``.
+
+        Returns None when unbounded, and zero or less once the global
+        deadline has passed. Upstream calls are bounded by
+        ``provider_timeout`` inside ``_quote_with_deadline`` on top of this.
+        """
+        if self.total_timeout is None:
+            return None
+        return self.total_timeout - (time.monotonic() - started)
+
+    async def _query_sequential(
+        self,
+        providers: list[RouteProvider],
+        started: float,
+        from_asset: str,
+        to_asset: str,
+        amount: Decimal,
+        slippage_tolerance: Decimal,
+    ) -> list:
+        """Query providers one at a time, sharing the global deadline."""
+        outcomes = []
+        for provider in providers:
+            timeout = self._remaining_total(started)
+            if timeout is not None and timeout <= 0:
+                outcomes.append(asyncio.TimeoutError())
+                continue
+
+            try:
+                outcomes.append(
+                    await self._quote_with_deadline(
+                        provider, from_asset, to_asset, amount, slippage_tolerance, timeout
+                    )
+                )
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
@@ -0,0 +1,253 @@
+"""Short-lived quote cache with request coalescing.
+
+Many users asking for the same pair at the same time would otherwise hit
+each upstream API once per request. QuoteCache keeps successful quotes
+for a short TTL and folds concurrent identical lookups into a single
+in-flight upstream call.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, replace
+from decimal import Decimal
+from typing import Awaitable, Callable, Optional
+
+from swaperex.routing.base import Quote
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[str, str, str, str, str]
+
+
+@dataclass
+class QuoteCacheStats:
+    """Counters describing cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served without a new upstream call."""
+        total = self.hits + self.misses + self.coalesced
+        return (self.hits + self.coalesced) / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for API responses."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "size": self.size,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class QuoteCache:
+    """TTL cache for provider quotes with in-flight request coalescing.
+
+    Entries are keyed by provider name, pair, amount bucket and slippage.
+    The amount bucket rounds the amount to ``amount_precision`` significant
+    digits; a hit for a slightly different amount in the same bucket is
+    rescaled to the requested amount. Only successful quotes are cached.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 10.0,
+        amount_precision: int = 6,
+        max_entries: int = 10_000,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.amount_precision = amount_precision
+        self.max_entries = max_entries
+        self._entries: dict[CacheKey, tuple[float, Quote]] = {}
+        self._inflight: dict[CacheKey, asyncio.Task] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Caching is disabled when the TTL is not positive."""
+        return self.ttl_seconds > 0
+
+    def amount_bucket(self, amount: Decimal) -> str:
+        """Round an amount to the configured number of significant digits."""
+        if amount == 0:
+            return "0"
+        exponent = amount.adjusted() - self.amount_precision + 1
+        return str(amount.scaleb(-exponent).quantize(Decimal("1")).scaleb(exponent).normalize())
+
+    def make_key(
+        self,
+        provider: str,
+        from_asset: str,
+        to_asset: str,
+        amount: Decimal,
+        slippage_tolerance: Decimal,
+    ) -> CacheKey:
+        """Build the cache key for a quote request."""
+        return (
+            provider,
+            from_asset.upper(),
+            to_asset.upper(),
+            self.amount_bucket(amount),
+            str(slippage_tolerance.normalize()),
+        )
+
+    def get(self, key: CacheKey, amount: Decimal) -> Optional[Quote]:
+        """Get a fresh cached quote for the requested amount, if any."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, quote = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        return self._for_amount(quote, amount)
+
+    def put(self, key: CacheKey, quote: Quote) -> None:
+        """Store a quote."""
+        if len(self._entries) >= self.max_entries:
+            self._evict()
+        self._entries[key] = (time.monotonic(), quote)
+
+    async def get_or_fetch(
+        self,
+        provider: str,
+        from_asset: str,
+        to_asset: str,
+        amount: Decimal,
+        slippage_tolerance: Decimal,
+        fetch: Callable[[], Awaitable[Optional[Quote]]],
+    ) -> Optional[Quote]:
+        """Return a cached quote or fetch it, sharing concurrent identical fetches.
+
+        Args:
+            provider: Provider name (part of the cache key)
+            from_asset: Source asset symbol
+            to_asset: Destination asset symbol
+            amount: Requested amount
+            slippage_tolerance: Slippage tolerance
+            fetch: Coroutine factory performing the upstream call
+
+        Returns:
+            Quote for the requested amount, or None if the provider has none
+        """
+        if not self.enabled:
+            return await fetch()
+
+        key = self.make_key(provider, from_asset, to_asset, amount, slippage_tolerance)
+
+        cached = self.get(key, amount)
+        if cached is not None:
+            self._hits += 1
+            return cached
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self._coalesced += 1
+        else:
+            self._misses += 1
+            task = asyncio.create_task(self._fetch_and_store(key, fetch))
+            self._inflight[key] = task
+
+        # Shield the shared upstream call so one caller's deadline does not
+        # cancel it for the other waiters.
+        quote = await asyncio.shield(task)
+        return self._for_amount(quote, amount) if quote is not None else None
+
+    async def _fetch_and_store(
+        self,
+        key: CacheKey,
+        fetch: Callable[[], Awaitable[Optional[Quote]]],
+    ) -> Optional[Quote]:
+        try:
+            quote = await fetch()
+            if quote is not None:
+                self.put(key, quote)
+            return quote
+        finally:
+            self._inflight.pop(key, None)
+
+    @staticmethod
+    def _for_amount(quote: Quote, amount: Decimal) -> Quote:
+        """Copy a cached quote, rescaling it if the amount differs within the bucket."""
+        if quote.from_amount == amount or quote.from_amount == 0:
+            return replace(quote, route_details=dict(quote.route_details or {}))
+        ratio = amount / quote.from_amount
+        return replace(
+            quote,
+            from_amount=amount,
+            to_amount=quote.to_amount * ratio,
+            route_details=dict(quote.route_details or {}),
+        )
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the oldest ones if still full."""
+        now = time.monotonic()
+        expired = [k for k, (ts, _) in self._entries.items() if now - ts > self.ttl_seconds]
+        for key in expired:
+            del self._entries[key]
+
+        overflow = len(self._entries) - self.max_entries + 1
+        if overflow > 0:
+            oldest = sorted(self._entries.items(), key=lambda item: item[1][0])[:overflow]
+            for key, _ in oldest:
+                del self._entries[key]
+
+    def invalidate(self, provider: Optional[str] = None) -> None:
+        """Drop cached quotes (all, or for one provider)."""
+        if provider is None:
+            self._entries.clear()
+        else:
+            for key in [k for k in self._entries if k[0] == provider]:
+                del self._entries[key]
+
+    @property
+    def stats(self) -> QuoteCacheStats:
+        """Current counters."""
+        return QuoteCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            coalesced=self._coalesced,
+            size=len(self._entries),
+        )
+
+    def reset_stats(self) -> None:
+        """Reset the hit/miss/coalesce counters."""
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+
+_quote_cache: Optional[QuoteCache] = None
+
+
+def get_quote_cache() -> QuoteCache:
+    """Get the process-wide quote cache configured from settings."""
+    global _quote_cache
+
+    if _quote_cache is None:
+        from swaperex.config import get_settings
+
+        settings = get_settings()
+        _quote_cache = QuoteCache(
+            ttl_seconds=settings.quote_cache_ttl,
+            amount_precision=settings.quote_cache_amount_precision,
+        )
+        logger.info(f"Quote cache initialized (ttl={settings.quote_cache_ttl}s)")
+
+    return _quote_cache
+
+
+def reset_quote_cache() -> None:
+    """Reset the process-wide quote cache (useful for testing)."""
+    global _quote_cache
+    _quote_cache = None
@@ -4,135 +4,15 @@ import random
 from decimal import Decimal
 from typing import Optional
 
+from swaperex.prices import PriceView
 from swaperex.routing.base import Quote, RouteProvider, SwapRoute
 
 
-# Simulated market prices in USD (approximate December 2024 values)
-# These are for demonstration purposes only and should not be used for real trading
-SIMULATED_PRICES: dict[str, Decimal] = {
-    # ========== Major Cryptocurrencies ==========
-    "BTC": Decimal("100000.00"),
-    "ETH": Decimal("3900.00"),
-    "LTC": Decimal("115.00"),
-    "DASH": Decimal("48.00"),
-    "BCH": Decimal("480.00"),
-    "DOGE": Decimal("0.42"),
-    "ZEC": Decimal("62.00"),
-    "XMR": Decimal("195.00"),
-
-    # ========== Layer 1 Blockchains ==========
-    "SOL": Decimal("225.00"),
-    "TRX": Decimal("0.27"),
-    "BNB": Decimal("710.00"),
-    "BSC": Decimal("710.00"),  # Alias for BNB
-    "AVAX": Decimal("52.00"),
-    "DOT": Decimal("9.50"),
-    "MATIC": Decimal("0.62"),
-    "POL": Decimal("0.62"),  # Polygon renamed
-    "FTM": Decimal("1.05"),
-    "NEAR": Decimal("7.20"),
-    "ALGO": Decimal("0.45"),
-    "ATOM": Decimal("12.50"),
-    "XRP": Decimal("2.35"),
-    "XLM": Decimal("0.45"),
-    "TON": Decimal("6.80"),
-    "KAS": Decimal("0.15"),
-    "ICP": Decimal("13.50"),
-    "EGLD": Decimal("48.00"),
-    "HBAR": Decimal("0.29"),
-    "VET": Decimal("0.052"),
-    "ROSE": Decimal("0.12"),
-
-    # ========== Stablecoins ==========
-    "USDT": Decimal("1.00"),
-    "USDC": Decimal("1.00"),
-    "BUSD": Decimal("1.00"),
-    "DAI": Decimal("1.00"),
-    "TUSD": Decimal("1.00"),
-    "USDJ": Decimal("1.00"),
-    "FDUSD": Decimal("1.00"),
-
-    # ========== DeFi & Ecosystem Tokens ==========
-    "RUNE": Decimal("6.80"),
-    "LINK": Decimal("28.00"),
-    "UNI": Decimal("17.50"),
-    "AAVE": Decimal("185.00"),
-    "MKR": Decimal("1850.00"),
-    "COMP": Decimal("95.00"),
-    "SNX": Decimal("3.20"),
-    "CRV": Decimal("1.10"),
-    "SUSHI": Decimal("1.85"),
-    "1INCH": Decimal("0.52"),
-    "GRT": Decimal("0.32"),
-    "ENS": Decimal("38.00"),
-    "LDO": Decimal("2.40"),
-    "YFI": Decimal("9500.00"),
-    "BAL": Decimal("3.80"),
-    "OMG": Decimal("0.65"),
-
-    # ========== BNB Chain (PancakeSwap) Tokens ==========
-    "CAKE": Decimal("2.80"),
-    "BTCB": Decimal("100000.00"),
-    "XVS": Decimal("8.50"),
-    "ALPACA": Decimal("0.22"),
-    "FLOKI": Decimal("0.00022"),
-    "BABYDOGE": Decimal("0.0000000028"),
-    "GMT": Decimal("0.22"),
-    "SFP": Decimal("0.85"),
-
-    # ========== Solana (Jupiter) Tokens ==========
-    "RAY": Decimal("5.20"),
-    "SRM": Decimal("0.035"),
-    "ORCA": Decimal("4.80"),
-    "JUP": Decimal("1.25"),
-    "BONK": Decimal("0.000035"),
-    "WIF": Decimal("3.20"),
-    "PYTH": Decimal("0.48"),
-    "SAMO": Decimal("0.028"),
-    "MNDE": Decimal("0.15"),
-    "HNT": Decimal("8.50"),
-
-    # ========== Cosmos (Osmosis) Tokens ==========
-    "OSMO": Decimal("1.15"),
-    "JUNO": Decimal("0.45"),
-    "SCRT": Decimal("0.52"),
-    "INJ": Decimal("42.00"),
-    "TIA": Decimal("8.50"),
-    "STARS": Decimal("0.015"),
-
-    # ========== Tron (SunSwap) Tokens ==========
-    "BTT": Decimal("0.0000012"),
-    "JST": Decimal("0.038"),
-    "SUN": Decimal("0.022"),
-    "WIN": Decimal("0.00012"),
-
-    # ========== Meme & Other Tokens ==========
-    "PEPE": Decimal("0.000022"),
-    "SHIB": Decimal("0.000028"),
-    "LRC": Decimal("0.28"),
-    "BAT": Decimal("0.28"),
-    "ZRX": Decimal("0.62"),
-    "WBTC": Decimal("100000.00"),
-
-    # ========== UTXO Coins ==========
-    "DGB": Decimal("0.018"),
-    "RVN": Decimal("0.028"),
-    "BTG": Decimal("32.00"),
-    "NMC": Decimal("1.80"),
-    "VIA": Decimal("0.35"),
-    "SYS": Decimal("0.15"),
-    "KMD": Decimal("0.38"),
-    "XEC": Decimal("0.000048"),
-    "MONA": Decimal("0.62"),
-    "FIO": Decimal("0.032"),
-}
-
-
 class DryRunRouter(RouteProvider):
     """
     Simulated router for PoC testing.
 
-    Provides realistic quotes based on simulated prices with:
+    Provides realistic quotes based on oracle prices with:
     - Configurable fee structure
     - Simulated slippage
     - Multiple simulated routes to compare
@@ -147,7 +27,7 @@ class DryRunRouter(RouteProvider):
         self.base_fee_percent = base_fee_percent
         self.network_fee_usd = network_fee_usd
         self.add_random_variance = add_random_variance
-        self._prices = SIMULATED_PRICES.copy()
+        self._prices = PriceView()
 
     @property
     def name(self) -> str:
@@ -256,7 +136,7 @@ class SimulatedThorChainRouter(RouteProvider):
     """Simulated THORChain router for comparison."""
 
     def __init__(self):
-        self._prices = SIMULATED_PRICES.copy()
+        self._prices = PriceView()
 
     @property
     def name(self) -> str:
@@ -346,7 +226,7 @@ class SimulatedDexAggregator(RouteProvider):
     """Simulated DEX aggregator (like 1inch) for EVM tokens."""
 
     def __init__(self):
-        self._prices = SIMULATED_PRICES.copy()
+        self._prices = PriceView()
 
     @property
     def name(self) -> str:
@@ -437,7 +317,7 @@ class SimulatedQuickSwapRouter(RouteProvider):
     """Simulated QuickSwap router for Polygon."""
 
     def __init__(self):
-        self._prices = SIMULATED_PRICES.copy()
+        self._prices = PriceView()
 
     @property
     def name(self) -> str:
@@ -526,7 +406,7 @@ class SimulatedTraderJoeRouter(RouteProvider):
     """Simulated TraderJoe router for Avalanche."""
 
     def __init__(self):
-        self._prices = SIMULATED_PRICES.copy()
+        self._prices = PriceView()
 
     @property
     def name(self) -> str:
@@ -615,7 +495,7 @@ class SimulatedSunSwapRouter(RouteProvider):
     """Simulated SunSwap router for Tron."""
 
     def __init__(self):
-        self._prices = SIMULATED_PRICES.copy()
+        self._prices = PriceView()
 
     @property
     def name(self) -> str:
@@ -704,7 +584,7 @@ class SimulatedStonfiRouter(RouteProvider):
     """Simulated STON.fi router for TON."""
 
     def __init__(self):
-        self._prices = SIMULATED_PRICES.copy()
+        self._prices = PriceView()
 
     @property
     def name(self) -> str:
@@ -793,7 +673,7 @@ class SimulatedRefFinanceRouter(RouteProvider):
     """Simulated Ref Finance router for NEAR."""
 
     def __init__(self):
-        self._prices = SIMULATED_PRICES.copy()
+        self._prices = PriceView()
 
     @property
     def name(self) -> str:
@@ -882,7 +762,7 @@ class SimulatedJupiterRouter(RouteProvider):
     """Simulated Jupiter router for Solana."""
 
     def __init__(self):
-        self._prices = SIMULATED_PRICES.copy()
+        self._prices = PriceView()
 
     @property
     def name(self) -> str:
@@ -972,7 +852,7 @@ class SimulatedOsmosisRouter(RouteProvider):
     """Simulated Osmosis router for Cosmos ecosystem."""
 
     def __init__(self):
-        self._prices = SIMULATED_PRICES.copy()
+        self._prices = PriceView()
 
     @property
     def name(self) -> str:
@@ -1061,7 +941,7 @@ class SimulatedPancakeSwapRouter(RouteProvider):
     """Simulated PancakeSwap router for BNB Chain."""
 
     def __init__(self):
-        self._prices = SIMULATED_PRICES.copy()
+        self._prices = PriceView()
 
     @property
     def name(self) -> str:
@@ -1158,7 +1038,7 @@ class SimulatedUniswapRouter(RouteProvider):
     """Simulated Uniswap V3 router for Ethereum."""
 
     def __init__(self):
-        self._prices = SIMULATED_PRICES.copy()
+        self._prices = PriceView()
 
     @property
     def name(self) -> str:
@@ -10,10 +10,23 @@ from typing import Optional
 
 from swaperex.config import get_settings
 from swaperex.routing.base import RouteAggregator, RouteProvider
+from swaperex.routing.cache import get_quote_cache
 
 logger = logging.getLogger(__name__)
 
 
+def _new_aggregator() -> RouteAggregator:
+    """Create an empty aggregator with the configured deadlines, quote cache and routing."""
+    settings = get_settings()
+    return RouteAggregator(
+        provider_timeout=settings.quote_provider_timeout,
+        total_timeout=settings.quote_total_timeout,
+        quote_cache=get_quote_cache(),
+        multi_hop=settings.route_multi_hop,
+        max_hops=settings.route_max_hops,
+    )
+
+
 def create_thorchain_provider(use_real: bool = True) -> RouteProvider:
     """Create THORChain provider.
 
@@ -148,10 +161,75 @@ def create_ref_finance_provider() -> RouteProvider:
     return SimulatedRefFinanceRouter()
 
 
+# Provider keys per chain/DEX ("name" or "name:argument", see create_provider)
+CHAIN_PROVIDERS: dict[str, list[str]] = {
+    "pancakeswap": ["1inch:bsc"],  # BNB Chain via 1inch
+    "uniswap": ["1inch:ethereum"],  # Ethereum via 1inch
+    "quickswap": ["1inch:polygon"],  # Polygon via 1inch
+    "traderjoe": ["1inch:avalanche"],  # Avalanche via 1inch
+    "thorchain": ["thorchain"],  # Cross-chain swaps
+    "jupiter": ["jupiter"],  # Solana
+    "osmosis": ["osmosis"],  # Cosmos ecosystem
+    "sunswap": ["sunswap"],  # Tron
+    "stonfi": ["stonfi"],  # TON
+    "ref_finance": ["ref_finance"],  # NEAR
+}
+
+PRODUCTION_PROVIDERS = [
+    "1inch:ethereum",
+    "1inch:bsc",
+    "1inch:polygon",
+    "1inch:avalanche",
+    "thorchain",
+    "jupiter",
+    "osmosis",
+    "sunswap",
+    "stonfi",
+    "ref_finance",
+]
+
+
+def create_provider(key: str) -> RouteProvider:
+    """Create a provider from its key (e.g. "thorchain", "1inch:bsc").
+
+    Raises:
+        ValueError: For an unknown provider key
+    """
+    name, _, argument = key.partition(":")
+    if name == "1inch":
+        return create_oneinch_provider(chain=argument or "ethereum")
+    if name == "thorchain":
+        return create_thorchain_provider()
+    if name == "jupiter":
+        return create_jupiter_provider()
+    if name == "osmosis":
+        return create_osmosis_provider()
+    if name == "sunswap":
+        return create_sunswap_provider()
+    if name == "stonfi":
+        return create_stonfi_provider()
+    if name == "ref_finance":
+        return create_ref_finance_provider()
+    if name == "dry_run":
+        from swaperex.routing.dry_run import DryRunRouter
+        return DryRunRouter()
+    raise ValueError(f"Unknown routing provider: {key}")
+
+
+def chain_provider_keys(chain: str) -> list[str]:
+    """Provider keys for a chain/DEX (dry-run router for unknown chains)."""
+    keys = CHAIN_PROVIDERS.get(chain.lower())
+    if keys is None:
+        logger.warning(f"Unknown chain '{chain}', using DryRunRouter")
+        return ["dry_run"]
+    return keys
+
+
 def create_chain_aggregator(chain: str) -> RouteAggregator:
-    """Create a route aggregator for a specific chain/DEX.
+    """Create a new route aggregator for a specific chain/DEX.
 
-    This is the main factory function used by the swap handler.
+    Builds fresh provider instances; request handlers should use
+    ``swaperex.routing.registry.get_chain_aggregator`` to share warm ones.
     Creates real providers when available, with simulated fallbacks.
 
     Args:
@@ -160,67 +238,11 @@ def create_chain_aggregator(chain: str) -> RouteAggregator:
     Returns:
         RouteAggregator with providers for the specified chain
     """
-    aggregator = RouteAggregator()
-
-    chain_lower = chain.lower()
-
-    # Add chain-specific providers
-    if chain_lower == "pancakeswap":
-        # BNB Chain - Use 1inch aggregator for BSC
-        aggregator.add_provider(create_oneinch_provider(chain="bsc"))
-        logger.info("Added 1inch (BSC) provider for PancakeSwap")
-
-    elif chain_lower == "uniswap":
-        # Ethereum - Use 1inch aggregator
-        aggregator.add_provider(create_oneinch_provider(chain="ethereum"))
-        logger.info("Added 1inch (Ethereum) provider for Uniswap")
-
-    elif chain_lower == "quickswap":
-        # Polygon - Use 1inch aggregator
-        aggregator.add_provider(create_oneinch_provider(chain="polygon"))
-        logger.info("Added 1inch (Polygon) provider for QuickSwap")
-
-    elif chain_lower == "traderjoe":
-        # Avalanche - Use 1inch aggregator
-        aggregator.add_provider(create_oneinch_provider(chain="avalanche"))
-        logger.info("Added 1inch (Avalanche) provider for TraderJoe")
-
-    elif chain_lower == "thorchain":
-        # Cross-chain swaps
-        aggregator.add_provider(create_thorchain_provider())
-        logger.info("Added THORChain provider")
-
-    elif chain_lower == "jupiter":
-        # Solana
-        aggregator.add_provider(create_jupiter_provider())
-        logger.info("Added Jupiter provider")
-
-    elif chain_lower == "osmosis":
-        # Cosmos ecosystem
-        aggregator.add_provider(create_osmosis_provider())
-        logger.info("Added Osmosis provider")
-
-    elif chain_lower == "sunswap":
-        # Tron
-        aggregator.add_provider(create_sunswap_provider())
-        logger.info("Added SunSwap provider")
-
-    elif chain_lower == "stonfi":
-        # TON
-        aggregator.add_provider(create_stonfi_provider())
-        logger.info("Added STON.fi provider")
-
-    elif chain_lower == "ref_finance":
-        # NEAR
-        aggregator.add_provider(create_ref_finance_provider())
-        logger.info("Added Ref Finance provider")
-
-    else:
-        # Default: add dry-run router
-        from swaperex.routing.dry_run import DryRunRouter
-        aggregator.add_provider(DryRunRouter())
-        logger.warning(f"Unknown chain '{chain}', using DryRunRouter")
-
+    aggregator = _new_aggregator()
+    for key in chain_provider_keys(chain):
+        provider = create_provider(key)
+        aggregator.add_provider(provider)
+        logger.info(f"Added {provider.name} provider for {chain}")
     return aggregator
 
 
@@ -240,7 +262,7 @@ def create_aggregator(
         Configured RouteAggregator
     """
     settings = get_settings()
-    aggregator = RouteAggregator()
+    aggregator = _new_aggregator()
 
     # Always add dry-run provider for testing
     from swaperex.routing.dry_run import DryRunRouter
@@ -265,21 +287,9 @@ def create_aggregator(
 
 def create_production_aggregator() -> RouteAggregator:
     """Create aggregator with all production providers enabled."""
-    aggregator = RouteAggregator()
-
-    # EVM chains via 1inch
-    for chain in ["ethereum", "bsc", "polygon", "avalanche"]:
-        aggregator.add_provider(create_oneinch_provider(chain=chain))
-
-    # Cross-chain
-    aggregator.add_provider(create_thorchain_provider())
-
-    # Non-EVM chains
-    aggregator.add_provider(create_jupiter_provider())
-    aggregator.add_provider(create_osmosis_provider())
-    aggregator.add_provider(create_sunswap_provider())
-    aggregator.add_provider(create_stonfi_provider())
-    aggregator.add_provider(create_ref_finance_provider())
+    aggregator = _new_aggregator()
+    for key in PRODUCTION_PROVIDERS:
+        aggregator.add_provider(create_provider(key))
 
     logger.info("Created production aggregator with all providers")
     return aggregator
@@ -287,7 +297,7 @@ def create_production_aggregator() -> RouteAggregator:
 
 def create_minimal_aggregator() -> RouteAggregator:
     """Create aggregator with minimal providers (for testing)."""
-    aggregator = RouteAggregator()
+    aggregator = _new_aggregator()
     from swaperex.routing.dry_run import DryRunRouter
     aggregator.add_provider(DryRunRouter())
     return aggregator
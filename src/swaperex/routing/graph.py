@@ -0,0 +1,242 @@
+"""Multi-hop route search over a liquidity graph built from cached pools.
+
+Providers that can expose their pools (THORChain, Osmosis, Ref Finance,
+STON.fi) contribute symbol-level, human-unit ``PoolState``s. The graph
+keeps one adjacency map per provider, because a path has to be executed
+by a single provider: a Ref Finance USDT is not a STON.fi USDT.
+
+For a request the graph searches 1-``max_hops`` paths per provider,
+fewest hops first, pruning a partial path when another one already
+reached the same token with more output, and stopping after
+``max_expansions`` pool evaluations. It returns one ``RoutePlan`` per
+provider, best estimated output first.
+
+This is a provider-selection heuristic only. Providers quote and execute
+swaps through their own routers and cannot be handed a path, so
+``RouteAggregator`` uses the estimates to decide which provider to ask
+for a live quote; the live quote, not the plan, is what gets executed.
+"""
+
+import heapq
+import itertools
+import logging
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional
+
+from swaperex.routing.pools import PoolState
+
+logger = logging.getLogger(__name__)
+
+def simulate_path(tokens: list[str], pools: list[PoolState], amount_in: Decimal) -> Decimal:
+    """Output of pushing ``amount_in`` through a path of pools."""
+    amount = amount_in
+    for pool, token_in, token_out in zip(pools, tokens, tokens[1:]):
+        amount = pool.get_amount_out(token_in, token_out, amount)
+        if amount <= 0:
+            return Decimal("0")
+    return amount
+
+
+@dataclass
+class PathQuote:
+    """Estimated output of one path for one input amount."""
+
+    provider: str
+    tokens: list[str]
+    pools: list[PoolState]
+    amount_in: Decimal
+    amount_out: Decimal
+
+    @property
+    def hops(self) -> int:
+        return len(self.pools)
+
+    def quote(self, amount_in: Decimal) -> Decimal:
+        """Output of this path for another input amount."""
+        return simulate_path(self.tokens, self.pools, amount_in)
+
+    def to_dict(self) -> dict:
+        return {
+            "path": self.tokens,
+            "pools": [pool.pool_id for pool in self.pools],
+            "amount_in": str(self.amount_in),
+            "amount_out": str(self.amount_out),
+        }
+
+
+@dataclass
+class RoutePlan:
+    """Best estimated path for an order through one provider."""
+
+    provider: str
+    from_asset: str
+    to_asset: str
+    amount_in: Decimal
+    path: PathQuote
+
+    @property
+    def amount_out(self) -> Decimal:
+        return self.path.amount_out
+
+    @property
+    def hops(self) -> int:
+        return self.path.hops
+
+    def to_dict(self) -> dict:
+        return {
+            "provider": self.provider,
+            "estimated_to_amount": str(self.amount_out),
+            **self.path.to_dict(),
+        }
+
+
+class LiquidityGraph:
+    """Token graph over the pools of one or more providers."""
+
+    def __init__(self, pools_by_provider: dict[str, list[PoolState]]):
+        """Index pools by provider and token.
+
+        Args:
+            pools_by_provider: Provider name -> symbol-level, human-unit pools
+        """
+        self._adjacency: dict[str, dict[str, list[tuple[PoolState, str]]]] = {}
+        for provider, pools in pools_by_provider.items():
+            adjacency: dict[str, list[tuple[PoolState, str]]] = {}
+            for pool in pools:
+                tokens = [t.upper() for t in pool.tokens]
+                if tokens != pool.tokens:
+                    pool = PoolState(
+                        pool.pool_id, tokens, pool.reserves, pool.fee_bps,
+                        pool.kind, pool.amp, pool.decimals,
+                    )
+                for a in tokens:
+                    for b in tokens:
+                        if a != b:
+                            adjacency.setdefault(a, []).append((pool, b))
+            self._adjacency[provider] = adjacency
+
+    @property
+    def providers(self) -> list[str]:
+        return list(self._adjacency)
+
+    def has_token(self, provider: str, token: str) -> bool:
+        return token.upper() in self._adjacency.get(provider, {})
+
+    def find_paths(
+        self,
+        provider: str,
+        from_asset: str,
+        to_asset: str,
+        amount: Decimal,
+        max_hops: int = 3,
+        max_paths: int = 5,
+        max_expansions: int = 5000,
+    ) -> list[PathQuote]:
+        """Best paths through one provider's pools, highest output first."""
+        adjacency = self._adjacency.get(provider, {})
+        source, target = from_asset.upper(), to_asset.upper()
+        if source not in adjacency or target not in adjacency or amount <= 0:
+            return []
+
+        best_at: dict[str, Decimal] = {source: amount}
+        found: list[PathQuote] = []
+        counter = itertools.count()
+        frontier: list = [(0, next(counter), [source], [], amount)]
+        expansions = 0
+
+        while frontier and expansions < max_expansions:
+            hops, _, tokens, pools, amount_here = heapq.heappop(frontier)
+            if amount_here < best_at.get(tokens[-1], Decimal("0")):
+                continue  # a better path to this token was found meanwhile
+
+            for pool, next_token in adjacency.get(tokens[-1], []):
+                if next_token in tokens:
+                    continue
+                expansions += 1
+                try:
+                    out = pool.get_amount_out(tokens[-1], next_token, amount_here)
+                except (ArithmeticError, ValueError):
+                    continue
+                if out <= 0:
+                    continue
+
+                if next_token == target:
+                    found.append(PathQuote(
+                        provider, tokens + [next_token], pools + [pool], amount, out
+                    ))
+                    continue
+                if hops + 1 >= max_hops or out <= best_at.get(next_token, Decimal("0")):
+                    continue
+                best_at[next_token] = out
+                heapq.heappush(
+                    frontier,
+                    (hops + 1, next(counter), tokens + [next_token], pools + [pool], out),
+                )
+
+        if expansions >= max_expansions:
+            logger.debug(
+                f"Route search {source}->{target} on {provider} hit the expansion limit"
+            )
+        found.sort(key=lambda p: p.amount_out, reverse=True)
+        return found[:max_paths]
+
+    def plan(
+        self,
+        from_asset: str,
+        to_asset: str,
+        amount: Decimal,
+        providers: Optional[list[str]] = None,
+        max_hops: int = 3,
+    ) -> list[RoutePlan]:
+        """Best path per provider, highest estimated output first.
+
+        Args:
+            from_asset: Source symbol
+            to_asset: Destination symbol
+            amount: Input amount in human units
+            providers: Only plan for these providers (default: all)
+            max_hops: Longest path considered
+        """
+        plans = []
+        for provider in providers if providers is not None else self.providers:
+            paths = self.find_paths(
+                provider, from_asset, to_asset, amount, max_hops=max_hops, max_paths=1
+            )
+            if not paths:
+                continue
+            plans.append(RoutePlan(
+                provider, from_asset.upper(), to_asset.upper(), amount, paths[0]
+            ))
+
+        plans.sort(key=lambda p: p.amount_out, reverse=True)
+        return plans
+
+
+_graphs: dict[tuple[str, ...], tuple[tuple[list[PoolState], ...], LiquidityGraph]] = {}
+
+
+def get_liquidity_graph(pools_by_provider: dict[str, list[PoolState]]) -> LiquidityGraph:
+    """Get a graph for these pool lists, reusing the last one built from them.
+
+    Providers return the same list object while their snapshot is
+    unchanged, so the graph is only rebuilt after a snapshot refresh.
+    """
+    key = tuple(sorted(pools_by_provider))
+    pool_lists = tuple(pools_by_provider[name] for name in key)
+    cached = _graphs.get(key)
+    if cached is not None and all(a is b for a, b in zip(cached[0], pool_lists)):
+        return cached[1]
+
+    graph = LiquidityGraph(pools_by_provider)
+    _graphs[key] = (pool_lists, graph)
+    logger.debug(
+        f"Built liquidity graph for {', '.join(key)} "
+        f"({sum(len(p) for p in pool_lists)} pools)"
+    )
+    return graph
+
+
+def reset_liquidity_graphs() -> None:
+    """Forget cached graphs (useful for testing)."""
+    _graphs.clear()
@@ -0,0 +1,211 @@
+"""Per-provider circuit breakers and health scores.
+
+Each routing provider gets a ``ProviderHealth`` that records the outcome
+and latency of every quote call over a rolling window:
+
+- closed: calls go through; once the window holds ``min_calls`` calls and
+  the error rate reaches ``error_threshold`` the breaker opens;
+- open: the provider is skipped (zero latency instead of a timeout) until
+  ``cooldown`` seconds pass;
+- half-open: one probe call is let through. Success closes the breaker,
+  failure reopens it with the cooldown doubled (up to ``max_cooldown``).
+
+``score`` (0-1) combines success rate and median latency; the aggregator
+queries providers in score order. Health is kept per provider name so it
+survives aggregators being rebuilt.
+"""
+
+import logging
+import statistics
+import time
+from collections import deque
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Median latency at which the latency part of the score halves
+_LATENCY_SCALE_SECONDS = 1.0
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose circuit is open."""
+
+    def __init__(self, provider: str):
+        super().__init__(f"Circuit open for {provider}")
+        self.provider = provider
+
+
+class ProviderHealth:
+    """Rolling error rate, latency and circuit state for one provider."""
+
+    def __init__(
+        self,
+        name: str,
+        window_seconds: float = 60.0,
+        min_calls: int = 5,
+        error_threshold: float = 0.5,
+        cooldown: float = 30.0,
+        max_cooldown: float = 300.0,
+    ):
+        """Initialize a closed breaker.
+
+        Args:
+            name: Provider name
+            window_seconds: Age of the oldest outcome counted
+            min_calls: Calls in the window before the breaker can open
+            error_threshold: Error rate (0.5 = 50%) that opens the breaker
+            cooldown: Seconds open before a half-open probe
+            max_cooldown: Upper bound for the doubling cooldown
+        """
+        self.name = name
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.error_threshold = error_threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.cooldown = cooldown
+        self.state = CLOSED
+        self.opened_at: Optional[float] = None
+        self.skipped = 0
+        self._probe_in_flight = False
+        self._outcomes: deque[tuple[float, bool, float]] = deque()
+
+    def _prune(self, now: float) -> None:
+        while self._outcomes and now - self._outcomes[0][0] > self.window_seconds:
+            self._outcomes.popleft()
+
+    @property
+    def calls(self) -> int:
+        self._prune(time.monotonic())
+        return len(self._outcomes)
+
+    @property
+    def error_rate(self) -> float:
+        """Share of failed calls in the window."""
+        self._prune(time.monotonic())
+        if not self._outcomes:
+            return 0.0
+        return sum(1 for _, ok, _ in self._outcomes if not ok) / len(self._outcomes)
+
+    @property
+    def median_latency(self) -> Optional[float]:
+        """Median latency of successful calls in the window."""
+        self._prune(time.monotonic())
+        latencies = [latency for _, ok, latency in self._outcomes if ok]
+        return statistics.median(latencies) if latencies else None
+
+    @property
+    def score(self) -> float:
+        """Health from 0 (open) to 1 (fast and error-free)."""
+        if self.state == OPEN:
+            return 0.0
+        latency = self.median_latency
+        latency_factor = 1.0 if latency is None else 1 / (1 + latency / _LATENCY_SCALE_SECONDS)
+        return (1 - self.error_rate) * latency_factor
+
+    def allow_request(self) -> bool:
+        """Whether a call may go out now (claims the probe when half-open)."""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN and time.monotonic() - (self.opened_at or 0) >= self.cooldown:
+            self.state = HALF_OPEN
+            logger.info(f"Circuit for {self.name} half-open, probing")
+        if self.state == HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.skipped += 1
+        return False
+
+    def record_success(self, latency: float) -> None:
+        """Record a call that got an answer (a quote or a clean "no route")."""
+        now = time.monotonic()
+        self._outcomes.append((now, True, latency))
+        self._prune(now)
+        if self.state == HALF_OPEN:
+            logger.info(f"Circuit for {self.name} closed after successful probe")
+            self.state = CLOSED
+            self.cooldown = self.base_cooldown
+            self._outcomes.clear()
+            self._outcomes.append((now, True, latency))
+        self._probe_in_flight = False
+
+    def record_failure(self, latency: float) -> None:
+        """Record an error or timeout."""
+        now = time.monotonic()
+        self._outcomes.append((now, False, latency))
+        self._prune(now)
+        if self.state == HALF_OPEN:
+            self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+            self._open(now)
+        elif (
+            self.state == CLOSED
+            and len(self._outcomes) >= self.min_calls
+            and self.error_rate >= self.error_threshold
+        ):
+            self._open(now)
+        self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Give back a claimed probe without recording an outcome.
+
+        For calls cancelled from outside (a caller's deadline, shutdown):
+        they say nothing about the provider, so the next request probes.
+        """
+        self._probe_in_flight = False
+
+    def _open(self, now: float) -> None:
+        self.state = OPEN
+        self.opened_at = now
+        logger.warning(
+            f"Circuit for {self.name} opened (error rate {self.error_rate:.0%}), "
+            f"skipping for {self.cooldown:.0f}s"
+        )
+
+    def to_dict(self) -> dict:
+        latency = self.median_latency
+        return {
+            "name": self.name,
+            "state": self.state,
+            "score": round(self.score, 3),
+            "calls": self.calls,
+            "error_rate": round(self.error_rate, 3),
+            "median_latency_seconds": round(latency, 3) if latency is not None else None,
+            "cooldown_seconds": self.cooldown,
+            "skipped": self.skipped,
+        }
+
+
+_health: dict[str, ProviderHealth] = {}
+
+
+def get_provider_health(name: str) -> ProviderHealth:
+    """Get the process-wide health tracker for a provider, configured from settings."""
+    health = _health.get(name)
+    if health is None:
+        from swaperex.config import get_settings
+
+        settings = get_settings()
+        health = ProviderHealth(
+            name,
+            window_seconds=settings.breaker_window_seconds,
+            min_calls=settings.breaker_min_calls,
+            error_threshold=settings.breaker_error_threshold,
+            cooldown=settings.breaker_cooldown_seconds,
+            max_cooldown=settings.breaker_max_cooldown_seconds,
+        )
+        _health[name] = health
+    return health
+
+
+def all_provider_health() -> list[ProviderHealth]:
+    """Health of every provider seen so far, healthiest first."""
+    return sorted(_health.values(), key=lambda h: h.score, reverse=True)
+
+
+def reset_provider_health() -> None:
+    """Forget all health state (useful for testing)."""
+    _health.clear()
@@ -0,0 +1,181 @@
+"""Hedged requests for providers with redundant endpoints.
+
+A slow upstream call usually isn't a failure, just a slow replica. Rather
+than waiting out a timeout and then trying the next endpoint,
+``hedged_request`` starts the primary attempt and, if no good answer has
+arrived after the provider's recent p95 latency, starts a backup. The
+first acceptable answer wins and the others are cancelled. An attempt
+that fails outright starts the next one immediately.
+
+Since only requests slower than p95 get a backup, steady-state load goes
+up by roughly 5% while tail latency drops to about that of the faster of
+two attempts.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Sliding window of successful request latencies for one upstream."""
+
+    def __init__(
+        self,
+        window: int = 256,
+        min_samples: int = 20,
+        quantile: float = 0.95,
+        min_delay: float = 0.05,
+        max_delay: float = 2.0,
+        default_delay: float = 1.0,
+    ):
+        """Initialize the tracker.
+
+        Args:
+            window: Latencies kept
+            min_samples: Samples needed before the quantile is trusted
+            quantile: Latency quantile used as the hedge delay
+            min_delay: Lower bound on the hedge delay (seconds)
+            max_delay: Upper bound on the hedge delay (seconds)
+            default_delay: Hedge delay until ``min_samples`` are recorded
+        """
+        self.min_samples = min_samples
+        self.quantile = quantile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.default_delay = default_delay
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        """Record one successful request's latency."""
+        self._samples.append(seconds)
+
+    def percentile(self, quantile: Optional[float] = None) -> Optional[float]:
+        """Latency at a quantile of the window (None if empty)."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        q = self.quantile if quantile is None else quantile
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait on an attempt before starting a backup."""
+        if len(self._samples) < self.min_samples:
+            delay = self.default_delay
+        else:
+            delay = self.percentile()
+        return min(self.max_delay, max(self.min_delay, delay))
+
+
+def _is_present(result) -> bool:
+    return result is not None
+
+
+def is_definitive_response(response) -> bool:
+    """Whether an HTTP response settles the request (not 5xx or 429).
+
+    Use as ``accept`` when hedging duplicate calls to one endpoint: a
+    4xx won't change on retry, while a 5xx or rate limit might.
+    """
+    return response is not None and response.status_code < 500 and response.status_code != 429
+
+
+async def hedged_request(
+    attempts: Sequence[Callable[[], Awaitable[T]]],
+    tracker: Optional[LatencyTracker] = None,
+    accept: Callable[[T], bool] = _is_present,
+    label: str = "",
+) -> Optional[T]:
+    """Run attempts with hedging and return the first acceptable result.
+
+    Args:
+        attempts: Coroutine factories, in order of preference (e.g. one
+            per endpoint, or the same call repeated)
+        tracker: Latency history that sets the hedge delay (also updated)
+        accept: Whether a result is good enough to win
+        label: Name used in log messages
+
+    Returns:
+        First accepted result, or None if every attempt failed or was rejected
+    """
+    if not attempts:
+        return None
+    if tracker is None:
+        tracker = LatencyTracker()
+
+    started: dict[asyncio.Task, float] = {}
+    next_attempt = 0
+
+    def launch() -> None:
+        nonlocal next_attempt
+        task = asyncio.create_task(attempts[next_attempt]())
+        started[task] = time.monotonic()
+        next_attempt += 1
+
+    launch()
+    try:
+        while started:
+            more = next_attempt < len(attempts)
+            done, _ = await asyncio.wait(
+                started,
+                timeout=tracker.hedge_delay() if more else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                logger.debug(f"{label}: no answer after hedge delay, starting attempt {next_attempt + 1}")
+                launch()
+                continue
+
+            failed = False
+            for task in done:
+                began = started.pop(task)
+                if task.exception() is not None:
+                    logger.debug(f"{label}: attempt failed: {task.exception()}")
+                    failed = True
+                elif accept(task.result()):
+                    tracker.record(time.monotonic() - began)
+                    return task.result()
+                else:
+                    failed = True
+
+            if failed and next_attempt < len(attempts):
+                launch()
+        return None
+    finally:
+        for task in started:
+            task.cancel()
+        if started:
+            await asyncio.gather(*started, return_exceptions=True)
+
+
+_trackers: dict[str, LatencyTracker] = {}
+
+
+def get_latency_tracker(name: str) -> LatencyTracker:
+    """Get the process-wide latency tracker for an upstream, configured from settings."""
+    tracker = _trackers.get(name)
+    if tracker is None:
+        from swaperex.config import get_settings
+
+        settings = get_settings()
+        tracker = LatencyTracker(
+            quantile=settings.hedge_quantile,
+            min_delay=settings.hedge_min_delay,
+            max_delay=settings.hedge_max_delay,
+        )
+        _trackers[name] = tracker
+    return tracker
+
+
+def reset_latency_trackers() -> None:
+    """Forget all latency history (useful for testing)."""
+    _trackers.clear()
@@ -8,9 +8,15 @@ import logging
 from decimal import Decimal
 from typing import Optional
 
-import httpx
-
-from swaperex.routing.base import Quote, RouteProvider, SwapRoute
+from swaperex.routing.base import (
+    ProviderUnavailableError,
+    Quote,
+    RouteProvider,
+    SwapRoute,
+    is_unavailable_status,
+)
+from swaperex.routing.hedging import get_latency_tracker, hedged_request, is_definitive_response
+from swaperex.utils.http import pooled_client
 
 logger = logging.getLogger(__name__)
 
@@ -129,22 +135,38 @@ class JupiterProvider(RouteProvider):
         slippage_bps = int(slippage_tolerance * 10000)
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # Get quote from Jupiter API
-                response = await client.get(
-                    f"{self.base_url}/quote",
-                    headers=self._get_headers(),
-                    params={
-                        "inputMint": from_mint,
-                        "outputMint": to_mint,
-                        "amount": str(amount_lamports),
-                        "slippageBps": str(slippage_bps),
-                        "onlyDirectRoutes": "false",
-                    },
+            async with pooled_client(timeout=30.0) as client:
+                def fetch():
+                    return client.get(
+                        f"{self.base_url}/quote",
+                        headers=self._get_headers(),
+                        params={
+                            "inputMint": from_mint,
+                            "outputMint": to_mint,
+                            "amount": str(amount_lamports),
+                            "slippageBps": str(slippage_bps),
+                            "onlyDirectRoutes": "false",
+                        },
+                    )
+
+                # Get quote from Jupiter API, with a hedged backup call after p95
+                response = await hedged_request(
+                    [fetch, fetch],
+                    tracker=get_latency_tracker("jupiter_quote"),
+                    accept=is_definitive_response,
+                    label="Jupiter quote",
                 )
 
+                if response is None:
+                    logger.warning("Jupiter API unavailable")
+                    raise ProviderUnavailableError("Jupiter API unavailable")
+
                 if response.status_code != 200:
                     logger.warning(f"Jupiter API error: {response.status_code} - {response.text}")
+                    if is_unavailable_status(response.status_code):
+                        raise ProviderUnavailableError(
+                            f"Jupiter API error: {response.status_code}"
+                        )
                     return None
 
                 data = response.json()
@@ -193,9 +215,11 @@ class JupiterProvider(RouteProvider):
                     is_simulated=False,
                 )
 
+        except ProviderUnavailableError:
+            raise
         except Exception as e:
             logger.error(f"Jupiter quote error: {e}")
-            return None
+            raise ProviderUnavailableError(f"Jupiter quote error: {e}") from e
 
     async def execute_swap(self, route: SwapRoute) -> dict:
         """Execute swap via Jupiter.
@@ -209,7 +233,7 @@ class JupiterProvider(RouteProvider):
             return {"success": False, "error": "Missing quote response"}
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 # Get swap transaction from Jupiter
                 response = await client.post(
                     f"{self.base_url}/swap",
@@ -250,7 +274,7 @@ class JupiterProvider(RouteProvider):
             return None
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with pooled_client(timeout=10.0) as client:
                 response = await client.get(
                     f"{JUPITER_PRICE_API}/price",
                     params={"ids": mint},
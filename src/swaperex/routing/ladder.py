@@ -0,0 +1,336 @@
+"""Precomputed quote ladders for popular pairs.
+
+Most swap requests are for a few pairs, yet each amount typed into the
+bot used to cost a full upstream quote. ``QuoteLadderPrecomputer`` keeps,
+for the top-N pairs ranked by recent rows in the ``swaps`` table (plus
+configured seed pairs), a ladder of quotes at standard USD amount tiers,
+refreshed in the background.
+
+A display quote for any amount inside the ladder is interpolated from
+the two neighbouring rungs (linear in the rate, so price impact between
+tiers is approximated) and returned instantly. Such quotes carry
+``route_details["estimate"] == "quote_ladder"``; the swap handler fetches
+a live firm quote at confirmation before anything is executed.
+"""
+
+import asyncio
+import bisect
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Callable, Optional
+
+from swaperex.routing.base import Quote, RouteAggregator
+
+logger = logging.getLogger(__name__)
+
+ESTIMATE_TAG = "quote_ladder"
+
+PairKey = tuple[str, str, str]  # (chain, from_asset, to_asset)
+
+
+def parse_ladder_pairs(value: str) -> list[PairKey]:
+    """Parse ``"pancakeswap:BNB/USDT,jupiter:SOL/USDC"`` into pair keys."""
+    pairs = []
+    for item in value.split(","):
+        chain, _, pair = item.strip().partition(":")
+        from_asset, _, to_asset = pair.partition("/")
+        if chain and from_asset and to_asset:
+            pairs.append((chain.lower(), from_asset.upper(), to_asset.upper()))
+        elif item.strip():
+            logger.warning(f"Ignoring invalid quote ladder pair: {item!r}")
+    return pairs
+
+
+@dataclass
+class QuoteLadder:
+    """Best quotes for one pair at increasing input amounts."""
+
+    chain: str
+    from_asset: str
+    to_asset: str
+    rungs: list[Quote] = field(default_factory=list)  # sorted by from_amount
+    updated_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.updated_at
+
+    @property
+    def max_amount(self) -> Decimal:
+        return self.rungs[-1].from_amount if self.rungs else Decimal("0")
+
+    def rate_at(self, amount: Decimal) -> Optional[Decimal]:
+        """Interpolated rate for an amount (None above the top rung).
+
+        Below the first rung the first rung's rate is used.
+        """
+        if not self.rungs or amount <= 0 or amount > self.max_amount:
+            return None
+        amounts = [rung.from_amount for rung in self.rungs]
+        i = bisect.bisect_left(amounts, amount)
+        if i == 0:
+            return self.rungs[0].effective_rate
+        lower, upper = self.rungs[i - 1], self.rungs[i]
+        weight = (amount - lower.from_amount) / (upper.from_amount - lower.from_amount)
+        return lower.effective_rate + (upper.effective_rate - lower.effective_rate) * weight
+
+    def estimate(self, amount: Decimal) -> Optional[Quote]:
+        """Display quote for an amount, or None if outside the ladder."""
+        rate = self.rate_at(amount)
+        if rate is None:
+            return None
+        amounts = [rung.from_amount for rung in self.rungs]
+        nearest = self.rungs[min(bisect.bisect_left(amounts, amount), len(self.rungs) - 1)]
+        return Quote(
+            provider=nearest.provider,
+            from_asset=self.from_asset,
+            to_asset=self.to_asset,
+            from_amount=amount,
+            to_amount=amount * rate,
+            fee_asset=nearest.fee_asset,
+            fee_amount=nearest.fee_amount,
+            slippage_percent=nearest.slippage_percent,
+            estimated_time_seconds=nearest.estimated_time_seconds,
+            route_details={
+                "estimate": ESTIMATE_TAG,
+                "chain": self.chain,
+                "ladder_age_seconds": round(self.age, 1),
+            },
+            is_simulated=nearest.is_simulated,
+        )
+
+
+def is_ladder_estimate(quote_data: dict) -> bool:
+    """Whether stored quote data came from a ladder (needs a firm quote)."""
+    return quote_data.get("estimate") == ESTIMATE_TAG
+
+
+class QuoteLadderPrecomputer:
+    """Keeps quote ladders for the most swapped pairs up to date."""
+
+    def __init__(
+        self,
+        top_pairs: int = 10,
+        tiers_usd: Optional[list[Decimal]] = None,
+        seed_pairs: Optional[list[PairKey]] = None,
+        refresh_interval: float = 30.0,
+        max_age: float = 120.0,
+        lookback_days: int = 7,
+        concurrency: int = 8,
+        aggregator_for: Optional[Callable[[str], RouteAggregator]] = None,
+    ):
+        """Initialize the precomputer.
+
+        Args:
+            top_pairs: Pairs kept (most swapped first, then seed pairs)
+            tiers_usd: Rung sizes in USD, converted with the price oracle
+            seed_pairs: Pairs kept even without swap history
+            refresh_interval: Seconds between ladder refreshes
+            max_age: Age after which a ladder is no longer used
+            lookback_days: Swap history counted when ranking pairs
+            concurrency: Max quotes in flight while refreshing
+            aggregator_for: Chain -> aggregator (defaults to the shared registry)
+        """
+        if aggregator_for is None:
+            from swaperex.routing.registry import get_chain_aggregator
+
+            aggregator_for = get_chain_aggregator
+        self.top_pairs = top_pairs
+        self.tiers_usd = sorted(tiers_usd or [Decimal(t) for t in (10, 100, 1000, 10000)])
+        self.seed_pairs = seed_pairs or []
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.lookback_days = lookback_days
+        self.concurrency = concurrency
+        self.aggregator_for = aggregator_for
+        self._ladders: dict[PairKey, QuoteLadder] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.refreshes = 0
+
+    # ----- lookups -----
+
+    def get_ladder(self, chain: str, from_asset: str, to_asset: str) -> Optional[QuoteLadder]:
+        """Fresh ladder for a pair, if one is kept."""
+        ladder = self._ladders.get((chain.lower(), from_asset.upper(), to_asset.upper()))
+        if ladder is None or ladder.age > self.max_age:
+            return None
+        return ladder
+
+    def estimate(
+        self, chain: str, from_asset: str, to_asset: str, amount: Decimal
+    ) -> Optional[Quote]:
+        """Instant display quote, or None if no fresh ladder covers the amount."""
+        ladder = self.get_ladder(chain, from_asset, to_asset)
+        return ladder.estimate(amount) if ladder is not None else None
+
+    @property
+    def pairs(self) -> list[PairKey]:
+        return list(self._ladders)
+
+    # ----- refresh -----
+
+    def _route_chains(self) -> dict[str, str]:
+        """Provider name -> chain, from the shared chain aggregators."""
+        from swaperex.routing.factory import CHAIN_PROVIDERS
+
+        chains: dict[str, str] = {}
+        for chain in CHAIN_PROVIDERS:
+            for provider in self.aggregator_for(chain).providers:
+                chains.setdefault(provider.name, chain)
+        return chains
+
+    async def select_pairs(self) -> list[PairKey]:
+        """Top pairs by recent swaps, topped up with seed pairs."""
+        from swaperex.ledger.database import get_read_db
+        from swaperex.ledger.repository import LedgerRepository
+
+        pairs: list[PairKey] = []
+        try:
+            since = datetime.now(timezone.utc) - timedelta(days=self.lookback_days)
+            async with get_read_db() as session:
+                rows = await LedgerRepository(session).get_popular_swap_pairs(
+                    since=since, limit=self.top_pairs * 3
+                )
+            route_chains = self._route_chains()
+            for from_asset, to_asset, route, _ in rows:
+                chain = route_chains.get(route)
+                key = (chain, from_asset.upper(), to_asset.upper()) if chain else None
+                if key and key not in pairs:
+                    pairs.append(key)
+        except Exception as e:
+            logger.warning(f"Could not rank swap pairs, using seed pairs: {e}")
+
+        for key in self.seed_pairs:
+            if key not in pairs:
+                pairs.append(key)
+        return pairs[: self.top_pairs]
+
+    def tier_amounts(self, from_asset: str) -> list[Decimal]:
+        """Rung input amounts for an asset (raw tiers if it has no price)."""
+        from swaperex.prices import get_price_oracle
+
+        price = get_price_oracle().get_price(from_asset)
+        if not price:
+            return list(self.tiers_usd)
+        return [(tier / price).quantize(Decimal("1e-8")) for tier in self.tiers_usd]
+
+    async def build_ladder(
+        self, chain: str, from_asset: str, to_asset: str, semaphore: asyncio.Semaphore
+    ) -> Optional[QuoteLadder]:
+        """Quote every tier of one pair."""
+        aggregator = self.aggregator_for(chain)
+
+        async def quote(amount: Decimal) -> Optional[Quote]:
+            async with semaphore:
+                try:
+                    return await aggregator.get_best_quote(from_asset, to_asset, amount)
+                except Exception as e:
+                    logger.debug(f"Ladder quote {from_asset}/{to_asset} {amount} failed: {e}")
+                    return None
+
+        amounts = [a for a in self.tier_amounts(from_asset) if a > 0]
+        quotes = await asyncio.gather(*(quote(amount) for amount in amounts))
+        rungs = sorted((q for q in quotes if q and q.to_amount > 0), key=lambda q: q.from_amount)
+        if not rungs:
+            return None
+        return QuoteLadder(chain, from_asset, to_asset, rungs)
+
+    async def refresh(self) -> int:
+        """Rebuild the ladders of the current top pairs.
+
+        Returns:
+            Number of ladders built
+        """
+        pairs = await self.select_pairs()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        ladders = await asyncio.gather(
+            *(self.build_ladder(*pair, semaphore) for pair in pairs)
+        )
+
+        fresh = {pair: ladder for pair, ladder in zip(pairs, ladders) if ladder is not None}
+        # Keep a pair's previous ladder until it ages out if this refresh failed
+        for pair in pairs:
+            if pair not in fresh and pair in self._ladders:
+                fresh[pair] = self._ladders[pair]
+        self._ladders = fresh
+        self.refreshes += 1
+        built = sum(1 for ladder in ladders if ladder is not None)
+        logger.debug(f"Refreshed {built}/{len(pairs)} quote ladders")
+        return built
+
+    # ----- background task -----
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start refreshing ladders in the background."""
+        if not self.running:
+            self._task = asyncio.create_task(self._refresh_loop())
+            logger.info(
+                f"Quote ladder precomputer started (top {self.top_pairs} pairs, "
+                f"every {self.refresh_interval:.0f}s)"
+            )
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"Quote ladder refresh failed: {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+    def stats(self) -> dict:
+        return {
+            "running": self.running,
+            "refreshes": self.refreshes,
+            "ladders": [
+                {
+                    "chain": ladder.chain,
+                    "pair": f"{ladder.from_asset}/{ladder.to_asset}",
+                    "rungs": len(ladder.rungs),
+                    "max_amount": str(ladder.max_amount),
+                    "age_seconds": round(ladder.age, 1),
+                }
+                for ladder in self._ladders.values()
+            ],
+        }
+
+
+_precomputer: Optional[QuoteLadderPrecomputer] = None
+
+
+def get_quote_ladder() -> QuoteLadderPrecomputer:
+    """Get the process-wide quote ladder precomputer, configured from settings."""
+    global _precomputer
+    if _precomputer is None:
+        from swaperex.config import get_settings
+
+        settings = get_settings()
+        _precomputer = QuoteLadderPrecomputer(
+            top_pairs=settings.quote_ladder_top_pairs,
+            tiers_usd=[
+                Decimal(t.strip()) for t in settings.quote_ladder_tiers_usd.split(",") if t.strip()
+            ],
+            seed_pairs=parse_ladder_pairs(settings.quote_ladder_seed_pairs),
+            refresh_interval=settings.quote_ladder_refresh_interval,
+            max_age=settings.quote_ladder_max_age,
+            lookback_days=settings.quote_ladder_lookback_days,
+        )
+    return _precomputer
+
+
+def reset_quote_ladder() -> None:
+    """Drop the precomputer (useful for testing)."""
+    global _precomputer
+    _precomputer = None
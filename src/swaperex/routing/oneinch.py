@@ -8,9 +8,15 @@ import logging
 from decimal import Decimal
 from typing import Optional
 
-import httpx
-
-from swaperex.routing.base import Quote, RouteProvider, SwapRoute
+from swaperex.routing.base import (
+    ProviderUnavailableError,
+    Quote,
+    RouteProvider,
+    SwapRoute,
+    is_unavailable_status,
+)
+from swaperex.routing.hedging import get_latency_tracker, hedged_request, is_definitive_response
+from swaperex.utils.http import pooled_client
 
 logger = logging.getLogger(__name__)
 
@@ -189,21 +195,39 @@ class OneInchProvider(RouteProvider):
         amount_wei = int(amount * (10 ** decimals))
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 # Get quote from 1inch API
                 logger.info(f"1inch quote request: {from_asset}->{to_asset}, amount={amount_wei}, chain={self.chain_id}")
-                response = await client.get(
-                    f"{self.base_url}/quote",
-                    headers=self._get_headers(),
-                    params={
-                        "src": from_address,
-                        "dst": to_address,
-                        "amount": str(amount_wei),
-                    },
+
+                def fetch():
+                    return client.get(
+                        f"{self.base_url}/quote",
+                        headers=self._get_headers(),
+                        params={
+                            "src": from_address,
+                            "dst": to_address,
+                            "amount": str(amount_wei),
+                        },
+                    )
+
+                # Hedged: a backup call goes out if the first is slower than p95
+                response = await hedged_request(
+                    [fetch, fetch],
+                    tracker=get_latency_tracker(f"oneinch_quote_{self.chain_id}"),
+                    accept=is_definitive_response,
+                    label="1inch quote",
                 )
 
+                if response is None:
+                    logger.warning("1inch API unavailable")
+                    raise ProviderUnavailableError("1inch API unavailable")
+
                 if response.status_code != 200:
                     logger.warning(f"1inch API error: {response.status_code} - {response.text}")
+                    if is_unavailable_status(response.status_code):
+                        raise ProviderUnavailableError(
+                            f"1inch API error: {response.status_code}"
+                        )
                     return None
 
                 data = response.json()
@@ -245,9 +269,11 @@ class OneInchProvider(RouteProvider):
                     is_simulated=False,
                 )
 
+        except ProviderUnavailableError:
+            raise
         except Exception as e:
             logger.error(f"1inch quote error: {e}")
-            return None
+            raise ProviderUnavailableError(f"1inch quote error: {e}") from e
 
     async def _get_gas_price(self) -> int:
         """Get current gas price in wei."""
@@ -260,7 +286,7 @@ class OneInchProvider(RouteProvider):
         rpc_url = rpc_urls.get(self.chain, rpc_urls["ethereum"])
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with pooled_client(timeout=10.0) as client:
                 response = await client.post(
                     rpc_url,
                     json={
@@ -309,7 +335,7 @@ class OneInchProvider(RouteProvider):
         min_return_wei = int(min_return * (10 ** to_decimals))
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 response = await client.get(
                     f"{self.base_url}/swap",
                     headers=self._get_headers(),
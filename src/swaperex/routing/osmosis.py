@@ -8,9 +8,16 @@ import logging
 from decimal import Decimal
 from typing import Optional
 
-import httpx
-
-from swaperex.routing.base import Quote, RouteProvider, SwapRoute
+from swaperex.prices import get_price_oracle
+from swaperex.routing.base import (
+    ProviderUnavailableError,
+    Quote,
+    RouteProvider,
+    SwapRoute,
+    is_unavailable_status,
+)
+from swaperex.routing.pools import PoolSnapshotStore, PoolState, get_pool_snapshot_store
+from swaperex.utils.http import pooled_client
 
 logger = logging.getLogger(__name__)
 
@@ -109,7 +116,7 @@ class OsmosisProvider(RouteProvider):
         amount_micro = int(amount * (10 ** from_decimals))
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 # Use Osmosis SQS (Sidecar Query Server) for quotes
                 response = await client.get(
                     f"{self.sqs_url}/router/quote",
@@ -148,15 +155,25 @@ class OsmosisProvider(RouteProvider):
                     )
 
                 # Fallback to simulated quote if SQS fails
-                return await self._get_simulated_quote(
+                fallback = await self._get_simulated_quote(
                     from_asset, to_asset, amount, slippage_tolerance
                 )
+                if is_unavailable_status(response.status_code):
+                    raise ProviderUnavailableError(
+                        f"Osmosis SQS error: {response.status_code}", fallback=fallback
+                    )
+                return fallback
 
+        except ProviderUnavailableError:
+            raise
         except Exception as e:
             logger.error(f"Osmosis quote error: {e}")
-            return await self._get_simulated_quote(
-                from_asset, to_asset, amount, slippage_tolerance
-            )
+            raise ProviderUnavailableError(
+                f"Osmosis quote error: {e}",
+                fallback=await self._get_simulated_quote(
+                    from_asset, to_asset, amount, slippage_tolerance
+                ),
+            ) from e
 
     async def _get_simulated_quote(
         self,
@@ -172,23 +189,10 @@ class OsmosisProvider(RouteProvider):
         if not from_denom or not to_denom:
             return None
 
-        # Simulated price ratios (approximate market rates)
-        # These are estimates - real quotes should use SQS API
-        simulated_prices_usd = {
-            "OSMO": Decimal("0.45"),
-            "ATOM": Decimal("9.50"),
-            "USDC": Decimal("1.00"),
-            "USDC.AXL": Decimal("1.00"),
-            "JUNO": Decimal("0.35"),
-            "INJ": Decimal("25.00"),
-            "TIA": Decimal("5.00"),
-            "SCRT": Decimal("0.40"),
-            "STARS": Decimal("0.01"),
-            "AKT": Decimal("3.50"),
-        }
-
-        from_price = simulated_prices_usd.get(from_asset.upper(), Decimal("1"))
-        to_price = simulated_prices_usd.get(to_asset.upper(), Decimal("1"))
+        # Oracle prices (unknown tokens count as $1)
+        oracle = get_price_oracle()
+        from_price = oracle.get_price(from_asset) or Decimal("1")
+        to_price = oracle.get_price(to_asset) or Decimal("1")
 
         if to_price <= 0:
             return None
@@ -242,7 +246,7 @@ class OsmosisProvider(RouteProvider):
     async def get_pools(self) -> list[dict]:
         """Get all active liquidity pools."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 response = await client.get(
                     f"{self.imperator_url}/pools/v2/all",
                 )
@@ -255,6 +259,50 @@ class OsmosisProvider(RouteProvider):
 
         return []
 
+    @property
+    def pool_snapshots(self) -> PoolSnapshotStore:
+        """Shared snapshot of Osmosis pools between known tokens."""
+        return get_pool_snapshot_store("osmosis", self._fetch_pools)
+
+    async def _fetch_pools(self) -> list[PoolState]:
+        """Download pools from SQS, keeping two-asset balancer pools of known tokens.
+
+        Concentrated-liquidity and CosmWasm pools are left to the live
+        SQS router; their reserves don't follow x*y=k.
+        """
+        async with pooled_client(timeout=30.0) as client:
+            response = await client.get(f"{self.sqs_url}/pools")
+        response.raise_for_status()
+
+        symbols: dict[str, str] = {}
+        for symbol, denom in COSMOS_TOKENS.items():
+            symbols.setdefault(denom, symbol)
+
+        pools = []
+        for pool in response.json():
+            balances = pool.get("balances") or []
+            if pool.get("type", 0) != 0 or len(balances) != 2:
+                continue
+            names = [symbols.get(b.get("denom")) for b in balances]
+            if None in names:
+                continue
+            try:
+                fee_bps = int(Decimal(str(pool.get("spread_factor", "0.002"))) * 10000)
+                reserves = [
+                    Decimal(b["amount"]) / Decimal(10 ** self._get_decimals(n))
+                    for b, n in zip(balances, names)
+                ]
+            except (ArithmeticError, KeyError, ValueError):
+                continue
+            pool_id = pool.get("chain_model", {}).get("id", pool.get("id", ""))
+            pools.append(PoolState(str(pool_id), names, reserves, fee_bps=fee_bps))
+        return pools
+
+    async def get_liquidity_pools(self) -> Optional[list[PoolState]]:
+        """Cached balancer pools for multi-hop route search."""
+        snapshot = await self.pool_snapshots.get_snapshot()
+        return snapshot.pools if snapshot is not None else None
+
 
 def create_osmosis_provider() -> OsmosisProvider:
     """Create an Osmosis provider instance."""
@@ -0,0 +1,405 @@
+"""Local pool-state snapshots and AMM math for DEX fallback quotes.
+
+Fallback quoting used to download a DEX's full pool list on every
+request and scan it linearly. PoolSnapshotStore keeps one snapshot per
+DEX, indexed by token pair, and quotes are computed locally:
+
+- constant-product pools: x * y = k with the pool's fee on the input
+- stable-swap pools: the Curve/StableSwap invariant with amplification
+- continuous-liquidity pools: THORChain's slip-based fee model
+
+Snapshots are refreshed in the background once older than
+``refresh_interval`` (readers keep using the current one meanwhile) and
+are never used once older than ``max_age``, so a quote's staleness is
+bounded. Each successful refresh is written to disk so a cold start can
+quote immediately from the last snapshot.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+CONSTANT_PRODUCT = "constant_product"
+STABLE_SWAP = "stable_swap"
+CONTINUOUS_LIQUIDITY = "clp"
+
+# Stable-swap math runs on integers scaled to this many decimals
+STABLE_PRECISION = 18
+
+
+def constant_product_out(
+    amount_in: Decimal, reserve_in: Decimal, reserve_out: Decimal, fee_bps: int
+) -> Decimal:
+    """Output of an x*y=k swap with the fee taken from the input."""
+    if amount_in <= 0 or reserve_in <= 0 or reserve_out <= 0:
+        return Decimal("0")
+    amount_after_fee = amount_in * (10000 - fee_bps) / 10000
+    return amount_after_fee * reserve_out / (reserve_in + amount_after_fee)
+
+
+def clp_out(amount_in: Decimal, reserve_in: Decimal, reserve_out: Decimal) -> Decimal:
+    """Output of a THORChain CLP swap: x * X * Y / (x + X)^2 (fee grows with slip)."""
+    if amount_in <= 0 or reserve_in <= 0 or reserve_out <= 0:
+        return Decimal("0")
+    return amount_in * reserve_in * reserve_out / (amount_in + reserve_in) ** 2
+
+
+def _stable_d(xp: list[int], amp: int) -> int:
+    """StableSwap invariant D for balances ``xp``."""
+    n = len(xp)
+    total = sum(xp)
+    if total == 0:
+        return 0
+    d = total
+    ann = amp * n
+    for _ in range(255):
+        d_p = d
+        for x in xp:
+            d_p = d_p * d // (x * n)
+        d_prev = d
+        d = (ann * total + d_p * n) * d // ((ann - 1) * d + (n + 1) * d_p)
+        if abs(d - d_prev) <= 1:
+            break
+    return d
+
+
+def _stable_y(i: int, j: int, x: int, xp: list[int], amp: int) -> int:
+    """New balance of coin ``j`` when coin ``i`` has balance ``x``."""
+    n = len(xp)
+    d = _stable_d(xp, amp)
+    ann = amp * n
+    c = d
+    s = 0
+    for k in range(n):
+        if k == i:
+            balance = x
+        elif k == j:
+            continue
+        else:
+            balance = xp[k]
+        s += balance
+        c = c * d // (balance * n)
+    c = c * d // (ann * n)
+    b = s + d // ann
+    y = d
+    for _ in range(255):
+        y_prev = y
+        y = (y * y + c) // (2 * y + b - d)
+        if abs(y - y_prev) <= 1:
+            break
+    return y
+
+
+def stable_swap_out(
+    amount_in: Decimal,
+    i: int,
+    j: int,
+    balances: list[Decimal],
+    amp: int,
+    fee_bps: int,
+) -> Decimal:
+    """Output of a StableSwap trade with the fee taken from the output.
+
+    ``balances`` and ``amount_in`` must share one precision (see
+    ``PoolState.normalized``).
+    """
+    scale = Decimal(10) ** STABLE_PRECISION
+    xp = [int(b * scale) for b in balances]
+    dx = int(amount_in * scale)
+    if dx <= 0 or any(b <= 0 for b in xp):
+        return Decimal("0")
+    y = _stable_y(i, j, xp[i] + dx, xp, amp)
+    dy = max(0, xp[j] - y - 1)
+    return Decimal(dy) * (10000 - fee_bps) / 10000 / scale
+
+
+@dataclass
+class PoolState:
+    """Reserves of one pool, in raw (smallest) token units."""
+
+    pool_id: str
+    tokens: list[str]
+    reserves: list[Decimal]
+    fee_bps: int = 30
+    kind: str = CONSTANT_PRODUCT
+    amp: Optional[int] = None
+    decimals: Optional[list[int]] = None  # required for stable-swap pools
+
+    def has_pair(self, token_in: str, token_out: str) -> bool:
+        return token_in in self.tokens and token_out in self.tokens and token_in != token_out
+
+    def reserve(self, token: str) -> Decimal:
+        """Raw reserve of a token in this pool."""
+        return self.reserves[self.tokens.index(token)]
+
+    def get_amount_out(self, token_in: str, token_out: str, amount_in: Decimal) -> Decimal:
+        """Raw output for a raw input amount."""
+        i = self.tokens.index(token_in)
+        j = self.tokens.index(token_out)
+
+        if self.kind == STABLE_SWAP and self.amp and self.decimals:
+            balances = [
+                r / (Decimal(10) ** d) for r, d in zip(self.reserves, self.decimals)
+            ]
+            out = stable_swap_out(
+                amount_in / (Decimal(10) ** self.decimals[i]),
+                i, j, balances, self.amp, self.fee_bps,
+            )
+            return out * (Decimal(10) ** self.decimals[j])
+
+        if self.kind == CONTINUOUS_LIQUIDITY:
+            return clp_out(amount_in, self.reserves[i], self.reserves[j])
+
+        return constant_product_out(amount_in, self.reserves[i], self.reserves[j], self.fee_bps)
+
+    def to_dict(self) -> dict:
+        return {
+            "pool_id": self.pool_id,
+            "tokens": self.tokens,
+            "reserves": [str(r) for r in self.reserves],
+            "fee_bps": self.fee_bps,
+            "kind": self.kind,
+            "amp": self.amp,
+            "decimals": self.decimals,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PoolState":
+        return cls(
+            pool_id=str(data["pool_id"]),
+            tokens=list(data["tokens"]),
+            reserves=[Decimal(r) for r in data["reserves"]],
+            fee_bps=int(data.get("fee_bps", 30)),
+            kind=data.get("kind", CONSTANT_PRODUCT),
+            amp=data.get("amp"),
+            decimals=data.get("decimals"),
+        )
+
+
+@dataclass
+class PoolSnapshot:
+    """All pools of one DEX at a point in time, indexed by token pair."""
+
+    pools: list[PoolState]
+    fetched_at: float = field(default_factory=time.time)
+
+    def __post_init__(self) -> None:
+        self._symbol_pools: Optional[list[PoolState]] = None
+        self._by_pair: dict[frozenset, list[PoolState]] = {}
+        for pool in self.pools:
+            for a in pool.tokens:
+                for b in pool.tokens:
+                    if a < b:
+                        self._by_pair.setdefault(frozenset((a, b)), []).append(pool)
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was fetched."""
+        return time.time() - self.fetched_at
+
+    def pools_for(self, token_a: str, token_b: str) -> list[PoolState]:
+        """Pools trading a pair (constant-time lookup)."""
+        return self._by_pair.get(frozenset((token_a, token_b)), [])
+
+    def best_quote(
+        self, token_in: str, token_out: str, amount_in: Decimal
+    ) -> Optional[tuple[PoolState, Decimal]]:
+        """Best single-pool output for a raw input amount."""
+        best: Optional[tuple[PoolState, Decimal]] = None
+        for pool in self.pools_for(token_in, token_out):
+            try:
+                out = pool.get_amount_out(token_in, token_out, amount_in)
+            except (ArithmeticError, ValueError):
+                continue
+            if out > 0 and (best is None or out > best[1]):
+                best = (pool, out)
+        return best
+
+    def symbol_pools(
+        self, symbols: dict[str, str], decimals: dict[str, int]
+    ) -> list[PoolState]:
+        """Pools between known tokens, keyed by symbol with human-unit reserves.
+
+        Computed once per snapshot; pools with an unknown token are dropped.
+
+        Args:
+            symbols: Token id -> symbol
+            decimals: Symbol -> token decimals
+        """
+        if self._symbol_pools is None:
+            converted = []
+            for pool in self.pools:
+                names = [symbols.get(t) for t in pool.tokens]
+                if None in names or any(n not in decimals for n in names):
+                    continue
+                converted.append(PoolState(
+                    pool_id=pool.pool_id,
+                    tokens=names,
+                    reserves=[
+                        r / (Decimal(10) ** decimals[n]) for r, n in zip(pool.reserves, names)
+                    ],
+                    fee_bps=pool.fee_bps,
+                    kind=pool.kind,
+                    amp=pool.amp,
+                    decimals=[0] * len(names) if pool.kind == STABLE_SWAP else None,
+                ))
+            self._symbol_pools = converted
+        return self._symbol_pools
+
+    def to_dict(self) -> dict:
+        return {"fetched_at": self.fetched_at, "pools": [p.to_dict() for p in self.pools]}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PoolSnapshot":
+        return cls(
+            pools=[PoolState.from_dict(p) for p in data.get("pools", [])],
+            fetched_at=float(data.get("fetched_at", 0)),
+        )
+
+    def save(self, path: Path) -> None:
+        """Write the snapshot atomically."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(self.to_dict()))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["PoolSnapshot"]:
+        """Read a snapshot written by ``save`` (None if missing or unreadable)."""
+        try:
+            return cls.from_dict(json.loads(path.read_text()))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable pool snapshot {path}: {e}")
+            return None
+
+
+PoolFetcher = Callable[[], Awaitable[list[PoolState]]]
+
+
+class PoolSnapshotStore:
+    """Background-refreshed, disk-persisted pool snapshot for one DEX."""
+
+    def __init__(
+        self,
+        name: str,
+        fetch: PoolFetcher,
+        refresh_interval: float = 30.0,
+        max_age: float = 300.0,
+        cache_dir: Optional[str] = None,
+    ):
+        """Initialize the store.
+
+        Args:
+            name: DEX name (also the snapshot file name)
+            fetch: Coroutine factory returning the DEX's current pools
+            refresh_interval: Age after which a background refresh starts
+            max_age: Age after which a snapshot is no longer used
+            cache_dir: Directory for persisted snapshots (None = memory only)
+        """
+        self.name = name
+        self.fetch = fetch
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.path = Path(cache_dir) / f"{name}.json" if cache_dir else None
+        self._snapshot: Optional[PoolSnapshot] = None
+        self._loaded_from_disk = False
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def snapshot(self) -> Optional[PoolSnapshot]:
+        """Current snapshot, if any (regardless of age)."""
+        return self._snapshot
+
+    async def get_snapshot(self) -> Optional[PoolSnapshot]:
+        """Get a snapshot no older than ``max_age``.
+
+        Returns immediately when the current (or persisted) snapshot is
+        usable, scheduling a background refresh if it is getting old; only
+        waits on the network when there is no usable snapshot at all.
+        """
+        if self._snapshot is None and not self._loaded_from_disk:
+            self._loaded_from_disk = True
+            if self.path is not None:
+                self._snapshot = await asyncio.to_thread(PoolSnapshot.load, self.path)
+                if self._snapshot is not None:
+                    logger.info(
+                        f"Loaded {self.name} pool snapshot from disk "
+                        f"({len(self._snapshot.pools)} pools, {self._snapshot.age:.0f}s old)"
+                    )
+
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.age <= self.max_age:
+            if snapshot.age > self.refresh_interval:
+                self._start_refresh()
+            return snapshot
+
+        try:
+            return await asyncio.shield(self._start_refresh())
+        except Exception as e:
+            logger.warning(f"{self.name} pool snapshot refresh failed: {e}")
+            return None
+
+    def _start_refresh(self) -> asyncio.Task:
+        """Start a refresh unless one is already running."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self.refresh())
+            self._refresh_task.add_done_callback(_log_refresh_error)
+        return self._refresh_task
+
+    async def refresh(self) -> PoolSnapshot:
+        """Fetch pools now and replace (and persist) the snapshot."""
+        pools = await self.fetch()
+        snapshot = PoolSnapshot(pools)
+        self._snapshot = snapshot
+        logger.debug(f"Refreshed {self.name} pool snapshot ({len(pools)} pools)")
+
+        if self.path is not None:
+            try:
+                await asyncio.to_thread(snapshot.save, self.path)
+            except OSError as e:
+                logger.warning(f"Could not persist {self.name} pool snapshot: {e}")
+        return snapshot
+
+
+def _log_refresh_error(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug(f"Background pool snapshot refresh failed: {task.exception()}")
+
+
+_stores: dict[str, PoolSnapshotStore] = {}
+
+
+def get_pool_snapshot_store(name: str, fetch: PoolFetcher) -> PoolSnapshotStore:
+    """Get the process-wide snapshot store for a DEX, configured from settings.
+
+    ``fetch`` is only used when the store is first created.
+    """
+    store = _stores.get(name)
+    if store is None:
+        from swaperex.config import get_settings
+
+        settings = get_settings()
+        store = PoolSnapshotStore(
+            name,
+            fetch,
+            refresh_interval=settings.pool_snapshot_refresh_interval,
+            max_age=settings.pool_snapshot_max_age,
+            cache_dir=settings.pool_snapshot_dir or None,
+        )
+        _stores[name] = store
+    return store
+
+
+def reset_pool_snapshot_stores() -> None:
+    """Forget all stores (useful for testing)."""
+    _stores.clear()
@@ -8,9 +8,16 @@ import logging
 from decimal import Decimal
 from typing import Optional
 
-import httpx
-
+from swaperex.prices import get_price_oracle
 from swaperex.routing.base import Quote, RouteProvider, SwapRoute
+from swaperex.routing.pools import (
+    CONSTANT_PRODUCT,
+    STABLE_SWAP,
+    PoolSnapshotStore,
+    PoolState,
+    get_pool_snapshot_store,
+)
+from swaperex.utils.http import pooled_client
 
 logger = logging.getLogger(__name__)
 
@@ -95,77 +102,86 @@ class RefFinanceProvider(RouteProvider):
             logger.debug(f"Token not found: {from_asset} or {to_asset}")
             return None
 
-        # Convert to smallest units (yoctoNEAR for NEAR)
-        from_decimals = self._get_decimals(from_asset)
-        amount_yocto = int(amount * (10 ** from_decimals))
-
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # Get swap estimate from Ref Finance
-                response = await client.get(
-                    f"{self.base_url}/get-token-price",
-                    params={
-                        "token_id": from_token,
-                    },
-                )
-
-                from_price = None
-                if response.status_code == 200:
-                    data = response.json()
-                    from_price = Decimal(str(data.get("price", "0")))
-
-                # Get destination token price
-                response2 = await client.get(
-                    f"{self.base_url}/get-token-price",
-                    params={
-                        "token_id": to_token,
-                    },
-                )
-
-                to_price = None
-                if response2.status_code == 200:
-                    data = response2.json()
-                    to_price = Decimal(str(data.get("price", "0")))
-
-                if not from_price or not to_price or from_price <= 0 or to_price <= 0:
-                    return await self._get_pool_quote(
-                        from_asset, to_asset, amount, slippage_tolerance
-                    )
-
-                # Calculate output with 0.3% fee
-                usd_value = amount * from_price
-                fee_percent = Decimal("0.003")
-                to_amount = (usd_value * (1 - fee_percent)) / to_price
-
-                # Estimate fee in NEAR (~0.01 NEAR per tx)
-                estimated_fee_near = Decimal("0.01")
-
-                return Quote(
-                    provider=self.name,
-                    from_asset=from_asset.upper(),
-                    to_asset=to_asset.upper(),
-                    from_amount=amount,
-                    to_amount=to_amount,
-                    fee_asset="NEAR",
-                    fee_amount=estimated_fee_near,
-                    slippage_percent=slippage_tolerance * 100,
-                    estimated_time_seconds=2,  # NEAR is very fast
-                    route_details={
-                        "chain": "near",
-                        "from_token": from_token,
-                        "to_token": to_token,
-                        "from_price_usd": str(from_price),
-                        "to_price_usd": str(to_price),
-                    },
-                    is_simulated=False,
-                )
+        # Prices kept current by the oracle (Ref indexer, Binance, ...)
+        oracle = get_price_oracle()
+        from_price = oracle.get_fresh_price(from_asset)
+        to_price = oracle.get_fresh_price(to_asset)
 
-        except Exception as e:
-            logger.error(f"Ref Finance quote error: {e}")
+        if not from_price or not to_price:
             return await self._get_pool_quote(
                 from_asset, to_asset, amount, slippage_tolerance
             )
 
+        # Calculate output with 0.3% fee
+        usd_value = amount * from_price
+        fee_percent = Decimal("0.003")
+        to_amount = (usd_value * (1 - fee_percent)) / to_price
+
+        # Estimate fee in NEAR (~0.01 NEAR per tx)
+        estimated_fee_near = Decimal("0.01")
+
+        return Quote(
+            provider=self.name,
+            from_asset=from_asset.upper(),
+            to_asset=to_asset.upper(),
+            from_amount=amount,
+            to_amount=to_amount,
+            fee_asset="NEAR",
+            fee_amount=estimated_fee_near,
+            slippage_percent=slippage_tolerance * 100,
+            estimated_time_seconds=2,  # NEAR is very fast
+            route_details={
+                "chain": "near",
+                "from_token": from_token,
+                "to_token": to_token,
+                "from_price_usd": str(from_price),
+                "to_price_usd": str(to_price),
+            },
+            is_simulated=False,
+        )
+
+    @property
+    def pool_snapshots(self) -> PoolSnapshotStore:
+        """Shared snapshot of Ref Finance pools."""
+        return get_pool_snapshot_store("ref_finance", self._fetch_pools)
+
+    async def _fetch_pools(self) -> list[PoolState]:
+        """Download all pools from the indexer."""
+        async with pooled_client(timeout=30.0) as client:
+            response = await client.get(f"{self.base_url}/list-pools")
+        response.raise_for_status()
+
+        decimals_by_token = {
+            token_id: TOKEN_DECIMALS[symbol] for symbol, token_id in NEAR_TOKENS.items()
+        }
+        pools = []
+        for pool in response.json():
+            token_ids = pool.get("token_account_ids", [])
+            amounts = pool.get("amounts", [])
+            if len(token_ids) < 2 or len(amounts) != len(token_ids):
+                continue
+
+            kind = CONSTANT_PRODUCT
+            decimals = None
+            if pool.get("pool_kind") == "STABLE_SWAP" and pool.get("amp"):
+                decimals = [decimals_by_token.get(t) for t in token_ids]
+                if None in decimals:
+                    continue  # can't normalise unknown tokens
+                kind = STABLE_SWAP
+            elif pool.get("pool_kind") not in (None, "SIMPLE_POOL"):
+                continue  # rated pools need external rates
+
+            pools.append(PoolState(
+                pool_id=str(pool.get("id")),
+                tokens=token_ids,
+                reserves=[Decimal(a) for a in amounts],
+                fee_bps=int(pool.get("total_fee", 30)),
+                kind=kind,
+                amp=int(pool["amp"]) if kind == STABLE_SWAP else None,
+                decimals=decimals,
+            ))
+        return pools
+
     async def _get_pool_quote(
         self,
         from_asset: str,
@@ -173,70 +189,58 @@ class RefFinanceProvider(RouteProvider):
         amount: Decimal,
         slippage_tolerance: Decimal,
     ) -> Optional[Quote]:
-        """Get quote using pool data as fallback."""
+        """Get quote from the local pool snapshot as fallback."""
         try:
             from_token = self._get_token_id(from_asset)
             to_token = self._get_token_id(to_asset)
 
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                # Get pools
-                response = await client.get(
-                    f"{self.base_url}/list-pools",
-                )
-
-                if response.status_code != 200:
-                    return None
-
-                pools = response.json()
-
-                # Find matching pool
-                for pool in pools:
-                    token_ids = pool.get("token_account_ids", [])
-
-                    if from_token in token_ids and to_token in token_ids:
-                        # Get pool amounts
-                        amounts = pool.get("amounts", [])
-                        if len(amounts) >= 2:
-                            from_idx = token_ids.index(from_token)
-                            to_idx = token_ids.index(to_token)
-
-                            from_reserve = Decimal(amounts[from_idx])
-                            to_reserve = Decimal(amounts[to_idx])
-
-                            if from_reserve > 0 and to_reserve > 0:
-                                # AMM calculation with fee
-                                from_decimals = self._get_decimals(from_asset)
-                                to_decimals = self._get_decimals(to_asset)
-
-                                amount_in = amount * Decimal(10 ** from_decimals)
-                                fee = 1 - Decimal(pool.get("total_fee", 30)) / Decimal(10000)
-
-                                amount_out = (amount_in * fee * to_reserve) / (from_reserve + amount_in * fee)
-                                to_amount = amount_out / Decimal(10 ** to_decimals)
-
-                                return Quote(
-                                    provider=self.name,
-                                    from_asset=from_asset.upper(),
-                                    to_asset=to_asset.upper(),
-                                    from_amount=amount,
-                                    to_amount=to_amount,
-                                    fee_asset="NEAR",
-                                    fee_amount=Decimal("0.01"),
-                                    slippage_percent=slippage_tolerance * 100,
-                                    estimated_time_seconds=2,
-                                    route_details={
-                                        "chain": "near",
-                                        "pool_id": pool.get("id"),
-                                        "method": "pool_calculation",
-                                    },
-                                    is_simulated=False,
-                                )
+            snapshot = await self.pool_snapshots.get_snapshot()
+            if snapshot is None:
+                return None
+
+            amount_in = amount * Decimal(10 ** self._get_decimals(from_asset))
+            best = snapshot.best_quote(from_token, to_token, amount_in)
+            if best is None:
+                return None
+
+            pool, amount_out = best
+            to_amount = amount_out / Decimal(10 ** self._get_decimals(to_asset))
+
+            return Quote(
+                provider=self.name,
+                from_asset=from_asset.upper(),
+                to_asset=to_asset.upper(),
+                from_amount=amount,
+                to_amount=to_amount,
+                fee_asset="NEAR",
+                fee_amount=Decimal("0.01"),
+                slippage_percent=slippage_tolerance * 100,
+                estimated_time_seconds=2,
+                route_details={
+                    "chain": "near",
+                    "from_token": from_token,
+                    "to_token": to_token,
+                    "pool_id": pool.pool_id,
+                    "pool_kind": pool.kind,
+                    "method": "pool_calculation",
+                    "snapshot_age_seconds": round(snapshot.age, 1),
+                },
+                is_simulated=False,
+            )
 
         except Exception as e:
             logger.error(f"Ref Finance pool quote error: {e}")
 
         return None
 
+    async def get_liquidity_pools(self) -> Optional[list[PoolState]]:
+        """Cached Ref Finance pools between known tokens, for multi-hop route search."""
+        snapshot = await self.pool_snapshots.get_snapshot()
+        if snapshot is None:
+            return None
+        symbols = {token: symbol for symbol, token in NEAR_TOKENS.items()}
+        return snapshot.symbol_pools(symbols, TOKEN_DECIMALS)
+
     async def execute_swap(self, route: SwapRoute) -> dict:
         """Execute swap via Ref Finance.
 
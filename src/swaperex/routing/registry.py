@@ -0,0 +1,177 @@
+"""Process-wide registry of routing providers and aggregators.
+
+``create_chain_aggregator`` builds new provider objects on every call,
+so nothing a provider learns (pool snapshots, connection state, latency
+history) outlives one request. The registry builds each provider once
+per process, keyed as in ``factory.CHAIN_PROVIDERS``, and hands out one
+shared aggregator per chain. A provider used by several chains (e.g.
+1inch on Ethereum for both "uniswap" and the production aggregator) is
+one instance.
+
+Hot reload: at most every ``routing_reload_check_seconds`` a lookup
+checks the raw settings sources (the environment and the ``.env`` file's
+mtime and size); when they changed, the ``get_settings()`` cache is
+cleared so settings are read again. Every lookup then compares the
+settings (by value) and the provider API-key environment variables with
+the ones the instances were built from, and rebuilds lazily when they
+differ. ``reload()`` forces a rebuild. Requests already holding an old
+aggregator finish with it.
+"""
+
+import logging
+import os
+import time
+from typing import Optional
+
+from swaperex.config import Settings, get_settings
+from swaperex.routing.base import RouteAggregator, RouteProvider
+from swaperex.routing.factory import (
+    PRODUCTION_PROVIDERS,
+    _new_aggregator,
+    chain_provider_keys,
+    create_provider,
+)
+
+logger = logging.getLogger(__name__)
+
+# Environment variables read directly by provider factories
+PROVIDER_ENV_KEYS = ("ONEINCH_API_KEY", "TRONGRID_API_KEY")
+
+_PRODUCTION = "@production"
+
+
+def _settings_source_fingerprint() -> tuple:
+    """Raw inputs ``Settings`` is read from: the environment and the .env file."""
+    env_file = Settings.model_config.get("env_file")
+    try:
+        stat = os.stat(env_file) if env_file else None
+    except OSError:
+        stat = None
+    env_file_state = (stat.st_mtime_ns, stat.st_size) if stat else None
+    return hash(frozenset(os.environ.items())), env_file_state
+
+
+def _config_fingerprint() -> tuple:
+    """Configuration providers are built from (settings compare by value)."""
+    return (get_settings(),) + tuple(os.environ.get(key) for key in PROVIDER_ENV_KEYS)
+
+
+class ProviderRegistry:
+    """Shared provider instances and per-chain aggregators."""
+
+    def __init__(self, reload_check_seconds: Optional[float] = None):
+        """Initialize an empty registry.
+
+        Args:
+            reload_check_seconds: Seconds between checks of the settings
+                sources (default: ``routing_reload_check_seconds``)
+        """
+        self._providers: dict[str, RouteProvider] = {}
+        self._aggregators: dict[str, RouteAggregator] = {}
+        self._fingerprint: Optional[tuple] = None
+        self._source: Optional[tuple] = None
+        self._source_checked_at = 0.0
+        self.reload_check_seconds = reload_check_seconds
+        self.builds = 0
+        self.reloads = 0
+
+    def _check_settings_source(self) -> None:
+        """Clear the settings cache if the environment or .env changed."""
+        interval = self.reload_check_seconds
+        if interval is None:
+            interval = get_settings().routing_reload_check_seconds
+        now = time.monotonic()
+        if self._source is not None and now - self._source_checked_at < interval:
+            return
+        self._source_checked_at = now
+
+        source = _settings_source_fingerprint()
+        if self._source is not None and source != self._source:
+            get_settings.cache_clear()
+        self._source = source
+
+    def _check_config(self) -> None:
+        """Drop instances built from a configuration that has since changed."""
+        self._check_settings_source()
+        fingerprint = _config_fingerprint()
+        if fingerprint == self._fingerprint:
+            return
+        if self._fingerprint is not None:
+            logger.info("Routing configuration changed, rebuilding providers")
+            self.reloads += 1
+        self._providers.clear()
+        self._aggregators.clear()
+        self._fingerprint = fingerprint
+
+    def get_provider(self, key: str) -> RouteProvider:
+        """Get the shared provider for a key (e.g. "thorchain", "1inch:bsc")."""
+        self._check_config()
+        provider = self._providers.get(key)
+        if provider is None:
+            provider = create_provider(key)
+            self._providers[key] = provider
+            self.builds += 1
+            logger.info(f"Built routing provider {provider.name}")
+        return provider
+
+    def _aggregator_for(self, name: str, keys: list[str]) -> RouteAggregator:
+        self._check_config()
+        aggregator = self._aggregators.get(name)
+        if aggregator is None:
+            aggregator = _new_aggregator()
+            for key in keys:
+                aggregator.add_provider(self.get_provider(key))
+            self._aggregators[name] = aggregator
+        return aggregator
+
+    def get_chain_aggregator(self, chain: str) -> RouteAggregator:
+        """Get the shared aggregator for a chain/DEX."""
+        chain = chain.lower()
+        self._check_config()
+        aggregator = self._aggregators.get(chain)
+        if aggregator is None:
+            aggregator = self._aggregator_for(chain, chain_provider_keys(chain))
+        return aggregator
+
+    def get_production_aggregator(self) -> RouteAggregator:
+        """Get the shared aggregator over all production providers."""
+        return self._aggregator_for(_PRODUCTION, PRODUCTION_PROVIDERS)
+
+    def reload(self) -> None:
+        """Re-read settings and rebuild providers on next use."""
+        get_settings.cache_clear()
+        self._fingerprint = None
+        self._providers.clear()
+        self._aggregators.clear()
+        self.reloads += 1
+        logger.info("Routing providers will be rebuilt from fresh settings")
+
+    def stats(self) -> dict:
+        return {
+            "providers": sorted(self._providers),
+            "aggregators": sorted(self._aggregators),
+            "builds": self.builds,
+            "reloads": self.reloads,
+        }
+
+
+_registry: Optional[ProviderRegistry] = None
+
+
+def get_provider_registry() -> ProviderRegistry:
+    """Get the process-wide provider registry."""
+    global _registry
+    if _registry is None:
+        _registry = ProviderRegistry()
+    return _registry
+
+
+def get_chain_aggregator(chain: str) -> RouteAggregator:
+    """Shared, warm aggregator for a chain/DEX."""
+    return get_provider_registry().get_chain_aggregator(chain)
+
+
+def reset_provider_registry() -> None:
+    """Drop the registry (useful for testing)."""
+    global _registry
+    _registry = None
@@ -8,9 +8,15 @@ import logging
 from decimal import Decimal
 from typing import Optional
 
-import httpx
-
-from swaperex.routing.base import Quote, RouteProvider, SwapRoute
+from swaperex.routing.base import (
+    ProviderUnavailableError,
+    Quote,
+    RouteProvider,
+    SwapRoute,
+    is_unavailable_status,
+)
+from swaperex.routing.pools import PoolSnapshotStore, PoolState, get_pool_snapshot_store
+from swaperex.utils.http import pooled_client
 
 logger = logging.getLogger(__name__)
 
@@ -106,7 +112,7 @@ class StonfiProvider(RouteProvider):
         amount_nano = int(amount * (10 ** from_decimals))
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 # Get swap simulation from STON.fi
                 response = await client.post(
                     f"{self.base_url}/swap/simulate",
@@ -121,9 +127,14 @@ class StonfiProvider(RouteProvider):
 
                 if response.status_code != 200:
                     logger.warning(f"STON.fi API error: {response.status_code}")
-                    return await self._get_fallback_quote(
+                    fallback = await self._get_fallback_quote(
                         from_asset, to_asset, amount, slippage_tolerance
                     )
+                    if is_unavailable_status(response.status_code):
+                        raise ProviderUnavailableError(
+                            f"STON.fi API error: {response.status_code}", fallback=fallback
+                        )
+                    return fallback
 
                 data = response.json()
 
@@ -170,11 +181,45 @@ class StonfiProvider(RouteProvider):
                     is_simulated=False,
                 )
 
+        except ProviderUnavailableError:
+            raise
         except Exception as e:
             logger.error(f"STON.fi quote error: {e}")
-            return await self._get_fallback_quote(
-                from_asset, to_asset, amount, slippage_tolerance
-            )
+            raise ProviderUnavailableError(
+                f"STON.fi quote error: {e}",
+                fallback=await self._get_fallback_quote(
+                    from_asset, to_asset, amount, slippage_tolerance
+                ),
+            ) from e
+
+    @property
+    def pool_snapshots(self) -> PoolSnapshotStore:
+        """Shared snapshot of STON.fi pools."""
+        return get_pool_snapshot_store("stonfi", self._fetch_pools)
+
+    async def _fetch_pools(self) -> list[PoolState]:
+        """Download all pools from the STON.fi API."""
+        async with pooled_client(timeout=30.0) as client:
+            response = await client.get(f"{self.base_url}/pools", headers=self._get_headers())
+        response.raise_for_status()
+
+        pools = []
+        for pool in response.json().get("pool_list", []):
+            token0 = pool.get("token0_address")
+            token1 = pool.get("token1_address")
+            if not token0 or not token1 or pool.get("deprecated"):
+                continue
+            try:
+                fee_bps = int(pool.get("lp_fee", 20)) + int(pool.get("protocol_fee", 10))
+            except (TypeError, ValueError):
+                fee_bps = 30
+            pools.append(PoolState(
+                pool_id=pool.get("address", ""),
+                tokens=[token0, token1],
+                reserves=[Decimal(pool.get("reserve0", "0")), Decimal(pool.get("reserve1", "0"))],
+                fee_bps=fee_bps,
+            ))
+        return pools
 
     async def _get_fallback_quote(
         self,
@@ -183,72 +228,57 @@ class StonfiProvider(RouteProvider):
         amount: Decimal,
         slippage_tolerance: Decimal,
     ) -> Optional[Quote]:
-        """Fallback quote using pool data when simulation fails."""
+        """Fallback quote from the local pool snapshot when simulation fails."""
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                # Get pools list
-                response = await client.get(
-                    f"{self.base_url}/pools",
-                    headers=self._get_headers(),
-                )
-
-                if response.status_code != 200:
-                    return None
-
-                data = response.json()
-                pools = data.get("pool_list", [])
-
-                from_address = self._get_token_address(from_asset)
-                to_address = self._get_token_address(to_asset)
-
-                # Find matching pool
-                for pool in pools:
-                    token0 = pool.get("token0_address", "")
-                    token1 = pool.get("token1_address", "")
-
-                    if (token0 == from_address and token1 == to_address) or \
-                       (token1 == from_address and token0 == to_address):
-                        # Calculate output based on reserves
-                        reserve0 = Decimal(pool.get("reserve0", "0"))
-                        reserve1 = Decimal(pool.get("reserve1", "0"))
-
-                        if reserve0 > 0 and reserve1 > 0:
-                            # AMM formula with 0.3% fee
-                            from_decimals = self._get_decimals(from_asset)
-                            to_decimals = self._get_decimals(to_asset)
-
-                            amount_in = amount * Decimal(10 ** from_decimals)
-
-                            if token0 == from_address:
-                                amount_out = (amount_in * Decimal("0.997") * reserve1) / (reserve0 + amount_in * Decimal("0.997"))
-                            else:
-                                amount_out = (amount_in * Decimal("0.997") * reserve0) / (reserve1 + amount_in * Decimal("0.997"))
-
-                            to_amount = amount_out / Decimal(10 ** to_decimals)
-
-                            return Quote(
-                                provider=self.name,
-                                from_asset=from_asset.upper(),
-                                to_asset=to_asset.upper(),
-                                from_amount=amount,
-                                to_amount=to_amount,
-                                fee_asset="TON",
-                                fee_amount=Decimal("0.15"),
-                                slippage_percent=slippage_tolerance * 100,
-                                estimated_time_seconds=5,
-                                route_details={
-                                    "chain": "ton",
-                                    "pool_address": pool.get("address"),
-                                    "method": "pool_calculation",
-                                },
-                                is_simulated=False,
-                            )
+            from_address = self._get_token_address(from_asset)
+            to_address = self._get_token_address(to_asset)
+
+            snapshot = await self.pool_snapshots.get_snapshot()
+            if snapshot is None:
+                return None
+
+            amount_in = amount * Decimal(10 ** self._get_decimals(from_asset))
+            best = snapshot.best_quote(from_address, to_address, amount_in)
+            if best is None:
+                return None
+
+            pool, amount_out = best
+            to_amount = amount_out / Decimal(10 ** self._get_decimals(to_asset))
+
+            return Quote(
+                provider=self.name,
+                from_asset=from_asset.upper(),
+                to_asset=to_asset.upper(),
+                from_amount=amount,
+                to_amount=to_amount,
+                fee_asset="TON",
+                fee_amount=Decimal("0.15"),
+                slippage_percent=slippage_tolerance * 100,
+                estimated_time_seconds=5,
+                route_details={
+                    "chain": "ton",
+                    "pool_address": pool.pool_id,
+                    "offer_address": from_address,
+                    "ask_address": to_address,
+                    "method": "pool_calculation",
+                    "snapshot_age_seconds": round(snapshot.age, 1),
+                },
+                is_simulated=False,
+            )
 
         except Exception as e:
             logger.error(f"STON.fi fallback quote error: {e}")
 
         return None
 
+    async def get_liquidity_pools(self) -> Optional[list[PoolState]]:
+        """Cached STON.fi pools between known tokens, for multi-hop route search."""
+        snapshot = await self.pool_snapshots.get_snapshot()
+        if snapshot is None:
+            return None
+        symbols = {token: symbol for symbol, token in TON_TOKENS.items()}
+        return snapshot.symbol_pools(symbols, TOKEN_DECIMALS)
+
     async def execute_swap(self, route: SwapRoute) -> dict:
         """Execute swap via STON.fi.
 
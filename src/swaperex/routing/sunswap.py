@@ -8,15 +8,16 @@ import logging
 from decimal import Decimal
 from typing import Optional
 
-import httpx
-
-from swaperex.routing.base import Quote, RouteProvider, SwapRoute
+from swaperex.prices import get_price_oracle
+from swaperex.routing.base import ProviderUnavailableError, Quote, RouteProvider, SwapRoute
+from swaperex.routing.hedging import get_latency_tracker, hedged_request
+from swaperex.utils.http import pooled_client
 
 logger = logging.getLogger(__name__)
 
 # SunSwap API endpoints
 SUNSWAP_API = "https://api.sun.io"
-# SunPump/SunSwap router APIs (multiple fallbacks)
+# SunPump/SunSwap router APIs, in order of preference (raced with hedging)
 SUNSWAP_ROUTER_APIS = [
     "https://api.sunswap.com/swap/v2/router",
     "https://apilist.tronscanapi.com/api/defi/swap/route",
@@ -124,36 +125,29 @@ class SunSwapProvider(RouteProvider):
         from_decimals = self._get_decimals(from_asset)
         amount_sun = int(amount * (10 ** from_decimals))
 
+        payload = {
+            "tokenIn": from_address,
+            "tokenOut": to_address,
+            "amountIn": str(amount_sun),
+            "typeList": ["PSM", "CURVE", "WTRX", "SUNSWAP_V1", "SUNSWAP_V2"],
+        }
+
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # Try multiple router APIs with fallback
-                data = None
-                for router_api in SUNSWAP_ROUTER_APIS:
-                    try:
-                        response = await client.post(
-                            router_api,
-                            headers=self._get_headers(),
-                            json={
-                                "tokenIn": from_address,
-                                "tokenOut": to_address,
-                                "amountIn": str(amount_sun),
-                                "typeList": ["PSM", "CURVE", "WTRX", "SUNSWAP_V1", "SUNSWAP_V2"],
-                            },
-                            timeout=10.0,
-                        )
-                        if response.status_code == 200:
-                            data = response.json()
-                            if data.get("code") == 0 or data.get("success"):
-                                logger.info(f"SunSwap quote from: {router_api}")
-                                break
-                    except Exception as e:
-                        logger.debug(f"Router API {router_api} failed: {e}")
-                        continue
-
-                if not data or (data.get("code") != 0 and not data.get("success")):
+            async with pooled_client(timeout=30.0) as client:
+                # Race the router APIs: primary first, backups hedged after p95
+                data = await hedged_request(
+                    [self._router_attempt(client, api, payload) for api in SUNSWAP_ROUTER_APIS],
+                    tracker=get_latency_tracker("sunswap_router"),
+                    label="SunSwap router",
+                )
+
+                if data is None:
                     logger.warning("All SunSwap router APIs failed")
-                    return await self._get_fallback_quote(
-                        from_asset, to_asset, amount, slippage_tolerance
+                    raise ProviderUnavailableError(
+                        "All SunSwap router APIs failed",
+                        fallback=await self._get_fallback_quote(
+                            from_asset, to_asset, amount, slippage_tolerance
+                        ),
                     )
 
                 result = data.get("data", {})
@@ -190,11 +184,33 @@ class SunSwapProvider(RouteProvider):
                     is_simulated=False,
                 )
 
+        except ProviderUnavailableError:
+            raise
         except Exception as e:
             logger.error(f"SunSwap quote error: {e}")
-            return await self._get_fallback_quote(
-                from_asset, to_asset, amount, slippage_tolerance
+            raise ProviderUnavailableError(
+                f"SunSwap quote error: {e}",
+                fallback=await self._get_fallback_quote(
+                    from_asset, to_asset, amount, slippage_tolerance
+                ),
+            ) from e
+
+    def _router_attempt(self, client, router_api: str, payload: dict):
+        """Coroutine factory for one router API; yields its data or None."""
+
+        async def attempt() -> Optional[dict]:
+            response = await client.post(
+                router_api, headers=self._get_headers(), json=payload, timeout=10.0
             )
+            if response.status_code != 200:
+                return None
+            data = response.json()
+            if data.get("code") == 0 or data.get("success"):
+                logger.info(f"SunSwap quote from: {router_api}")
+                return data
+            return None
+
+        return attempt
 
     async def _get_fallback_quote(
         self,
@@ -203,108 +219,57 @@ class SunSwapProvider(RouteProvider):
         amount: Decimal,
         slippage_tolerance: Decimal,
     ) -> Optional[Quote]:
-        """Fallback quote using price API or hardcoded rates when router fails."""
-        # Approximate USD prices for Tron tokens (updated periodically)
-        # These are fallback values when API is unavailable
-        FALLBACK_PRICES_USD = {
-            "TRX": Decimal("0.25"),
-            "USDT": Decimal("1.0"),
-            "USDC": Decimal("1.0"),
-            "SUN": Decimal("0.02"),
-            "BTT": Decimal("0.0000012"),
-            "JST": Decimal("0.03"),
-            "WIN": Decimal("0.00012"),
-            "USDJ": Decimal("1.0"),
-            "TUSD": Decimal("1.0"),
-            "NFT": Decimal("0.0000005"),
-        }
+        """Fallback quote from oracle prices when the router fails."""
+        oracle = get_price_oracle()
+        from_entry = oracle.get(from_asset)
+        to_entry = oracle.get(to_asset)
 
-        try:
-            # Try to get prices from Sun.io price API first
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/v1/market/tickers",
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    tickers = data.get("data", {}).get("tickers", [])
-
-                    # Find relevant pairs
-                    from_price = None
-                    to_price = None
-
-                    for ticker in tickers:
-                        base = ticker.get("base_currency", "").upper()
-                        quote_currency = ticker.get("quote_currency", "").upper()
-
-                        if base == from_asset.upper() and quote_currency == "USDT":
-                            from_price = Decimal(ticker.get("last_price", "0"))
-                        elif base == to_asset.upper() and quote_currency == "USDT":
-                            to_price = Decimal(ticker.get("last_price", "0"))
-                        elif from_asset.upper() == "USDT":
-                            from_price = Decimal("1")
-                        elif to_asset.upper() == "USDT":
-                            to_price = Decimal("1")
-
-                    if from_price and to_price and from_price > 0 and to_price > 0:
-                        # Calculate output with 0.3% fee
-                        usd_value = amount * from_price
-                        fee_percent = Decimal("0.003")
-                        to_amount = (usd_value * (1 - fee_percent)) / to_price
-
-                        return Quote(
-                            provider=self.name,
-                            from_asset=from_asset.upper(),
-                            to_asset=to_asset.upper(),
-                            from_amount=amount,
-                            to_amount=to_amount,
-                            fee_asset="TRX",
-                            fee_amount=Decimal("2.0"),
-                            slippage_percent=slippage_tolerance * 100,
-                            estimated_time_seconds=5,
-                            route_details={
-                                "chain": "tron",
-                                "method": "price_api",
-                            },
-                            is_simulated=False,
-                        )
-
-        except Exception as e:
-            logger.warning(f"SunSwap price API failed, using fallback prices: {e}")
-
-        # Use hardcoded fallback prices
-        from_price = FALLBACK_PRICES_USD.get(from_asset.upper())
-        to_price = FALLBACK_PRICES_USD.get(to_asset.upper())
+        if not from_entry or not to_entry:
+            logger.error(f"No fallback price available for {from_asset} or {to_asset}")
+            return None
 
-        if from_price and to_price and from_price > 0 and to_price > 0:
-            # Calculate output with 0.5% fee (slightly higher for fallback)
-            usd_value = amount * from_price
+        price_age = max(from_entry.age, to_entry.age)
+        if price_age <= oracle.max_age:
+            # Calculate output with 0.3% fee
+            fee_percent = Decimal("0.003")
+            route_details = {
+                "chain": "tron",
+                "method": "price_oracle",
+                "price_age_seconds": round(price_age, 1),
+            }
+            fee_amount = Decimal("2.0")
+            slippage_percent = slippage_tolerance * 100
+        else:
+            # Stale prices: 0.5% fee (slightly higher for fallback)
             fee_percent = Decimal("0.005")
-            to_amount = (usd_value * (1 - fee_percent)) / to_price
-
-            logger.info(f"Using fallback quote: {amount} {from_asset} -> {to_amount} {to_asset}")
-
-            return Quote(
-                provider=self.name,
-                from_asset=from_asset.upper(),
-                to_asset=to_asset.upper(),
-                from_amount=amount,
-                to_amount=to_amount,
-                fee_asset="TRX",
-                fee_amount=Decimal("3.0"),  # Slightly higher fee estimate
-                slippage_percent=Decimal("1.0"),  # 1% slippage for fallback
-                estimated_time_seconds=5,
-                route_details={
-                    "chain": "tron",
-                    "method": "fallback_calculation",
-                    "warning": "Using estimated prices - actual rate may vary",
-                },
-                is_simulated=False,
-            )
-
-        logger.error(f"No fallback price available for {from_asset} or {to_asset}")
-        return None
+            route_details = {
+                "chain": "tron",
+                "method": "fallback_calculation",
+                "warning": "Using estimated prices - actual rate may vary",
+            }
+            fee_amount = Decimal("3.0")  # Slightly higher fee estimate
+            slippage_percent = Decimal("1.0")  # 1% slippage for fallback
+
+        usd_value = amount * from_entry.price_usd
+        to_amount = (usd_value * (1 - fee_percent)) / to_entry.price_usd
+
+        logger.info(
+            f"Using {route_details['method']} quote: {amount} {from_asset} -> {to_amount} {to_asset}"
+        )
+
+        return Quote(
+            provider=self.name,
+            from_asset=from_asset.upper(),
+            to_asset=to_asset.upper(),
+            from_amount=amount,
+            to_amount=to_amount,
+            fee_asset="TRX",
+            fee_amount=fee_amount,
+            slippage_percent=slippage_percent,
+            estimated_time_seconds=5,
+            route_details=route_details,
+            is_simulated=False,
+        )
 
     async def execute_swap(self, route: SwapRoute) -> dict:
         """Execute swap via SunSwap.
@@ -8,12 +8,26 @@ import logging
 from decimal import Decimal
 from typing import Optional
 
-import httpx
-
-from swaperex.routing.base import Quote, RouteProvider, SwapRoute
+from swaperex.routing.base import (
+    ProviderUnavailableError,
+    Quote,
+    RouteProvider,
+    SwapRoute,
+    is_unavailable_status,
+)
+from swaperex.routing.pools import (
+    CONTINUOUS_LIQUIDITY,
+    PoolSnapshotStore,
+    PoolState,
+    get_pool_snapshot_store,
+)
+from swaperex.utils.http import pooled_client
 
 logger = logging.getLogger(__name__)
 
+# Midgard pool depths are in 1e8 units for every asset
+MIDGARD_DEPTH_DECIMALS = 8
+
 # THORChain API endpoints
 THORNODE_MAINNET = "https://thornode.ninerealms.com"
 THORNODE_STAGENET = "https://stagenet-thornode.ninerealms.com"
@@ -109,7 +123,7 @@ class THORChainProvider(RouteProvider):
         amount_base = int(amount * Decimal("100000000"))
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 # Get quote from THORNode quote endpoint
                 response = await client.get(
                     f"{self.thornode_url}/thorchain/quote/swap",
@@ -122,6 +136,10 @@ class THORChainProvider(RouteProvider):
 
                 if response.status_code != 200:
                     logger.warning(f"THORChain API error: {response.status_code}")
+                    if is_unavailable_status(response.status_code):
+                        raise ProviderUnavailableError(
+                            f"THORChain API error: {response.status_code}"
+                        )
                     return None
 
                 data = response.json()
@@ -181,9 +199,11 @@ class THORChainProvider(RouteProvider):
                     is_simulated=False,
                 )
 
+        except ProviderUnavailableError:
+            raise
         except Exception as e:
             logger.error(f"THORChain quote error: {e}")
-            return None
+            raise ProviderUnavailableError(f"THORChain quote error: {e}") from e
 
     async def execute_swap(self, route: SwapRoute) -> dict:
         """Execute swap via THORChain.
@@ -232,7 +252,7 @@ class THORChainProvider(RouteProvider):
     async def get_pools(self) -> list[dict]:
         """Get all active liquidity pools."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 response = await client.get(f"{self.midgard_url}/pools")
 
                 if response.status_code == 200:
@@ -246,7 +266,7 @@ class THORChainProvider(RouteProvider):
     async def get_inbound_addresses(self) -> list[dict]:
         """Get current inbound addresses for all chains."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 response = await client.get(
                     f"{self.thornode_url}/thorchain/inbound_addresses"
                 )
@@ -259,6 +279,46 @@ class THORChainProvider(RouteProvider):
 
         return []
 
+    @property
+    def pool_snapshots(self) -> PoolSnapshotStore:
+        """Shared snapshot of THORChain pools (each asset paired with RUNE)."""
+        suffix = "_stagenet" if self.stagenet else ""
+        return get_pool_snapshot_store(f"thorchain{suffix}", self._fetch_pools)
+
+    async def _fetch_pools(self) -> list[PoolState]:
+        """Download available pools from Midgard as RUNE-paired CLP pools."""
+        async with pooled_client(timeout=30.0) as client:
+            response = await client.get(f"{self.midgard_url}/pools")
+        response.raise_for_status()
+
+        symbols = {asset: symbol for symbol, asset in THORCHAIN_ASSETS.items()}
+        scale = Decimal(10) ** MIDGARD_DEPTH_DECIMALS
+        pools = []
+        for pool in response.json():
+            symbol = symbols.get(str(pool.get("asset", "")).upper())
+            if symbol is None or symbol == "RUNE" or pool.get("status") != "available":
+                continue
+            try:
+                reserves = [
+                    Decimal(pool["assetDepth"]) / scale,
+                    Decimal(pool["runeDepth"]) / scale,
+                ]
+            except (ArithmeticError, KeyError, ValueError):
+                continue
+            pools.append(PoolState(
+                pool_id=pool["asset"],
+                tokens=[symbol, "RUNE"],
+                reserves=reserves,
+                fee_bps=0,
+                kind=CONTINUOUS_LIQUIDITY,
+            ))
+        return pools
+
+    async def get_liquidity_pools(self) -> Optional[list[PoolState]]:
+        """Cached pools for multi-hop route search."""
+        snapshot = await self.pool_snapshots.get_snapshot()
+        return snapshot.pools if snapshot is not None else None
+
 
 def create_thorchain_provider(stagenet: bool = False) -> THORChainProvider:
     """Create a THORChain provider instance."""
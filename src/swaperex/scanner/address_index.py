@@ -0,0 +1,151 @@
+"""In-memory index of our active deposit addresses.
+
+Block-driven scanning tests every output/transfer of a block against the
+addresses we track. DepositAddressIndex keeps one compact set per asset:
+each address is stored as a 64-bit hash of its normalised form instead
+of a Python string. A hash collision can only produce a false "match",
+which the deposit path rejects when it looks the address up in the DB.
+
+The index is loaded from ``LedgerRepository.get_all_active_deposit_addresses``
+and kept current two ways:
+
+- addresses inserted by this process are added by an ORM ``after_insert``
+  listener;
+- ``refresh()`` picks up rows inserted by other processes (the API, the
+  bot) by reading only ids above the highest one already indexed, and
+  periodically rebuilds the set so deactivated addresses drop out.
+"""
+
+import hashlib
+import logging
+import time
+from typing import Iterable, Optional
+
+from sqlalchemy import event
+
+from swaperex.ledger.models import DepositAddress
+
+logger = logging.getLogger(__name__)
+
+# Prefixes of case-insensitive address encodings (hex EVM, bech32)
+_CASE_INSENSITIVE_PREFIXES = ("0x", "bc1", "tb1", "bcrt1", "ltc1", "tltc1")
+
+
+def is_case_insensitive(address: str) -> bool:
+    """Whether an address encoding ignores case (EVM hex, bech32).
+
+    Base58 addresses (legacy BTC, TRON) are case-sensitive.
+    """
+    return address.strip().lower().startswith(_CASE_INSENSITIVE_PREFIXES)
+
+
+def normalize_address(address: str) -> str:
+    """Canonical form used for index lookups."""
+    address = address.strip()
+    return address.lower() if is_case_insensitive(address) else address
+
+
+def _address_key(address: str) -> int:
+    digest = hashlib.blake2b(normalize_address(address).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class DepositAddressIndex:
+    """Set of active deposit addresses for one asset."""
+
+    def __init__(self, asset: str, full_reload_interval: float = 3600.0):
+        """Initialize an empty index.
+
+        Args:
+            asset: Asset symbol
+            full_reload_interval: Seconds between full rebuilds in ``refresh()``
+        """
+        self.asset = asset.upper()
+        self.full_reload_interval = full_reload_interval
+        self._keys: set[int] = set()
+        self._max_id = 0
+        self._loaded_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, address: object) -> bool:
+        return isinstance(address, str) and _address_key(address) in self._keys
+
+    @property
+    def loaded(self) -> bool:
+        """Whether a full load has happened."""
+        return self._loaded_at is not None
+
+    def add(self, address: str, record_id: Optional[int] = None) -> None:
+        """Add an address (and remember the highest DB id seen)."""
+        self._keys.add(_address_key(address))
+        if record_id is not None and record_id > self._max_id:
+            self._max_id = record_id
+
+    def discard(self, address: str) -> None:
+        """Remove an address."""
+        self._keys.discard(_address_key(address))
+
+    def add_records(self, records: Iterable[DepositAddress]) -> int:
+        """Add deposit address rows; returns how many were added."""
+        count = 0
+        for record in records:
+            self.add(record.address, record.id)
+            count += 1
+        return count
+
+    async def refresh(self, repo, force_full: bool = False) -> int:
+        """Bring the index up to date with the database.
+
+        Args:
+            repo: LedgerRepository
+            force_full: Rebuild from scratch instead of loading new rows
+
+        Returns:
+            Number of rows read
+        """
+        due = (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at > self.full_reload_interval
+        )
+        if force_full or due:
+            records = await repo.get_all_active_deposit_addresses(self.asset)
+            self._keys = set()
+            self._max_id = 0
+            count = self.add_records(records)
+            self._loaded_at = time.monotonic()
+            logger.info(f"Loaded {count} {self.asset} deposit addresses into the index")
+            return count
+
+        records = await repo.get_all_active_deposit_addresses(self.asset, after_id=self._max_id)
+        count = self.add_records(records)
+        if count:
+            logger.debug(f"Added {count} new {self.asset} deposit addresses to the index")
+        return count
+
+
+_indexes: dict[str, DepositAddressIndex] = {}
+
+
+def get_address_index(asset: str) -> DepositAddressIndex:
+    """Get the process-wide address index for an asset."""
+    asset = asset.upper()
+    index = _indexes.get(asset)
+    if index is None:
+        index = DepositAddressIndex(asset)
+        _indexes[asset] = index
+    return index
+
+
+def reset_address_indexes() -> None:
+    """Drop all indexes (useful for testing)."""
+    _indexes.clear()
+
+
+@event.listens_for(DepositAddress, "after_insert")
+def _index_inserted_address(mapper, connection, target: DepositAddress) -> None:
+    """Add addresses created in this process to an already-loaded index."""
+    index = _indexes.get((target.asset or "").upper())
+    if index is not None and target.status in (None, "active"):
+        index.add(target.address, target.id)
@@ -10,7 +10,16 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
+
+from swaperex.scanner.scheduler import (
+    ScanPriority,
+    get_rate_limiter,
+    rate_limited_request,
+    scan_concurrently,
+)
+from swaperex.scanner.seen import SeenTransactions
+from swaperex.utils.rate_limit import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +36,7 @@ class TransactionInfo:
     block_height: Optional[int] = None
     block_time: Optional[datetime] = None
     from_address: Optional[str] = None
+    tx_index: int = 0  # Output index for multi-output transactions
 
     @property
     def is_confirmed(self) -> bool:
@@ -43,6 +53,26 @@ class TransactionInfo:
         return self.confirmations >= required
 
 
+class ScanIncompleteError(Exception):
+    """An address's history could not be read completely.
+
+    Raised by ``get_address_transactions`` on API errors and when the
+    activity above ``since_block`` did not fit in the pages read. Scan
+    cursors must not move past ``complete_height`` (None = not at all);
+    ``transactions`` holds whatever was read before giving up.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        transactions: Optional[list[TransactionInfo]] = None,
+        complete_height: Optional[int] = None,
+    ):
+        super().__init__(message)
+        self.transactions = transactions or []
+        self.complete_height = complete_height
+
+
 class DepositScanner(ABC):
     """Abstract base class for blockchain deposit scanners.
 
@@ -50,6 +80,11 @@ class DepositScanner(ABC):
     to tracked addresses.
     """
 
+    # Backend whose request quota this scanner draws from (None = unlimited)
+    rate_limit_backend: Optional[str] = None
+    # Times a rate-limited request is retried before giving up
+    MAX_RATE_LIMIT_RETRIES = 3
+
     def __init__(self, asset: str):
         """Initialize scanner for a specific asset.
 
@@ -58,21 +93,36 @@ class DepositScanner(ABC):
         """
         self.asset = asset.upper()
         self._running = False
-        self._processed_txids: set[str] = set()
+        self._processed_txids = SeenTransactions()
         self._on_deposit_callback: Optional[Callable] = None
+        # address -> height below which everything has been seen (in-memory)
+        self._cursors: dict[str, int] = {}
+        self._rate_limiter: Optional[TokenBucket] = None
+        self.priority = ScanPriority()
 
     @abstractmethod
     async def get_address_transactions(
-        self, address: str, min_confirmations: int = 1
+        self,
+        address: str,
+        min_confirmations: int = 1,
+        since_block: Optional[int] = None,
+        current_block: Optional[int] = None,
     ) -> list[TransactionInfo]:
         """Get transactions for an address.
 
         Args:
             address: Blockchain address to check
             min_confirmations: Minimum confirmation count
+            since_block: Only return transactions at or above this height
+                (unconfirmed ones are always included). None = latest page.
+            current_block: Chain tip already fetched for this scan cycle
+                (fetched by the scanner if None)
 
         Returns:
             List of transactions to this address
+
+        Raises:
+            ScanIncompleteError: If the history was not read completely
         """
         pass
 
@@ -93,6 +143,35 @@ class DepositScanner(ABC):
         """Get the current blockchain height."""
         pass
 
+    @property
+    def rate_limiter(self) -> Optional[TokenBucket]:
+        """Shared token bucket for this scanner's backend."""
+        if self._rate_limiter is None and self.rate_limit_backend:
+            self._rate_limiter = get_rate_limiter(self.rate_limit_backend)
+        return self._rate_limiter
+
+    def _is_rate_limited(self, response: Any) -> bool:
+        """Check whether a backend response means "slow down"."""
+        return response.status_code == 429
+
+    async def _request(self, client: Any, method: str, url: str, **kwargs) -> Any:
+        """Send a request paced by the backend's token bucket.
+
+        Rate-limited responses halve the bucket's rate and are retried up
+        to ``MAX_RATE_LIMIT_RETRIES`` times; the last response is returned
+        either way so callers keep their own status handling.
+        """
+        return await rate_limited_request(
+            client,
+            method,
+            url,
+            self.rate_limiter,
+            is_rate_limited=self._is_rate_limited,
+            max_retries=self.MAX_RATE_LIMIT_RETRIES,
+            label=f"{self.asset} scanner ({self.rate_limit_backend or url})",
+            **kwargs,
+        )
+
     def set_deposit_callback(self, callback: Callable) -> None:
         """Set callback function for detected deposits.
 
@@ -100,17 +179,74 @@ class DepositScanner(ABC):
         """
         self._on_deposit_callback = callback
 
-    async def scan_address(self, address: str) -> list[TransactionInfo]:
+    @staticmethod
+    def safe_cursor_height(current_block: int, min_confirmations: int) -> int:
+        """Highest block whose transactions all have enough confirmations.
+
+        Advancing a cursor past this height could skip deposits that are
+        still waiting for confirmations.
+        """
+        return max(0, current_block - min_confirmations)
+
+    async def fetch_address_transactions(
+        self,
+        address: str,
+        min_confirmations: int = 1,
+        since_block: Optional[int] = None,
+        current_block: Optional[int] = None,
+    ) -> tuple[list[TransactionInfo], Optional[int]]:
+        """``get_address_transactions`` plus how far a cursor may advance.
+
+        Returns:
+            (transactions, highest height the address's cursor may move to;
+            None = no limit, ``since_block - 1`` or -1 = stay put)
+
+        Raises:
+            ScanIncompleteError: If nothing usable was read
+        """
+        try:
+            txs = await self.get_address_transactions(
+                address,
+                min_confirmations=min_confirmations,
+                since_block=since_block,
+                current_block=current_block,
+            )
+            return txs, None
+        except ScanIncompleteError as e:
+            if not e.transactions and e.complete_height is None:
+                raise
+            logger.warning(f"Incomplete {self.asset} scan of {address}: {e}")
+            if e.complete_height is not None:
+                return e.transactions, e.complete_height
+            return e.transactions, since_block - 1 if since_block is not None else -1
+
+    async def scan_address(
+        self, address: str, current_block: Optional[int] = None
+    ) -> list[TransactionInfo]:
         """Scan an address for new deposits.
 
         Args:
             address: Address to scan
+            current_block: Chain tip for this cycle (fetched if None)
 
         Returns:
             List of new (unprocessed) transactions
         """
-        transactions = await self.get_address_transactions(address)
+        cursor = self._cursors.get(address)
+        transactions, limit = await self.fetch_address_transactions(
+            address,
+            since_block=cursor + 1 if cursor is not None else None,
+            current_block=current_block,
+        )
+        if current_block:
+            height = self.safe_cursor_height(current_block, 1)
+            if limit is not None:
+                height = min(height, limit)
+            if height > (cursor if cursor is not None else -1):
+                self._cursors[address] = height
         new_txs = []
+        if transactions:
+            self.priority.mark_active(address)
 
         for tx in transactions:
             if tx.txid not in self._processed_txids:
@@ -125,22 +261,41 @@ class DepositScanner(ABC):
 
         return new_txs
 
-    async def scan_addresses(self, addresses: list[str]) -> list[TransactionInfo]:
+    async def scan_addresses(
+        self, addresses: list[str], concurrency: Optional[int] = None
+    ) -> list[TransactionInfo]:
         """Scan multiple addresses for new deposits.
 
+        Addresses are scanned concurrently (recently active and freshly
+        issued ones first); request pacing is handled by the backend's
+        token bucket.
+
         Args:
             addresses: List of addresses to scan
+            concurrency: Max lookups in flight (default: SCANNER_CONCURRENCY)
 
         Returns:
             List of all new transactions found
         """
+        if concurrency is None:
+            from swaperex.config import get_settings
+
+            concurrency = get_settings().scanner_concurrency
+
+        # One tip lookup per cycle instead of one per address
+        current_block = await self.get_current_block_height() or None
+        results = await scan_concurrently(
+            self.priority.order(addresses),
+            lambda address: self.scan_address(address, current_block),
+            concurrency,
+        )
+
         all_txs = []
-        for address in addresses:
-            try:
-                txs = await self.scan_address(address)
-                all_txs.extend(txs)
-            except Exception as e:
-                logger.error(f"Error scanning {address}: {e}")
+        for address, result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error scanning {address}: {result}")
+                continue
+            all_txs.extend(result)
         return all_txs
 
     async def run(
@@ -179,7 +334,11 @@ class DepositScanner(ABC):
         self._processed_txids.add(txid)
 
     def is_processed(self, txid: str) -> bool:
-        """Check if a transaction has been processed."""
+        """Check if a transaction has been processed recently.
+
+        Only recent txids are remembered, so the deposit callback must stay
+        idempotent for older ones.
+        """
         return txid in self._processed_txids
 
 
@@ -192,12 +351,18 @@ class SimulatedScanner(DepositScanner):
         self._block_height = 800000
 
     async def get_address_transactions(
-        self, address: str, min_confirmations: int = 1
+        self,
+        address: str,
+        min_confirmations: int = 1,
+        since_block: Optional[int] = None,
+        current_block: Optional[int] = None,
     ) -> list[TransactionInfo]:
         """Return simulated transactions for testing."""
         return [
             tx for tx in self._simulated_txs
-            if tx.to_address == address and tx.confirmations >= min_confirmations
+            if tx.to_address == address
+            and tx.confirmations >= min_confirmations
+            and (since_block is None or tx.block_height is None or tx.block_height >= since_block)
         ]
 
     async def get_transaction(self, txid: str) -> Optional[TransactionInfo]:
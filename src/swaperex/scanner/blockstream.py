@@ -10,7 +10,8 @@ from typing import Optional
 
 import httpx
 
-from swaperex.scanner.base import DepositScanner, TransactionInfo
+from swaperex.scanner.base import DepositScanner, ScanIncompleteError, TransactionInfo
+from swaperex.utils.http import PooledHTTPClient, get_pooled_client
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,12 @@ class BlockstreamScanner(DepositScanner):
     MAINNET_URL = "https://blockstream.info/api"
     TESTNET_URL = "https://blockstream.info/testnet/api"
 
+    rate_limit_backend = "blockstream"
+
+    # Esplora returns 25 confirmed txs per history page
+    CHAIN_PAGE_SIZE = 25
+    MAX_HISTORY_PAGES = 20
+
     def __init__(self, testnet: bool = False):
         """Initialize Blockstream scanner.
 
@@ -35,51 +42,106 @@ class BlockstreamScanner(DepositScanner):
         super().__init__("BTC")
         self.testnet = testnet
         self.base_url = self.TESTNET_URL if testnet else self.MAINNET_URL
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[PooledHTTPClient] = None
 
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
+    async def _get_client(self) -> PooledHTTPClient:
+        """Get the shared pooled HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=30.0)
+            self._client = get_pooled_client(timeout=30.0)
         return self._client
 
     async def get_address_transactions(
-        self, address: str, min_confirmations: int = 1
+        self,
+        address: str,
+        min_confirmations: int = 1,
+        since_block: Optional[int] = None,
+        current_block: Optional[int] = None,
     ) -> list[TransactionInfo]:
         """Get transactions for a BTC address.
 
+        Without ``since_block`` only the newest page is read. With it,
+        older confirmed pages are followed (``/txs/chain/{last_txid}``)
+        until the page reaches below ``since_block``; if that takes more
+        than ``MAX_HISTORY_PAGES`` the transactions read so far come with a
+        ``ScanIncompleteError`` that keeps the cursor in place.
+
         Args:
             address: BTC address (bc1q..., 1..., 3..., etc.)
             min_confirmations: Minimum confirmation count
+            since_block: Only return transactions at or above this height
+            current_block: Chain tip for this scan cycle (fetched if None)
 
         Returns:
             List of incoming transactions
         """
         client = await self._get_client()
         transactions = []
+        complete = True
 
         try:
-            # Get address transactions
+            # Get address transactions (mempool + newest confirmed page)
             url = f"{self.base_url}/address/{address}/txs"
-            response = await client.get(url)
+            response = await self._request(client, "GET", url)
             response.raise_for_status()
             txs = response.json()
 
+            if since_block is not None:
+                older, complete = await self._fetch_older_pages(address, txs, since_block)
+                txs.extend(older)
+
             # Get current block height for confirmation calculation
-            current_height = await self.get_current_block_height()
+            current_height = current_block or await self.get_current_block_height()
 
             for tx in txs:
+                height = tx.get("status", {}).get("block_height")
+                if since_block is not None and height and height < since_block:
+                    continue
                 tx_info = self._parse_transaction(tx, address, current_height)
                 if tx_info and tx_info.confirmations >= min_confirmations:
                     transactions.append(tx_info)
 
         except httpx.HTTPError as e:
-            logger.error(f"Blockstream API error for {address}: {e}")
+            raise ScanIncompleteError(f"Blockstream API error for {address}: {e}") from e
         except Exception as e:
-            logger.error(f"Error parsing transactions for {address}: {e}")
-
+            raise ScanIncompleteError(f"Error parsing transactions for {address}: {e}") from e
+
+        if not complete:
+            raise ScanIncompleteError(
+                f"History of {address} since block {since_block} exceeds "
+                f"{self.MAX_HISTORY_PAGES} pages",
+                transactions,
+            )
         return transactions
 
+    async def _fetch_older_pages(
+        self, address: str, first_page: list[dict], since_block: int
+    ) -> tuple[list[dict], bool]:
+        """Follow confirmed-history pages back to ``since_block``.
+
+        Returns:
+            (older transactions, whether ``since_block`` was reached)
+        """
+        client = await self._get_client()
+        older: list[dict] = []
+        page = [tx for tx in first_page if tx.get("status", {}).get("confirmed")]
+
+        pages = 0
+        while len(page) >= self.CHAIN_PAGE_SIZE:
+            oldest = page[-1]
+            if (oldest.get("status", {}).get("block_height") or 0) < since_block:
+                break
+            if pages == self.MAX_HISTORY_PAGES:
+                return older, False
+
+            url = f"{self.base_url}/address/{address}/txs/chain/{oldest['txid']}"
+            response = await self._request(client, "GET", url)
+            response.raise_for_status()
+            page = response.json()
+            older.extend(page)
+            pages += 1
+
+        return older, True
+
     async def get_transaction(self, txid: str) -> Optional[TransactionInfo]:
         """Get a specific BTC transaction.
 
@@ -93,7 +155,7 @@ class BlockstreamScanner(DepositScanner):
 
         try:
             url = f"{self.base_url}/tx/{txid}"
-            response = await client.get(url)
+            response = await self._request(client, "GET", url)
             response.raise_for_status()
             tx = response.json()
 
@@ -118,7 +180,7 @@ class BlockstreamScanner(DepositScanner):
 
         try:
             url = f"{self.base_url}/blocks/tip/height"
-            response = await client.get(url)
+            response = await self._request(client, "GET", url)
             response.raise_for_status()
             return int(response.text)
         except Exception as e:
@@ -177,10 +239,12 @@ class BlockstreamScanner(DepositScanner):
         )
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Release the HTTP client.
+
+        The underlying connections are pooled process-wide and closed by
+        ``close_http_clients()`` on shutdown.
+        """
+        self._client = None
 
 
 class LTCBlockstreamScanner(BlockstreamScanner):
@@ -196,8 +260,13 @@ class LTCBlockstreamScanner(BlockstreamScanner):
         # e.g., blockcypher.com or similar
 
     async def get_address_transactions(
-        self, address: str, min_confirmations: int = 1
+        self,
+        address: str,
+        min_confirmations: int = 1,
+        since_block: Optional[int] = None,
+        current_block: Optional[int] = None,
     ) -> list[TransactionInfo]:
         """LTC scanning not yet implemented."""
-        logger.warning("LTC scanning not yet implemented, returning empty list")
-        return []
+        # Raised rather than returning [] so no scan cursor moves past
+        # deposits that a real implementation would find
+        raise ScanIncompleteError("LTC scanning not yet implemented")
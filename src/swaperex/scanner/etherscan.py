@@ -8,9 +8,8 @@ import logging
 from decimal import Decimal
 from typing import Optional
 
-import httpx
-
-from swaperex.scanner.base import DepositScanner, TransactionInfo
+from swaperex.scanner.base import DepositScanner, ScanIncompleteError, TransactionInfo
+from swaperex.utils.http import pooled_client
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +25,57 @@ USDT_CONTRACT_SEPOLIA = "0x7169D38820dfd117C3FA1f22a697dBA58d90BA06"  # Test tok
 USDC_CONTRACT_MAINNET = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
 
 
+# Transactions per account history request
+PAGE_SIZE = 50
+
+
+def _history_page(response) -> list[dict]:
+    """Raw entries of an account history response.
+
+    Raises ``ScanIncompleteError`` unless the response is a result list
+    or Etherscan's "No transactions found".
+    """
+    if response.status_code != 200:
+        raise ScanIncompleteError(f"Etherscan API error: {response.status_code}")
+    data = response.json()
+    if data.get("status") != "1":
+        if data.get("message") == "No transactions found":
+            return []
+        raise ScanIncompleteError(f"Etherscan API error: {data.get('result')}")
+    return data.get("result") or []
+
+
+def _complete_height(entries: list[dict], since_block: Optional[int]) -> Optional[int]:
+    """Cursor limit for a page read oldest first from ``since_block``.
+
+    A full page may stop inside a block, so only blocks below its last
+    entry are known to be complete.
+    """
+    if since_block is None or len(entries) < PAGE_SIZE:
+        return None
+    return max(int(entries[-1].get("blockNumber", 0)) - 1, since_block - 1)
+
+
+def is_etherscan_rate_limited(response) -> bool:
+    """Detect throttling, which Etherscan also reports as HTTP 200.
+
+    Over-quota calls return ``{"status": "0", "result": "Max rate limit reached"}``.
+    """
+    if response.status_code == 429:
+        return True
+    if response.status_code != 200:
+        return False
+    try:
+        data = response.json()
+    except ValueError:
+        return False
+    return (
+        isinstance(data, dict)
+        and data.get("status") == "0"
+        and "rate limit" in str(data.get("result", "")).lower()
+    )
+
+
 class EtherscanScanner(DepositScanner):
     """ETH deposit scanner using Etherscan API.
 
@@ -33,6 +83,8 @@ class EtherscanScanner(DepositScanner):
     Free tier: 5 calls/second, 100,000 calls/day.
     """
 
+    rate_limit_backend = "etherscan"
+
     def __init__(self, testnet: bool = False, api_key: Optional[str] = None):
         """Initialize Etherscan scanner.
 
@@ -45,14 +97,27 @@ class EtherscanScanner(DepositScanner):
         self.api_key = api_key or "YourApiKeyToken"  # Default (limited)
         self.base_url = ETHERSCAN_SEPOLIA if testnet else ETHERSCAN_MAINNET
 
+    def _is_rate_limited(self, response) -> bool:
+        return is_etherscan_rate_limited(response)
+
     async def get_address_transactions(
-        self, address: str, min_confirmations: int = 1
+        self,
+        address: str,
+        min_confirmations: int = 1,
+        since_block: Optional[int] = None,
+        current_block: Optional[int] = None,
     ) -> list[TransactionInfo]:
         """Get ETH transactions for an address.
 
+        Without ``since_block`` only the newest page is read. With it, the
+        page is read oldest first; a full page raises ``ScanIncompleteError``
+        limiting the cursor to the blocks it covered completely.
+
         Args:
             address: ETH address (0x... format)
             min_confirmations: Minimum confirmations required
+            since_block: Only fetch transactions from this block on
+            current_block: Chain tip for this scan cycle (fetched if None)
 
         Returns:
             List of incoming ETH transactions
@@ -60,34 +125,28 @@ class EtherscanScanner(DepositScanner):
         transactions = []
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 params = {
                     "module": "account",
                     "action": "txlist",
                     "address": address,
-                    "startblock": 0,
+                    "startblock": since_block or 0,
                     "endblock": 99999999,
                     "page": 1,
-                    "offset": 50,
-                    "sort": "desc",
+                    "offset": PAGE_SIZE,
+                    # From the cursor on, read oldest first so a full page
+                    # still covers a contiguous range of blocks
+                    "sort": "desc" if since_block is None else "asc",
                     "apikey": self.api_key,
                 }
 
-                response = await client.get(self.base_url, params=params)
+                response = await self._request(client, "GET", self.base_url, params=params)
+                entries = _history_page(response)
 
-                if response.status_code != 200:
-                    logger.warning(f"Etherscan API error: {response.status_code}")
-                    return []
-
-                data = response.json()
-
-                if data.get("status") != "1":
-                    # No transactions or error
-                    return []
-
-                current_block = await self.get_current_block_height()
+                if entries and current_block is None:
+                    current_block = await self.get_current_block_height()
 
-                for tx in data.get("result", []):
+                for tx in entries:
                     # Only incoming transactions
                     if tx.get("to", "").lower() != address.lower():
                         continue
@@ -96,9 +155,18 @@ class EtherscanScanner(DepositScanner):
                     if tx_info and tx_info.confirmations >= min_confirmations:
                         transactions.append(tx_info)
 
+        except ScanIncompleteError:
+            raise
         except Exception as e:
-            logger.error(f"Error fetching ETH transactions: {e}")
-
+            raise ScanIncompleteError(f"Error fetching ETH transactions: {e}") from e
+
+        complete_height = _complete_height(entries, since_block)
+        if complete_height is not None:
+            raise ScanIncompleteError(
+                f"More than {PAGE_SIZE} transactions since block {since_block}",
+                transactions,
+                complete_height,
+            )
         return transactions
 
     def _parse_transaction(
@@ -138,7 +206,7 @@ class EtherscanScanner(DepositScanner):
     async def get_transaction(self, txid: str) -> Optional[TransactionInfo]:
         """Get a specific ETH transaction."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 params = {
                     "module": "proxy",
                     "action": "eth_getTransactionByHash",
@@ -146,7 +214,7 @@ class EtherscanScanner(DepositScanner):
                     "apikey": self.api_key,
                 }
 
-                response = await client.get(self.base_url, params=params)
+                response = await self._request(client, "GET", self.base_url, params=params)
 
                 if response.status_code != 200:
                     return None
@@ -178,14 +246,14 @@ class EtherscanScanner(DepositScanner):
     async def get_current_block_height(self) -> int:
         """Get current ETH block height."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 params = {
                     "module": "proxy",
                     "action": "eth_blockNumber",
                     "apikey": self.api_key,
                 }
 
-                response = await client.get(self.base_url, params=params)
+                response = await self._request(client, "GET", self.base_url, params=params)
 
                 if response.status_code == 200:
                     data = response.json()
@@ -200,6 +268,8 @@ class EtherscanScanner(DepositScanner):
 class ERC20Scanner(DepositScanner):
     """ERC20 token scanner (USDT, USDC, etc.)."""
 
+    rate_limit_backend = "etherscan"
+
     def __init__(
         self,
         token_contract: str,
@@ -224,39 +294,43 @@ class ERC20Scanner(DepositScanner):
         self.api_key = api_key or "YourApiKeyToken"
         self.base_url = ETHERSCAN_SEPOLIA if testnet else ETHERSCAN_MAINNET
 
+    def _is_rate_limited(self, response) -> bool:
+        return is_etherscan_rate_limited(response)
+
     async def get_address_transactions(
-        self, address: str, min_confirmations: int = 1
+        self,
+        address: str,
+        min_confirmations: int = 1,
+        since_block: Optional[int] = None,
+        current_block: Optional[int] = None,
     ) -> list[TransactionInfo]:
-        """Get ERC20 token transactions for an address."""
+        """Get ERC20 token transactions for an address.
+
+        Paged like ``EtherscanScanner.get_address_transactions``.
+        """
         transactions = []
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 params = {
                     "module": "account",
                     "action": "tokentx",
                     "contractaddress": self.token_contract,
                     "address": address,
+                    "startblock": since_block or 0,
                     "page": 1,
-                    "offset": 50,
-                    "sort": "desc",
+                    "offset": PAGE_SIZE,
+                    "sort": "desc" if since_block is None else "asc",
                     "apikey": self.api_key,
                 }
 
-                response = await client.get(self.base_url, params=params)
-
-                if response.status_code != 200:
-                    logger.warning(f"Etherscan ERC20 API error: {response.status_code}")
-                    return []
-
-                data = response.json()
-
-                if data.get("status") != "1":
-                    return []
+                response = await self._request(client, "GET", self.base_url, params=params)
+                entries = _history_page(response)
 
-                current_block = await self.get_current_block_height()
+                if entries and current_block is None:
+                    current_block = await self.get_current_block_height()
 
-                for tx in data.get("result", []):
+                for tx in entries:
                     # Only incoming transactions
                     if tx.get("to", "").lower() != address.lower():
                         continue
@@ -265,9 +339,18 @@ class ERC20Scanner(DepositScanner):
                     if tx_info and tx_info.confirmations >= min_confirmations:
                         transactions.append(tx_info)
 
+        except ScanIncompleteError:
+            raise
         except Exception as e:
-            logger.error(f"Error fetching ERC20 transactions: {e}")
-
+            raise ScanIncompleteError(f"Error fetching ERC20 transactions: {e}") from e
+
+        complete_height = _complete_height(entries, since_block)
+        if complete_height is not None:
+            raise ScanIncompleteError(
+                f"More than {PAGE_SIZE} token transfers since block {since_block}",
+                transactions,
+                complete_height,
+            )
         return transactions
 
     def _parse_erc20_transaction(
@@ -309,14 +392,14 @@ class ERC20Scanner(DepositScanner):
     async def get_current_block_height(self) -> int:
         """Get current ETH block height."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 params = {
                     "module": "proxy",
                     "action": "eth_blockNumber",
                     "apikey": self.api_key,
                 }
 
-                response = await client.get(self.base_url, params=params)
+                response = await self._request(client, "GET", self.base_url, params=params)
 
                 if response.status_code == 200:
                     data = response.json()
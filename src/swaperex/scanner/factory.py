@@ -1,9 +1,17 @@
 """Factory for creating deposit scanners."""
 
 import os
+from typing import Optional
 
 from swaperex.config import get_settings
 from swaperex.scanner.base import DepositScanner, SimulatedScanner
+from swaperex.scanner.blocks import (
+    BitcoinRPCBlockSource,
+    BlockSource,
+    EsploraBlockSource,
+    EVMBlockSource,
+    TronBlockSource,
+)
 from swaperex.scanner.blockstream import BlockstreamScanner, LTCBlockstreamScanner
 
 # Cache for scanner instances
@@ -80,6 +88,7 @@ def get_scanner(asset: str) -> DepositScanner:
         api_key = os.environ.get("BSCSCAN_API_KEY")
         scanner = EtherscanScanner(testnet=testnet, api_key=api_key)
         scanner.asset = "BSC"
+        scanner.rate_limit_backend = "bscscan"
         scanner.base_url = (
             "https://api-testnet.bscscan.com/api" if testnet
             else "https://api.bscscan.com/api"
@@ -93,6 +102,69 @@ def get_scanner(asset: str) -> DepositScanner:
     return scanner
 
 
+def get_block_source(asset: str) -> Optional[BlockSource]:
+    """Get a block source for block-driven scanning of an asset.
+
+    Args:
+        asset: Asset symbol
+
+    Returns:
+        BlockSource, or None if the asset has none (or in dry-run mode)
+    """
+    asset_upper = asset.upper()
+    settings = get_settings()
+    if settings.dry_run:
+        return None
+
+    testnet = not settings.is_production
+
+    if asset_upper == "BTC":
+        if settings.btc_node_rpc_url:
+            return BitcoinRPCBlockSource(settings.btc_node_rpc_url)
+        base_url = BlockstreamScanner.TESTNET_URL if testnet else BlockstreamScanner.MAINNET_URL
+        return EsploraBlockSource(base_url)
+
+    if asset_upper in ("ETH", "USDT-ERC20", "USDC"):
+        from swaperex.scanner.etherscan import (
+            USDC_CONTRACT_MAINNET,
+            USDT_CONTRACT_MAINNET,
+            USDT_CONTRACT_SEPOLIA,
+        )
+        from swaperex.withdrawal.eth import PUBLIC_RPC_MAINNET, PUBLIC_RPC_SEPOLIA
+
+        rpc_url = os.environ.get("ETH_RPC_URL") or (
+            PUBLIC_RPC_SEPOLIA if testnet else PUBLIC_RPC_MAINNET
+        )
+        if asset_upper == "ETH":
+            return EVMBlockSource(rpc_url, asset_upper)
+        if asset_upper == "USDT-ERC20":
+            contract = USDT_CONTRACT_SEPOLIA if testnet else USDT_CONTRACT_MAINNET
+        else:
+            contract = USDC_CONTRACT_MAINNET
+        return EVMBlockSource(rpc_url, asset_upper, token_contract=contract, token_decimals=6)
+
+    if asset_upper in ("BSC", "BNB"):
+        rpc_url = os.environ.get("BSC_RPC_URL", "https://bsc-dataseed.binance.org/")
+        return EVMBlockSource(rpc_url, "BSC")
+
+    if asset_upper in ("TRX", "USDT-TRC20"):
+        from swaperex.scanner.trongrid import (
+            TRONGRID_MAINNET,
+            TRONGRID_TESTNET,
+            USDT_CONTRACT_MAINNET,
+            USDT_CONTRACT_TESTNET,
+        )
+
+        base_url = TRONGRID_TESTNET if testnet else TRONGRID_MAINNET
+        api_key = os.environ.get("TRONGRID_API_KEY")
+        if asset_upper == "TRX":
+            return TronBlockSource(base_url, asset_upper, api_key=api_key)
+        contract = USDT_CONTRACT_TESTNET if testnet else USDT_CONTRACT_MAINNET
+        return TronBlockSource(base_url, asset_upper, api_key=api_key, token_contract=contract)
+
+    return None
+
+
 def get_supported_scanner_assets() -> list[str]:
     """Get list of assets with real scanner support."""
     return [
@@ -10,6 +10,7 @@ Environment variables:
     BACKEND_URL: URL of the FastAPI backend (default: http://127.0.0.1:8000)
     BTC_CONFIRMATIONS: Minimum confirmations for BTC (default: 2)
     SCANNER_INTERVAL: Seconds between scan cycles (default: 60)
+    SCANNER_MODE: "address" (poll addresses) or "blocks" (walk blocks)
     TELEGRAM_BOT_TOKEN: Bot token for sending notifications (optional)
 """
 
@@ -20,8 +21,13 @@ import os
 from typing import Optional
 
 from swaperex.ledger.database import get_db, init_db
-from swaperex.ledger.repository import LedgerRepository
+from swaperex.ledger.repository import IngestedDeposit, LedgerRepository
 from swaperex.scanner import TransactionInfo, get_scanner
+from swaperex.scanner.address_index import get_address_index, is_case_insensitive
+from swaperex.scanner.blocks import BLOCK_CURSOR_KEY, BlockScanner
+from swaperex.scanner.factory import get_block_source
+from swaperex.scanner.scheduler import scan_concurrently
+from swaperex.scanner.seen import SeenTransactions
 
 # Configure logging - reduce SQL noise
 logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
@@ -76,6 +82,8 @@ class DepositScannerRunner:
         backend_url: str = "http://127.0.0.1:8000",
         min_confirmations: int = 2,
         interval: int = 60,
+        concurrency: Optional[int] = None,
+        mode: Optional[str] = None,
     ):
         """Initialize scanner runner.
 
@@ -84,124 +92,270 @@ class DepositScannerRunner:
             backend_url: URL of the backend API
             min_confirmations: Minimum confirmations required
             interval: Seconds between scan cycles
+            concurrency: Max address lookups in flight (default: SCANNER_CONCURRENCY)
+            mode: "address" or "blocks" (default: SCANNER_MODE)
         """
+        from swaperex.config import get_settings
+
+        settings = get_settings()
         self.asset = asset.upper()
         self.backend_url = backend_url
         self.min_confirmations = min_confirmations
         self.interval = interval
+        self.concurrency = concurrency or settings.scanner_concurrency
         self.scanner = get_scanner(asset)
-        self._processed_txids: set[str] = set()
+        self._processed_txids = SeenTransactions()
+        self._seen_warmed = False
+
+        self.mode = (mode or settings.scanner_mode).lower()
+        self.block_scanner: Optional[BlockScanner] = None
+        if self.mode == "blocks":
+            source = get_block_source(self.asset)
+            if source is None:
+                logger.warning(f"No block source for {self.asset}, falling back to address mode")
+                self.mode = "address"
+            else:
+                self.block_scanner = BlockScanner(
+                    self.asset,
+                    source,
+                    get_address_index(self.asset),
+                    min_confirmations=min_confirmations,
+                    max_blocks_per_cycle=settings.scanner_max_blocks_per_cycle,
+                )
 
     async def get_addresses_to_scan(self) -> list[str]:
         """Get list of active deposit addresses from database."""
         async with get_db() as session:
             repo = LedgerRepository(session)
             addresses = await repo.get_all_active_deposit_addresses(self.asset)
+            for addr in addresses:
+                self.scanner.priority.mark_issued(addr.address, addr.created_at)
             return [addr.address for addr in addresses]
 
-    async def process_deposit(self, tx: TransactionInfo) -> bool:
-        """Process a detected deposit.
+    async def process_deposits(self, txs: list[TransactionInfo]) -> int:
+        """Record and credit a batch of detected deposits in one transaction.
 
-        Posts to the backend webhook to credit user balance.
-        """
-        if tx.txid in self._processed_txids:
-            logger.debug(f"Skipping already processed tx: {tx.txid}")
-            return False
-
-        if tx.confirmations < self.min_confirmations:
-            logger.debug(
-                f"Tx {tx.txid} has {tx.confirmations} confirmations, "
-                f"need {self.min_confirmations}"
-            )
-            return False
+        Transactions already in the seen set or below ``min_confirmations``
+        are skipped; the rest go to ``LedgerRepository.ingest_deposits``,
+        which checks the database for duplicates itself. Users are notified
+        once the batch is committed.
 
-        logger.info(
-            f"Processing deposit: {tx.amount} {tx.asset} to {tx.to_address} "
-            f"(txid: {tx.txid[:16]}...)"
-        )
+        Returns:
+            Number of deposits credited
+        """
+        candidates = []
+        for tx in txs:
+            if tx.txid in self._processed_txids:
+                logger.debug(f"Skipping already processed tx: {tx.txid}")
+            elif tx.confirmations < self.min_confirmations:
+                logger.debug(
+                    f"Tx {tx.txid} has {tx.confirmations} confirmations, "
+                    f"need {self.min_confirmations}"
+                )
+            else:
+                candidates.append(tx)
+        if not candidates:
+            return 0
 
-        # Find user by address
         async with get_db() as session:
-            repo = LedgerRepository(session)
-            addr_record = await repo.get_deposit_address_record(tx.to_address)
+            results = await LedgerRepository(session).ingest_deposits(
+                candidates, source="scanner"
+            )
 
-            if not addr_record:
+        credited = []
+        for result in results:
+            tx = result.tx
+            if result.status == IngestedDeposit.UNKNOWN_ADDRESS:
                 logger.warning(f"Address {tx.to_address} not found in database")
-                return False
-
-            user = await repo.get_user_by_deposit_address(tx.to_address)
-            if not user:
-                logger.warning(f"User for address {tx.to_address} not found")
-                return False
-
-            # Check if deposit already recorded
-            existing = await repo.get_deposit_by_txid(tx.txid)
-            if existing:
-                logger.debug(f"Deposit {tx.txid} already recorded")
-                self._processed_txids.add(tx.txid)
-                return False
-
-            # Create deposit and credit balance
-            from swaperex.ledger.models import DepositStatus
-
-            deposit = await repo.create_deposit(
-                user_id=user.id,
-                asset=tx.asset,
-                amount=tx.amount,
-                to_address=tx.to_address,
-                tx_hash=tx.txid,
-                from_address=tx.from_address,
-                status=DepositStatus.PENDING,
+                continue
+            self._processed_txids.add(tx.txid)
+            if result.status == IngestedDeposit.CREDITED:
+                logger.info(
+                    f"Deposit confirmed: {tx.amount} {result.asset} credited to user "
+                    f"{result.user_id} (txid: {tx.txid[:16]}...)"
+                )
+                credited.append(result)
+
+        for result in credited:
+            await send_deposit_notification(
+                telegram_id=result.telegram_id,
+                asset=result.asset,
+                amount=result.tx.amount,
+                txid=result.tx.txid,
             )
+        return len(credited)
 
-            # Confirm deposit (credits balance)
-            await repo.confirm_deposit(deposit.id)
+    async def process_deposit(self, tx: TransactionInfo) -> bool:
+        """Process a single detected deposit (see ``process_deposits``)."""
+        return await self.process_deposits([tx]) > 0
 
-            logger.info(
-                f"Deposit confirmed: {tx.amount} {tx.asset} credited to user {user.id}"
-            )
+    async def warm_processed_txids(self) -> None:
+        """Load already processed transactions into the seen set (once)."""
+        if self._seen_warmed:
+            return
+        async with get_db() as session:
+            await self._processed_txids.warm(LedgerRepository(session), self.asset)
+        self._seen_warmed = True
 
-            # Send Telegram notification
-            await send_deposit_notification(
-                telegram_id=user.telegram_id,
-                asset=tx.asset,
-                amount=tx.amount,
-                txid=tx.txid,
-            )
+    async def load_cursors(self) -> dict[str, int]:
+        """Load persisted scan heights for this asset (address -> height)."""
+        async with get_db() as session:
+            repo = LedgerRepository(session)
+            cursors = await repo.get_scan_cursors(self.asset)
+            return {address: cursor.block_height for address, cursor in cursors.items()}
 
-        self._processed_txids.add(tx.txid)
-        return True
+    async def save_cursors(self, positions: dict[str, tuple[int, Optional[str]]]) -> None:
+        """Persist advanced scan cursors in one transaction."""
+        if not positions:
+            return
+        async with get_db() as session:
+            repo = LedgerRepository(session)
+            await repo.save_scan_cursors(self.asset, positions)
 
     async def scan_once(self) -> int:
-        """Run a single scan cycle.
+        """Run a single scan cycle (per-address polling or block walking).
+
+        Fetches the chain tip once, then asks each address only for
+        activity above its persisted cursor. Lookups run concurrently
+        (recently active and freshly issued addresses first) and are paced
+        by the backend's token bucket. Deposits found across all addresses
+        are ingested as one batch. A cursor only advances to
+        ``tip - min_confirmations`` and only when the address's history was
+        read completely and the batch was recorded, so deposits still
+        gaining confirmations, or hidden by an API error or a truncated
+        history, are seen again on the next cycle.
 
         Returns:
             Number of new deposits processed
         """
+        try:
+            await self.warm_processed_txids()
+        except Exception as e:
+            logger.warning(f"Could not warm processed {self.asset} transactions: {e}")
+
+        if self.block_scanner is not None:
+            return await self.scan_blocks_once()
+
         addresses = await self.get_addresses_to_scan()
 
         if not addresses:
             logger.debug(f"No {self.asset} addresses to scan")
             return 0
 
-        logger.info(f"Scanning {len(addresses)} {self.asset} addresses...")
+        cursors = await self.load_cursors()
+        current_block = await self.scanner.get_current_block_height() or None
+        if current_block is None:
+            logger.warning(f"Could not fetch {self.asset} chain tip, cursors will not advance")
 
-        processed = 0
-        for address in addresses:
-            try:
-                txs = await self.scanner.get_address_transactions(
-                    address, min_confirmations=self.min_confirmations
-                )
+        logger.info(
+            f"Scanning {len(addresses)} {self.asset} addresses "
+            f"(concurrency: {self.concurrency})..."
+        )
 
-                for tx in txs:
-                    if await self.process_deposit(tx):
-                        processed += 1
+        async def scan_address(address: str) -> tuple[list[TransactionInfo], Optional[int]]:
+            cursor = cursors.get(address)
+            txs, limit = await self.scanner.fetch_address_transactions(
+                address,
+                min_confirmations=self.min_confirmations,
+                since_block=cursor + 1 if cursor is not None else None,
+                current_block=current_block,
+            )
+            if txs:
+                self.scanner.priority.mark_active(address)
+            return txs, limit
 
-            except Exception as e:
-                logger.error(f"Error scanning {address}: {e}")
+        results = await scan_concurrently(
+            self.scanner.priority.order(addresses), scan_address, self.concurrency
+        )
+
+        scanned: list[tuple[str, list[TransactionInfo], Optional[int]]] = []
+        for address, result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error scanning {address}: {result}")
+            else:
+                scanned.append((address, *result))
+
+        try:
+            processed = await self.process_deposits(
+                [tx for _, txs, _ in scanned for tx in txs]
+            )
+        except Exception as e:
+            logger.error(f"Failed to process {self.asset} deposits: {e}")
+            return 0
+
+        advanced: dict[str, tuple[int, Optional[str]]] = {}
+        for address, txs, limit in scanned:
+            if current_block is None:
+                continue
+
+            cursor = cursors.get(address)
+            height = self.scanner.safe_cursor_height(current_block, self.min_confirmations)
+            if limit is not None:
+                height = min(height, limit)
+            if height > (cursor if cursor is not None else -1):
+                newest = max(txs, key=lambda t: t.block_height or 0, default=None)
+                advanced[address] = (height, newest.txid if newest else None)
+
+        try:
+            await self.save_cursors(advanced)
+        except Exception as e:
+            logger.error(f"Failed to save {self.asset} scan cursors: {e}")
 
         return processed
 
+    async def resolve_stored_addresses(self, txs: list[TransactionInfo]) -> None:
+        """Rewrite case-insensitive addresses to the form stored in the DB.
+
+        Blocks report hex/bech32 addresses in lowercase, while deposit
+        addresses may be stored checksummed.
+        """
+        pending = [tx for tx in txs if is_case_insensitive(tx.to_address)]
+        if not pending:
+            return
+        async with get_db() as session:
+            records = await LedgerRepository(session).get_deposit_address_records(
+                (tx.to_address for tx in pending), case_insensitive=True
+            )
+        for tx in pending:
+            record = records.get(tx.to_address.lower())
+            if record:
+                tx.to_address = record.address
+
+    async def scan_blocks_once(self) -> int:
+        """Walk the next window of confirmed blocks and credit matching deposits.
+
+        The address index is refreshed first (new rows only, with a
+        periodic full rebuild). The block cursor is saved only after every
+        matched deposit was processed, so a failure re-walks the window.
+
+        Returns:
+            Number of new deposits processed
+        """
+        index = self.block_scanner.index
+        async with get_db() as session:
+            await index.refresh(LedgerRepository(session))
+
+        if not len(index):
+            logger.debug(f"No {self.asset} addresses to scan")
+            return 0
+
+        cursors = await self.load_cursors()
+        result = await self.block_scanner.scan(cursors.get(BLOCK_CURSOR_KEY))
+        if result.to_height is None:
+            return 0
+
+        logger.info(
+            f"Walked {self.asset} blocks {result.from_height}-{result.to_height}: "
+            f"{result.transfers_seen} transfers, {len(result.transactions)} to our addresses"
+        )
+
+        await self.resolve_stored_addresses(result.transactions)
+        processed = await self.process_deposits(result.transactions)
+
+        last_txid = result.transactions[-1].txid if result.transactions else None
+        await self.save_cursors({BLOCK_CURSOR_KEY: (result.to_height, last_txid)})
+        return processed
+
     async def run(self) -> None:
         """Run continuous scanning loop."""
         logger.info(
@@ -243,6 +397,12 @@ async def main():
         default=int(os.environ.get("BTC_CONFIRMATIONS", "2")),
         help="Minimum confirmations (default: 2)",
     )
+    parser.add_argument(
+        "--mode",
+        choices=["address", "blocks"],
+        default=None,
+        help="Poll each address or walk new blocks (default: SCANNER_MODE)",
+    )
     parser.add_argument(
         "--once",
         action="store_true",
@@ -258,6 +418,7 @@ async def main():
         backend_url=backend_url,
         min_confirmations=args.confirmations,
         interval=args.interval,
+        mode=args.mode,
     )
 
     if args.once:
@@ -0,0 +1,187 @@
+"""Rate-limit-aware scheduling for deposit scans.
+
+Scanning addresses one at a time makes a cycle take as long as the number
+of addresses times the API latency. This module lets scanners run address
+lookups concurrently while staying inside each backend's request quota:
+
+- A ``TokenBucket`` (``swaperex.utils.rate_limit``) paces requests to one
+  backend and backs off (halving its rate) when the backend answers 429,
+  then slowly recovers.
+- Buckets are shared per backend, so e.g. the ETH, USDT-ERC20 and USDC
+  scanners draw from the same Etherscan quota.
+- ``ScanPriority`` orders addresses so recently active and freshly issued
+  ones are looked at first in every cycle.
+- ``scan_concurrently`` runs the lookups under a concurrency cap.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Optional
+
+from swaperex.utils.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# Default request rates (requests/second) per scanner backend
+BACKEND_RATE_LIMITS: dict[str, float] = {
+    "etherscan": 5.0,  # free tier
+    "bscscan": 5.0,  # free tier
+    "trongrid": 3.0,  # no API key
+    "trongrid_key": 15.0,  # with TRON-PRO-API-KEY
+    "blockstream": 10.0,
+}
+DEFAULT_RATE_LIMIT = 5.0
+
+
+_rate_limiters: dict[str, TokenBucket] = {}
+
+
+def parse_rate_limits(value: str) -> dict[str, float]:
+    """Parse ``"etherscan=5,trongrid=15"`` into a backend -> rate mapping."""
+    limits = {}
+    for item in value.split(","):
+        name, _, rate = item.partition("=")
+        if not name.strip() or not rate.strip():
+            continue
+        try:
+            limits[name.strip().lower()] = float(rate)
+        except ValueError:
+            logger.warning(f"Ignoring invalid scanner rate limit: {item!r}")
+    return limits
+
+
+def get_rate_limiter(backend: str) -> TokenBucket:
+    """Get the shared token bucket for a scanner backend.
+
+    Rates come from ``BACKEND_RATE_LIMITS``, overridden by the
+    SCANNER_RATE_LIMITS setting.
+    """
+    backend = backend.lower()
+    limiter = _rate_limiters.get(backend)
+    if limiter is None:
+        from swaperex.config import get_settings
+
+        overrides = parse_rate_limits(get_settings().scanner_rate_limits)
+        rate = overrides.get(backend, BACKEND_RATE_LIMITS.get(backend, DEFAULT_RATE_LIMIT))
+        limiter = TokenBucket(rate)
+        _rate_limiters[backend] = limiter
+        logger.debug(f"Scanner rate limiter for {backend}: {rate} req/s")
+    return limiter
+
+
+def reset_rate_limiters() -> None:
+    """Forget all shared buckets (useful for testing)."""
+    _rate_limiters.clear()
+
+
+def retry_after_seconds(headers: Any) -> Optional[float]:
+    """Read a numeric Retry-After header, if present."""
+    value = headers.get("Retry-After") if headers is not None else None
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+async def rate_limited_request(
+    client: Any,
+    method: str,
+    url: str,
+    limiter: Optional[TokenBucket],
+    is_rate_limited: Callable[[Any], bool] = lambda response: response.status_code == 429,
+    max_retries: int = 3,
+    label: str = "",
+    **kwargs,
+) -> Any:
+    """Send a request paced by ``limiter``, backing off and retrying on rate limits.
+
+    The last response is returned even if it was still rate limited, so
+    callers keep their own status handling.
+    """
+    response = None
+    for attempt in range(max_retries + 1):
+        if limiter is not None:
+            await limiter.acquire()
+        response = await client.request(method, url, **kwargs)
+        if not is_rate_limited(response):
+            if limiter is not None:
+                limiter.on_success()
+            return response
+
+        retry_after = retry_after_seconds(getattr(response, "headers", None))
+        logger.warning(f"Rate limited by {label or url} (attempt {attempt + 1})")
+        if limiter is not None:
+            limiter.on_rate_limited(retry_after)
+        else:
+            await asyncio.sleep(retry_after if retry_after is not None else 1.0)
+    return response
+
+
+class ScanPriority:
+    """Orders addresses so likely deposit targets are scanned first.
+
+    An address is "hot" if it received a transaction or was issued within
+    ``hot_window`` seconds. Hot addresses go first (most recent first); the
+    rest keep their original order.
+    """
+
+    def __init__(self, hot_window: float = 86400.0):
+        self.hot_window = hot_window
+        self._last_seen: dict[str, float] = {}
+
+    def mark_active(self, address: str, when: Optional[float] = None) -> None:
+        """Record activity on an address (unix timestamp, default now)."""
+        self._last_seen[address] = when if when is not None else time.time()
+
+    def mark_issued(self, address: str, created_at: Optional[datetime]) -> None:
+        """Record when an address was handed out to a user."""
+        if created_at is None:
+            return
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        issued = created_at.timestamp()
+        if issued > self._last_seen.get(address, 0.0):
+            self._last_seen[address] = issued
+
+    def order(self, addresses: list[str]) -> list[str]:
+        """Return addresses with hot ones first."""
+        now = time.time()
+
+        def key(item: tuple[int, str]) -> tuple[int, float, int]:
+            position, address = item
+            seen = self._last_seen.get(address)
+            if seen is not None and now - seen <= self.hot_window:
+                return (0, -seen, position)
+            return (1, 0.0, position)
+
+        return [address for _, address in sorted(enumerate(addresses), key=key)]
+
+
+async def scan_concurrently(
+    addresses: list[str],
+    scan: Callable[[str], Awaitable[Any]],
+    concurrency: int,
+) -> list[tuple[str, Any]]:
+    """Run ``scan(address)`` for every address with at most ``concurrency`` in flight.
+
+    Lookups start in list order. Request pacing is left to the scanners'
+    token buckets; this only bounds the number of open requests.
+
+    Returns:
+        (address, result) pairs in input order; result is the raised
+        exception if a lookup failed
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(address: str) -> tuple[str, Any]:
+        async with semaphore:
+            try:
+                return address, await scan(address)
+            except Exception as e:
+                return address, e
+
+    return list(await asyncio.gather(*(run(address) for address in addresses)))
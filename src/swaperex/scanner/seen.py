@@ -0,0 +1,70 @@
+"""Bounded "already processed" set for deposit scanners.
+
+Plain sets of txids grow for as long as a scanner runs and are empty
+after a restart, so every historical transaction goes back through the
+database check. SeenTransactions keeps an LRU of the most recent txids
+instead: memory stays flat, and it is warmed from the database on start.
+
+A hit means the transaction is definitely processed and can be skipped.
+A miss proves nothing (the txid may have been evicted), so misses still
+go through the database duplicate check when deposits are ingested.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+
+class SeenTransactions:
+    """LRU set of processed transaction ids."""
+
+    def __init__(self, lru_size: int = 50_000):
+        """Initialize the set.
+
+        Args:
+            lru_size: Recent txids answered without a database check
+        """
+        self.lru_size = lru_size
+        self._lru: OrderedDict[str, None] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    def add(self, txid: str) -> None:
+        """Record a processed transaction."""
+        if txid in self._lru:
+            self._lru.move_to_end(txid)
+            return
+        self._lru[txid] = None
+        if len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
+
+    def update(self, txids: Iterable[str]) -> None:
+        """Record many transactions (oldest first, so the newest stay in the LRU)."""
+        for txid in txids:
+            self.add(txid)
+
+    def __contains__(self, txid: object) -> bool:
+        """Definitely processed (LRU hit); refreshes the entry."""
+        if not isinstance(txid, str) or txid not in self._lru:
+            return False
+        self._lru.move_to_end(txid)
+        return True
+
+    async def warm(self, repo, chain: str) -> int:
+        """Load the most recent processed transactions for a chain from the database.
+
+        Args:
+            repo: LedgerRepository
+            chain: Chain/asset as stored in ``processed_transactions``
+
+        Returns:
+            Number of txids loaded
+        """
+        txids = await repo.get_processed_tx_hashes(chain, limit=self.lru_size)
+        # Repository returns newest first; add oldest first
+        self.update(reversed(txids))
+        logger.info(f"Loaded {len(txids)} processed {chain.upper()} transactions")
+        return len(txids)
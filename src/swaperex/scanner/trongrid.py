@@ -8,9 +8,8 @@ import logging
 from decimal import Decimal
 from typing import Optional
 
-import httpx
-
-from swaperex.scanner.base import DepositScanner, TransactionInfo
+from swaperex.scanner.base import DepositScanner, ScanIncompleteError, TransactionInfo
+from swaperex.utils.http import pooled_client
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +29,9 @@ class TronGridScanner(DepositScanner):
     Free API with generous rate limits.
     """
 
+    PAGE_SIZE = 50
+    MAX_HISTORY_PAGES = 20
+
     def __init__(self, testnet: bool = False, api_key: Optional[str] = None):
         """Initialize TronGrid scanner.
 
@@ -41,55 +43,98 @@ class TronGridScanner(DepositScanner):
         self.testnet = testnet
         self.api_key = api_key
         self.base_url = TRONGRID_TESTNET if testnet else TRONGRID_MAINNET
+        # Keyed and anonymous access have separate quotas
+        self.rate_limit_backend = "trongrid_key" if api_key else "trongrid"
 
         self._headers = {"Accept": "application/json"}
         if api_key:
             self._headers["TRON-PRO-API-KEY"] = api_key
 
     async def get_address_transactions(
-        self, address: str, min_confirmations: int = 1
+        self,
+        address: str,
+        min_confirmations: int = 1,
+        since_block: Optional[int] = None,
+        current_block: Optional[int] = None,
     ) -> list[TransactionInfo]:
         """Get TRX transactions for an address.
 
+        TronGrid filters by timestamp rather than block, so ``since_block``
+        is applied to the returned pages: older pages are followed
+        (``meta.fingerprint``) until one reaches below ``since_block``. If
+        that takes more than ``MAX_HISTORY_PAGES`` the transactions read so
+        far come with a ``ScanIncompleteError`` that keeps the cursor in place.
+
         Args:
             address: TRX address (T... format)
             min_confirmations: Minimum confirmations required
+            since_block: Skip transactions below this block
+            current_block: Chain tip for this scan cycle (fetched if None)
 
         Returns:
             List of incoming TRX transactions
         """
         transactions = []
+        complete = True
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                # Get TRX transfers
+            async with pooled_client(timeout=30.0) as client:
+                # Get TRX transfers, newest first
                 url = f"{self.base_url}/v1/accounts/{address}/transactions"
                 params = {
                     "only_to": "true",  # Only incoming
-                    "limit": 50,
+                    "limit": self.PAGE_SIZE,
                 }
+                entries: list[dict] = []
 
-                response = await client.get(url, headers=self._headers, params=params)
-
-                if response.status_code != 200:
-                    logger.warning(f"TronGrid API error: {response.status_code}")
-                    return []
-
-                data = response.json()
-
-                if not data.get("success", False):
-                    return []
-
-                current_block = await self.get_current_block_height()
+                for _ in range(self.MAX_HISTORY_PAGES):
+                    response = await self._request(
+                        client, "GET", url, headers=self._headers, params=params
+                    )
+                    if response.status_code != 200:
+                        raise ScanIncompleteError(f"TronGrid API error: {response.status_code}")
 
-                for tx in data.get("data", []):
+                    data = response.json()
+                    if not data.get("success", False):
+                        raise ScanIncompleteError(f"TronGrid API error: {data.get('error')}")
+
+                    batch = data.get("data", [])
+                    entries.extend(batch)
+                    fingerprint = data.get("meta", {}).get("fingerprint")
+                    oldest = (batch[-1].get("blockNumber") or 0) if batch else 0
+                    if (
+                        since_block is None
+                        or len(batch) < self.PAGE_SIZE
+                        or not fingerprint
+                        or oldest < since_block
+                    ):
+                        break
+                    params = {**params, "fingerprint": fingerprint}
+                else:
+                    complete = False
+
+                if entries and current_block is None:
+                    current_block = await self.get_current_block_height()
+
+                for tx in entries:
                     tx_info = self._parse_transaction(tx, address, current_block)
-                    if tx_info and tx_info.confirmations >= min_confirmations:
-                        transactions.append(tx_info)
-
+                    if not tx_info or tx_info.confirmations < min_confirmations:
+                        continue
+                    if since_block and tx_info.block_height and tx_info.block_height < since_block:
+                        continue
+                    transactions.append(tx_info)
+
+        except ScanIncompleteError:
+            raise
         except Exception as e:
-            logger.error(f"Error fetching TRX transactions: {e}")
+            raise ScanIncompleteError(f"Error fetching TRX transactions: {e}") from e
 
+        if not complete:
+            raise ScanIncompleteError(
+                f"History of {address} since block {since_block} exceeds "
+                f"{self.MAX_HISTORY_PAGES} pages",
+                transactions,
+            )
         return transactions
 
     def _parse_transaction(
@@ -144,9 +189,11 @@ class TronGridScanner(DepositScanner):
     async def get_transaction(self, txid: str) -> Optional[TransactionInfo]:
         """Get a specific TRX transaction."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 url = f"{self.base_url}/wallet/gettransactionbyid"
-                response = await client.post(
+                response = await self._request(
+                    client,
+                    "POST",
                     url,
                     headers=self._headers,
                     json={"value": txid},
@@ -169,9 +216,9 @@ class TronGridScanner(DepositScanner):
     async def get_current_block_height(self) -> int:
         """Get current TRON block height."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 url = f"{self.base_url}/wallet/getnowblock"
-                response = await client.get(url, headers=self._headers)
+                response = await self._request(client, "GET", url, headers=self._headers)
 
                 if response.status_code == 200:
                     data = response.json()
@@ -206,19 +253,29 @@ class TRC20Scanner(DepositScanner):
         self.testnet = testnet
         self.api_key = api_key
         self.base_url = TRONGRID_TESTNET if testnet else TRONGRID_MAINNET
+        # Keyed and anonymous access have separate quotas
+        self.rate_limit_backend = "trongrid_key" if api_key else "trongrid"
 
         self._headers = {"Accept": "application/json"}
         if api_key:
             self._headers["TRON-PRO-API-KEY"] = api_key
 
     async def get_address_transactions(
-        self, address: str, min_confirmations: int = 1
+        self,
+        address: str,
+        min_confirmations: int = 1,
+        since_block: Optional[int] = None,
+        current_block: Optional[int] = None,
     ) -> list[TransactionInfo]:
-        """Get TRC20 token transactions for an address."""
+        """Get TRC20 token transactions for an address.
+
+        The TRC20 endpoint reports block timestamps, not heights, so
+        ``since_block`` is not applied; duplicates are dropped by txid.
+        """
         transactions = []
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 # Get TRC20 transfers
                 url = f"{self.base_url}/v1/accounts/{address}/transactions/trc20"
                 params = {
@@ -227,26 +284,32 @@ class TRC20Scanner(DepositScanner):
                     "contract_address": self.token_contract,
                 }
 
-                response = await client.get(url, headers=self._headers, params=params)
+                response = await self._request(
+                    client, "GET", url, headers=self._headers, params=params
+                )
 
                 if response.status_code != 200:
-                    logger.warning(f"TronGrid TRC20 API error: {response.status_code}")
-                    return []
+                    raise ScanIncompleteError(
+                        f"TronGrid TRC20 API error: {response.status_code}"
+                    )
 
                 data = response.json()
 
                 if not data.get("success", False):
-                    return []
+                    raise ScanIncompleteError(f"TronGrid TRC20 API error: {data.get('error')}")
 
-                current_block = await self.get_current_block_height()
+                if current_block is None:
+                    current_block = await self.get_current_block_height()
 
                 for tx in data.get("data", []):
                     tx_info = self._parse_trc20_transaction(tx, address, current_block)
                     if tx_info and tx_info.confirmations >= min_confirmations:
                         transactions.append(tx_info)
 
+        except ScanIncompleteError:
+            raise
         except Exception as e:
-            logger.error(f"Error fetching TRC20 transactions: {e}")
+            raise ScanIncompleteError(f"Error fetching TRC20 transactions: {e}") from e
 
         return transactions
 
@@ -294,9 +357,9 @@ class TRC20Scanner(DepositScanner):
     async def get_current_block_height(self) -> int:
         """Get current TRON block height."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 url = f"{self.base_url}/wallet/getnowblock"
-                response = await client.get(url, headers=self._headers)
+                response = await self._request(client, "GET", url, headers=self._headers)
 
                 if response.status_code == 200:
                     data = response.json()
@@ -2,6 +2,7 @@
 
 from swaperex.services.balance_sync import (
     get_all_balances,
+    get_all_balances_for_addresses,
     get_native_balance,
     get_token_balance,
     sync_wallet_balance,
@@ -15,6 +16,7 @@ from swaperex.services.swap_executor import (
 
 __all__ = [
     "get_all_balances",
+    "get_all_balances_for_addresses",
     "get_native_balance",
     "get_token_balance",
     "sync_wallet_balance",
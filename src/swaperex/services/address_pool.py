@@ -0,0 +1,110 @@
+"""Pre-derived HD deposit address pool.
+
+Deposit address requests take the next address from the hd_address_pool
+table instead of deriving it on the request path. The pool is refilled
+in the background with one bulk ``derive_range`` call whenever it drops
+below the low watermark.
+
+Every pooled address records the fingerprint of the xpub it was derived
+from, and only addresses matching the current xpub are claimed. A refill
+that was already deriving when the xpub was rotated (in this or another
+process) rechecks the xpub before storing and drops its batch.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from swaperex.config import get_settings
+from swaperex.hdwallet import get_current_hd_wallet, get_hd_wallet
+from swaperex.hdwallet.base import SimulatedHDWallet
+from swaperex.hdwallet.factory import refresh_xpubs
+from swaperex.ledger.database import get_db
+from swaperex.ledger.repository import LedgerRepository
+
+logger = logging.getLogger(__name__)
+
+# One refill at a time per asset
+_refill_locks: dict[str, asyncio.Lock] = {}
+_refill_tasks: dict[str, asyncio.Task] = {}
+
+
+def address_pool_enabled() -> bool:
+    """Check if address pooling is configured."""
+    return get_settings().hd_address_pool_size > 0
+
+
+async def refill_address_pool(asset: str, force: bool = False) -> int:
+    """Top the pool for an asset back up to the configured size.
+
+    Args:
+        asset: Asset symbol
+        force: Refill even if the pool is above the low watermark
+
+    Returns:
+        Number of addresses added
+    """
+    settings = get_settings()
+    asset = asset.upper()
+    target = settings.hd_address_pool_size
+    if target <= 0:
+        return 0
+
+    lock = _refill_locks.setdefault(asset, asyncio.Lock())
+    async with lock:
+        # Resolved inside the lock so a queued refill sees a rotated xpub
+        wallet = await get_current_hd_wallet(asset)
+        if isinstance(wallet, SimulatedHDWallet):
+            # Simulated addresses are free to generate - nothing to pre-derive
+            return 0
+        fingerprint = wallet.xpub_fingerprint
+
+        # Reserve the index range in its own short transaction
+        async with get_db() as session:
+            repo = LedgerRepository(session)
+            await repo.discard_pooled_addresses(asset, keep_fingerprint=fingerprint)
+            available = await repo.count_pooled_addresses(asset, fingerprint)
+            if not force and available >= settings.hd_address_pool_low_watermark:
+                return 0
+            missing = target - available
+            if missing <= 0:
+                return 0
+            start = await repo.reserve_hd_index_range(asset, missing)
+
+        addresses = await asyncio.to_thread(wallet.derive_range, start, missing)
+
+        # The xpub may have been rotated while deriving
+        await refresh_xpubs(max_age=0)
+        if get_hd_wallet(asset).xpub_fingerprint != fingerprint:
+            logger.warning(f"Xpub for {asset} changed during refill, dropping {missing} addresses")
+            return 0
+
+        async with get_db() as session:
+            added = await LedgerRepository(session).add_pooled_addresses(
+                asset, addresses, fingerprint
+            )
+
+    logger.info(f"Address pool for {asset}: added {added} (indexes {start}-{start + missing - 1})")
+    return added
+
+
+def schedule_address_pool_refill(asset: str) -> Optional[asyncio.Task]:
+    """Start a background refill for an asset unless one is already running."""
+    if not address_pool_enabled():
+        return None
+
+    asset = asset.upper()
+    task = _refill_tasks.get(asset)
+    if task is not None and not task.done():
+        return task
+
+    task = asyncio.create_task(_refill_in_background(asset))
+    _refill_tasks[asset] = task
+    return task
+
+
+async def _refill_in_background(asset: str) -> None:
+    try:
+        await refill_address_pool(asset)
+    except Exception as e:
+        logger.warning(f"Address pool refill failed for {asset}: {e}")
@@ -4,11 +4,17 @@ Fetches actual on-chain balances from various blockchains.
 """
 
 import logging
-import os
 from decimal import Decimal
 from typing import Optional
 
-import httpx
+from swaperex.services.key_store import (
+    NEAR_PATH,
+    TON_PATH,
+    get_configured_seed_phrase,
+    get_key_store,
+)
+from swaperex.utils.evm_balances import EVMBalanceEngine
+from swaperex.utils.http import pooled_client
 
 logger = logging.getLogger(__name__)
 
@@ -77,7 +83,7 @@ async def get_native_balance(address: str, chain: str = "bsc") -> Optional[Decim
         return None
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with pooled_client(timeout=15.0) as client:
             response = await client.post(
                 rpc_url,
                 json={
@@ -116,7 +122,7 @@ async def get_token_balance(
     data = f"{BALANCE_OF_SIGNATURE}{address_padded}"
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with pooled_client(timeout=15.0) as client:
             response = await client.post(
                 rpc_url,
                 json={
@@ -143,7 +149,7 @@ async def get_token_balance(
 async def get_sol_balance(address: str) -> Optional[Decimal]:
     """Get Solana balance using public RPC."""
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with pooled_client(timeout=15.0) as client:
             response = await client.post(
                 "https://api.mainnet-beta.solana.com",
                 json={
@@ -184,7 +190,7 @@ async def get_trx_all_balances(address: str) -> dict[str, Decimal]:
 
     for attempt in range(3):  # Retry up to 3 times for rate limiting
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
+            async with pooled_client(timeout=15.0) as client:
                 response = await client.get(
                     f"https://api.trongrid.io/v1/accounts/{address}"
                 )
@@ -236,7 +242,7 @@ async def get_trx_usdt_balance(address: str) -> Optional[Decimal]:
 async def get_atom_balance(address: str) -> Optional[Decimal]:
     """Get Cosmos ATOM balance using public API."""
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with pooled_client(timeout=15.0) as client:
             response = await client.get(
                 f"https://lcd-cosmoshub.keplr.app/cosmos/bank/v1beta1/balances/{address}"
             )
@@ -255,7 +261,7 @@ async def get_atom_balance(address: str) -> Optional[Decimal]:
 async def get_ton_balance(address: str) -> Optional[Decimal]:
     """Get TON balance using public API."""
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with pooled_client(timeout=15.0) as client:
             response = await client.get(
                 f"https://toncenter.com/api/v2/getAddressBalance?address={address}"
             )
@@ -272,7 +278,7 @@ async def get_ton_balance(address: str) -> Optional[Decimal]:
 async def get_near_balance(address: str) -> Optional[Decimal]:
     """Get NEAR balance using public RPC."""
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with pooled_client(timeout=15.0) as client:
             response = await client.post(
                 "https://rpc.mainnet.near.org",
                 json={
@@ -297,59 +303,78 @@ async def get_near_balance(address: str) -> Optional[Decimal]:
     return None
 
 
-async def get_all_balances(address: str, chain: str = "bsc") -> dict[str, Decimal]:
-    """Get all balances (native + tokens) for an EVM address.
+NATIVE_TOKENS = {
+    "bsc": "BNB",
+    "ethereum": "ETH",
+    "polygon": "MATIC",
+    "avalanche": "AVAX",
+}
 
-    Uses parallel execution for all token balance checks for faster response.
-    """
-    import asyncio
+# Minimum balance to display (filter out dust)
+MIN_DISPLAY_BALANCE = Decimal("0.00000001")
 
-    balances = {}
 
-    native_tokens = {
-        "bsc": "BNB",
-        "ethereum": "ETH",
-        "polygon": "MATIC",
-        "avalanche": "AVAX",
-    }
+def _token_decimals(token_name: str, chain: str) -> int:
+    """Get decimals for a tracked token (USDT/USDC use 6 outside BSC)."""
+    if token_name in ("USDT", "USDC"):
+        return 6 if chain in ("ethereum", "polygon", "avalanche") else 18
+    return 18
+
+
+async def get_all_balances_for_addresses(
+    addresses: list[str],
+    chain: str = "bsc",
+) -> dict[str, dict[str, Decimal]]:
+    """Get native + token balances for several EVM addresses on one chain.
+
+    All reads are aggregated into a Multicall3 call (or JSON-RPC batch),
+    so the cost is one round-trip per chain rather than one per token.
+
+    Returns:
+        Dict of address -> {symbol: balance}, dust filtered out
+    """
+    rpc_url = RPC_ENDPOINTS.get(chain)
+    if not rpc_url or not addresses:
+        return {}
 
     tokens = TOKEN_CONTRACTS.get(chain, {})
+    engine = EVMBalanceEngine(rpc_url)
+    result = await engine.get_balances(addresses, list(tokens.values()))
+    logger.debug(
+        f"Fetched {len(addresses)} {chain} wallet(s) via {result.method} "
+        f"in {result.round_trips} round-trip(s)"
+    )
 
-    # Minimum balance to display (filter out dust)
-    MIN_DISPLAY = Decimal("0.00000001")
+    native_name = NATIVE_TOKENS.get(chain, "ETH")
+    all_balances: dict[str, dict[str, Decimal]] = {}
 
-    # Helper to fetch a single token balance
-    async def fetch_token_balance(token_name: str, contract: str):
-        decimals = 18
-        if token_name in ("USDT", "USDC"):
-            decimals = 6 if chain in ("ethereum", "polygon", "avalanche") else 18
+    for address in addresses:
+        balances = {}
 
-        balance = await get_token_balance(address, contract, chain, decimals)
-        if balance is not None and balance >= MIN_DISPLAY:
-            return (token_name, balance)
-        return None
+        native_raw = result.get(address)
+        if native_raw is not None:
+            balances[native_name] = Decimal(native_raw) / Decimal(10**18)
 
-    # Build tasks: native balance + all token balances
-    tasks = [get_native_balance(address, chain)]
-    for token_name, contract in tokens.items():
-        tasks.append(fetch_token_balance(token_name, contract))
+        for token_name, contract in tokens.items():
+            raw = result.get(address, contract)
+            if raw is None:
+                continue
+            balance = Decimal(raw) / Decimal(10 ** _token_decimals(token_name, chain))
+            if balance >= MIN_DISPLAY_BALANCE:
+                balances[token_name] = balance
 
-    # Run ALL balance checks in parallel
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+        all_balances[address] = balances
 
-    # First result is native balance
-    native_result = results[0]
-    if native_result is not None and not isinstance(native_result, Exception):
-        native_name = native_tokens.get(chain, "ETH")
-        balances[native_name] = native_result
+    return all_balances
 
-    # Remaining results are token balances
-    for result in results[1:]:
-        if result is not None and not isinstance(result, Exception):
-            token_name, balance = result
-            balances[token_name] = balance
 
-    return balances
+async def get_all_balances(address: str, chain: str = "bsc") -> dict[str, Decimal]:
+    """Get all balances (native + tokens) for an EVM address.
+
+    Uses a single batched read for the native balance and every tracked token.
+    """
+    all_balances = await get_all_balances_for_addresses([address], chain)
+    return all_balances.get(address, {})
 
 
 async def sync_wallet_balance(
@@ -365,13 +390,8 @@ async def sync_wallet_balance(
 def derive_solana_address(seed_phrase: str) -> Optional[str]:
     """Derive Solana address from seed phrase."""
     try:
-        from bip_utils import (
-            Bip39SeedGenerator, Bip44, Bip44Coins, Bip44Changes
-        )
-        seed = Bip39SeedGenerator(seed_phrase).Generate()
-        bip44_ctx = Bip44.FromSeed(seed, Bip44Coins.SOLANA)
-        account = bip44_ctx.Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT).AddressIndex(0)
-        return account.PublicKey().ToAddress()
+        from bip_utils import Bip44Coins
+        return get_key_store(seed_phrase).address(Bip44Coins.SOLANA)
     except Exception as e:
         logger.error(f"Failed to derive SOL address: {e}")
         return None
@@ -380,13 +400,8 @@ def derive_solana_address(seed_phrase: str) -> Optional[str]:
 def derive_tron_address(seed_phrase: str) -> Optional[str]:
     """Derive Tron address from seed phrase."""
     try:
-        from bip_utils import (
-            Bip39SeedGenerator, Bip44, Bip44Coins, Bip44Changes
-        )
-        seed = Bip39SeedGenerator(seed_phrase).Generate()
-        bip44_ctx = Bip44.FromSeed(seed, Bip44Coins.TRON)
-        account = bip44_ctx.Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT).AddressIndex(0)
-        return account.PublicKey().ToAddress()
+        from bip_utils import Bip44Coins
+        return get_key_store(seed_phrase).address(Bip44Coins.TRON)
     except Exception as e:
         logger.error(f"Failed to derive TRX address: {e}")
         return None
@@ -395,13 +410,8 @@ def derive_tron_address(seed_phrase: str) -> Optional[str]:
 def derive_cosmos_address(seed_phrase: str) -> Optional[str]:
     """Derive Cosmos ATOM address from seed phrase."""
     try:
-        from bip_utils import (
-            Bip39SeedGenerator, Bip44, Bip44Coins, Bip44Changes
-        )
-        seed = Bip39SeedGenerator(seed_phrase).Generate()
-        bip44_ctx = Bip44.FromSeed(seed, Bip44Coins.COSMOS)
-        account = bip44_ctx.Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT).AddressIndex(0)
-        return account.PublicKey().ToAddress()
+        from bip_utils import Bip44Coins
+        return get_key_store(seed_phrase).address(Bip44Coins.COSMOS)
     except Exception as e:
         logger.error(f"Failed to derive ATOM address: {e}")
         return None
@@ -416,23 +426,10 @@ def derive_ton_address(seed_phrase: str) -> Optional[str]:
     try:
         import hashlib
         import base64
-        from bip_utils import (
-            Bip39SeedGenerator, Bip32Slip10Ed25519
-        )
-
-        # Generate seed
-        seed = Bip39SeedGenerator(seed_phrase).Generate()
 
         # TON uses SLIP-10 Ed25519 with path m/44'/607'/0'/0'/0'
-        bip32_ctx = Bip32Slip10Ed25519.FromSeed(seed)
-        # Derive path for TON (coin type 607)
-        derived = bip32_ctx.DerivePath("44'/607'/0'/0'/0'")
-
         # Get the 32-byte Ed25519 public key
-        pubkey_bytes = derived.PublicKey().RawCompressed().ToBytes()
-        # Remove the first byte (0x00 prefix) if present
-        if len(pubkey_bytes) == 33 and pubkey_bytes[0] == 0:
-            pubkey_bytes = pubkey_bytes[1:]
+        pubkey_bytes = get_key_store(seed_phrase).ed25519_public_key(TON_PATH)
 
         # TON wallet v4r2 address calculation
         # This is a simplified version - creates bounceable address
@@ -492,22 +489,9 @@ def derive_near_address(seed_phrase: str) -> Optional[str]:
     Derivation path: m/44'/397'/0'
     """
     try:
-        from bip_utils import (
-            Bip39SeedGenerator, Bip32Slip10Ed25519
-        )
-
-        seed = Bip39SeedGenerator(seed_phrase).Generate()
-
         # NEAR uses SLIP-10 Ed25519 with path m/44'/397'/0'
-        bip32_ctx = Bip32Slip10Ed25519.FromSeed(seed)
-        derived = bip32_ctx.DerivePath("44'/397'/0'")
-
         # Get the raw 32-byte Ed25519 public key
-        pubkey_bytes = derived.PublicKey().RawCompressed().ToBytes()
-
-        # Remove the 0x00 prefix if present (SLIP-10 adds it)
-        if len(pubkey_bytes) == 33 and pubkey_bytes[0] == 0:
-            pubkey_bytes = pubkey_bytes[1:]
+        pubkey_bytes = get_key_store(seed_phrase).ed25519_public_key(NEAR_PATH)
 
         # NEAR implicit address is lowercase hex of the 32-byte public key
         return pubkey_bytes.hex().lower()
@@ -531,26 +515,17 @@ async def get_all_chain_balances_with_addresses() -> dict:
     """
     import asyncio
 
-    seed_phrase = (
-        os.environ.get("SEED_PHRASE")
-        or os.environ.get("WALLET_SEED_PHRASE")
-        or os.environ.get("MNEMONIC")
-    )
+    seed_phrase = get_configured_seed_phrase()
 
     if not seed_phrase:
         return {}
 
     all_data = {}
 
-    # Derive all addresses first (fast, CPU-bound)
+    # Derive all addresses first (cached by the key store after the first call)
     evm_address = None
     try:
-        from bip_utils import Bip39SeedGenerator, Bip32Secp256k1, EthAddrEncoder
-        seed = Bip39SeedGenerator(seed_phrase).Generate()
-        bip32_ctx = Bip32Secp256k1.FromSeed(seed)
-        account_ctx = bip32_ctx.DerivePath("44'/60'/0'/0/0")
-        pubkey = account_ctx.PublicKey().RawUncompressed().ToBytes()
-        evm_address = EthAddrEncoder.EncodeKey(pubkey)
+        evm_address = get_key_store(seed_phrase).evm_address(0)
     except Exception as e:
         logger.error(f"Failed to derive EVM address: {e}")
 
@@ -12,11 +12,12 @@ import os
 from decimal import Decimal
 from typing import Optional
 
-import httpx
 from eth_account import Account
-from bip_utils import Bip39SeedGenerator, Bip44, Bip44Coins, Bip44Changes
+from bip_utils import Bip44Coins
 
 from swaperex.config import get_settings
+from swaperex.services.key_store import get_key_store
+from swaperex.utils.http import pooled_client
 
 logger = logging.getLogger(__name__)
 
@@ -71,10 +72,7 @@ def derive_private_key(index: int = 0) -> Optional[str]:
         return None
 
     try:
-        seed_bytes = Bip39SeedGenerator(seed_phrase).Generate()
-        bip44 = Bip44.FromSeed(seed_bytes, Bip44Coins.ETHEREUM)
-        account = bip44.Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT).AddressIndex(index)
-        return account.PrivateKey().Raw().ToHex()
+        return get_key_store(seed_phrase).private_key(Bip44Coins.ETHEREUM, index).hex()
     except Exception as e:
         logger.error(f"Failed to derive private key: {e}")
         return None
@@ -93,7 +91,7 @@ async def get_balance(address: str, chain: str = "ethereum") -> int:
     rpc_url = RPC_ENDPOINTS.get(chain, RPC_ENDPOINTS["ethereum"])
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with pooled_client(timeout=30.0) as client:
             resp = await client.post(rpc_url, json={
                 "jsonrpc": "2.0",
                 "method": "eth_getBalance",
@@ -110,7 +108,7 @@ async def get_balance(address: str, chain: str = "ethereum") -> int:
 
 async def get_nonce(address: str, rpc_url: str) -> int:
     """Get transaction nonce."""
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with pooled_client(timeout=30.0) as client:
         resp = await client.post(rpc_url, json={
             "jsonrpc": "2.0",
             "method": "eth_getTransactionCount",
@@ -122,7 +120,7 @@ async def get_nonce(address: str, rpc_url: str) -> int:
 
 async def get_gas_price(rpc_url: str) -> int:
     """Get current gas price."""
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with pooled_client(timeout=30.0) as client:
         resp = await client.post(rpc_url, json={
             "jsonrpc": "2.0",
             "method": "eth_gasPrice",
@@ -195,7 +193,7 @@ async def sweep_address(
         raw_tx = "0x" + signed_tx.raw_transaction.hex()
 
         # Broadcast
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with pooled_client(timeout=30.0) as client:
             resp = await client.post(rpc_url, json={
                 "jsonrpc": "2.0",
                 "method": "eth_sendRawTransaction",
@@ -0,0 +1,232 @@
+"""In-memory key and address cache for the custodial wallet.
+
+Turning a BIP39 mnemonic into a seed is a 2048-round PBKDF2, and every
+BIP32 path derivation from the master repeats several EC operations.
+SeedKeyStore does the mnemonic -> seed step once per process, keeps the
+BIP32/SLIP-10 masters and per-coin account/change nodes, and memoises
+derived address nodes and addresses.
+
+Call ``warm_key_store()`` at startup and ``wipe_key_stores()`` on shutdown.
+
+SECURITY: Only usable in TELEGRAM_CUSTODIAL mode. Wiping is best effort -
+the seed buffer is overwritten, but key objects created by bip_utils are
+immutable and are only dropped for garbage collection.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from typing import Optional
+
+from bip_utils import (
+    Bip32Secp256k1,
+    Bip32Slip10Ed25519,
+    Bip39SeedGenerator,
+    Bip44,
+    Bip44Changes,
+    Bip44Coins,
+)
+
+from swaperex.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# SLIP-10 ed25519 paths for chains not covered by Bip44Coins derivation here
+TON_PATH = "44'/607'/0'/0'/0'"
+NEAR_PATH = "44'/397'/0'"
+
+
+def get_configured_seed_phrase() -> Optional[str]:
+    """Get the wallet mnemonic from the environment."""
+    return (
+        os.environ.get("SEED_PHRASE")
+        or os.environ.get("WALLET_SEED_PHRASE")
+        or os.environ.get("MNEMONIC")
+    )
+
+
+class SeedKeyStore:
+    """Process-lifetime cache of keys derived from one mnemonic."""
+
+    def __init__(self, seed_phrase: str):
+        """Derive the BIP39 seed (the expensive step) once.
+
+        Args:
+            seed_phrase: BIP39 mnemonic
+        """
+        self._seed = bytearray(Bip39SeedGenerator(seed_phrase).Generate())
+        self._lock = threading.Lock()
+        self._secp_master: Optional[Bip32Secp256k1] = None
+        self._ed25519_master: Optional[Bip32Slip10Ed25519] = None
+        self._change_nodes: dict[Bip44Coins, Bip44] = {}
+        self._address_nodes: dict[tuple[Bip44Coins, int], Bip44] = {}
+        self._ed25519_nodes: dict[str, Bip32Slip10Ed25519] = {}
+        self._addresses: dict[tuple[Bip44Coins, int], str] = {}
+        self._wiped = False
+
+    def _check_alive(self) -> None:
+        if self._wiped:
+            raise RuntimeError("Key store has been wiped")
+
+    @property
+    def secp256k1_master(self) -> Bip32Secp256k1:
+        """BIP32 secp256k1 master node."""
+        self._check_alive()
+        if self._secp_master is None:
+            self._secp_master = Bip32Secp256k1.FromSeed(bytes(self._seed))
+        return self._secp_master
+
+    @property
+    def ed25519_master(self) -> Bip32Slip10Ed25519:
+        """SLIP-10 ed25519 master node."""
+        self._check_alive()
+        if self._ed25519_master is None:
+            self._ed25519_master = Bip32Slip10Ed25519.FromSeed(bytes(self._seed))
+        return self._ed25519_master
+
+    def bip44_node(self, coin: Bip44Coins, index: int = 0) -> Bip44:
+        """Get the BIP44 node m/44'/coin'/0'/0/index.
+
+        The account/change node is derived once per coin; each address
+        index is then a single child derivation.
+        """
+        self._check_alive()
+        key = (coin, index)
+        node = self._address_nodes.get(key)
+        if node is not None:
+            return node
+
+        with self._lock:
+            change = self._change_nodes.get(coin)
+            if change is None:
+                change = (
+                    Bip44.FromSeed(bytes(self._seed), coin)
+                    .Purpose()
+                    .Coin()
+                    .Account(0)
+                    .Change(Bip44Changes.CHAIN_EXT)
+                )
+                self._change_nodes[coin] = change
+            node = change.AddressIndex(index)
+            self._address_nodes[key] = node
+        return node
+
+    def ed25519_node(self, path: str) -> Bip32Slip10Ed25519:
+        """Get a SLIP-10 ed25519 node for a hardened path (e.g. TON, NEAR)."""
+        self._check_alive()
+        node = self._ed25519_nodes.get(path)
+        if node is None:
+            node = self.ed25519_master.DerivePath(path)
+            self._ed25519_nodes[path] = node
+        return node
+
+    def ed25519_public_key(self, path: str) -> bytes:
+        """Get the raw 32-byte ed25519 public key for a path."""
+        pubkey_bytes = self.ed25519_node(path).PublicKey().RawCompressed().ToBytes()
+        # SLIP-10 prefixes ed25519 keys with 0x00
+        if len(pubkey_bytes) == 33 and pubkey_bytes[0] == 0:
+            pubkey_bytes = pubkey_bytes[1:]
+        return pubkey_bytes
+
+    def private_key(self, coin: Bip44Coins, index: int = 0) -> bytes:
+        """Get the raw private key for a BIP44 coin/index."""
+        return self.bip44_node(coin, index).PrivateKey().Raw().ToBytes()
+
+    def address(self, coin: Bip44Coins, index: int = 0) -> str:
+        """Get the (memoised) default address encoding for a BIP44 coin/index."""
+        key = (coin, index)
+        address = self._addresses.get(key)
+        if address is None:
+            address = self.bip44_node(coin, index).PublicKey().ToAddress()
+            self._addresses[key] = address
+        return address
+
+    def evm_private_key(self, index: int = 0) -> bytes:
+        """Private key for m/44'/60'/0'/0/index (shared by all EVM chains)."""
+        return self.private_key(Bip44Coins.ETHEREUM, index)
+
+    def evm_address(self, index: int = 0) -> str:
+        """Checksummed EVM address for m/44'/60'/0'/0/index."""
+        return self.address(Bip44Coins.ETHEREUM, index)
+
+    def warm(self) -> None:
+        """Pre-derive the account nodes and addresses used by the bot."""
+        self.evm_address(0)
+        for coin in (Bip44Coins.SOLANA, Bip44Coins.TRON, Bip44Coins.COSMOS):
+            self.address(coin, 0)
+        self.ed25519_node(TON_PATH)
+        self.ed25519_node(NEAR_PATH)
+
+    def wipe(self) -> None:
+        """Overwrite the seed and drop every cached node."""
+        with self._lock:
+            for i in range(len(self._seed)):
+                self._seed[i] = 0
+            self._secp_master = None
+            self._ed25519_master = None
+            self._change_nodes.clear()
+            self._address_nodes.clear()
+            self._ed25519_nodes.clear()
+            self._addresses.clear()
+            self._wiped = True
+
+
+# Stores keyed by a fingerprint of the mnemonic (never the mnemonic itself)
+_key_stores: dict[str, SeedKeyStore] = {}
+_stores_lock = threading.Lock()
+
+
+def _fingerprint(seed_phrase: str) -> str:
+    return hashlib.sha256(seed_phrase.encode()).hexdigest()
+
+
+def get_key_store(seed_phrase: Optional[str] = None) -> Optional[SeedKeyStore]:
+    """Get the shared key store for a mnemonic.
+
+    Args:
+        seed_phrase: Mnemonic to use (defaults to SEED_PHRASE / WALLET_SEED_PHRASE / MNEMONIC)
+
+    Returns:
+        SeedKeyStore, or None if no seed phrase is configured
+
+    Raises:
+        RuntimeError: If called in WEB_NON_CUSTODIAL mode
+    """
+    get_settings().require_custodial_mode("Key derivation")
+
+    seed_phrase = seed_phrase or get_configured_seed_phrase()
+    if not seed_phrase:
+        return None
+
+    key = _fingerprint(seed_phrase)
+    store = _key_stores.get(key)
+    if store is None:
+        with _stores_lock:
+            store = _key_stores.get(key)
+            if store is None:
+                store = SeedKeyStore(seed_phrase)
+                _key_stores[key] = store
+    return store
+
+
+def warm_key_store() -> bool:
+    """Build the default key store and pre-derive standard addresses.
+
+    Returns:
+        True if a seed phrase is configured and the store was warmed
+    """
+    store = get_key_store()
+    if store is None:
+        return False
+    store.warm()
+    logger.info("Key store initialized")
+    return True
+
+
+def wipe_key_stores() -> None:
+    """Wipe and forget all key stores (call on shutdown)."""
+    with _stores_lock:
+        for store in _key_stores.values():
+            store.wipe()
+        _key_stores.clear()
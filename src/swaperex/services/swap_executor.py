@@ -14,9 +14,9 @@ import os
 from decimal import Decimal
 from typing import Optional
 
-import httpx
-
 from swaperex.config import get_settings
+from swaperex.services.key_store import NEAR_PATH, TON_PATH, get_key_store
+from swaperex.utils.http import pooled_client
 
 logger = logging.getLogger(__name__)
 
@@ -86,35 +86,16 @@ async def get_private_key_from_seed(chain: str = "bsc") -> Optional[bytes]:
     Returns:
         Private key bytes or None
     """
-    seed_phrase = (
-        os.environ.get("SEED_PHRASE")
-        or os.environ.get("WALLET_SEED_PHRASE")
-        or os.environ.get("MNEMONIC")
-    )
-
-    if not seed_phrase:
+    store = get_key_store()
+    if store is None:
         logger.error("No seed phrase found in environment")
         return None
 
     try:
-        from bip_utils import Bip39SeedGenerator, Bip32Secp256k1
-
-        # Generate seed from mnemonic
-        seed = Bip39SeedGenerator(seed_phrase).Generate()
-
-        # Use BIP32 for EVM chains (coin_type 60)
-        bip32_ctx = Bip32Secp256k1.FromSeed(seed)
-
         # Standard path: m/44'/60'/0'/0/0
         # All EVM chains use coin_type 60
-        path = "44'/60'/0'/0/0"
-        account_ctx = bip32_ctx.DerivePath(path)
-
-        return account_ctx.PrivateKey().Raw().ToBytes()
+        return store.evm_private_key(0)
 
-    except ImportError:
-        logger.error("bip_utils not installed")
-        return None
     except Exception as e:
         logger.error(f"Failed to derive private key: {e}")
         return None
@@ -129,17 +110,15 @@ async def get_wallet_address(chain: str = "bsc") -> Optional[str]:
     Returns:
         Wallet address or None
     """
-    private_key = await get_private_key_from_seed(chain)
-    if not private_key:
+    store = get_key_store()
+    if store is None:
+        logger.error("No seed phrase found in environment")
         return None
 
     try:
-        from eth_account import Account
-
-        account = Account.from_key(private_key)
-        return account.address
-    except ImportError:
-        logger.error("eth_account not installed")
+        return store.evm_address(0)
+    except Exception as e:
+        logger.error(f"Failed to derive wallet address: {e}")
         return None
 
 
@@ -240,7 +219,7 @@ async def _get_allowance(
     )
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with pooled_client(timeout=15.0) as client:
             response = await client.post(
                 rpc_url,
                 json={
@@ -264,7 +243,7 @@ async def _get_allowance(
 async def _get_nonce(address: str, rpc_url: str) -> int:
     """Get transaction count (nonce)."""
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with pooled_client(timeout=15.0) as client:
             response = await client.post(
                 rpc_url,
                 json={
@@ -287,7 +266,7 @@ async def _get_nonce(address: str, rpc_url: str) -> int:
 async def _get_gas_price(rpc_url: str) -> int:
     """Get current gas price in wei."""
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with pooled_client(timeout=10.0) as client:
             response = await client.post(
                 rpc_url,
                 json={
@@ -311,7 +290,7 @@ async def _get_gas_price(rpc_url: str) -> int:
 async def _broadcast_transaction(raw_tx_hex: str, rpc_url: str) -> Optional[str]:
     """Broadcast raw transaction to network."""
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with pooled_client(timeout=30.0) as client:
             response = await client.post(
                 rpc_url,
                 json={
@@ -344,7 +323,7 @@ async def _wait_for_confirmation(txid: str, rpc_url: str, timeout: int = 60) ->
 
     for _ in range(timeout // 2):
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with pooled_client(timeout=10.0) as client:
                 response = await client.post(
                     rpc_url,
                     json={
@@ -436,7 +415,7 @@ async def execute_1inch_swap(
                 logger.info(f"Token approved: {approval_txid}")
 
         # Step 2: Get swap transaction from 1inch
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with pooled_client(timeout=30.0) as client:
             response = await client.get(
                 f"{ONEINCH_API}/{chain_id}/swap",
                 headers={
@@ -713,27 +692,16 @@ async def get_tron_private_key() -> Optional[tuple[bytes, str]]:
     Returns:
         Tuple of (private_key_bytes, tron_address) or None
     """
-    seed_phrase = (
-        os.environ.get("SEED_PHRASE")
-        or os.environ.get("WALLET_SEED_PHRASE")
-        or os.environ.get("MNEMONIC")
-    )
-
-    if not seed_phrase:
+    store = get_key_store()
+    if store is None:
         logger.error("No seed phrase found")
         return None
 
     try:
-        from bip_utils import (
-            Bip39SeedGenerator, Bip44, Bip44Coins, Bip44Changes
-        )
+        from bip_utils import Bip44Coins
 
-        seed = Bip39SeedGenerator(seed_phrase).Generate()
-        bip44_ctx = Bip44.FromSeed(seed, Bip44Coins.TRON)
-        account = bip44_ctx.Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT).AddressIndex(0)
-
-        private_key = account.PrivateKey().Raw().ToBytes()
-        address = account.PublicKey().ToAddress()
+        private_key = store.private_key(Bip44Coins.TRON)
+        address = store.address(Bip44Coins.TRON)
 
         return (private_key, address)
 
@@ -880,7 +848,7 @@ async def _execute_trx_to_token_swap(
             deadline=deadline,
         )
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with pooled_client(timeout=30.0) as client:
             # Create TriggerSmartContract transaction
             response = await client.post(
                 f"{TRON_API}/wallet/triggersmartcontract",
@@ -1012,7 +980,7 @@ async def _execute_token_swap(
             deadline=deadline,
         )
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with pooled_client(timeout=30.0) as client:
             response = await client.post(
                 f"{TRON_API}/wallet/triggersmartcontract",
                 headers=headers,
@@ -1091,7 +1059,7 @@ async def _approve_trc20(
 
         params = spender_padded + amount_padded
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with pooled_client(timeout=30.0) as client:
             response = await client.post(
                 f"{TRON_API}/wallet/triggersmartcontract",
                 headers=headers,
@@ -1403,26 +1371,15 @@ async def get_solana_keypair() -> Optional[tuple[bytes, str]]:
     Returns:
         Tuple of (private_key_bytes, solana_address) or None
     """
-    seed_phrase = (
-        os.environ.get("SEED_PHRASE")
-        or os.environ.get("WALLET_SEED_PHRASE")
-        or os.environ.get("MNEMONIC")
-    )
-
-    if not seed_phrase:
+    store = get_key_store()
+    if store is None:
         return None
 
     try:
-        from bip_utils import (
-            Bip39SeedGenerator, Bip44, Bip44Coins, Bip44Changes
-        )
+        from bip_utils import Bip44Coins
 
-        seed = Bip39SeedGenerator(seed_phrase).Generate()
-        bip44_ctx = Bip44.FromSeed(seed, Bip44Coins.SOLANA)
-        account = bip44_ctx.Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT).AddressIndex(0)
-
-        private_key = account.PrivateKey().Raw().ToBytes()
-        address = account.PublicKey().ToAddress()
+        private_key = store.private_key(Bip44Coins.SOLANA)
+        address = store.address(Bip44Coins.SOLANA)
 
         return (private_key, address)
 
@@ -1468,7 +1425,7 @@ async def execute_solana_swap(
     logger.info(f"Executing Solana swap: {amount} {from_asset} -> {to_asset}")
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with pooled_client(timeout=30.0) as client:
             # Step 1: Get quote from Jupiter
             quote_response = await client.get(
                 f"{JUPITER_API}/quote",
@@ -1618,7 +1575,7 @@ async def _sign_and_send_solana_tx(
             "https://rpc.ankr.com/solana",
         ]
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
+        async with pooled_client(timeout=60.0) as client:
             for rpc_url in rpc_endpoints:
                 try:
                     response = await client.post(
@@ -1729,29 +1686,16 @@ async def get_ton_keypair() -> Optional[tuple[bytes, bytes, str]]:
     Returns:
         Tuple of (private_key, public_key, user_friendly_address) or None
     """
-    seed_phrase = (
-        os.environ.get("SEED_PHRASE")
-        or os.environ.get("WALLET_SEED_PHRASE")
-        or os.environ.get("MNEMONIC")
-    )
-
-    if not seed_phrase:
+    store = get_key_store()
+    if store is None:
         return None
 
     try:
-        from bip_utils import Bip39SeedGenerator, Bip32Slip10Ed25519
-
-        seed = Bip39SeedGenerator(seed_phrase).Generate()
-        bip32_ctx = Bip32Slip10Ed25519.FromSeed(seed)
         # TON uses coin type 607
-        derived = bip32_ctx.DerivePath("44'/607'/0'/0'/0'")
-
-        private_key = derived.PrivateKey().Raw().ToBytes()
+        private_key = store.ed25519_node(TON_PATH).PrivateKey().Raw().ToBytes()
 
         # Get raw public key (32 bytes for ed25519)
-        pubkey_bytes = derived.PublicKey().RawCompressed().ToBytes()
-        if len(pubkey_bytes) == 33 and pubkey_bytes[0] == 0:
-            pubkey_bytes = pubkey_bytes[1:]
+        pubkey_bytes = store.ed25519_public_key(TON_PATH)
 
         # Calculate address
         _, user_friendly = _calculate_ton_address_from_pubkey(pubkey_bytes)
@@ -1766,7 +1710,7 @@ async def get_ton_keypair() -> Optional[tuple[bytes, bytes, str]]:
 async def _get_ton_wallet_seqno(address: str) -> int:
     """Get wallet sequence number for transaction."""
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with pooled_client(timeout=30.0) as client:
             response = await client.get(
                 f"{TON_API}/runGetMethod",
                 params={
@@ -1804,7 +1748,7 @@ async def _get_stonfi_swap_route(
         return None
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with pooled_client(timeout=30.0) as client:
             # Get swap simulation from STON.fi
             response = await client.get(
                 f"{STONFI_API}/swap/simulate",
@@ -1973,7 +1917,7 @@ async def _sign_and_send_ton_tx(
         boc_b64 = base64.b64encode(ext_msg).decode()
 
         # Broadcast via toncenter
-        async with httpx.AsyncClient(timeout=60.0) as client:
+        async with pooled_client(timeout=60.0) as client:
             response = await client.post(
                 f"{TON_API}/sendBoc",
                 json={"boc": boc_b64},
@@ -2186,25 +2130,16 @@ async def get_osmosis_keypair() -> Optional[tuple[bytes, bytes, str]]:
     Returns:
         Tuple of (private_key, public_key, osmo_address) or None
     """
-    seed_phrase = (
-        os.environ.get("SEED_PHRASE")
-        or os.environ.get("WALLET_SEED_PHRASE")
-        or os.environ.get("MNEMONIC")
-    )
-
-    if not seed_phrase:
+    store = get_key_store()
+    if store is None:
         return None
 
     try:
-        from bip_utils import (
-            Bip39SeedGenerator, Bip44, Bip44Coins, Bip44Changes
-        )
+        from bip_utils import Bip44Coins
         import hashlib
 
-        seed = Bip39SeedGenerator(seed_phrase).Generate()
         # Osmosis uses coin type 118 (same as Cosmos)
-        bip44_ctx = Bip44.FromSeed(seed, Bip44Coins.COSMOS)
-        account = bip44_ctx.Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT).AddressIndex(0)
+        account = store.bip44_node(Bip44Coins.COSMOS)
 
         private_key = account.PrivateKey().Raw().ToBytes()
         public_key = account.PublicKey().RawCompressed().ToBytes()
@@ -2239,7 +2174,7 @@ async def get_cosmos_keypair() -> Optional[tuple[bytes, str]]:
 async def _get_osmosis_account_info(address: str) -> Optional[dict]:
     """Get Osmosis account info (sequence and account number)."""
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with pooled_client(timeout=30.0) as client:
             response = await client.get(
                 f"{OSMOSIS_LCD}/cosmos/auth/v1beta1/accounts/{address}"
             )
@@ -2269,7 +2204,7 @@ async def _get_osmosis_swap_route(
 
     try:
         # Use Osmosis SQS (Smart Query Service) for optimal routing
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with pooled_client(timeout=30.0) as client:
             response = await client.get(
                 f"https://sqs.osmosis.zone/router/quote",
                 params={
@@ -2427,7 +2362,7 @@ async def _broadcast_osmosis_tx(signed_tx_json: str) -> Optional[str]:
     import json
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with pooled_client(timeout=30.0) as client:
             # Use legacy /txs endpoint for Amino JSON format
             response = await client.post(
                 f"{OSMOSIS_LCD}/txs",
@@ -2631,29 +2566,16 @@ async def get_near_keypair() -> Optional[tuple[bytes, bytes, str]]:
     Returns:
         Tuple of (private_key, public_key, implicit_address) or None
     """
-    seed_phrase = (
-        os.environ.get("SEED_PHRASE")
-        or os.environ.get("WALLET_SEED_PHRASE")
-        or os.environ.get("MNEMONIC")
-    )
-
-    if not seed_phrase:
+    store = get_key_store()
+    if store is None:
         return None
 
     try:
-        from bip_utils import Bip39SeedGenerator, Bip32Slip10Ed25519
-
-        seed = Bip39SeedGenerator(seed_phrase).Generate()
-        bip32_ctx = Bip32Slip10Ed25519.FromSeed(seed)
         # NEAR uses path m/44'/397'/0'
-        derived = bip32_ctx.DerivePath("44'/397'/0'")
-
-        private_key = derived.PrivateKey().Raw().ToBytes()
+        private_key = store.ed25519_node(NEAR_PATH).PrivateKey().Raw().ToBytes()
 
         # Get raw public key (32 bytes for ed25519)
-        pubkey_bytes = derived.PublicKey().RawCompressed().ToBytes()
-        if len(pubkey_bytes) == 33 and pubkey_bytes[0] == 0:
-            pubkey_bytes = pubkey_bytes[1:]
+        pubkey_bytes = store.ed25519_public_key(NEAR_PATH)
 
         # NEAR implicit address is hex of public key (64 characters)
         address = pubkey_bytes.hex().lower()
@@ -2675,7 +2597,7 @@ async def _get_near_access_key(account_id: str, public_key: bytes) -> Optional[d
         pk_b58 = base58.b58encode(public_key).decode()
         pk_str = f"ed25519:{pk_b58}"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with pooled_client(timeout=30.0) as client:
             response = await client.post(
                 NEAR_RPC,
                 json={
@@ -2711,7 +2633,7 @@ async def _get_near_block_hash() -> Optional[bytes]:
     try:
         import base58
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with pooled_client(timeout=30.0) as client:
             response = await client.post(
                 NEAR_RPC,
                 json={
@@ -2863,7 +2785,7 @@ async def _sign_and_send_near_tx(
         signed_tx = tx_bytes + (0).to_bytes(1, "little") + signature
 
         # Broadcast
-        async with httpx.AsyncClient(timeout=60.0) as client:
+        async with pooled_client(timeout=60.0) as client:
             response = await client.post(
                 NEAR_RPC,
                 json={
@@ -2906,7 +2828,7 @@ async def _get_ref_finance_pool(
 ) -> Optional[dict]:
     """Get Ref Finance pool for token pair."""
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with pooled_client(timeout=30.0) as client:
             # Get all pools
             response = await client.get(
                 "https://indexer.ref.finance/list-pools"
@@ -3198,7 +3120,7 @@ async def execute_thorchain_swap(
 
         amount_base = int(amount * (10 ** from_decimals))
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with pooled_client(timeout=30.0) as client:
             # Get quote from THORNode
             quote_response = await client.get(
                 f"{THORCHAIN_API}/quote/swap",
@@ -3271,36 +3193,23 @@ async def _get_chain_address(chain: str) -> Optional[str]:
 
     Derives address from seed phrase for the given chain.
     """
-    seed_phrase = (
-        os.environ.get("SEED_PHRASE")
-        or os.environ.get("WALLET_SEED_PHRASE")
-        or os.environ.get("MNEMONIC")
-    )
-
-    if not seed_phrase:
+    store = get_key_store()
+    if store is None:
         return None
 
     try:
+        from bip_utils import Bip44Coins
+
         # EVM chains (ETH, BNB, AVAX) share the same address
         if chain in ("ETH", "BNB", "AVAX"):
-            from bip_utils import Bip39SeedGenerator, Bip32Secp256k1, EthAddrEncoder
-            seed = Bip39SeedGenerator(seed_phrase).Generate()
-            bip32_ctx = Bip32Secp256k1.FromSeed(seed)
-            account_ctx = bip32_ctx.DerivePath("44'/60'/0'/0/0")
-            pubkey = account_ctx.PublicKey().RawUncompressed().ToBytes()
-            return EthAddrEncoder.EncodeKey(pubkey)
+            return store.evm_address(0)
 
         # Cosmos/ATOM
         if chain == "ATOM":
-            from bip_utils import Bip39SeedGenerator, Bip44, Bip44Coins, Bip44Changes
-            seed = Bip39SeedGenerator(seed_phrase).Generate()
-            bip44_ctx = Bip44.FromSeed(seed, Bip44Coins.COSMOS)
-            account = bip44_ctx.Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT).AddressIndex(0)
-            return account.PublicKey().ToAddress()
+            return store.address(Bip44Coins.COSMOS)
 
         # Bitcoin and UTXO chains (BTC, LTC, DOGE, BCH)
         if chain in ("BTC", "LTC", "DOGE", "BCH"):
-            from bip_utils import Bip39SeedGenerator, Bip44, Bip44Coins, Bip44Changes
             coin_map = {
                 "BTC": Bip44Coins.BITCOIN,
                 "LTC": Bip44Coins.LITECOIN,
@@ -3308,20 +3217,13 @@ async def _get_chain_address(chain: str) -> Optional[str]:
                 "BCH": Bip44Coins.BITCOIN_CASH,
             }
             coin = coin_map.get(chain, Bip44Coins.BITCOIN)
-            seed = Bip39SeedGenerator(seed_phrase).Generate()
-            bip44_ctx = Bip44.FromSeed(seed, coin)
-            account = bip44_ctx.Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT).AddressIndex(0)
-            return account.PublicKey().ToAddress()
+            return store.address(coin)
 
         # RUNE (THORChain native)
         if chain == "RUNE":
-            from bip_utils import Bip39SeedGenerator, Bip44, Bip44Coins, Bip44Changes
-            # THORChain uses coin type 931
-            seed = Bip39SeedGenerator(seed_phrase).Generate()
-            bip44_ctx = Bip44.FromSeed(seed, Bip44Coins.COSMOS)  # Uses Cosmos-like derivation
-            account = bip44_ctx.Purpose().Coin().Account(0).Change(Bip44Changes.CHAIN_EXT).AddressIndex(0)
+            # THORChain uses coin type 931, derived Cosmos-like here
             # Convert to thor prefix
-            address = account.PublicKey().ToAddress()
+            address = store.address(Bip44Coins.COSMOS)
             if address.startswith("cosmos"):
                 address = "thor" + address[6:]
             return address
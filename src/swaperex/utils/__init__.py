@@ -1,5 +1,10 @@
 """Utility modules for Swaperex."""
 
-from swaperex.utils.locks import UserBalanceLock, get_user_lock
+from swaperex.utils.locks import (
+    LockBackend,
+    UserBalanceLock,
+    get_lock_backend,
+    get_user_lock,
+)
 
-__all__ = ["UserBalanceLock", "get_user_lock"]
+__all__ = ["LockBackend", "UserBalanceLock", "get_lock_backend", "get_user_lock"]
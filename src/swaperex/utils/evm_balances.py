@@ -0,0 +1,329 @@
+"""Batched EVM balance reads.
+
+Fetching a wallet view one ``eth_call`` at a time costs a round-trip per
+token per chain. EVMBalanceEngine collects every native and ERC-20
+balance needed for a set of addresses and reads them per chain with:
+
+1. a single Multicall3 ``aggregate3`` call (native balances via
+   ``getEthBalance``), or, if Multicall3 is unavailable,
+2. JSON-RPC batch requests, or, if the endpoint rejects batches,
+3. concurrent individual calls.
+
+Results are raw integer balances; callers apply token decimals.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Optional
+
+from swaperex.utils.http import pooled_client
+
+logger = logging.getLogger(__name__)
+
+# Multicall3 is deployed at the same address on all major EVM chains
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Function selectors
+AGGREGATE3_SELECTOR = "82ad56cb"  # aggregate3((address,bool,bytes)[])
+GET_ETH_BALANCE_SELECTOR = "4d2301cc"  # getEthBalance(address)
+BALANCE_OF_SELECTOR = "70a08231"  # balanceOf(address)
+
+# Key used for the native balance in result dicts
+NATIVE = "native"
+
+
+def _word(value: int) -> str:
+    return format(value, "064x")
+
+
+def _address_word(address: str) -> str:
+    return address.lower().replace("0x", "").zfill(64)
+
+
+def encode_balance_of(address: str) -> str:
+    """Encode ``balanceOf(address)`` calldata (hex, no 0x prefix)."""
+    return BALANCE_OF_SELECTOR + _address_word(address)
+
+
+def encode_aggregate3(calls: list[tuple[str, str]]) -> str:
+    """ABI-encode an ``aggregate3`` call with allowFailure=true for every call.
+
+    Args:
+        calls: List of (target contract, calldata hex without 0x)
+
+    Returns:
+        Calldata hex string with 0x prefix
+    """
+    heads = []
+    tails = []
+    offset = 32 * len(calls)
+
+    for target, data in calls:
+        data_bytes = bytes.fromhex(data)
+        padded_len = (len(data_bytes) + 31) // 32 * 32
+        encoded = (
+            _address_word(target)
+            + _word(1)  # allowFailure
+            + _word(96)  # offset of bytes within the tuple
+            + _word(len(data_bytes))
+            + data_bytes.hex().ljust(padded_len * 2, "0")
+        )
+        heads.append(_word(offset))
+        tails.append(encoded)
+        offset += len(encoded) // 2
+
+    return (
+        "0x"
+        + AGGREGATE3_SELECTOR
+        + _word(32)  # offset of the array argument
+        + _word(len(calls))
+        + "".join(heads)
+        + "".join(tails)
+    )
+
+
+def decode_aggregate3(result_hex: str) -> list[tuple[bool, bytes]]:
+    """Decode the ``(bool success, bytes returnData)[]`` returned by aggregate3."""
+    data = bytes.fromhex(result_hex[2:] if result_hex.startswith("0x") else result_hex)
+
+    def read_int(pos: int) -> int:
+        return int.from_bytes(data[pos:pos + 32], "big")
+
+    array_start = read_int(0)
+    count = read_int(array_start)
+    items_start = array_start + 32
+    results = []
+
+    for i in range(count):
+        tuple_start = items_start + read_int(items_start + 32 * i)
+        success = read_int(tuple_start) != 0
+        bytes_start = tuple_start + read_int(tuple_start + 32)
+        length = read_int(bytes_start)
+        results.append((success, data[bytes_start + 32:bytes_start + 32 + length]))
+
+    return results
+
+
+@dataclass
+class BalanceCall:
+    """One balance read: the native balance or an ERC-20 balanceOf."""
+
+    address: str
+    token: str = NATIVE  # token contract address, or NATIVE
+
+    @property
+    def is_native(self) -> bool:
+        return self.token == NATIVE
+
+
+@dataclass
+class BalanceBatchResult:
+    """Raw balances keyed by wallet address, then by token contract (or NATIVE)."""
+
+    balances: dict[str, dict[str, Optional[int]]] = field(default_factory=dict)
+    round_trips: int = 0
+    method: str = ""
+
+    def get(self, address: str, token: str = NATIVE) -> Optional[int]:
+        """Get a raw balance (None if the read failed)."""
+        return self.balances.get(address.lower(), {}).get(token.lower() if token != NATIVE else NATIVE)
+
+
+class EVMBalanceEngine:
+    """Reads many native/ERC-20 balances from one EVM chain in bulk."""
+
+    def __init__(
+        self,
+        rpc_url: str,
+        use_multicall: bool = True,
+        multicall_address: str = MULTICALL3_ADDRESS,
+        max_calls_per_request: int = 200,
+        timeout: float = 15.0,
+    ):
+        """Initialize the engine.
+
+        Args:
+            rpc_url: JSON-RPC endpoint for the chain
+            use_multicall: Try Multicall3 before JSON-RPC batching
+            multicall_address: Multicall3 contract address
+            max_calls_per_request: Max balance reads per aggregate3 call or RPC batch
+            timeout: HTTP timeout per request in seconds
+        """
+        self.rpc_url = rpc_url
+        self.use_multicall = use_multicall
+        self.multicall_address = multicall_address
+        self.max_calls_per_request = max_calls_per_request
+        self.timeout = timeout
+
+    @staticmethod
+    def build_calls(addresses: list[str], tokens: list[str], include_native: bool = True) -> list[BalanceCall]:
+        """Build the native + balanceOf reads for every address/token combination."""
+        calls = []
+        for address in addresses:
+            if include_native:
+                calls.append(BalanceCall(address=address))
+            for token in tokens:
+                calls.append(BalanceCall(address=address, token=token))
+        return calls
+
+    async def get_balances(
+        self,
+        addresses: list[str],
+        tokens: list[str],
+        include_native: bool = True,
+    ) -> BalanceBatchResult:
+        """Read native and token balances for all addresses.
+
+        Args:
+            addresses: Wallet addresses
+            tokens: ERC-20 contract addresses
+            include_native: Also read the native coin balance
+
+        Returns:
+            BalanceBatchResult with raw integer balances (None where a read failed)
+        """
+        calls = self.build_calls(addresses, tokens, include_native)
+        return await self.execute(calls)
+
+    async def execute(self, calls: list[BalanceCall]) -> BalanceBatchResult:
+        """Execute balance reads, preferring Multicall3 then JSON-RPC batching."""
+        result = BalanceBatchResult()
+        if not calls:
+            return result
+
+        chunks = [
+            calls[i:i + self.max_calls_per_request]
+            for i in range(0, len(calls), self.max_calls_per_request)
+        ]
+
+        values: list[Optional[int]] = []
+        if self.use_multicall:
+            try:
+                for chunk in chunks:
+                    values.extend(await self._multicall(chunk))
+                    result.round_trips += 1
+                result.method = "multicall3"
+            except Exception as e:
+                logger.debug(f"Multicall3 unavailable on {self.rpc_url}, using RPC batch: {e}")
+                values = []
+                result.round_trips = 0
+
+        if not result.method:
+            for chunk in chunks:
+                chunk_values, trips, method = await self._rpc_batch(chunk)
+                values.extend(chunk_values)
+                result.round_trips += trips
+                result.method = method
+
+        for call, value in zip(calls, values):
+            token_key = NATIVE if call.is_native else call.token.lower()
+            result.balances.setdefault(call.address.lower(), {})[token_key] = value
+
+        return result
+
+    async def _multicall(self, calls: list[BalanceCall]) -> list[Optional[int]]:
+        """Read a chunk of balances with one aggregate3 eth_call."""
+        encoded_calls = []
+        for call in calls:
+            if call.is_native:
+                encoded_calls.append(
+                    (self.multicall_address, GET_ETH_BALANCE_SELECTOR + _address_word(call.address))
+                )
+            else:
+                encoded_calls.append((call.token, encode_balance_of(call.address)))
+
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "eth_call",
+            "params": [{"to": self.multicall_address, "data": encode_aggregate3(encoded_calls)}, "latest"],
+            "id": 1,
+        }
+
+        async with pooled_client(timeout=self.timeout) as client:
+            response = await client.post(self.rpc_url, json=payload)
+
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP {response.status_code}")
+
+        data = response.json()
+        if "error" in data or not data.get("result") or data["result"] == "0x":
+            raise RuntimeError(f"aggregate3 failed: {data.get('error')}")
+
+        decoded = decode_aggregate3(data["result"])
+        if len(decoded) != len(calls):
+            raise RuntimeError("aggregate3 returned unexpected result count")
+
+        return [
+            int.from_bytes(ret[:32], "big") if success and len(ret) >= 32 else None
+            for success, ret in decoded
+        ]
+
+    @staticmethod
+    def _rpc_request(call: BalanceCall, request_id: int) -> dict:
+        if call.is_native:
+            return {
+                "jsonrpc": "2.0",
+                "method": "eth_getBalance",
+                "params": [call.address, "latest"],
+                "id": request_id,
+            }
+        return {
+            "jsonrpc": "2.0",
+            "method": "eth_call",
+            "params": [{"to": call.token, "data": "0x" + encode_balance_of(call.address)}, "latest"],
+            "id": request_id,
+        }
+
+    @staticmethod
+    def _parse_rpc_result(item: dict) -> Optional[int]:
+        value = item.get("result")
+        if not value or value == "0x" or "error" in item:
+            return None
+        try:
+            return int(value, 16)
+        except (TypeError, ValueError):
+            return None
+
+    async def _rpc_batch(self, calls: list[BalanceCall]) -> tuple[list[Optional[int]], int, str]:
+        """Read a chunk of balances with one JSON-RPC batch request.
+
+        Falls back to concurrent single requests if the endpoint does not
+        support batching.
+
+        Returns:
+            (values, round trips, method name)
+        """
+        payload = [self._rpc_request(call, i) for i, call in enumerate(calls)]
+
+        try:
+            async with pooled_client(timeout=self.timeout) as client:
+                response = await client.post(self.rpc_url, json=payload)
+            data = response.json() if response.status_code == 200 else None
+        except Exception as e:
+            logger.debug(f"RPC batch request failed on {self.rpc_url}: {e}")
+            data = None
+
+        if isinstance(data, list):
+            by_id = {item.get("id"): item for item in data if isinstance(item, dict)}
+            return (
+                [self._parse_rpc_result(by_id.get(i, {})) for i in range(len(calls))],
+                1,
+                "rpc_batch",
+            )
+
+        values = await asyncio.gather(
+            *[self._single(request) for request in payload], return_exceptions=True
+        )
+        return (
+            [v if not isinstance(v, Exception) else None for v in values],
+            len(calls),
+            "rpc_single",
+        )
+
+    async def _single(self, request: dict) -> Optional[int]:
+        async with pooled_client(timeout=self.timeout) as client:
+            response = await client.post(self.rpc_url, json=request)
+        if response.status_code != 200:
+            return None
+        return self._parse_rpc_result(response.json())
@@ -0,0 +1,167 @@
+"""Shared, pooled HTTP clients for outbound API and RPC calls.
+
+Opening a fresh ``httpx.AsyncClient`` per request costs a TCP (and TLS)
+handshake every time. This module keeps one long-lived client per
+upstream origin so connections stay warm and are reused across quotes,
+balance checks, scans and broadcasts.
+
+Usage mirrors the old per-request pattern:
+
+    async with pooled_client(timeout=30.0) as client:
+        response = await client.get(url, params=...)
+
+The yielded client is shared - leaving the ``async with`` block does not
+close it. Call ``close_http_clients()`` once on shutdown.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from swaperex.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def http2_available() -> bool:
+    """Check if the optional ``h2`` package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class HostClientRegistry:
+    """Registry of pooled ``httpx.AsyncClient`` instances, one per origin.
+
+    Each origin (scheme://host:port) gets its own connection pool so a
+    slow or saturated upstream cannot starve connections to the others.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and http2_available()
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    @staticmethod
+    def origin(url: str) -> str:
+        """Get the pool key (scheme://netloc) for a URL."""
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}".lower()
+
+    def client_for(self, url: str) -> httpx.AsyncClient:
+        """Get or create the pooled client for the URL's origin."""
+        key = self.origin(url)
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(limits=self.limits, http2=self.http2)
+            self._clients[key] = client
+            logger.debug(f"Created pooled HTTP client for {key} (http2={self.http2})")
+        return client
+
+    @property
+    def origins(self) -> list[str]:
+        """Origins with an open pooled client."""
+        return [key for key, client in self._clients.items() if not client.is_closed]
+
+    async def aclose(self) -> None:
+        """Close every pooled client."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP client: {e}")
+
+
+class PooledHTTPClient:
+    """httpx-style client facade that dispatches to per-origin pooled clients.
+
+    Supports the ``get``/``post``/``request`` calls used across the code
+    base. ``timeout`` is applied per request unless the caller overrides it.
+    """
+
+    def __init__(self, timeout: Optional[float] = 30.0):
+        self.timeout = timeout
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request through the pooled client for the URL's origin."""
+        kwargs.setdefault("timeout", self.timeout)
+        client = get_http_registry().client_for(url)
+        return await client.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """Send a GET request."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        """Send a POST request."""
+        return await self.request("POST", url, **kwargs)
+
+
+# Pooled connections belong to the event loop that opened them, so keep
+# one registry per loop (tests and thread-pool helpers run their own loops).
+_registries: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, HostClientRegistry]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _create_registry() -> HostClientRegistry:
+    settings = get_settings()
+    return HostClientRegistry(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+        http2=settings.http2_enabled,
+    )
+
+
+def get_http_registry() -> HostClientRegistry:
+    """Get the client registry for the running event loop."""
+    loop = asyncio.get_running_loop()
+    registry = _registries.get(loop)
+    if registry is None:
+        registry = _create_registry()
+        _registries[loop] = registry
+    return registry
+
+
+def get_pooled_client(timeout: Optional[float] = 30.0) -> PooledHTTPClient:
+    """Get a pooled client facade with the given default timeout."""
+    return PooledHTTPClient(timeout=timeout)
+
+
+@asynccontextmanager
+async def pooled_client(timeout: Optional[float] = 30.0) -> AsyncIterator[PooledHTTPClient]:
+    """Context manager yielding a shared pooled client.
+
+    Drop-in replacement for ``async with httpx.AsyncClient(timeout=...)``;
+    the underlying connections are kept open for reuse on exit.
+    """
+    yield get_pooled_client(timeout)
+
+
+async def close_http_clients() -> None:
+    """Close the pooled clients of the running event loop."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    registry = _registries.pop(loop, None)
+    if registry is not None:
+        await registry.aclose()
+        logger.info("Closed pooled HTTP clients")
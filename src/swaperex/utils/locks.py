@@ -1,22 +1,313 @@
 """Concurrency control utilities for user balance operations.
 
 Provides per-user locking to prevent race conditions in swap and withdrawal operations.
+
+The lock itself is held by a pluggable backend (``BALANCE_LOCK_BACKEND``):
+
+- ``local``: asyncio locks in this process, kept only while held or awaited
+- ``postgres``: PostgreSQL session advisory locks, shared by every worker
+  using the database
+- ``redis``: a lease (``SET NX PX`` with a random token) on a Redis-compatible
+  server, renewed while held and expiring if the holder dies
 """
 
 import asyncio
 import logging
+import uuid
+import weakref
+from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
-# Global lock registry: user_id -> asyncio.Lock
-_user_locks: dict[int, asyncio.Lock] = {}
-_registry_lock = asyncio.Lock()
+
+class LockTimeoutError(Exception):
+    """Raised when a lock cannot be acquired within the timeout period."""
+
+    pass
+
+
+class LockBackend(ABC):
+    """Where per-user balance locks are held."""
+
+    name = "base"
+
+    @abstractmethod
+    async def acquire(self, user_id: int, timeout: Optional[float]) -> Any:
+        """Acquire the user's lock.
+
+        Args:
+            user_id: Internal user ID
+            timeout: Maximum time to wait (None = wait forever)
+
+        Returns:
+            Handle to pass to ``release``
+
+        Raises:
+            LockTimeoutError: If the lock is not acquired in time
+        """
+        pass
+
+    @abstractmethod
+    async def release(self, user_id: int, handle: Any) -> None:
+        """Release a lock acquired with ``acquire``."""
+        pass
+
+    async def close(self) -> None:
+        """Release backend resources."""
+        pass
+
+
+def _timeout_error(user_id: int, timeout: Optional[float]) -> LockTimeoutError:
+    return LockTimeoutError(f"Could not acquire lock for user {user_id} within {timeout}s")
+
+
+class LocalLockBackend(LockBackend):
+    """In-process asyncio locks.
+
+    A user's lock lives only while someone holds, awaits or references it,
+    so the registry stays as large as the set of active users. Creating a
+    lock never awaits, so no registry-wide lock is needed.
+    """
+
+    name = "local"
+
+    def __init__(self):
+        self._locks: weakref.WeakValueDictionary[int, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def get_lock(self, user_id: int) -> asyncio.Lock:
+        """Get or create the lock for a user."""
+        lock = self._locks.get(user_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[user_id] = lock
+        return lock
+
+    async def acquire(self, user_id: int, timeout: Optional[float]) -> asyncio.Lock:
+        lock = self.get_lock(user_id)
+        try:
+            await asyncio.wait_for(lock.acquire(), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise _timeout_error(user_id, timeout)
+        return lock
+
+    async def release(self, user_id: int, handle: asyncio.Lock) -> None:
+        handle.release()
+
+    def clear(self) -> None:
+        self._locks.clear()
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+
+class PostgresAdvisoryLockBackend(LockBackend):
+    """PostgreSQL session-level advisory locks.
+
+    Each held lock pins one pooled connection; PostgreSQL releases the
+    lock by itself if that connection is lost.
+    """
+
+    name = "postgres"
+
+    # First key of the two-key advisory lock, so balance locks don't collide
+    # with other advisory lock users of the same database
+    NAMESPACE = 0x5357_4150  # "SWAP"
+
+    def __init__(self, engine=None):
+        """Initialize the backend.
+
+        Args:
+            engine: Async engine (defaults to the ledger engine)
+        """
+        self._engine = engine
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from swaperex.ledger.database import get_engine
+
+            self._engine = get_engine()
+        return self._engine
+
+    async def acquire(self, user_id: int, timeout: Optional[float]) -> Any:
+        from sqlalchemy import text
+        from sqlalchemy.exc import DBAPIError
+
+        conn = await self.engine.connect()
+        try:
+            # lock_timeout also bounds advisory lock waits (0 = wait forever);
+            # set for this transaction only, so the pooled connection is left as is
+            await conn.execute(
+                text("SELECT set_config('lock_timeout', :value, true)"),
+                {"value": f"{int(timeout * 1000)}ms" if timeout else "0"},
+            )
+            await conn.execute(
+                text("SELECT pg_advisory_lock(:namespace, :key)"),
+                {"namespace": self.NAMESPACE, "key": user_id},
+            )
+            await conn.commit()
+        except DBAPIError as e:
+            await conn.close()
+            if "lock timeout" in str(e).lower():
+                raise _timeout_error(user_id, timeout)
+            raise
+        except BaseException:
+            await conn.close()
+            raise
+        return conn
+
+    async def release(self, user_id: int, handle: Any) -> None:
+        from sqlalchemy import text
+
+        try:
+            await handle.execute(
+                text("SELECT pg_advisory_unlock(:namespace, :key)"),
+                {"namespace": self.NAMESPACE, "key": user_id},
+            )
+            await handle.commit()
+        finally:
+            await handle.close()
+
+
+class RedisLeaseLockBackend(LockBackend):
+    """Lease locks on a Redis-compatible server.
+
+    A lock is a key set with ``NX`` and a random token that expires after
+    ``lease`` seconds. While held it is renewed every third of the lease;
+    release and renewal only touch the key if it still holds our token.
+
+    Needs the ``redis`` package unless a client is passed in.
+    """
+
+    name = "redis"
+
+    RELEASE_SCRIPT = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('del', KEYS[1]) else return 0 end"
+    )
+    RENEW_SCRIPT = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('pexpire', KEYS[1], ARGV[2]) else return 0 end"
+    )
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        client: Any = None,
+        lease: float = 30.0,
+        prefix: str = "swaperex:balance-lock:",
+        poll_interval: float = 0.05,
+    ):
+        """Initialize the backend.
+
+        Args:
+            url: Server URL (used when no client is given)
+            client: Async client with redis-py's ``set`` and ``eval``
+            lease: Seconds a lock survives without renewal
+            prefix: Key prefix
+            poll_interval: Initial wait between acquisition attempts
+        """
+        self.url = url
+        self._client = client
+        self.lease = lease
+        self.prefix = prefix
+        self.poll_interval = poll_interval
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            import redis.asyncio as redis
+
+            self._client = redis.from_url(self.url)
+        return self._client
+
+    def _key(self, user_id: int) -> str:
+        return f"{self.prefix}{user_id}"
+
+    async def acquire(self, user_id: int, timeout: Optional[float]) -> Any:
+        key = self._key(user_id)
+        token = uuid.uuid4().hex
+        lease_ms = int(self.lease * 1000)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
+        delay = self.poll_interval
+
+        while not await self.client.set(key, token, nx=True, px=lease_ms):
+            if deadline is not None and loop.time() >= deadline:
+                raise _timeout_error(user_id, timeout)
+            wait = delay if deadline is None else min(delay, max(0.0, deadline - loop.time()))
+            await asyncio.sleep(wait)
+            delay = min(delay * 2, 1.0)
+
+        renewal = asyncio.create_task(self._renew(key, token, lease_ms))
+        return token, renewal
+
+    async def _renew(self, key: str, token: str, lease_ms: int) -> None:
+        while True:
+            await asyncio.sleep(self.lease / 3)
+            try:
+                if not await self.client.eval(self.RENEW_SCRIPT, 1, key, token, lease_ms):
+                    logger.warning(f"Balance lock lease {key} was lost")
+                    return
+            except Exception as e:
+                logger.warning(f"Could not renew balance lock lease {key}: {e}")
+
+    async def release(self, user_id: int, handle: Any) -> None:
+        token, renewal = handle
+        renewal.cancel()
+        await self.client.eval(self.RELEASE_SCRIPT, 1, self._key(user_id), token)
+
+    async def close(self) -> None:
+        if self._client is not None and hasattr(self._client, "aclose"):
+            await self._client.aclose()
+
+
+_local_backend = LocalLockBackend()
+_backend: Optional[LockBackend] = None
+
+
+def create_lock_backend(name: str) -> LockBackend:
+    """Build a lock backend by name (local, postgres, redis)."""
+    name = name.strip().lower()
+    if name == "local":
+        return _local_backend
+    if name == "postgres":
+        return PostgresAdvisoryLockBackend()
+    if name == "redis":
+        from swaperex.config import get_settings
+
+        settings = get_settings()
+        return RedisLeaseLockBackend(
+            url=settings.balance_lock_redis_url, lease=settings.balance_lock_lease
+        )
+    raise ValueError(f"Unknown balance lock backend: {name}")
+
+
+def get_lock_backend() -> LockBackend:
+    """Get the process-wide lock backend, configured from settings."""
+    global _backend
+    if _backend is None:
+        from swaperex.config import get_settings
+
+        _backend = create_lock_backend(get_settings().balance_lock_backend)
+        logger.info(f"Using {_backend.name} balance locks")
+    return _backend
+
+
+def set_lock_backend(backend: Optional[LockBackend]) -> None:
+    """Replace the lock backend (None = configure from settings again)."""
+    global _backend
+    _backend = backend
 
 
 async def get_user_lock(user_id: int) -> asyncio.Lock:
-    """Get or create a lock for a specific user.
+    """Get or create the in-process lock for a specific user.
+
+    Only meaningful with the ``local`` backend.
 
     Args:
         user_id: Internal user ID (not telegram_id)
@@ -24,10 +315,7 @@ async def get_user_lock(user_id: int) -> asyncio.Lock:
     Returns:
         asyncio.Lock for the user
     """
-    async with _registry_lock:
-        if user_id not in _user_locks:
-            _user_locks[user_id] = asyncio.Lock()
-        return _user_locks[user_id]
+    return _local_backend.get_lock(user_id)
 
 
 class UserBalanceLock:
@@ -49,6 +337,7 @@ class UserBalanceLock:
         user_id: int,
         timeout: Optional[float] = 30.0,
         operation: str = "balance_operation",
+        backend: Optional[LockBackend] = None,
     ):
         """Initialize the lock.
 
@@ -56,54 +345,42 @@ class UserBalanceLock:
             user_id: Internal user ID
             timeout: Maximum time to wait for lock (None = wait forever)
             operation: Description of the operation for logging
+            backend: Lock backend (defaults to the configured one)
         """
         self.user_id = user_id
         self.timeout = timeout
         self.operation = operation
-        self._lock: Optional[asyncio.Lock] = None
+        self.backend = backend
+        self._handle: Any = None
         self._acquired = False
 
     async def __aenter__(self) -> "UserBalanceLock":
         """Acquire the lock."""
-        self._lock = await get_user_lock(self.user_id)
+        if self.backend is None:
+            self.backend = get_lock_backend()
 
         try:
-            if self.timeout:
-                # Try to acquire with timeout
-                self._acquired = await asyncio.wait_for(
-                    self._lock.acquire(),
-                    timeout=self.timeout,
-                )
-            else:
-                await self._lock.acquire()
-                self._acquired = True
-
-            if self._acquired:
-                logger.debug(f"Lock acquired for user {self.user_id}: {self.operation}")
-            return self
-
-        except asyncio.TimeoutError:
+            self._handle = await self.backend.acquire(self.user_id, self.timeout or None)
+        except LockTimeoutError:
             logger.warning(
                 f"Lock timeout for user {self.user_id} after {self.timeout}s: {self.operation}"
             )
-            raise LockTimeoutError(
-                f"Could not acquire lock for user {self.user_id} within {self.timeout}s"
-            )
+            raise
+
+        self._acquired = True
+        logger.debug(f"Lock acquired for user {self.user_id}: {self.operation}")
+        return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Release the lock."""
-        if self._acquired and self._lock:
-            self._lock.release()
+        if self._acquired:
+            self._acquired = False
+            await self.backend.release(self.user_id, self._handle)
+            self._handle = None
             logger.debug(f"Lock released for user {self.user_id}: {self.operation}")
         return False
 
 
-class LockTimeoutError(Exception):
-    """Raised when a lock cannot be acquired within the timeout period."""
-
-    pass
-
-
 @asynccontextmanager
 async def user_balance_lock(
     user_id: int,
@@ -125,31 +402,10 @@ async def user_balance_lock(
             # Atomic balance operations here
             pass
     """
-    lock = await get_user_lock(user_id)
-
-    try:
-        if timeout:
-            acquired = await asyncio.wait_for(lock.acquire(), timeout=timeout)
-            if not acquired:
-                raise LockTimeoutError(f"Could not acquire lock for user {user_id}")
-        else:
-            await lock.acquire()
-
-        logger.debug(f"Lock acquired for user {user_id}: {operation}")
+    async with UserBalanceLock(user_id, timeout=timeout, operation=operation):
         yield
 
-    except asyncio.TimeoutError:
-        logger.warning(f"Lock timeout for user {user_id}: {operation}")
-        raise LockTimeoutError(
-            f"Could not acquire lock for user {user_id} within {timeout}s"
-        )
-
-    finally:
-        if lock.locked():
-            lock.release()
-            logger.debug(f"Lock released for user {user_id}: {operation}")
-
 
 def clear_user_locks() -> None:
-    """Clear all user locks (useful for testing)."""
-    _user_locks.clear()
+    """Clear all in-process user locks (useful for testing)."""
+    _local_backend.clear()
@@ -0,0 +1,81 @@
+"""Async token bucket rate limiter.
+
+Paces requests to an upstream that enforces a request quota, backing off
+when the upstream answers 429. Used by the deposit scanners (one bucket
+per backend, see ``swaperex.scanner.scheduler``) and by batch quoting.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Async token bucket with multiplicative backoff on rate limiting.
+
+    ``acquire()`` never holds a lock across an await: each caller reserves
+    a token (the balance may go negative) and sleeps until its slot, so the
+    bucket can be shared by tasks on any event loop.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        min_rate: float = 0.2,
+        recovery: float = 0.05,
+    ):
+        """Initialize the bucket.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Bucket capacity (defaults to one second of requests)
+            min_rate: Floor the rate never backs off below
+            recovery: Fraction of ``rate`` regained per successful request
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.min_rate = min(min_rate, rate)
+        self.recovery = recovery
+        self.throttled = 0
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait to use it."""
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens -= 1
+        wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        return max(wait, self._paused_until - now)
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_success(self) -> None:
+        """Recover towards the configured rate after a successful request."""
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * self.recovery)
+
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """Halve the rate and pause after the backend answered 429.
+
+        Args:
+            retry_after: Seconds from the Retry-After header, if sent
+        """
+        now = time.monotonic()
+        self._refill(now)
+        self.rate = max(self.min_rate, self.rate / 2)
+        self._tokens = min(self._tokens, 0.0)
+        pause = retry_after if retry_after is not None else 1.0 / self.rate
+        self._paused_until = max(self._paused_until, now + pause)
+        self.throttled += 1
@@ -9,6 +9,9 @@ from swaperex.web.contracts.quotes import (
     QuoteResponse,
     MultiQuoteRequest,
     MultiQuoteResponse,
+    BatchQuoteRequest,
+    BatchQuoteResult,
+    BatchQuoteResponse,
 )
 from swaperex.web.contracts.assets import (
     AssetInfo,
@@ -59,6 +62,9 @@ __all__ = [
     "QuoteResponse",
     "MultiQuoteRequest",
     "MultiQuoteResponse",
+    "BatchQuoteRequest",
+    "BatchQuoteResult",
+    "BatchQuoteResponse",
     # Asset contracts
     "AssetInfo",
     "AssetListResponse",
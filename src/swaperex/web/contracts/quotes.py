@@ -64,3 +64,36 @@ class MultiQuoteResponse(BaseModel):
 
     class Config:
         json_encoders = {Decimal: str}
+
+
+class BatchQuoteRequest(BaseModel):
+    """Request for quotes on many pairs and amounts at once."""
+
+    quotes: list[QuoteRequest] = Field(
+        ...,
+        min_length=1,
+        description="Pair/amount requests; identical entries share one upstream call",
+    )
+
+
+class BatchQuoteResult(BaseModel):
+    """One quote of a batch, tagged with its position in the request."""
+
+    index: int = Field(..., description="Position of the request in the batch")
+    quote: QuoteResponse
+
+    class Config:
+        json_encoders = {Decimal: str}
+
+
+class BatchQuoteResponse(BaseModel):
+    """All quotes of a batch, in request order."""
+
+    success: bool
+    results: list[BatchQuoteResult] = Field(default_factory=list)
+    total: int = Field(0, description="Requests in the batch")
+    unique: int = Field(0, description="Distinct quotes fetched upstream")
+    error: Optional[str] = None
+
+    class Config:
+        json_encoders = {Decimal: str}
@@ -15,6 +15,7 @@ from swaperex.web.controllers.swaps import router as swaps_router
 from swaperex.web.controllers.withdrawals import router as withdrawals_router
 from swaperex.web.controllers.balances import router as balances_router
 from swaperex.web.controllers.wallet import router as wallet_router
+from swaperex.web.controllers.streams import router as streams_router
 
 __all__ = [
     "quotes_router",
@@ -24,4 +25,5 @@ __all__ = [
     "withdrawals_router",
     "balances_router",
     "wallet_router",
+    "streams_router",
 ]
@@ -1,12 +1,18 @@
 """Quote API endpoints."""
 
-from fastapi import APIRouter, HTTPException
+import json
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 from swaperex.web.contracts.quotes import (
     QuoteRequest,
     QuoteResponse,
     MultiQuoteRequest,
     MultiQuoteResponse,
+    BatchQuoteRequest,
+    BatchQuoteResponse,
 )
 from swaperex.web.services.quote_service import QuoteService
 
@@ -35,6 +41,60 @@ async def get_multi_quote(request: MultiQuoteRequest) -> MultiQuoteResponse:
     return await _quote_service.get_multi_quote(request)
 
 
+@router.post("/batch", response_model=None)
+async def get_batch_quotes(
+    request: BatchQuoteRequest,
+    format: Optional[str] = Query(
+        None,
+        pattern="^(json|ndjson|sse)$",
+        description="json (all at once), ndjson or sse (streamed as they arrive)",
+    ),
+    accept: Optional[str] = Header(None),
+) -> BatchQuoteResponse | StreamingResponse:
+    """Get quotes for many pairs and amounts in one call.
+
+    Identical requests in the batch share one upstream quote. With
+    ndjson or sse, each result is sent as soon as it is ready, tagged
+    with its index in the batch. Without ``format``, the Accept header
+    picks the output (text/event-stream, application/x-ndjson, else json).
+    """
+    try:
+        _quote_service.check_batch_size(request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if format is None:
+        accept = (accept or "").lower()
+        if "text/event-stream" in accept:
+            format = "sse"
+        elif "application/x-ndjson" in accept:
+            format = "ndjson"
+        else:
+            format = "json"
+
+    if format == "json":
+        return await _quote_service.get_batch_quotes(request)
+
+    async def ndjson() -> AsyncIterator[str]:
+        async for result in _quote_service.stream_batch_quotes(request):
+            yield result.model_dump_json() + "\n"
+
+    async def sse() -> AsyncIterator[str]:
+        sent = 0
+        async for result in _quote_service.stream_batch_quotes(request):
+            sent += 1
+            yield f"event: quote\ndata: {result.model_dump_json()}\n\n"
+        yield f"event: done\ndata: {json.dumps({'total': sent})}\n\n"
+
+    if format == "sse":
+        return StreamingResponse(
+            sse(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @router.get("/pairs")
 async def get_supported_pairs() -> dict:
     """Get list of supported trading pairs.
@@ -0,0 +1,185 @@
+"""Streaming quote endpoints.
+
+Clients subscribe to a pair/amount instead of polling ``/quotes`` or
+``/swaps/quote``; subscriptions with the same parameters share one
+upstream refresh loop and only changed quotes are pushed.
+
+WebSocket protocol (``/stream/ws``), JSON messages:
+
+- client: ``{"action": "subscribe", "type": "quote" | "swap", "id": "...",
+  "request": {...QuoteRequest or SwapQuoteRequest fields...}}``
+- client: ``{"action": "unsubscribe", "id": "..."}``
+- server: ``{"type": "subscribed", "id": ...}``, ``{"type": "update",
+  "id": ..., "data": {...quote...}}``, ``{"type": "unsubscribed", "id": ...}``
+  or ``{"type": "error", "id": ..., "error": "..."}`` (also sent, with a null
+  id, for frames that are not JSON)
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from typing import Annotated, AsyncIterator
+
+from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
+
+from swaperex.config import get_settings
+from swaperex.web.contracts.quotes import QuoteRequest
+from swaperex.web.contracts.swaps import SwapQuoteRequest
+from swaperex.web.services.quote_stream import (
+    REQUEST_MODELS,
+    QuoteStreamHub,
+    QuoteSubscription,
+    TopicLimitError,
+    get_quote_stream_hub,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/stream", tags=["streams"])
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+async def _sse_events(
+    hub: QuoteStreamHub, kind: str, request: BaseModel
+) -> AsyncIterator[str]:
+    """Subscribe and format updates as server-sent events.
+
+    The subscription is taken once the response body starts, so nothing is
+    left subscribed if the response never gets that far.
+    """
+    try:
+        subscription = hub.subscribe(kind, request)
+    except TopicLimitError as e:
+        yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+        return
+
+    heartbeat = get_settings().quote_stream_heartbeat
+    async with subscription:
+        while True:
+            payload = await subscription.next(timeout=heartbeat)
+            if payload is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield f"event: quote\ndata: {json.dumps(payload)}\n\n"
+
+
+def _sse_response(kind: str, request: BaseModel) -> StreamingResponse:
+    hub = get_quote_stream_hub()
+    if not hub.has_room(kind, request):
+        raise HTTPException(status_code=503, detail="Too many active quote streams")
+    return StreamingResponse(
+        _sse_events(hub, kind, request), media_type="text/event-stream", headers=SSE_HEADERS
+    )
+
+
+@router.get("/quotes")
+async def stream_quotes(request: Annotated[QuoteRequest, Query()]) -> StreamingResponse:
+    """Stream quote updates for a pair/amount as server-sent events.
+
+    Sends the current quote, then an event each time it changes.
+    """
+    return _sse_response("quote", request)
+
+
+@router.get("/swaps")
+async def stream_swap_quotes(
+    request: Annotated[SwapQuoteRequest, Query()],
+) -> StreamingResponse:
+    """Stream swap quote updates (with unsigned transaction) as server-sent events."""
+    return _sse_response("swap", request)
+
+
+@router.websocket("/ws")
+async def quote_stream_ws(websocket: WebSocket) -> None:
+    """Multiplex quote subscriptions over one WebSocket."""
+    await websocket.accept()
+    hub = get_quote_stream_hub()
+    max_subscriptions = get_settings().quote_stream_max_subscriptions
+    subscriptions: dict[str, QuoteSubscription] = {}
+    pumps: dict[str, asyncio.Task] = {}
+
+    async def pump(sub_id: str, subscription: QuoteSubscription) -> None:
+        try:
+            async for payload in subscription:
+                await websocket.send_json({"type": "update", "id": sub_id, "data": payload})
+        except Exception as e:
+            # The socket went away mid-send; the receive loop sees the disconnect
+            logger.debug(f"Stopped quote stream {sub_id}: {e}")
+            pumps.pop(sub_id, None)
+            drop(sub_id)
+
+    def drop(sub_id: str) -> bool:
+        subscription = subscriptions.pop(sub_id, None)
+        task = pumps.pop(sub_id, None)
+        if task is not None:
+            task.cancel()
+        if subscription is None:
+            return False
+        subscription.close()
+        return True
+
+    try:
+        while True:
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                break
+            try:
+                message = json.loads(frame.get("text") or frame.get("bytes") or "")
+            except ValueError:
+                await websocket.send_json(
+                    {"type": "error", "id": None, "error": "Expected a JSON message"}
+                )
+                continue
+            action = message.get("action") if isinstance(message, dict) else None
+            sub_id = str(message.get("id") or uuid.uuid4().hex[:12]) if action else None
+
+            if action == "subscribe":
+                kind = message.get("type", "quote")
+                model = REQUEST_MODELS.get(kind)
+                if model is None or kind not in hub.kinds:
+                    error = f"Unknown subscription type: {kind}"
+                elif sub_id in subscriptions:
+                    error = f"Subscription {sub_id} already exists"
+                elif len(subscriptions) >= max_subscriptions:
+                    error = f"At most {max_subscriptions} subscriptions per connection"
+                else:
+                    try:
+                        request = model(**(message.get("request") or {}))
+                    except (TypeError, ValidationError) as e:
+                        error = f"Invalid request: {e}"
+                    else:
+                        try:
+                            subscription = hub.subscribe(kind, request)
+                        except TopicLimitError as e:
+                            error = str(e)
+                        else:
+                            subscriptions[sub_id] = subscription
+                            pumps[sub_id] = asyncio.create_task(pump(sub_id, subscription))
+                            await websocket.send_json({"type": "subscribed", "id": sub_id})
+                            continue
+                await websocket.send_json({"type": "error", "id": sub_id, "error": error})
+
+            elif action == "unsubscribe":
+                if drop(sub_id):
+                    await websocket.send_json({"type": "unsubscribed", "id": sub_id})
+                else:
+                    await websocket.send_json(
+                        {"type": "error", "id": sub_id, "error": "Unknown subscription"}
+                    )
+
+            else:
+                await websocket.send_json(
+                    {"type": "error", "id": None, "error": "Expected subscribe or unsubscribe"}
+                )
+
+    except WebSocketDisconnect:
+        pass
+    finally:
+        tasks = list(pumps.values())
+        for sub_id in list(subscriptions):
+            drop(sub_id)
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -12,6 +12,7 @@ These services CAN:
 """
 
 from swaperex.web.services.quote_service import QuoteService
+from swaperex.web.services.quote_stream import QuoteStreamHub, get_quote_stream_hub
 from swaperex.web.services.chain_service import ChainService
 from swaperex.web.services.transaction_builder import TransactionBuilder
 from swaperex.web.services.swap_service import SwapService
@@ -21,6 +22,8 @@ from swaperex.web.services.wallet_service import WalletService
 
 __all__ = [
     "QuoteService",
+    "QuoteStreamHub",
+    "get_quote_stream_hub",
     "ChainService",
     "TransactionBuilder",
     "SwapService",
@@ -15,6 +15,8 @@ from decimal import Decimal
 from typing import Optional
 
 from swaperex.config import get_settings, ExecutionMode
+from swaperex.prices import get_price_oracle
+from swaperex.utils.evm_balances import EVMBalanceEngine
 from swaperex.web.contracts.balances import (
     TokenBalance,
     WalletBalanceRequest,
@@ -128,11 +130,9 @@ class BalanceService:
     ) -> WalletBalanceResponse:
         """Get wallet balances from blockchain state.
 
-        In production, this would make RPC calls to fetch:
-        - Native balance via eth_getBalance
-        - Token balances via ERC-20 balanceOf calls
-
-        For this implementation, we simulate the responses.
+        Outside dry-run mode the native balance and all ERC-20 balanceOf
+        calls are read from the chain's RPC in one batched request. In
+        dry-run mode the balances are simulated.
         """
         self._check_mode()
 
@@ -160,19 +160,26 @@ class BalanceService:
                     error=f"Unsupported chain: {request.chain}",
                 )
 
-            # Fetch native balance (simulated for demo)
-            native_balance = await self._fetch_native_balance(
-                request.address, request.chain, chain_info
-            )
-
-            # Fetch token balances if requested
-            token_balances = []
-            if request.include_tokens:
-                token_balances = await self._fetch_token_balances(
+            if not get_settings().dry_run:
+                native_balance, token_balances = await self._fetch_balances_from_rpc(
                     request.address,
                     request.chain,
-                    request.token_list,
+                    request.token_list if request.include_tokens else [],
                 )
+            else:
+                # Simulated balances in dry-run mode
+                native_balance = await self._fetch_native_balance(
+                    request.address, request.chain, chain_info
+                )
+
+                # Fetch token balances if requested
+                token_balances = []
+                if request.include_tokens:
+                    token_balances = await self._fetch_token_balances(
+                        request.address,
+                        request.chain,
+                        request.token_list,
+                    )
 
             # Calculate total USD value
             total_usd = native_balance.usd_value or Decimal("0")
@@ -258,7 +265,8 @@ class BalanceService:
         In production:
         - Make eth_getBalance RPC call
         - Convert from wei to human-readable
-        - Fetch USD price from price feed
+
+        USD value comes from the shared price oracle.
         """
         # Simulated balance for demo
         # In production, this would be: await rpc_client.eth_getBalance(address)
@@ -271,20 +279,12 @@ class BalanceService:
             "avalanche": Decimal("25.0"),  # 25 AVAX
         }
 
-        simulated_prices = {
-            "ETH": Decimal("3500"),
-            "BNB": Decimal("600"),
-            "MATIC": Decimal("1.2"),
-            "AVAX": Decimal("40"),
-        }
-
         balance = simulated_balances.get(chain.lower(), Decimal("0"))
         symbol = chain_info.native_asset
         decimals = 18
 
         balance_raw = str(int(balance * Decimal(10**decimals)))
-        usd_price = simulated_prices.get(symbol, Decimal("0"))
-        usd_value = balance * usd_price if usd_price else None
+        usd_value = get_price_oracle().usd_value(symbol, balance)
 
         return TokenBalance(
             symbol=symbol,
@@ -334,8 +334,7 @@ class BalanceService:
             if balance > 0:
                 balance_raw = str(int(balance * Decimal(10**token_info["decimals"])))
 
-                # Stablecoins = $1
-                usd_value = balance if symbol in ("USDT", "USDC", "DAI", "BUSD") else None
+                usd_value = get_price_oracle().usd_value(symbol, balance)
 
                 balances.append(
                     TokenBalance(
@@ -352,6 +351,81 @@ class BalanceService:
 
         return balances
 
+    async def _fetch_balances_from_rpc(
+        self,
+        address: str,
+        chain: str,
+        token_list: Optional[list[str]] = None,
+    ) -> tuple[TokenBalance, list[TokenBalance]]:
+        """Fetch native and ERC-20 balances for a wallet in one batched read.
+
+        All balanceOf calls plus the native balance are aggregated into a
+        single Multicall3 call (or JSON-RPC batch) against the chain's RPC.
+
+        Args:
+            address: Wallet address
+            chain: Chain name
+            token_list: Token symbols to read (None = all known, [] = none)
+
+        Returns:
+            Native balance and the non-zero token balances
+
+        Raises:
+            ValueError: If the chain is not supported
+            RuntimeError: If the RPC returned no native balance
+        """
+        chain_info = SUPPORTED_CHAINS.get(chain.lower())
+        if not chain_info:
+            raise ValueError(f"Unsupported chain: {chain}")
+
+        chain_tokens = TOKEN_CONTRACTS.get(chain.lower(), {})
+        if token_list is None:
+            token_list = list(chain_tokens.keys())
+        symbols = [s for s in token_list if s in chain_tokens]
+
+        engine = EVMBalanceEngine(chain_info.rpc_url, timeout=10.0)
+        result = await engine.get_balances(
+            [address], [chain_tokens[symbol]["address"] for symbol in symbols]
+        )
+
+        native_raw = result.get(address)
+        if native_raw is None:
+            raise RuntimeError(f"No native balance returned by {chain} RPC")
+
+        oracle = get_price_oracle()
+        balance = Decimal(native_raw) / Decimal(10**18)
+        native_balance = TokenBalance(
+            symbol=chain_info.native_asset,
+            name=f"{chain_info.native_asset} (Native)",
+            balance=balance,
+            balance_raw=str(native_raw),
+            decimals=18,
+            chain=chain,
+            usd_value=oracle.usd_value(chain_info.native_asset, balance),
+        )
+
+        balances = []
+        for symbol in symbols:
+            token_info = chain_tokens[symbol]
+            raw = result.get(address, token_info["address"])
+            if not raw:
+                continue
+            balance = Decimal(raw) / Decimal(10 ** token_info["decimals"])
+            balances.append(
+                TokenBalance(
+                    symbol=symbol,
+                    name=token_info["name"],
+                    contract_address=token_info["address"],
+                    balance=balance,
+                    balance_raw=str(raw),
+                    decimals=token_info["decimals"],
+                    chain=chain,
+                    usd_value=oracle.usd_value(symbol, balance),
+                )
+            )
+
+        return native_balance, balances
+
     async def fetch_balance_from_rpc(
         self,
         rpc_url: str,
@@ -362,28 +436,12 @@ class BalanceService:
         This is a real implementation that can be used when
         production RPC endpoints are configured.
         """
-        import aiohttp
-
         try:
-            payload = {
-                "jsonrpc": "2.0",
-                "method": "eth_getBalance",
-                "params": [address, "latest"],
-                "id": 1,
-            }
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    rpc_url,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if "result" in data:
-                            balance_wei = int(data["result"], 16)
-                            return Decimal(balance_wei) / Decimal(10**18)
-
+            engine = EVMBalanceEngine(rpc_url, use_multicall=False, timeout=10.0)
+            result = await engine.get_balances([address], [])
+            balance_wei = result.get(address)
+            if balance_wei is not None:
+                return Decimal(balance_wei) / Decimal(10**18)
             return None
 
         except Exception as e:
@@ -401,35 +459,12 @@ class BalanceService:
 
         Calls balanceOf(address) on the token contract.
         """
-        import aiohttp
-
         try:
-            # Encode balanceOf call
-            address_padded = wallet_address.lower().replace("0x", "").zfill(64)
-            data = f"{BALANCE_OF_SELECTOR}{address_padded}"
-
-            payload = {
-                "jsonrpc": "2.0",
-                "method": "eth_call",
-                "params": [
-                    {"to": token_address, "data": data},
-                    "latest",
-                ],
-                "id": 1,
-            }
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    rpc_url,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        if "result" in result:
-                            balance_raw = int(result["result"], 16)
-                            return Decimal(balance_raw) / Decimal(10**decimals)
-
+            engine = EVMBalanceEngine(rpc_url, use_multicall=False, timeout=10.0)
+            result = await engine.get_balances([wallet_address], [token_address], include_native=False)
+            balance_raw = result.get(wallet_address, token_address)
+            if balance_raw is not None:
+                return Decimal(balance_raw) / Decimal(10**decimals)
             return None
 
         except Exception as e:
@@ -111,11 +111,11 @@ class ChainService:
         Returns:
             AssetListResponse with all supported assets
         """
-        # Build from routing module's price list
-        from swaperex.routing.dry_run import SIMULATED_PRICES
+        # Build from the price oracle's symbol list
+        from swaperex.prices import get_price_oracle
 
         assets = []
-        for symbol in SIMULATED_PRICES.keys():
+        for symbol in get_price_oracle().symbols():
             chain = self._get_asset_chain(symbol)
             assets.append(
                 AssetInfo(
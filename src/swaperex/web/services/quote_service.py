@@ -4,15 +4,21 @@ This service queries DEX aggregators for quotes but does NOT execute swaps.
 Swap execution requires client-side signing in non-custodial mode.
 """
 
+import asyncio
 import logging
 from decimal import Decimal
-from typing import Optional
+from typing import AsyncIterator, Optional
 
+from swaperex.config import get_settings
+from swaperex.utils.rate_limit import TokenBucket
 from swaperex.web.contracts.quotes import (
     QuoteRequest,
     QuoteResponse,
     MultiQuoteRequest,
     MultiQuoteResponse,
+    BatchQuoteRequest,
+    BatchQuoteResult,
+    BatchQuoteResponse,
 )
 
 logger = logging.getLogger(__name__)
@@ -29,6 +35,8 @@ class QuoteService:
         # Import only the routing module (quotes only, no execution)
         from swaperex.routing.dry_run import DryRunRouter
         self._dry_run_router = DryRunRouter()
+        # Paces upstream quote calls made on behalf of batches
+        self._batch_limiter = TokenBucket(get_settings().batch_quote_rate)
 
     async def get_quote(self, request: QuoteRequest) -> QuoteResponse:
         """Get a swap quote.
@@ -106,6 +114,84 @@ class QuoteService:
             error=quote.error,
         )
 
+    @staticmethod
+    def _batch_key(request: QuoteRequest) -> tuple:
+        """Requests with equal keys get the same quote."""
+        return (
+            request.from_asset.upper(),
+            request.to_asset.upper(),
+            request.amount.normalize(),
+            request.slippage,
+        )
+
+    def check_batch_size(self, request: BatchQuoteRequest) -> None:
+        """Raise ValueError if a batch is larger than allowed."""
+        max_items = get_settings().batch_quote_max_items
+        if len(request.quotes) > max_items:
+            raise ValueError(f"Batch has {len(request.quotes)} quotes, max is {max_items}")
+
+    async def stream_batch_quotes(
+        self, request: BatchQuoteRequest
+    ) -> AsyncIterator[BatchQuoteResult]:
+        """Yield quotes for a batch as they complete.
+
+        Identical pair/amount requests are fetched once and yielded for
+        each of their indexes. Upstream calls run concurrently, capped by
+        BATCH_QUOTE_CONCURRENCY and paced by BATCH_QUOTE_RATE.
+
+        Args:
+            request: Batch of quote requests
+
+        Yields:
+            BatchQuoteResult per request, in completion order
+        """
+        self.check_batch_size(request)
+
+        groups: dict[tuple, list[int]] = {}
+        for index, item in enumerate(request.quotes):
+            groups.setdefault(self._batch_key(item), []).append(index)
+
+        semaphore = asyncio.Semaphore(get_settings().batch_quote_concurrency)
+
+        async def fetch(indexes: list[int]) -> tuple[list[int], QuoteResponse]:
+            async with semaphore:
+                await self._batch_limiter.acquire()
+                return indexes, await self.get_quote(request.quotes[indexes[0]])
+
+        tasks = [asyncio.create_task(fetch(indexes)) for indexes in groups.values()]
+        logger.debug(f"Batch of {len(request.quotes)} quotes, {len(tasks)} unique")
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                indexes, quote = await next_done
+                for index in indexes:
+                    yield BatchQuoteResult(index=index, quote=quote)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def get_batch_quotes(self, request: BatchQuoteRequest) -> BatchQuoteResponse:
+        """Get quotes for a batch, returned together in request order.
+
+        Args:
+            request: Batch of quote requests
+
+        Returns:
+            BatchQuoteResponse with one result per request
+        """
+        try:
+            results = [result async for result in self.stream_batch_quotes(request)]
+        except ValueError as e:
+            return BatchQuoteResponse(success=False, total=len(request.quotes), error=str(e))
+
+        results.sort(key=lambda r: r.index)
+        return BatchQuoteResponse(
+            success=any(r.quote.success for r in results),
+            results=results,
+            total=len(results),
+            unique=len({self._batch_key(item) for item in request.quotes}),
+        )
+
     def get_supported_pairs(self) -> list[tuple[str, str]]:
         """Get list of supported trading pairs.
 
@@ -113,8 +199,8 @@ class QuoteService:
             List of (from_asset, to_asset) tuples
         """
         # In production, would aggregate from all providers
-        from swaperex.routing.dry_run import SIMULATED_PRICES
-        assets = list(SIMULATED_PRICES.keys())
+        from swaperex.prices import get_price_oracle
+        assets = get_price_oracle().symbols()
 
         # Generate pairs (all assets can swap to all other assets in simulation)
         pairs = []
@@ -0,0 +1,266 @@
+"""Quote subscriptions for the web frontend.
+
+Instead of every open tab polling ``/quotes`` or ``/swaps/quote``, clients
+subscribe to a pair/amount over WebSocket or SSE. Subscriptions with the
+same parameters share one topic, and each topic runs one refresh loop
+that re-fetches the quote every ``interval`` seconds. A subscriber only
+gets a message when the quote materially changes (volatile fields such
+as ``expires_at`` and ``quote_id`` are ignored), so upstream load grows
+with the number of distinct subscriptions, not with connected clients.
+
+A topic's loop stops when its last subscriber leaves. ``max_topics``
+caps the number of distinct topics (and so refresh loops) per process;
+subscribing to an existing topic is always allowed.
+"""
+
+import asyncio
+import logging
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Optional
+
+from pydantic import BaseModel
+
+from swaperex.web.contracts.quotes import QuoteRequest
+from swaperex.web.contracts.swaps import SwapQuoteRequest
+
+logger = logging.getLogger(__name__)
+
+QuoteFetcher = Callable[[BaseModel], Awaitable[BaseModel]]
+
+# Fields that change on every fetch without the quote changing
+VOLATILE_FIELDS = frozenset({"expires_at", "quote_id"})
+
+# Request model per subscription kind
+REQUEST_MODELS: dict[str, type[BaseModel]] = {
+    "quote": QuoteRequest,
+    "swap": SwapQuoteRequest,
+}
+
+
+class TopicLimitError(Exception):
+    """Raised by ``subscribe`` when a new topic would exceed ``max_topics``."""
+
+
+def subscription_key(kind: str, request: BaseModel) -> tuple:
+    """Key under which equivalent subscriptions share a topic."""
+    fields = []
+    for name, value in sorted(request.model_dump().items()):
+        if name in ("from_asset", "to_asset", "chain") and isinstance(value, str):
+            value = value.upper()
+        elif isinstance(value, Decimal):
+            value = value.normalize()
+        fields.append((name, str(value)))
+    return (kind, tuple(fields))
+
+
+class QuoteSubscription:
+    """One client's view of a topic.
+
+    Holds only the latest undelivered update: a slow client skips
+    intermediate quotes rather than queueing them.
+    """
+
+    def __init__(self, hub: "QuoteStreamHub", key: tuple):
+        self.key = key
+        self._hub = hub
+        self._queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=1)
+        self.closed = False
+
+    def _push(self, payload: dict) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(payload)
+
+    async def next(self, timeout: Optional[float] = None) -> Optional[dict]:
+        """Wait for the next update (None if ``timeout`` passes first)."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        """Leave the topic."""
+        if not self.closed:
+            self.closed = True
+            self._hub._unsubscribe(self)
+
+    def __aiter__(self) -> "QuoteSubscription":
+        return self
+
+    async def __anext__(self) -> dict:
+        return await self._queue.get()
+
+    async def __aenter__(self) -> "QuoteSubscription":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class _Topic:
+    """Refresh loop and subscribers for one subscription key."""
+
+    def __init__(self, key: tuple, fetch: Callable[[], Awaitable[BaseModel]]):
+        self.key = key
+        self.fetch = fetch
+        self.subscribers: set[QuoteSubscription] = set()
+        self.latest: Optional[dict] = None
+        self.fingerprint: Optional[dict] = None
+        self.task: Optional[asyncio.Task] = None
+        self.fetches = 0
+        self.changes = 0
+
+
+class QuoteStreamHub:
+    """Shares one refresh loop per distinct quote subscription."""
+
+    def __init__(
+        self,
+        fetchers: Optional[dict[str, QuoteFetcher]] = None,
+        interval: float = 5.0,
+        max_topics: Optional[int] = None,
+    ):
+        """Initialize the hub.
+
+        Args:
+            fetchers: Subscription kind -> coroutine fetching a quote for a
+                request (defaults to QuoteService and SwapService)
+            interval: Seconds between refreshes of a topic
+            max_topics: Most distinct topics at once (None = unlimited)
+        """
+        if fetchers is None:
+            from swaperex.web.services.quote_service import QuoteService
+            from swaperex.web.services.swap_service import SwapService
+
+            fetchers = {
+                "quote": QuoteService().get_quote,
+                "swap": SwapService().get_swap_quote,
+            }
+        self.fetchers = fetchers
+        self.interval = interval
+        self.max_topics = max_topics
+        self._topics: dict[tuple, _Topic] = {}
+
+    @property
+    def kinds(self) -> list[str]:
+        return list(self.fetchers)
+
+    def has_room(self, kind: str, request: BaseModel) -> bool:
+        """Whether subscribing to this request would stay within ``max_topics``."""
+        return (
+            self.max_topics is None
+            or len(self._topics) < self.max_topics
+            or subscription_key(kind, request) in self._topics
+        )
+
+    def subscribe(self, kind: str, request: BaseModel) -> QuoteSubscription:
+        """Subscribe to quote updates for a request.
+
+        The subscriber receives the current quote right away if the topic
+        already has one, then every change.
+
+        Raises:
+            ValueError: If ``kind`` is not a known subscription kind
+            TopicLimitError: If a new topic would exceed ``max_topics``
+        """
+        fetcher = self.fetchers.get(kind)
+        if fetcher is None:
+            raise ValueError(f"Unknown subscription type: {kind}")
+
+        key = subscription_key(kind, request)
+        topic = self._topics.get(key)
+        if topic is None:
+            if self.max_topics is not None and len(self._topics) >= self.max_topics:
+                raise TopicLimitError(f"At most {self.max_topics} distinct quote streams")
+            topic = _Topic(key, lambda: fetcher(request))
+            topic.task = asyncio.create_task(self._refresh_loop(topic))
+            self._topics[key] = topic
+            logger.debug(f"Started quote stream for {key}")
+
+        subscription = QuoteSubscription(self, key)
+        topic.subscribers.add(subscription)
+        if topic.latest is not None:
+            subscription._push(topic.latest)
+        return subscription
+
+    def _unsubscribe(self, subscription: QuoteSubscription) -> None:
+        topic = self._topics.get(subscription.key)
+        if topic is None:
+            return
+        topic.subscribers.discard(subscription)
+        if not topic.subscribers:
+            del self._topics[topic.key]
+            if topic.task is not None:
+                topic.task.cancel()
+            logger.debug(f"Stopped quote stream for {topic.key}")
+
+    async def _refresh_loop(self, topic: _Topic) -> None:
+        while True:
+            try:
+                response = await topic.fetch()
+                topic.fetches += 1
+                self._publish(topic, response.model_dump(mode="json"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Quote stream refresh failed for {topic.key}: {e}")
+            await asyncio.sleep(self.interval)
+
+    @staticmethod
+    def _publish(topic: _Topic, payload: dict) -> None:
+        fingerprint = {k: v for k, v in payload.items() if k not in VOLATILE_FIELDS}
+        if fingerprint == topic.fingerprint:
+            return
+        topic.fingerprint = fingerprint
+        topic.latest = payload
+        topic.changes += 1
+        for subscription in list(topic.subscribers):
+            subscription._push(payload)
+
+    async def close(self) -> None:
+        """Stop every refresh loop."""
+        tasks = [topic.task for topic in self._topics.values() if topic.task is not None]
+        self._topics.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {
+            "topics": len(self._topics),
+            "subscribers": sum(len(t.subscribers) for t in self._topics.values()),
+            "fetches": sum(t.fetches for t in self._topics.values()),
+            "changes": sum(t.changes for t in self._topics.values()),
+        }
+
+
+_hub: Optional[QuoteStreamHub] = None
+
+
+def get_quote_stream_hub() -> QuoteStreamHub:
+    """Get the process-wide quote stream hub."""
+    global _hub
+    if _hub is None:
+        from swaperex.config import get_settings
+
+        settings = get_settings()
+        _hub = QuoteStreamHub(
+            interval=settings.quote_stream_interval,
+            max_topics=settings.quote_stream_max_topics,
+        )
+    return _hub
+
+
+async def close_quote_stream_hub() -> None:
+    """Stop the hub's refresh loops on shutdown (no-op if it was never used)."""
+    global _hub
+    hub, _hub = _hub, None
+    if hub is not None:
+        await hub.close()
+        logger.info("Closed quote stream hub")
+
+
+def reset_quote_stream_hub() -> None:
+    """Drop the hub (useful for testing)."""
+    global _hub
+    _hub = None
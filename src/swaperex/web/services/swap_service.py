@@ -20,9 +20,8 @@ import uuid
 from decimal import Decimal
 from typing import Optional
 
-import httpx
-
 from swaperex.config import get_settings, ExecutionMode
+from swaperex.utils.http import PooledHTTPClient, get_pooled_client
 from swaperex.web.contracts.swaps import (
     SwapQuoteRequest,
     SwapQuoteResponse,
@@ -64,12 +63,12 @@ class SwapService:
 
     def __init__(self):
         """Initialize swap service."""
-        self._http_client: Optional[httpx.AsyncClient] = None
+        self._http_client: Optional[PooledHTTPClient] = None
 
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
+    async def _get_client(self) -> PooledHTTPClient:
+        """Get the shared pooled HTTP client."""
         if self._http_client is None:
-            self._http_client = httpx.AsyncClient(timeout=30.0)
+            self._http_client = get_pooled_client(timeout=30.0)
         return self._http_client
 
     def _check_mode(self) -> None:
@@ -369,7 +368,5 @@ class SwapService:
         )
 
     async def close(self) -> None:
-        """Close HTTP client."""
-        if self._http_client:
-            await self._http_client.aclose()
-            self._http_client = None
+        """Release HTTP client (pooled connections are closed on shutdown)."""
+        self._http_client = None
@@ -8,8 +8,7 @@ import logging
 from decimal import Decimal
 from typing import Optional
 
-import httpx
-
+from swaperex.utils.http import pooled_client
 from swaperex.withdrawal.base import (
     FeeEstimate,
     WithdrawalHandler,
@@ -71,7 +70,7 @@ class BTCWithdrawalHandler(WithdrawalHandler):
     ) -> FeeEstimate:
         """Estimate BTC transaction fee using mempool.space API."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 response = await client.get(f"{self.mempool_url}/v1/fees/recommended")
 
                 if response.status_code == 200:
@@ -184,7 +183,7 @@ class BTCWithdrawalHandler(WithdrawalHandler):
             Transaction ID if successful, None otherwise
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 response = await client.post(
                     f"{self.blockstream_url}/tx",
                     content=raw_tx_hex,
@@ -206,7 +205,7 @@ class BTCWithdrawalHandler(WithdrawalHandler):
     async def get_transaction_status(self, txid: str) -> WithdrawalStatus:
         """Check BTC transaction confirmation status."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 response = await client.get(f"{self.blockstream_url}/tx/{txid}")
 
                 if response.status_code == 200:
@@ -229,7 +228,7 @@ class BTCWithdrawalHandler(WithdrawalHandler):
     async def get_utxos(self, address: str) -> list[dict]:
         """Get UTXOs for an address."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 response = await client.get(f"{self.blockstream_url}/address/{address}/utxo")
 
                 if response.status_code == 200:
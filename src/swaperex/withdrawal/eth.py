@@ -8,8 +8,7 @@ import logging
 from decimal import Decimal
 from typing import Optional
 
-import httpx
-
+from swaperex.utils.http import pooled_client
 from swaperex.withdrawal.base import (
     FeeEstimate,
     WithdrawalHandler,
@@ -132,7 +131,7 @@ class ETHWithdrawalHandler(WithdrawalHandler):
     async def _get_gas_price(self) -> int:
         """Get current gas price in wei."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 response = await client.post(
                     self.rpc_url,
                     json={
@@ -156,7 +155,7 @@ class ETHWithdrawalHandler(WithdrawalHandler):
     async def _get_nonce(self, address: str) -> int:
         """Get transaction count (nonce) for address."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 response = await client.post(
                     self.rpc_url,
                     json={
@@ -261,7 +260,7 @@ class ETHWithdrawalHandler(WithdrawalHandler):
     async def _broadcast_transaction(self, raw_tx_hex: str) -> Optional[str]:
         """Broadcast raw transaction."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 response = await client.post(
                     self.rpc_url,
                     json={
@@ -287,7 +286,7 @@ class ETHWithdrawalHandler(WithdrawalHandler):
     async def get_transaction_status(self, txid: str) -> WithdrawalStatus:
         """Check ETH transaction status."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 response = await client.post(
                     self.rpc_url,
                     json={
@@ -8,8 +8,7 @@ import logging
 from decimal import Decimal
 from typing import Optional
 
-import httpx
-
+from swaperex.utils.http import pooled_client
 from swaperex.withdrawal.base import (
     FeeEstimate,
     WithdrawalHandler,
@@ -163,7 +162,7 @@ class TRXWithdrawalHandler(WithdrawalHandler):
     async def get_transaction_status(self, txid: str) -> WithdrawalStatus:
         """Check TRX transaction status."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with pooled_client(timeout=30.0) as client:
                 response = await client.post(
                     f"{self.base_url}/wallet/gettransactionbyid",
                     json={"value": txid},
@@ -14,6 +14,7 @@ os.environ["ENVIRONMENT"] = "test"
 os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///:memory:"
 os.environ["TELEGRAM_BOT_TOKEN"] = ""
 os.environ["DEBUG"] = "true"
+os.environ["PRICE_SOURCES"] = ""
 
 from swaperex.ledger.models import Base
 from swaperex.ledger.repository import LedgerRepository
@@ -27,6 +28,16 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def reset_provider_health():
+    """Start every test with closed routing circuit breakers."""
+    from swaperex.routing.health import reset_provider_health
+
+    reset_provider_health()
+    yield
+    reset_provider_health()
+
+
 @pytest_asyncio.fixture
 async def db_engine():
     """Create in-memory database engine for testing."""
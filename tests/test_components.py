@@ -128,6 +128,90 @@ class TestUserLocks:
         lock1_new = await get_user_lock(1)
         assert not lock1_new.locked()
 
+    @pytest.mark.asyncio
+    async def test_local_locks_are_evicted_when_unused(self):
+        """Test that idle user locks do not accumulate."""
+        import gc
+
+        from swaperex.utils import locks
+
+        for user_id in range(500, 600):
+            async with UserBalanceLock(user_id, backend=locks._local_backend):
+                pass
+        gc.collect()
+
+        assert len(locks._local_backend) == 0
+
+    @pytest.mark.asyncio
+    async def test_redis_lease_lock_is_shared_between_workers(self):
+        """Test lease locks exclude other workers and expire if the holder dies."""
+        from swaperex.utils.locks import RedisLeaseLockBackend
+
+        server = _FakeRedis()
+        worker_a = RedisLeaseLockBackend(client=server, lease=0.3, poll_interval=0.01)
+        worker_b = RedisLeaseLockBackend(client=server, lease=0.3, poll_interval=0.01)
+        results = []
+
+        async def task(name, backend):
+            async with UserBalanceLock(700, timeout=5.0, backend=backend):
+                results.append(f"{name}_start")
+                await asyncio.sleep(0.5)  # longer than the lease: renewal keeps it
+                results.append(f"{name}_end")
+
+        await asyncio.gather(task("A", worker_a), task("B", worker_b))
+        assert results in [
+            ["A_start", "A_end", "B_start", "B_end"],
+            ["B_start", "B_end", "A_start", "A_end"],
+        ]
+
+        # A worker that dies while holding the lock stops renewing it
+        token, renewal = await worker_a.acquire(701, timeout=1.0)
+        renewal.cancel()
+        with pytest.raises(LockTimeoutError):
+            await worker_b.acquire(701, timeout=0.1)
+        token_b, renewal_b = await worker_b.acquire(701, timeout=1.0)
+
+        # The dead worker's late release must not free the new holder's lock
+        await worker_a.release(701, (token, renewal))
+        assert server.get("swaperex:balance-lock:701") == token_b
+        await worker_b.release(701, (token_b, renewal_b))
+        assert server.get("swaperex:balance-lock:701") is None
+
+
+class _FakeRedis:
+    """In-memory stand-in for the Redis commands used by lease locks."""
+
+    def __init__(self):
+        self._data: dict[str, tuple[str, float]] = {}
+
+    def get(self, key):
+        import time
+
+        value, expires_at = self._data.get(key, (None, 0.0))
+        if value is not None and time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        return value
+
+    async def set(self, key, value, nx=False, px=None):
+        import time
+
+        if nx and self.get(key) is not None:
+            return None
+        self._data[key] = (value, time.monotonic() + px / 1000)
+        return True
+
+    async def eval(self, script, numkeys, key, token, *args):
+        import time
+
+        if self.get(key) != token:
+            return 0
+        if "pexpire" in script:
+            self._data[key] = (token, time.monotonic() + int(args[0]) / 1000)
+        else:
+            del self._data[key]
+        return 1
+
 
 class TestNotifications:
     """Tests for the notifications module."""
@@ -337,6 +421,59 @@ class TestHDWallet:
         assert "is_simulated" in info
         assert "coin_type" in info
 
+    @pytest.mark.asyncio
+    async def test_preloaded_xpubs_served_from_memory(self, ledger_repo, monkeypatch):
+        """Stored xpubs are preloaded once and invalidated on change."""
+        from swaperex.hdwallet import factory
+
+        monkeypatch.delenv("XPUB_ETH", raising=False)
+        monkeypatch.delenv("XPUB_USDT", raising=False)
+        monkeypatch.setattr(factory, "get_xpub_from_seed_for_asset", lambda asset: None)
+        await ledger_repo.store_xpub("ETH", "xpub_stored_eth", label="main")
+
+        assert await factory.preload_xpubs(ledger_repo.session) == 1
+        try:
+            settings = factory.get_settings()
+            assert factory._get_xpub_for_asset("ETH", settings) == "xpub_stored_eth"
+            # Family fallback resolves from memory too
+            assert factory._get_xpub_for_asset("USDT", settings) == "xpub_stored_eth"
+
+            factory.set_stored_xpub("eth", "xpub_rotated_eth")
+            assert factory._get_xpub_for_asset("USDT", settings) == "xpub_rotated_eth"
+
+            factory.invalidate_xpub("ETH")
+            assert factory._get_xpub_for_asset("ETH", settings) is None
+        finally:
+            factory._db_xpubs.clear()
+            factory.reset_wallet_cache()
+
+    @pytest.mark.asyncio
+    async def test_xpub_changes_from_other_processes_are_picked_up(self, ledger_repo, monkeypatch):
+        """Test refresh_xpubs reloads when another process rewrites xpub_keys."""
+        from swaperex.hdwallet import factory
+
+        monkeypatch.delenv("XPUB_ETH", raising=False)
+        monkeypatch.setattr(factory, "get_xpub_from_seed_for_asset", lambda asset: None)
+        await ledger_repo.store_xpub("ETH", "xpub_first_eth", label="main")
+        await factory.preload_xpubs(ledger_repo.session)
+        try:
+            session = ledger_repo.session
+            assert not await factory.refresh_xpubs(max_age=0, session=session)
+
+            # Another worker rotates the key: only the database changes here
+            await ledger_repo.store_xpub("ETH", "xpub_second_eth", label="main")
+            assert not await factory.refresh_xpubs(max_age=60, session=session)
+            assert await factory.refresh_xpubs(max_age=0, session=session)
+            assert factory._load_xpub_from_db("ETH") == "xpub_second_eth"
+
+            await ledger_repo.delete_xpub("ETH")
+            assert await factory.refresh_xpubs(max_age=0, session=session)
+            assert factory._load_xpub_from_db("ETH") is None
+        finally:
+            factory._db_xpubs.clear()
+            factory._db_xpubs_version = None
+            factory.reset_wallet_cache()
+
     def test_simulated_wallet_generates_addresses(self):
         """Test that simulated wallet generates addresses."""
         from swaperex.hdwallet.base import SimulatedHDWallet
@@ -383,6 +520,37 @@ class TestHDWallet:
             assert WALLET_CLASSES[token] == TRXHDWallet
 
 
+    # Account xpub for m/44'/60'/0' of the "abandon ... about" test mnemonic
+    ETH_TEST_XPUB = "xpub6DCoCpSuQZB2jawqnGMEPS63ePKWkwWPH4TU45Q7LPXWuNd8TMtVxRrgjtEshuqpK3mdhaWHPFsBngh5GFZaM6si3yZdUsT8ddYM3PwnATt"
+
+    def test_derive_range_matches_single_derivation(self):
+        """Test bulk derivation returns the same addresses as one-at-a-time."""
+        from swaperex.hdwallet.eth import ETHHDWallet
+
+        wallet = ETHHDWallet(xpub=self.ETH_TEST_XPUB)
+        addresses = wallet.derive_range(start=3, count=5)
+
+        assert [a.index for a in addresses] == [3, 4, 5, 6, 7]
+        assert [a.address for a in addresses] == [
+            ETHHDWallet(xpub=self.ETH_TEST_XPUB).derive_address(i).address for i in range(3, 8)
+        ]
+        assert wallet.derive_address(0).address == "0x9858EfFD232B4033E47d90003D41EC34EcaEda94"
+
+    def test_derive_range_in_process_pool(self):
+        """Test large ranges derived across worker processes keep order."""
+        from swaperex.hdwallet.base import PARALLEL_DERIVATION_THRESHOLD
+        from swaperex.hdwallet.eth import ETHHDWallet
+
+        wallet = ETHHDWallet(xpub=self.ETH_TEST_XPUB)
+        count = PARALLEL_DERIVATION_THRESHOLD
+
+        parallel = wallet.derive_range(0, count, processes=2)
+        serial = wallet.derive_range(0, count, processes=1)
+
+        assert len(parallel) == count
+        assert [a.address for a in parallel] == [a.address for a in serial]
+
+
 class TestLedgerRepository:
     """Tests for ledger repository operations."""
 
@@ -430,6 +598,102 @@ class TestLedgerRepository:
 
         assert user1.id == user2.id
 
+    @pytest.mark.asyncio
+    async def test_address_pool_claims_in_index_order(self, repo):
+        """Test pooled addresses are reserved from the HD counter and claimed once."""
+        from swaperex.hdwallet.base import SimulatedHDWallet
+
+        first = await repo.get_next_hd_index("POOLTEST")
+        start = await repo.reserve_hd_index_range("POOLTEST", 3)
+        assert start == first + 1
+
+        wallet = SimulatedHDWallet("POOLTEST")
+        fingerprint = wallet.xpub_fingerprint
+        await repo.add_pooled_addresses("POOLTEST", wallet.derive_range(start, 3), fingerprint)
+        assert await repo.count_pooled_addresses("POOLTEST") == 3
+
+        claimed = await repo.claim_pooled_address("POOLTEST", fingerprint)
+        assert claimed.derivation_index == start
+        assert claimed.status == "assigned"
+        assert await repo.count_pooled_addresses("POOLTEST") == 2
+        assert await repo.get_next_hd_index("POOLTEST") == start + 3
+
+        second = await repo.claim_pooled_address("POOLTEST", fingerprint)
+        assert second.derivation_index == start + 1
+        assert second.address != claimed.address
+
+        assert await repo.discard_pooled_addresses("POOLTEST") == 1
+        assert await repo.claim_pooled_address("POOLTEST", fingerprint) is None
+
+    @pytest.mark.asyncio
+    async def test_address_pool_ignores_addresses_from_a_rotated_xpub(self, repo):
+        """Test addresses stored after a key rotation are never claimed, then discarded."""
+        from swaperex.hdwallet.base import SimulatedHDWallet
+
+        old = SimulatedHDWallet("POOLROT", xpub="sim_xpub_old")
+        new = SimulatedHDWallet("POOLROT", xpub="sim_xpub_new")
+        # A refill that started before the rotation stores its batch late
+        await repo.add_pooled_addresses("POOLROT", old.derive_range(0, 2), old.xpub_fingerprint)
+        await repo.add_pooled_addresses("POOLROT", new.derive_range(2, 1), new.xpub_fingerprint)
+
+        assert await repo.count_pooled_addresses("POOLROT", new.xpub_fingerprint) == 1
+        claimed = await repo.claim_pooled_address("POOLROT", new.xpub_fingerprint)
+        assert claimed.derivation_index == 2
+        assert await repo.claim_pooled_address("POOLROT", new.xpub_fingerprint) is None
+
+        assert await repo.discard_pooled_addresses("POOLROT", keep_fingerprint=new.xpub_fingerprint) == 2
+        assert await repo.count_pooled_addresses("POOLROT") == 0
+
+    @pytest.mark.asyncio
+    async def test_scan_cursors_only_move_forward(self, repo):
+        """Test scan cursors persist per address and never move backwards."""
+        await repo.save_scan_cursors("BTC", {"addr1": (100, "tx_a"), "addr2": (90, None)})
+        await repo.save_scan_cursors("BTC", {"addr1": (95, "tx_old"), "addr2": (120, "tx_b")})
+
+        cursors = await repo.get_scan_cursors("BTC")
+
+        assert cursors["addr1"].block_height == 100
+        assert cursors["addr1"].last_txid == "tx_a"
+        assert cursors["addr2"].block_height == 120
+        assert await repo.get_scan_cursors("ETH") == {}
+
+    @pytest.mark.asyncio
+    async def test_seen_transactions_warm_from_processed_table(self, repo):
+        """Test the scanner seen-set is warmed from processed_transactions."""
+        from swaperex.scanner.seen import SeenTransactions
+
+        for txid in ("warm_a", "warm_b"):
+            await repo.mark_transaction_processed(
+                chain="XMR", tx_hash=txid, amount=Decimal("1"), to_address="addr"
+            )
+
+        assert await repo.get_processed_tx_hashes("xmr") == ["warm_b", "warm_a"]
+
+        seen = SeenTransactions()
+        assert await seen.warm(repo, "XMR") == 2
+        assert "warm_a" in seen
+        assert "cold" not in seen
+
+    @pytest.mark.asyncio
+    async def test_address_index_tracks_new_addresses(self, repo):
+        """Test the scanner address index loads and picks up new addresses."""
+        from swaperex.scanner.address_index import DepositAddressIndex
+
+        user = await repo.get_or_create_user(telegram_id=918273645)
+        await repo.create_deposit_address(user.id, "DOGE", "0xAbCdEf0000000000000000000000000000000001")
+
+        index = DepositAddressIndex("DOGE")
+        assert await index.refresh(repo) >= 1
+        assert "0xabcdef0000000000000000000000000000000001" in index
+
+        other = await repo.get_or_create_user(telegram_id=918273646)
+        await repo.create_deposit_address(other.id, "DOGE", "DNewAddress1")
+        assert "DNewAddress1" not in index
+
+        assert await index.refresh(repo) == 1
+        assert "DNewAddress1" in index
+        assert "dnewaddress1" not in index
+
     @pytest.mark.asyncio
     async def test_credit_balance(self, repo):
         """Test crediting balance."""
@@ -547,6 +811,745 @@ class TestRouting:
             assert quote is not None, f"No quote for {from_asset}/{to_asset}"
 
 
+class TestBatchQuotes:
+    """Tests for batch quoting in the web quote service."""
+
+    @pytest.mark.asyncio
+    async def test_batch_deduplicates_upstream_calls(self):
+        """Test identical requests share one quote and results keep their index."""
+        from swaperex.web.contracts.quotes import BatchQuoteRequest, QuoteRequest
+        from swaperex.web.services.quote_service import QuoteService
+
+        service = QuoteService()
+        service._dry_run_router.get_quote = AsyncMock(
+            wraps=service._dry_run_router.get_quote
+        )
+        request = BatchQuoteRequest(quotes=[
+            QuoteRequest(from_asset="BTC", to_asset="ETH", amount=Decimal("1")),
+            QuoteRequest(from_asset="eth", to_asset="usdt", amount=Decimal("2")),
+            QuoteRequest(from_asset="btc", to_asset="eth", amount=Decimal("1.00")),
+        ])
+
+        response = await service.get_batch_quotes(request)
+
+        assert response.success
+        assert [r.index for r in response.results] == [0, 1, 2]
+        assert (response.total, response.unique) == (3, 2)
+        assert service._dry_run_router.get_quote.await_count == 2
+        assert response.results[0].quote == response.results[2].quote
+        assert response.results[1].quote.to_asset == "USDT"
+
+    @pytest.mark.asyncio
+    async def test_batch_endpoint_streams_ndjson_and_sse(self):
+        """Test the batch endpoint streams one line/event per request."""
+        import json
+
+        from fastapi import FastAPI
+        from httpx import ASGITransport, AsyncClient
+
+        from swaperex.web.controllers.quotes import router
+
+        app = FastAPI()
+        app.include_router(router)
+        body = {"quotes": [
+            {"from_asset": "BTC", "to_asset": "ETH", "amount": "1"},
+            {"from_asset": "SOL", "to_asset": "USDC", "amount": "3"},
+        ]}
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            ndjson = await client.post("/quotes/batch?format=ndjson", json=body)
+            sse = await client.post(
+                "/quotes/batch", json=body, headers={"Accept": "text/event-stream"}
+            )
+            too_big = await client.post(
+                "/quotes/batch", json={"quotes": body["quotes"] * 150}
+            )
+
+        assert ndjson.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in ndjson.text.splitlines()]
+        assert sorted(line["index"] for line in lines) == [0, 1]
+        assert all(line["quote"]["success"] for line in lines)
+
+        assert sse.headers["content-type"].startswith("text/event-stream")
+        assert sse.text.count("event: quote") == 2
+        assert sse.text.rstrip().endswith('data: {"total": 2}')
+        assert too_big.status_code == 400
+
+
+class TestQuoteStreams:
+    """Tests for shared quote subscriptions."""
+
+    @pytest.mark.asyncio
+    async def test_subscribers_share_one_loop_and_get_only_changes(self):
+        """Test equivalent subscriptions share a topic and unchanged quotes are not pushed."""
+        from swaperex.web.contracts.quotes import QuoteRequest, QuoteResponse
+        from swaperex.web.services.quote_stream import QuoteStreamHub
+
+        rates = iter(["2", "2", "3"])
+        calls = []
+
+        async def fetch(request):
+            calls.append(request)
+            rate = next(rates, "3")
+            return QuoteResponse(
+                success=True, from_asset="BTC", to_asset="ETH",
+                from_amount=request.amount, rate=Decimal(rate), expires_at=len(calls),
+            )
+
+        hub = QuoteStreamHub(fetchers={"quote": fetch}, interval=0.01)
+        a = hub.subscribe("quote", QuoteRequest(from_asset="BTC", to_asset="ETH", amount=Decimal("1")))
+        b = hub.subscribe("quote", QuoteRequest(from_asset="btc", to_asset="eth", amount=Decimal("1.0")))
+
+        first_a, first_b = await a.next(timeout=1), await b.next(timeout=1)
+        second = await a.next(timeout=1)
+
+        assert first_a == first_b and first_a["rate"] == "2"
+        assert second["rate"] == "3"  # the unchanged second fetch was not pushed
+        assert hub.stats()["topics"] == 1 and hub.stats()["subscribers"] == 2
+        assert len(calls) >= 3
+
+        a.close()
+        b.close()
+        await asyncio.sleep(0.03)
+        fetched = len(calls)
+        await asyncio.sleep(0.03)
+        assert len(calls) == fetched
+        assert hub.stats()["topics"] == 0
+
+    @pytest.mark.asyncio
+    async def test_closing_hub_stops_refresh_loops(self):
+        """Test shutdown stops every topic loop and drops the shared hub."""
+        from swaperex.web.contracts.quotes import QuoteRequest, QuoteResponse
+        from swaperex.web.services import quote_stream
+
+        calls = []
+
+        async def fetch(request):
+            calls.append(request)
+            return QuoteResponse(
+                success=True, from_asset="BTC", to_asset="ETH",
+                from_amount=request.amount, rate=Decimal(len(calls)),
+            )
+
+        hub = quote_stream.QuoteStreamHub(fetchers={"quote": fetch}, interval=0.01)
+        quote_stream._hub = hub
+        subscription = hub.subscribe(
+            "quote", QuoteRequest(from_asset="BTC", to_asset="ETH", amount=Decimal("1"))
+        )
+        assert await subscription.next(timeout=1) is not None
+
+        await quote_stream.close_quote_stream_hub()
+        fetched = len(calls)
+        await asyncio.sleep(0.03)
+
+        assert len(calls) == fetched
+        assert hub.stats()["topics"] == 0
+        assert quote_stream._hub is None
+
+    @pytest.mark.asyncio
+    async def test_topic_limit_rejects_new_streams_only(self):
+        """Test max_topics caps distinct topics while existing ones stay joinable."""
+        from fastapi import FastAPI
+        from httpx import ASGITransport, AsyncClient
+
+        from swaperex.web.contracts.quotes import QuoteRequest, QuoteResponse
+        from swaperex.web.controllers.streams import router
+        from swaperex.web.services import quote_stream
+
+        async def fetch(request):
+            return QuoteResponse(
+                success=True, from_asset=request.from_asset, to_asset=request.to_asset,
+                from_amount=request.amount, rate=Decimal("2"),
+            )
+
+        hub = quote_stream.QuoteStreamHub(fetchers={"quote": fetch}, max_topics=1)
+        btc_eth = QuoteRequest(from_asset="BTC", to_asset="ETH", amount=Decimal("1"))
+        btc_sol = QuoteRequest(from_asset="BTC", to_asset="SOL", amount=Decimal("1"))
+        app = FastAPI()
+        app.include_router(router)
+        quote_stream._hub = hub
+        try:
+            first = hub.subscribe("quote", btc_eth)
+            second = hub.subscribe("quote", btc_eth)
+            assert not hub.has_room("quote", btc_sol)
+            with pytest.raises(quote_stream.TopicLimitError):
+                hub.subscribe("quote", btc_sol)
+
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.get(
+                    "/stream/quotes", params={"from_asset": "BTC", "to_asset": "SOL", "amount": "1"}
+                )
+            assert response.status_code == 503
+            assert hub.stats()["subscribers"] == 2
+        finally:
+            first.close()
+            second.close()
+            await hub.close()
+            quote_stream.reset_quote_stream_hub()
+
+    def test_websocket_subscribe_and_unsubscribe(self):
+        """Test the WebSocket endpoint multiplexes subscriptions."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from swaperex.web.controllers.streams import router
+        from swaperex.web.services.quote_stream import reset_quote_stream_hub
+
+        app = FastAPI()
+        app.include_router(router)
+        reset_quote_stream_hub()
+        try:
+            with TestClient(app).websocket_connect("/stream/ws") as ws:
+                ws.send_json({
+                    "action": "subscribe", "type": "quote", "id": "btc-eth",
+                    "request": {"from_asset": "BTC", "to_asset": "ETH", "amount": "1"},
+                })
+                assert ws.receive_json() == {"type": "subscribed", "id": "btc-eth"}
+                update = ws.receive_json()
+                assert update["type"] == "update" and update["id"] == "btc-eth"
+                assert update["data"]["success"] and update["data"]["to_asset"] == "ETH"
+
+                ws.send_json({"action": "subscribe", "type": "nope", "id": "x"})
+                assert ws.receive_json()["type"] == "error"
+
+                ws.send_text("not json")
+                assert ws.receive_json() == {
+                    "type": "error", "id": None, "error": "Expected a JSON message",
+                }
+
+                ws.send_json({"action": "unsubscribe", "id": "btc-eth"})
+                assert ws.receive_json() == {"type": "unsubscribed", "id": "btc-eth"}
+        finally:
+            reset_quote_stream_hub()
+
+
+class TestHTTPPool:
+    """Tests for the shared pooled HTTP client registry."""
+
+    @pytest.mark.asyncio
+    async def test_registry_reuses_client_per_origin(self):
+        """Test requests to the same origin share one pooled client."""
+        from swaperex.utils.http import close_http_clients, get_http_registry
+
+        registry = get_http_registry()
+        a = registry.client_for("https://api.example.com/v1/quote")
+        b = registry.client_for("https://API.example.com/v2/other?x=1")
+        c = registry.client_for("https://rpc.example.org/")
+
+        assert a is b
+        assert a is not c
+        assert get_http_registry() is registry
+        assert set(registry.origins) == {"https://api.example.com", "https://rpc.example.org"}
+
+        await close_http_clients()
+
+        assert a.is_closed and c.is_closed
+        assert get_http_registry() is not registry
+        await close_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_pooled_client_applies_default_timeout(self):
+        """Test the facade passes its timeout through to the pooled client."""
+        from swaperex.utils.http import close_http_clients, get_http_registry, pooled_client
+
+        registry = get_http_registry()
+        inner = registry.client_for("https://api.example.com")
+        inner.request = AsyncMock(return_value="ok")
+
+        async with pooled_client(timeout=7.0) as client:
+            result = await client.get("https://api.example.com/x", params={"a": 1})
+
+        assert result == "ok"
+        inner.request.assert_awaited_once_with(
+            "GET", "https://api.example.com/x", params={"a": 1}, timeout=7.0
+        )
+        await close_http_clients()
+
+
+class _FakePriceSource:
+    """Price source returning fixed prices, optionally pushing once."""
+
+    def __init__(self, name, prices, push=None):
+        self.name = name
+        self.prices = prices
+        self.push = push
+        self.supports_push = push is not None
+        self.fetches = 0
+
+    async def fetch(self):
+        self.fetches += 1
+        return self.prices
+
+    async def stream(self, publish):
+        publish(self.push)
+        await asyncio.sleep(3600)
+
+
+class TestPriceOracle:
+    """Tests for the shared USD price oracle."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_updates_prices_and_staleness(self):
+        """Test polled prices replace stale seeds and views keep overrides."""
+        from swaperex.prices import PriceOracle, PriceView
+
+        source = _FakePriceSource("fake", {"BTC": Decimal("50000"), "ETH": Decimal("0")})
+        oracle = PriceOracle(sources=[source], max_age=60)
+
+        assert oracle.get_price("BTC") == Decimal("100000.00")
+        assert oracle.get_fresh_price("BTC") is None
+        assert oracle.is_stale("BTC")
+
+        assert await oracle.refresh() == 1
+
+        assert oracle.get_fresh_price("btc") == Decimal("50000")
+        assert oracle.get("BTC").source == "fake"
+        assert oracle.get("ETH").source == "seed"  # non-positive prices ignored
+        report = {p["symbol"]: p for p in oracle.staleness()}
+        assert not report["BTC"]["stale"] and report["ETH"]["stale"]
+        assert oracle.usd_value("BTC", Decimal("2")) == Decimal("100000")
+
+        view = PriceView(oracle)
+        view["BTC"] = Decimal("1")
+        assert view.get("BTC") == Decimal("1")
+        assert oracle.get_price("BTC") == Decimal("50000")
+        assert "ETH" in view and "NOPE" not in view
+
+    @pytest.mark.asyncio
+    async def test_push_source_is_not_polled_while_streaming(self):
+        """Test streamed prices land in the table and skip the next poll."""
+        from swaperex.prices import PriceOracle
+
+        pushed = _FakePriceSource("stream", {"SOL": Decimal("1")}, push={"SOL": Decimal("200")})
+        polled = _FakePriceSource("poll", {"TRX": Decimal("0.3")})
+        oracle = PriceOracle(sources=[pushed, polled], refresh_interval=30)
+
+        await oracle.start()
+        await asyncio.sleep(0)
+        try:
+            assert oracle.running
+            assert oracle.get_price("SOL") == Decimal("200")
+            assert oracle.get("SOL").source == "stream"
+
+            await oracle.refresh()
+            assert pushed.fetches == 1  # only the initial poll
+            assert polled.fetches == 2
+        finally:
+            await oracle.stop()
+        assert not oracle.running
+
+
+def _encode_aggregate3_result(results):
+    """ABI-encode a (bool, bytes)[] aggregate3 return value."""
+
+    def word(value: int) -> bytes:
+        return value.to_bytes(32, "big")
+
+    tails = []
+    for success, data in results:
+        padded = data + b"\x00" * (-len(data) % 32)
+        tails.append(word(int(success)) + word(64) + word(len(data)) + padded)
+    heads, offset = b"", 32 * len(results)
+    for tail in tails:
+        heads += word(offset)
+        offset += len(tail)
+    return "0x" + (word(32) + word(len(results)) + heads + b"".join(tails)).hex()
+
+
+class _FakeRPCResponse:
+    def __init__(self, payload, status_code=200):
+        self._payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self._payload
+
+
+class TestEVMBalanceEngine:
+    """Tests for batched EVM balance reads."""
+
+    WALLET = "0x" + "ab" * 20
+    TOKEN_A = "0x" + "11" * 20
+    TOKEN_B = "0x" + "22" * 20
+
+    @pytest.mark.asyncio
+    async def test_multicall_reads_all_balances_in_one_call(self):
+        """Test native + token balances come back from a single aggregate3 call."""
+        from swaperex.utils.evm_balances import EVMBalanceEngine
+
+        posts = []
+
+        async def fake_post(url, json):
+            posts.append(json)
+            return _FakeRPCResponse({
+                "jsonrpc": "2.0",
+                "id": 1,
+                "result": _encode_aggregate3_result([
+                    (True, (5 * 10**18).to_bytes(32, "big")),
+                    (True, (1234).to_bytes(32, "big")),
+                    (False, b""),
+                ]),
+            })
+
+        client = MagicMock(post=fake_post)
+        with patch("swaperex.utils.evm_balances.pooled_client") as pooled:
+            pooled.return_value.__aenter__.return_value = client
+            engine = EVMBalanceEngine("https://rpc.example")
+            result = await engine.get_balances([self.WALLET], [self.TOKEN_A, self.TOKEN_B])
+
+        assert len(posts) == 1
+        assert posts[0]["params"][0]["to"] == engine.multicall_address
+        assert result.method == "multicall3"
+        assert result.round_trips == 1
+        assert result.get(self.WALLET) == 5 * 10**18
+        assert result.get(self.WALLET, self.TOKEN_A) == 1234
+        assert result.get(self.WALLET, self.TOKEN_B) is None
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_rpc_batch(self):
+        """Test a failed aggregate3 call falls back to one JSON-RPC batch."""
+        from swaperex.utils.evm_balances import EVMBalanceEngine
+
+        async def fake_post(url, json):
+            if isinstance(json, dict):
+                return _FakeRPCResponse({"jsonrpc": "2.0", "id": 1, "error": {"code": -32000}})
+            return _FakeRPCResponse([
+                {"jsonrpc": "2.0", "id": req["id"], "result": hex(100 + req["id"])}
+                for req in reversed(json)
+            ])
+
+        client = MagicMock(post=fake_post)
+        with patch("swaperex.utils.evm_balances.pooled_client") as pooled:
+            pooled.return_value.__aenter__.return_value = client
+            engine = EVMBalanceEngine("https://rpc.example")
+            result = await engine.get_balances([self.WALLET], [self.TOKEN_A])
+
+        assert result.method == "rpc_batch"
+        assert result.round_trips == 1
+        assert result.get(self.WALLET) == 100
+        assert result.get(self.WALLET, self.TOKEN_A) == 101
+
+    @pytest.mark.asyncio
+    async def test_web_balances_read_from_rpc_outside_dry_run(self):
+        """Test the web balance service reads the chain when dry-run is off."""
+        from swaperex.utils.evm_balances import NATIVE, BalanceBatchResult
+        from swaperex.web.contracts.balances import WalletBalanceRequest
+        from swaperex.web.services.balance_service import TOKEN_CONTRACTS, BalanceService
+
+        usdt = TOKEN_CONTRACTS["ethereum"]["USDT"]["address"]
+        result = BalanceBatchResult(balances={
+            self.WALLET: {NATIVE: 2 * 10**18, usdt.lower(): 5 * 10**6},
+        })
+        settings = MagicMock(dry_run=False)
+
+        with (
+            patch("swaperex.web.services.balance_service.get_settings", return_value=settings),
+            patch("swaperex.web.services.balance_service.EVMBalanceEngine") as engine,
+        ):
+            engine.return_value.get_balances = AsyncMock(return_value=result)
+            response = await BalanceService().get_wallet_balance(
+                WalletBalanceRequest(address=self.WALLET, chain="ethereum", token_list=["USDT"])
+            )
+
+        engine.return_value.get_balances.assert_awaited_once_with([self.WALLET], [usdt])
+        assert response.success
+        assert response.native_balance.balance == Decimal("2")
+        assert [(t.symbol, t.balance) for t in response.token_balances] == [("USDT", Decimal("5"))]
+
+
+class TestIncrementalScan:
+    """Tests for cursor-based deposit scanning."""
+
+    @pytest.mark.asyncio
+    async def test_scan_once_uses_cursors_and_one_tip_lookup(self):
+        """Test each address is fetched from its cursor and the tip is read once."""
+        from swaperex.scanner.base import SimulatedScanner
+        from swaperex.scanner.runner import DepositScannerRunner
+
+        scanner = SimulatedScanner("BTC")
+        scanner._block_height = 1000
+        scanner.add_simulated_deposit("addr_new", Decimal("0.1"), txid="tx_new")
+        scanner.get_current_block_height = AsyncMock(return_value=1000)
+
+        calls = {}
+        original = scanner.get_address_transactions
+
+        async def recording_fetch(address, min_confirmations=1, since_block=None, current_block=None):
+            calls[address] = (since_block, current_block)
+            return await original(address, min_confirmations, since_block, current_block)
+
+        scanner.get_address_transactions = recording_fetch
+
+        with patch("swaperex.scanner.runner.get_scanner", return_value=scanner):
+            runner = DepositScannerRunner("BTC", min_confirmations=2)
+
+        runner.get_addresses_to_scan = AsyncMock(return_value=["addr_known", "addr_new"])
+        runner.load_cursors = AsyncMock(return_value={"addr_known": 990})
+        runner.save_cursors = AsyncMock()
+        runner.process_deposits = AsyncMock(return_value=1)
+
+        processed = await runner.scan_once()
+
+        assert processed == 1
+        [batch] = runner.process_deposits.await_args.args
+        assert [tx.txid for tx in batch] == ["tx_new"]
+        assert scanner.get_current_block_height.await_count == 1
+        assert calls["addr_known"] == (991, 1000)
+        assert calls["addr_new"] == (None, 1000)
+        runner.save_cursors.assert_awaited_once_with({
+            "addr_known": (998, None),
+            "addr_new": (998, "tx_new"),
+        })
+
+    @pytest.mark.asyncio
+    async def test_incomplete_fetches_hold_cursors_back(self):
+        """Test failed or truncated fetches don't advance past unread blocks."""
+        from swaperex.scanner.base import ScanIncompleteError, SimulatedScanner, TransactionInfo
+        from swaperex.scanner.runner import DepositScannerRunner
+
+        scanner = SimulatedScanner("BTC")
+        scanner.get_current_block_height = AsyncMock(return_value=1000)
+        partial = TransactionInfo("tx_partial", "BTC", "addr_truncated", Decimal("1"), 50, 950)
+
+        async def fetch(address, min_confirmations=1, since_block=None, current_block=None):
+            if address == "addr_down":
+                raise ScanIncompleteError("Etherscan API error: 502")
+            if address == "addr_truncated":
+                raise ScanIncompleteError("More than 50", [partial], complete_height=949)
+            if address == "addr_deep":
+                raise ScanIncompleteError("History exceeds 20 pages", [partial])
+            return []
+
+        scanner.get_address_transactions = fetch
+
+        with patch("swaperex.scanner.runner.get_scanner", return_value=scanner):
+            runner = DepositScannerRunner("BTC", min_confirmations=2)
+
+        runner.get_addresses_to_scan = AsyncMock(
+            return_value=["addr_down", "addr_truncated", "addr_deep", "addr_quiet"]
+        )
+        runner.load_cursors = AsyncMock(return_value={"addr_down": 900, "addr_deep": 900})
+        runner.save_cursors = AsyncMock()
+        runner.process_deposits = AsyncMock(return_value=2)
+
+        await runner.scan_once()
+
+        [batch] = runner.process_deposits.await_args.args
+        assert [tx.txid for tx in batch] == ["tx_partial", "tx_partial"]
+        runner.save_cursors.assert_awaited_once_with({
+            "addr_truncated": (949, "tx_partial"),
+            "addr_quiet": (998, None),
+        })
+
+
+class TestSeenTransactions:
+    """Tests for the bounded processed-transaction set."""
+
+    def test_lru_keeps_most_recent_txids(self):
+        """Test the set stays bounded and evicts the least recently seen txid."""
+        from swaperex.scanner.seen import SeenTransactions
+
+        seen = SeenTransactions(lru_size=2)
+        seen.update(["tx1", "tx2"])
+        assert "tx1" in seen  # refreshes tx1, so tx2 is now the oldest
+        seen.add("tx3")
+
+        assert len(seen) == 2
+        assert "tx1" in seen
+        assert "tx3" in seen
+        assert "tx2" not in seen
+        assert "never_seen" not in seen
+
+
+class TestScanScheduler:
+    """Tests for concurrent, rate-limited address scanning."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_backs_off_and_retries(self):
+        """Test a 429 halves the bucket rate and the request is retried."""
+        from swaperex.scanner.base import SimulatedScanner
+        from swaperex.utils.rate_limit import TokenBucket
+
+        responses = [
+            MagicMock(status_code=429, headers={"Retry-After": "0"}),
+            MagicMock(status_code=200, headers={}),
+        ]
+        client = MagicMock()
+        client.request = AsyncMock(side_effect=responses)
+
+        scanner = SimulatedScanner("BTC")
+        scanner._rate_limiter = TokenBucket(rate=100.0)
+
+        response = await scanner._request(client, "GET", "https://example.invalid/txs")
+
+        assert response.status_code == 200
+        assert client.request.await_count == 2
+        assert scanner.rate_limiter.throttled == 1
+        assert scanner.rate_limiter.rate < 100.0
+
+    @pytest.mark.asyncio
+    async def test_scan_concurrently_bounds_in_flight_lookups(self):
+        """Test lookups overlap but never exceed the concurrency cap."""
+        from swaperex.scanner.scheduler import scan_concurrently
+
+        in_flight = 0
+        peak = 0
+
+        async def lookup(address):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if address == "bad":
+                raise RuntimeError("boom")
+            return address.upper()
+
+        addresses = [f"a{i}" for i in range(10)] + ["bad"]
+        results = await scan_concurrently(addresses, lookup, concurrency=3)
+
+        assert peak == 3
+        assert [address for address, _ in results] == addresses
+        assert results[0][1] == "A0"
+        assert isinstance(results[-1][1], RuntimeError)
+
+    def test_priority_puts_active_and_fresh_addresses_first(self):
+        """Test recently active and newly issued addresses are scanned first."""
+        import time
+        from datetime import datetime, timedelta
+
+        from swaperex.scanner.scheduler import ScanPriority
+
+        priority = ScanPriority(hot_window=3600)
+        priority.mark_issued("fresh", datetime.utcnow() - timedelta(minutes=5))
+        priority.mark_issued("old", datetime.utcnow() - timedelta(days=30))
+        priority.mark_active("active", time.time())
+
+        ordered = priority.order(["old", "idle", "fresh", "active"])
+
+        assert ordered == ["active", "fresh", "old", "idle"]
+
+
+class TestBlockScanner:
+    """Tests for block-driven deposit detection."""
+
+    class FakeBlockSource:
+        def __init__(self, tip, transfers):
+            self.tip = tip
+            self.transfers = transfers
+            self.ranges = []
+
+        async def get_tip_height(self):
+            return self.tip
+
+        async def get_transfers(self, from_height, to_height):
+            self.ranges.append((from_height, to_height))
+            return [t for t in self.transfers if from_height <= t.block_height <= to_height]
+
+        async def verify(self, transfers):
+            return transfers
+
+    @pytest.mark.asyncio
+    async def test_walks_confirmed_blocks_and_matches_index(self):
+        """Test only confirmed blocks are walked and outputs to us are merged per tx."""
+        from swaperex.scanner.address_index import DepositAddressIndex
+        from swaperex.scanner.blocks import BlockScanner, BlockTransfer
+
+        index = DepositAddressIndex("BTC")
+        index.add("bc1qours")
+
+        transfers = [
+            BlockTransfer("tx1", "BC1QOURS", Decimal("0.1"), 101),
+            BlockTransfer("tx1", "bc1qours", Decimal("0.2"), 101),
+            BlockTransfer("tx2", "bc1qsomeoneelse", Decimal("5"), 102),
+            BlockTransfer("tx3", "bc1qours", Decimal("1"), 104),
+        ]
+        source = self.FakeBlockSource(tip=104, transfers=transfers)
+        scanner = BlockScanner("BTC", source, index, min_confirmations=2, max_blocks_per_cycle=10)
+
+        result = await scanner.scan(last_height=100)
+
+        assert source.ranges == [(101, 103)]
+        assert result.to_height == 103
+        assert result.transfers_seen == 3
+        assert len(result.transactions) == 1
+        tx = result.transactions[0]
+        assert tx.txid == "tx1"
+        assert tx.amount == Decimal("0.3")
+        assert tx.confirmations == 4
+
+        # Caught up: nothing more is walked until new blocks confirm
+        assert (await scanner.scan(last_height=103)).to_height is None
+
+    def test_tron_trc20_transfer_is_decoded(self):
+        """Test a TRC-20 transfer() call is parsed into a transfer to the recipient."""
+        from swaperex.scanner.blocks import TronBlockSource, tron_base58_to_hex, tron_hex_to_base58
+
+        contract = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+        recipient = "TG3XXyExBkPp9nzdajDZsozEu4BkaSJozs"
+        source = TronBlockSource("https://api.trongrid.io", "USDT-TRC20", token_contract=contract)
+
+        data = "a9059cbb" + tron_base58_to_hex(recipient)[2:].rjust(64, "0") + format(2_500_000, "064x")
+        tx = {
+            "txID": "abc",
+            "ret": [{"contractRet": "SUCCESS"}],
+            "raw_data": {"contract": [{
+                "type": "TriggerSmartContract",
+                "parameter": {"value": {
+                    "data": data,
+                    "owner_address": tron_base58_to_hex(recipient),
+                    "contract_address": tron_base58_to_hex(contract),
+                }},
+            }]},
+        }
+
+        transfer = source._parse_transaction(tx, 500)
+
+        assert transfer.to_address == recipient
+        assert transfer.amount == Decimal("2.5")
+        assert tron_hex_to_base58(tron_base58_to_hex(contract)) == contract
+
+        tx["ret"] = [{"contractRet": "REVERT"}]
+        assert source._parse_transaction(tx, 500) is None
+
+
+class TestKeyStore:
+    """Tests for the cached seed key store."""
+
+    MNEMONIC = (
+        "abandon abandon abandon abandon abandon abandon "
+        "abandon abandon abandon abandon abandon about"
+    )
+
+    def test_derivation_is_cached(self):
+        """Test the seed is derived once and addresses are memoised."""
+        from swaperex.services.key_store import get_key_store, wipe_key_stores
+
+        try:
+            store = get_key_store(self.MNEMONIC)
+            assert get_key_store(self.MNEMONIC) is store
+
+            assert store.evm_address(0) == "0x9858EfFD232B4033E47d90003D41EC34EcaEda94"
+            assert store.evm_address(0) is store.evm_address(0)
+            assert len(store.evm_private_key(0)) == 32
+            assert store.evm_address(1) != store.evm_address(0)
+        finally:
+            wipe_key_stores()
+
+    def test_wipe_clears_store(self):
+        """Test a wiped store refuses further derivations."""
+        from swaperex.services.key_store import get_key_store, wipe_key_stores
+
+        store = get_key_store(self.MNEMONIC)
+        store.evm_address(0)
+        wipe_key_stores()
+
+        with pytest.raises(RuntimeError):
+            store.evm_address(0)
+        assert get_key_store(self.MNEMONIC) is not store
+        wipe_key_stores()
+
+
 class TestAPI:
     """Additional API tests."""
 
@@ -102,6 +102,39 @@ class TestBalanceOperations:
         assert balance.locked_amount == Decimal("0")
         assert balance.available == Decimal("100")
 
+    @pytest.mark.asyncio
+    async def test_mutations_check_the_stored_balance(
+        self, ledger_repo: LedgerRepository, db_session, db_engine
+    ):
+        """Test balance changes are single statements checked against the database row."""
+        from sqlalchemy import event, update
+
+        from swaperex.ledger.models import Balance
+
+        user = await ledger_repo.get_or_create_user(telegram_id=666666)
+        await db_session.flush()
+        balance = await ledger_repo.credit_balance(user.id, "TRX", Decimal("10"))
+
+        # Another process spends most of it behind this session's back
+        await db_session.execute(
+            update(Balance).where(Balance.id == balance.id).values(amount=Decimal("2")),
+            execution_options={"synchronize_session": False},
+        )
+        assert balance.available == Decimal("10")  # stale in-memory copy
+
+        statements = []
+        event.listen(
+            db_engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+        )
+        with pytest.raises(ValueError, match="Insufficient available balance"):
+            await ledger_repo.lock_balance(user.id, "TRX", Decimal("5"))
+
+        statements.clear()
+        balance = await ledger_repo.debit_balance(user.id, "TRX", Decimal("2"))
+
+        assert len(statements) == 1
+        assert balance.amount == Decimal("0")
+
 
 class TestDepositOperations:
     """Tests for deposit operations."""
@@ -161,6 +194,64 @@ class TestDepositOperations:
         balance = await ledger_repo.get_balance(user.id, "BTC")
         assert balance.amount == Decimal("0.5")
 
+    @pytest.mark.asyncio
+    async def test_ingest_deposits_batch(
+        self, ledger_repo: LedgerRepository, db_session, db_engine
+    ):
+        """Test a 500-deposit batch takes a few statements and is idempotent."""
+        from sqlalchemy import event, insert
+
+        from swaperex.ledger.models import DepositAddress, User
+        from swaperex.ledger.repository import IngestedDeposit
+        from swaperex.scanner.base import TransactionInfo
+
+        users = 50
+        await db_session.execute(
+            insert(User), [{"id": i + 1, "telegram_id": 20_000 + i} for i in range(users)]
+        )
+        await db_session.execute(insert(DepositAddress), [
+            {"user_id": i + 1, "asset": "BTC", "address": f"bc1q{i}"} for i in range(users)
+        ])
+        await ledger_repo.mark_transaction_processed("BTC", "tx0", Decimal("1"), "bc1q0")
+
+        txs = [
+            TransactionInfo(
+                txid=f"tx{i}", asset="BTC", to_address=f"bc1q{i % users}",
+                amount=Decimal("0.25"), confirmations=1 if i == 1 else 6,
+            )
+            for i in range(497)
+        ]
+        txs.append(TransactionInfo("tx2", "BTC", "bc1q2", Decimal("0.25"), 6))  # repeat
+        txs.append(TransactionInfo("tx_unknown", "BTC", "bc1qnobody", Decimal("1"), 6))
+        txs.append(TransactionInfo("tx_unknown2", "BTC", "bc1qnobody", Decimal("1"), 6))
+
+        statements = []
+        capture = lambda *args: statements.append(args[2])  # noqa: E731
+        event.listen(db_engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            results = await ledger_repo.ingest_deposits(txs, min_confirmations=2)
+        finally:
+            event.remove(db_engine.sync_engine, "before_cursor_execute", capture)
+
+        assert len(statements) <= 6
+        statuses = [r.status for r in results]
+        assert statuses[0] == IngestedDeposit.DUPLICATE
+        assert statuses[1] == IngestedDeposit.PENDING
+        assert statuses[2:497] == [IngestedDeposit.CREDITED] * 495
+        assert results[497].status == IngestedDeposit.DUPLICATE
+        assert results[497].deposit_id == results[2].deposit_id is not None
+        assert statuses[498:] == [IngestedDeposit.UNKNOWN_ADDRESS] * 2
+        assert results[2].telegram_id == 20_002
+
+        # User 1 got tx0 (already processed), tx50, ..., tx450; user 2 had tx1 pending
+        assert (await ledger_repo.get_balance(1, "BTC")).amount == Decimal("2.25")
+        assert (await ledger_repo.get_balance(2, "BTC")).amount == Decimal("2.25")
+        assert (await ledger_repo.get_balance(3, "BTC")).amount == Decimal("2.5")
+
+        again = await ledger_repo.ingest_deposits(txs, min_confirmations=2)
+        assert {r.status for r in again[:498]} == {IngestedDeposit.DUPLICATE}
+        assert (await ledger_repo.get_balance(3, "BTC")).amount == Decimal("2.5")
+
 
 class TestSwapOperations:
     """Tests for swap operations."""
@@ -257,3 +348,204 @@ class TestSwapOperations:
         balance = await ledger_repo.get_balance(user.id, "BTC")
         assert balance.locked_amount == Decimal("0")
         assert balance.available == Decimal("1.0")
+
+    @pytest.mark.asyncio
+    async def test_popular_swap_pairs(self, ledger_repo: LedgerRepository, db_session):
+        """Test pairs are ranked by swap count per route."""
+        user = await ledger_repo.get_or_create_user(telegram_id=2222222)
+        await db_session.flush()
+
+        for from_asset, to_asset, route in [
+            ("BNB", "USDT", "1inch (bsc)"),
+            ("SOL", "USDC", "jupiter"),
+            ("BNB", "USDT", "1inch (bsc)"),
+        ]:
+            await ledger_repo.create_swap(
+                user_id=user.id,
+                from_asset=from_asset,
+                to_asset=to_asset,
+                from_amount=Decimal("1"),
+                expected_to_amount=Decimal("1"),
+                route=route,
+                fee_asset="USD",
+                fee_amount=Decimal("0"),
+                skip_balance_lock=True,
+            )
+        await db_session.flush()
+
+        pairs = await ledger_repo.get_popular_swap_pairs(limit=5)
+
+        assert pairs == [("BNB", "USDT", "1inch (bsc)", 2), ("SOL", "USDC", "jupiter", 1)]
+
+
+class TestQueryPlans:
+    """Hot ledger queries must keep using their indexes."""
+
+    @staticmethod
+    async def _seed(db_session, rows: int = 20000):
+        """Insert a large ledger with a realistic status mix."""
+        from datetime import datetime, timedelta, timezone
+
+        from sqlalchemy import insert, text
+
+        from swaperex.ledger.models import Deposit, DepositAddress, Swap, User, Withdrawal
+
+        users = 200
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        withdrawal_statuses = ["completed"] * 40 + ["failed"] * 5 + ["pending", "broadcast", "confirming"]
+
+        await db_session.execute(
+            insert(User), [{"id": i + 1, "telegram_id": 10_000 + i} for i in range(users)]
+        )
+        await db_session.execute(insert(Swap), [
+            {
+                "user_id": i % users + 1, "from_asset": "BNB", "to_asset": "USDT",
+                "from_amount": 1, "expected_to_amount": 1, "route": "1inch (bsc)",
+                "fee_asset": "USD", "fee_amount": 0, "status": "completed",
+                "created_at": start + timedelta(minutes=i),
+            }
+            for i in range(rows)
+        ])
+        await db_session.execute(insert(Deposit), [
+            {
+                "user_id": i % users + 1, "asset": "BTC", "amount": 1, "to_address": f"addr{i}",
+                "status": "confirmed", "created_at": start + timedelta(minutes=i),
+            }
+            for i in range(rows)
+        ])
+        await db_session.execute(insert(Withdrawal), [
+            {
+                "user_id": i % users + 1, "asset": "ETH", "amount": 1, "fee_amount": 0,
+                "net_amount": 1, "destination_address": f"dest{i}",
+                "status": withdrawal_statuses[i % len(withdrawal_statuses)],
+                "created_at": start + timedelta(minutes=i),
+                "broadcast_at": start + timedelta(minutes=i + 1),
+            }
+            for i in range(rows)
+        ])
+        await db_session.execute(insert(DepositAddress), [
+            {
+                "user_id": i % users + 1, "asset": ["BTC", "ETH", "TRX", "SOL"][i // users % 4],
+                "address": f"deposit{i}", "status": "active" if i % 10 else "unused",
+            }
+            for i in range(users * 4)
+        ])
+        await db_session.execute(text("ANALYZE"))
+
+    @pytest.mark.asyncio
+    async def test_hot_queries_use_indexes(self, ledger_repo: LedgerRepository, db_session, db_engine):
+        """Test history, withdrawal queue and scanner queries avoid scans and sorts."""
+        from sqlalchemy import event
+
+        await self._seed(db_session)
+
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(db_engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            expected = {
+                "ix_swaps_user_created": ledger_repo.get_user_swaps(7),
+                "ix_deposits_user_created": ledger_repo.get_user_deposits(7),
+                "ix_withdrawals_user_created": ledger_repo.get_user_withdrawals(7),
+                "ix_withdrawals_pending_created": ledger_repo.get_pending_withdrawals(),
+                "ix_withdrawals_confirming_broadcast": ledger_repo.get_confirming_withdrawals(),
+                "ix_deposit_addresses_active_asset": ledger_repo.get_all_active_deposit_addresses(
+                    "ETH", after_id=0
+                ),
+            }
+            for index_name, query in expected.items():
+                statements.clear()
+                await query
+                statement, parameters = statements[-1]
+                conn = await db_session.connection()
+                plan = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+                details = [row[-1] for row in plan.all()]
+
+                assert any(index_name in d for d in details), (index_name, details)
+                assert not any(d.startswith("SCAN") and "INDEX" not in d for d in details), details
+                assert not any("TEMP B-TREE" in d for d in details), details
+        finally:
+            event.remove(db_engine.sync_engine, "before_cursor_execute", capture)
+
+    @pytest.mark.asyncio
+    async def test_missing_indexes_are_created(self, db_engine):
+        """Test indexes added to models are created on existing tables."""
+        from sqlalchemy import inspect, text
+
+        from swaperex.ledger.database import ensure_indexes
+
+        async with db_engine.begin() as conn:
+            await conn.execute(text("DROP INDEX ix_withdrawals_pending_created"))
+
+        created = await ensure_indexes(db_engine)
+
+        async with db_engine.connect() as conn:
+            indexes = await conn.run_sync(
+                lambda sync_conn: {ix["name"] for ix in inspect(sync_conn).get_indexes("withdrawals")}
+            )
+        assert await ensure_indexes(db_engine) == []
+        assert created == ["ix_withdrawals_pending_created"]
+        assert "ix_withdrawals_pending_created" in indexes
+
+    def test_postgresql_indexes_are_built_concurrently(self):
+        """Test index DDL on PostgreSQL does not lock the table and tolerates reruns."""
+        from sqlalchemy.dialects import postgresql
+
+        from swaperex.ledger.database import _create_index_sql
+        from swaperex.ledger.models import Withdrawal
+
+        index = next(
+            ix for ix in Withdrawal.__table__.indexes if ix.name == "ix_withdrawals_pending_created"
+        )
+        sql = _create_index_sql(index, postgresql.dialect())
+
+        assert sql.startswith(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_withdrawals_pending_created ON withdrawals"
+        )
+        assert "WHERE status = 'pending'" in sql
+
+
+class TestEngineProfile:
+    """Tests for database engine tuning."""
+
+    @pytest.mark.asyncio
+    async def test_sqlite_file_engine_is_tuned(self, tmp_path):
+        """Test file-backed SQLite gets WAL, NORMAL sync, busy timeout and a sized pool."""
+        from sqlalchemy import text
+
+        from swaperex.ledger.engine import EngineProfile, create_engine
+
+        engine = create_engine(
+            f"sqlite:///{tmp_path}/ledger.db", EngineProfile(pool_size=4, max_overflow=2)
+        )
+        try:
+            async with engine.connect() as conn:
+                journal_mode = await conn.scalar(text("PRAGMA journal_mode"))
+                synchronous = await conn.scalar(text("PRAGMA synchronous"))
+                busy_timeout = await conn.scalar(text("PRAGMA busy_timeout"))
+
+            assert journal_mode == "wal"
+            assert synchronous == 1  # NORMAL
+            assert busy_timeout == 5000
+            assert engine.pool.size() == 4
+        finally:
+            await engine.dispose()
+
+    def test_engine_options_per_dialect(self):
+        """Test pool options are skipped for in-memory SQLite and asyncpg caches statements."""
+        from swaperex.ledger.engine import EngineProfile, engine_options, normalize_url
+
+        profile = EngineProfile(statement_cache_size=0)
+
+        _, memory = engine_options(normalize_url("sqlite:///:memory:"), profile)
+        url, postgres = engine_options(
+            normalize_url("postgresql://user:pass@db/swaperex"), profile
+        )
+
+        assert "pool_size" not in memory
+        assert url.drivername == "postgresql+asyncpg"
+        assert url.query["prepared_statement_cache_size"] == "0"
+        assert postgres["pool_pre_ping"] is True
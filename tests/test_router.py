@@ -1,10 +1,13 @@
 """Tests for the routing module."""
 
+import asyncio
+import time
 from decimal import Decimal
 
 import pytest
 
 from swaperex.routing.base import RouteAggregator
+from swaperex.routing.cache import QuoteCache
 from swaperex.routing.dry_run import (
     DryRunRouter,
     SimulatedDexAggregator,
@@ -205,3 +208,641 @@ class TestSwapRoute:
         assert data["to_asset"] == "USDT"
         assert data["expiry_seconds"] == 120
         assert data["is_simulated"] is True
+
+
+class _SlowRouter(DryRunRouter):
+    """DryRunRouter that sleeps before quoting (or raises)."""
+
+    def __init__(self, provider_name: str, delay: float, fail: bool = False):
+        super().__init__(add_random_variance=False)
+        self._provider_name = provider_name
+        self.delay = delay
+        self.fail = fail
+
+    @property
+    def name(self) -> str:
+        return self._provider_name
+
+    async def get_quote(self, from_asset, to_asset, amount, slippage_tolerance=Decimal("0.01")):
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("upstream down")
+        quote = await super().get_quote(from_asset, to_asset, amount, slippage_tolerance)
+        quote.provider = self.name
+        return quote
+
+
+class TestConcurrentFanOut:
+    """Tests for concurrent quote fan-out with deadlines."""
+
+    @pytest.mark.asyncio
+    async def test_fan_out_runs_concurrently(self):
+        """Test latency is bounded by the slowest provider, not the sum."""
+        aggregator = RouteAggregator([_SlowRouter(f"p{i}", 0.2) for i in range(5)])
+
+        started = time.monotonic()
+        result = await aggregator.collect_quotes("ETH", "USDT", Decimal("1.0"))
+
+        assert time.monotonic() - started < 0.6
+        assert [q.provider for q in result.quotes] == ["p0", "p1", "p2", "p3", "p4"]
+        assert not result.is_partial
+
+    @pytest.mark.asyncio
+    async def test_provider_timeout_reports_slow_provider(self):
+        """Test a provider past its deadline is reported as timed out."""
+        aggregator = RouteAggregator(
+            [_SlowRouter("fast", 0.0), _SlowRouter("slow", 5.0)],
+            provider_timeout=0.1,
+        )
+
+        result = await aggregator.collect_quotes("ETH", "USDT", Decimal("1.0"))
+
+        assert [q.provider for q in result.quotes] == ["fast"]
+        assert result.timed_out == ["slow"]
+        assert result.is_partial
+
+    @pytest.mark.asyncio
+    async def test_total_timeout_returns_collected_quotes(self):
+        """Test the global deadline returns what has arrived so far."""
+        aggregator = RouteAggregator(
+            [_SlowRouter("fast", 0.0), _SlowRouter("slow", 5.0), _SlowRouter("broken", 0.0, fail=True)],
+            total_timeout=0.1,
+        )
+
+        result = await aggregator.collect_quotes("ETH", "USDT", Decimal("1.0"))
+
+        assert [q.provider for q in result.quotes] == ["fast"]
+        assert result.timed_out == ["slow"]
+        assert result.failed == ["broken"]
+        assert result.elapsed_seconds < 1.0
+
+    @pytest.mark.asyncio
+    async def test_sequential_mode_shares_total_deadline(self):
+        """Test sequential mode stops querying once the global deadline passes."""
+        aggregator = RouteAggregator(
+            [_SlowRouter("a", 0.15), _SlowRouter("b", 0.15), _SlowRouter("c", 0.15)],
+            total_timeout=0.2,
+            concurrent=False,
+        )
+
+        result = await aggregator.collect_quotes("ETH", "USDT", Decimal("1.0"))
+
+        assert [q.provider for q in result.quotes] == ["a"]
+        assert result.timed_out == ["b", "c"]
+
+
+class _CountingRouter(_SlowRouter):
+    """_SlowRouter that counts upstream calls."""
+
+    def __init__(self, provider_name: str, delay: float = 0.0):
+        super().__init__(provider_name, delay)
+        self.calls = 0
+
+    async def get_quote(self, from_asset, to_asset, amount, slippage_tolerance=Decimal("0.01")):
+        self.calls += 1
+        return await super().get_quote(from_asset, to_asset, amount, slippage_tolerance)
+
+
+class TestQuoteCache:
+    """Tests for the TTL quote cache with request coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_quote_is_served_from_cache(self):
+        """Test a repeated identical request does not hit the provider again."""
+        provider = _CountingRouter("p")
+        cache = QuoteCache(ttl_seconds=60)
+        aggregator = RouteAggregator([provider], quote_cache=cache)
+
+        first = await aggregator.get_all_quotes("ETH", "USDT", Decimal("1.0"))
+        second = await aggregator.get_all_quotes("ETH", "USDT", Decimal("1.0"))
+
+        assert provider.calls == 1
+        assert first[0].to_amount == second[0].to_amount
+        assert first[0] is not second[0]
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_coalesced(self):
+        """Test concurrent identical requests share one upstream call."""
+        provider = _CountingRouter("p", delay=0.1)
+        cache = QuoteCache(ttl_seconds=60)
+        aggregator = RouteAggregator([provider], quote_cache=cache)
+
+        results = await asyncio.gather(
+            *[aggregator.get_all_quotes("ETH", "USDT", Decimal("2")) for _ in range(10)]
+        )
+
+        assert provider.calls == 1
+        assert all(len(r) == 1 for r in results)
+        assert cache.stats.misses == 1
+        assert cache.stats.coalesced == 9
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_refetched(self):
+        """Test quotes older than the TTL trigger a new upstream call."""
+        provider = _CountingRouter("p")
+        cache = QuoteCache(ttl_seconds=0.05)
+        aggregator = RouteAggregator([provider], quote_cache=cache)
+
+        await aggregator.get_all_quotes("ETH", "USDT", Decimal("1.0"))
+        await asyncio.sleep(0.1)
+        await aggregator.get_all_quotes("ETH", "USDT", Decimal("1.0"))
+
+        assert provider.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_amount_bucket_rescales_quote(self):
+        """Test amounts in the same bucket share an entry, rescaled to the request."""
+        provider = _CountingRouter("p")
+        cache = QuoteCache(ttl_seconds=60, amount_precision=3)
+        aggregator = RouteAggregator([provider], quote_cache=cache)
+
+        base = (await aggregator.get_all_quotes("ETH", "USDT", Decimal("1.000")))[0]
+        near = (await aggregator.get_all_quotes("ETH", "USDT", Decimal("1.0001")))[0]
+
+        assert provider.calls == 1
+        assert near.from_amount == Decimal("1.0001")
+        assert near.to_amount == base.to_amount * Decimal("1.0001")
+
+    def test_amount_bucket(self):
+        """Test amount bucketing by significant digits."""
+        cache = QuoteCache(amount_precision=3)
+
+        assert cache.amount_bucket(Decimal("1.23456")) == "1.23"
+        assert cache.amount_bucket(Decimal("123456")) == "1.23E+5"
+        assert cache.amount_bucket(Decimal("0.000123456")) == "0.000123"
+
+
+class TestPoolSnapshots:
+    """Tests for local DEX pool snapshots and AMM math."""
+
+    def test_constant_product_and_stable_swap_math(self):
+        """Test x*y=k output and that stable pools quote near 1:1."""
+        from swaperex.routing.pools import STABLE_SWAP, PoolSnapshot, PoolState
+
+        cp = PoolState("cp", ["a", "b"], [Decimal("1000"), Decimal("2000")], fee_bps=30)
+        out = cp.get_amount_out("a", "b", Decimal("10"))
+        assert out == Decimal("9.97") * 2000 / (1000 + Decimal("9.97"))
+
+        stable = PoolState(
+            "st", ["a", "b"], [Decimal("1000000e6"), Decimal("1000000e18")],
+            fee_bps=5, kind=STABLE_SWAP, amp=200, decimals=[6, 18],
+        )
+        stable_out = stable.get_amount_out("a", "b", Decimal("1000e6")) / Decimal("1e18")
+        assert Decimal("999") < stable_out < Decimal("1000")
+
+        deeper = PoolState("deep", ["b", "a"], [Decimal("20000"), Decimal("10000")], fee_bps=30)
+        snapshot = PoolSnapshot([cp, deeper])
+        pool, best = snapshot.best_quote("a", "b", Decimal("10"))
+        assert pool.pool_id == "deep"
+        assert best > out
+        assert snapshot.pools_for("b", "a") == [cp, deeper]
+        assert snapshot.best_quote("a", "zzz", Decimal("10")) is None
+
+    @pytest.mark.asyncio
+    async def test_store_persists_and_serves_cold_start_from_disk(self, tmp_path):
+        """Test a fresh store quotes from the persisted snapshot without fetching."""
+        from swaperex.routing.pools import PoolSnapshotStore, PoolState
+
+        fetches = 0
+
+        async def fetch():
+            nonlocal fetches
+            fetches += 1
+            return [PoolState("p1", ["x", "y"], [Decimal("5"), Decimal("7")])]
+
+        first = PoolSnapshotStore("dex", fetch, cache_dir=str(tmp_path))
+        assert len((await first.get_snapshot()).pools) == 1
+        assert fetches == 1
+
+        second = PoolSnapshotStore("dex", fetch, cache_dir=str(tmp_path))
+        snapshot = await second.get_snapshot()
+
+        assert fetches == 1
+        assert snapshot.pools[0].reserves == [Decimal("5"), Decimal("7")]
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_refreshes_in_background(self):
+        """Test an aging snapshot is served immediately while a refresh runs."""
+        from swaperex.routing.pools import PoolSnapshotStore, PoolState
+
+        gate = asyncio.Event()
+        fetches = 0
+
+        async def fetch():
+            nonlocal fetches
+            fetches += 1
+            if fetches > 1:
+                await gate.wait()
+            return [PoolState(f"p{fetches}", ["x", "y"], [Decimal("1"), Decimal("1")])]
+
+        store = PoolSnapshotStore("dex", fetch, refresh_interval=0.01, max_age=60)
+        await store.get_snapshot()
+        await asyncio.sleep(0.02)
+
+        snapshot = await store.get_snapshot()
+        await asyncio.sleep(0)
+        assert snapshot.pools[0].pool_id == "p1"
+        assert fetches == 2
+
+        gate.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert store.snapshot.pools[0].pool_id == "p2"
+
+
+class _PoolRouter(_CountingRouter):
+    """_CountingRouter that exposes fixed pools for route planning."""
+
+    def __init__(self, provider_name: str, pools):
+        super().__init__(provider_name)
+        self.pools = pools
+
+    async def get_liquidity_pools(self):
+        return self.pools
+
+
+class TestMultiHopRouting:
+    """Tests for route planning over the liquidity graph."""
+
+    def test_two_hop_path_beats_thin_direct_pool(self):
+        """Test a deep A->X->B path wins over a shallow direct pool."""
+        from swaperex.routing.graph import LiquidityGraph
+        from swaperex.routing.pools import PoolState
+
+        graph = LiquidityGraph({"dex": [
+            PoolState("thin", ["A", "B"], [Decimal("100"), Decimal("100")]),
+            PoolState("ax", ["A", "X"], [Decimal("100000"), Decimal("100000")]),
+            PoolState("xb", ["X", "B"], [Decimal("100000"), Decimal("100000")]),
+        ]})
+
+        paths = graph.find_paths("dex", "a", "b", Decimal("50"))
+
+        assert paths[0].tokens == ["A", "X", "B"]
+        assert paths[0].amount_out > paths[1].amount_out
+        assert graph.find_paths("dex", "A", "B", Decimal("50"), max_hops=1)[0].tokens == ["A", "B"]
+        assert graph.find_paths("other", "A", "B", Decimal("50")) == []
+
+    def test_plan_ranks_providers_by_best_path(self):
+        """Test one plan per provider, best estimated output first."""
+        from swaperex.routing.graph import LiquidityGraph
+        from swaperex.routing.pools import PoolState
+
+        graph = LiquidityGraph({
+            "shallow": [PoolState("s", ["A", "B"], [Decimal("100"), Decimal("100")])],
+            "deep": [
+                PoolState("ax", ["A", "X"], [Decimal("100000"), Decimal("100000")]),
+                PoolState("xb", ["X", "B"], [Decimal("100000"), Decimal("100000")]),
+            ],
+        })
+
+        plans = graph.plan("A", "B", Decimal("50"))
+
+        assert [p.provider for p in plans] == ["deep", "shallow"]
+        assert plans[0].hops == 2
+        assert plans[0].to_dict()["path"] == ["A", "X", "B"]
+        assert graph.plan("A", "B", Decimal("50"), providers=["shallow"])[0].provider == "shallow"
+
+    @pytest.mark.asyncio
+    async def test_aggregator_confirms_only_the_planned_winner(self):
+        """Test pool-backed providers are ranked locally and only the best is quoted."""
+        from swaperex.routing.graph import reset_liquidity_graphs
+        from swaperex.routing.pools import PoolState
+
+        reset_liquidity_graphs()
+        deep = _PoolRouter("deep", [
+            PoolState("d", ["BTC", "USDT"], [Decimal("100"), Decimal("5000000")]),
+        ])
+        shallow = _PoolRouter("shallow", [
+            PoolState("s", ["BTC", "USDT"], [Decimal("1"), Decimal("50000")]),
+        ])
+        live_only = _CountingRouter("live")
+        aggregator = RouteAggregator(providers=[shallow, deep, live_only], multi_hop=True)
+
+        quote = await aggregator.get_best_quote("BTC", "USDT", Decimal("0.5"))
+
+        assert quote is not None
+        assert (deep.calls, shallow.calls, live_only.calls) == (1, 0, 1)
+        assert quote.provider == "deep"
+        assert quote.route_details["route_plan"]["path"] == ["BTC", "USDT"]
+
+    @pytest.mark.asyncio
+    async def test_route_confirmation_shares_total_deadline(self):
+        """Test confirming planned routes one by one stops at the global deadline."""
+        from swaperex.routing.graph import reset_liquidity_graphs
+        from swaperex.routing.pools import PoolState
+
+        reset_liquidity_graphs()
+        routers = [
+            _PoolRouter(f"slow{i}", [
+                PoolState(f"p{i}", ["BTC", "USDT"], [Decimal("100"), Decimal(5000000 - i)]),
+            ])
+            for i in range(3)
+        ]
+        for router in routers:
+            router.delay = 5.0
+        aggregator = RouteAggregator(
+            providers=routers, provider_timeout=0.15, total_timeout=0.25, multi_hop=True
+        )
+
+        start = time.monotonic()
+        quote = await aggregator.get_best_quote("BTC", "USDT", Decimal("0.5"))
+
+        assert quote is None
+        assert time.monotonic() - start < 0.4
+        assert [r.calls for r in routers] == [1, 1, 0]
+
+    @pytest.mark.asyncio
+    async def test_planned_and_live_providers_share_one_deadline(self):
+        """Test confirmation runs alongside the live fan-out within one total_timeout."""
+        from swaperex.routing.graph import reset_liquidity_graphs
+        from swaperex.routing.pools import PoolState
+
+        reset_liquidity_graphs()
+        planned = _PoolRouter("planned", [
+            PoolState("p", ["BTC", "USDT"], [Decimal("100"), Decimal("5000000")]),
+        ])
+        planned.delay = 5.0
+        live_only = _CountingRouter("live", delay=5.0)
+        aggregator = RouteAggregator(
+            providers=[planned, live_only], total_timeout=0.3, multi_hop=True
+        )
+
+        start = time.monotonic()
+        quote = await aggregator.get_best_quote("BTC", "USDT", Decimal("0.5"))
+
+        assert quote is None
+        assert time.monotonic() - start < 0.45
+        assert (planned.calls, live_only.calls) == (1, 1)
+
+
+class TestHedgedRequests:
+    """Tests for hedged requests over redundant endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self):
+        """Test a backup starts after the hedge delay and the loser is cancelled."""
+        from swaperex.routing.hedging import LatencyTracker, hedged_request
+
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(5)
+                return "primary"
+            except asyncio.CancelledError:
+                cancelled.append("primary")
+                raise
+
+        async def fast():
+            await asyncio.sleep(0.01)
+            return "backup"
+
+        tracker = LatencyTracker(min_delay=0.05, default_delay=0.05)
+        start = time.monotonic()
+        result = await hedged_request([slow, fast], tracker=tracker)
+
+        assert result == "backup"
+        assert time.monotonic() - start < 1.0
+        assert cancelled == ["primary"]
+        assert len(tracker) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_attempt_starts_next_immediately(self):
+        """Test failures and rejected answers skip the hedge delay."""
+        from swaperex.routing.hedging import LatencyTracker, hedged_request
+
+        async def broken():
+            raise RuntimeError("down")
+
+        async def rejected():
+            return None
+
+        async def good():
+            return {"code": 0}
+
+        tracker = LatencyTracker(default_delay=5.0, max_delay=5.0)
+        start = time.monotonic()
+        assert await hedged_request([broken, rejected, good], tracker=tracker) == {"code": 0}
+        assert time.monotonic() - start < 1.0
+        assert await hedged_request([broken, rejected], tracker=tracker) is None
+
+    def test_hedge_delay_follows_p95(self):
+        """Test the hedge delay tracks recent p95 latency within its bounds."""
+        from swaperex.routing.hedging import LatencyTracker
+
+        tracker = LatencyTracker(min_samples=20, min_delay=0.01, max_delay=2.0, default_delay=1.0)
+        assert tracker.hedge_delay() == 1.0
+
+        for i in range(100):
+            tracker.record(0.1 if i < 95 else 3.0)
+        assert tracker.hedge_delay() == 2.0  # p95 lands on a 3s outlier, capped
+        for _ in range(100):
+            tracker.record(0.2)
+        assert tracker.hedge_delay() == pytest.approx(0.2)
+
+
+class TestCircuitBreaker:
+    """Tests for per-provider circuit breakers and health ordering."""
+
+    def test_breaker_opens_then_half_open_probe_closes_it(self):
+        """Test the closed -> open -> half-open -> closed cycle."""
+        from swaperex.routing.health import CLOSED, HALF_OPEN, OPEN, ProviderHealth
+
+        health = ProviderHealth("p", min_calls=3, error_threshold=0.5, cooldown=0.05)
+        for _ in range(3):
+            assert health.allow_request()
+            health.record_failure(0.1)
+
+        assert health.state == OPEN
+        assert health.score == 0.0
+        assert not health.allow_request()
+
+        time.sleep(0.06)
+        assert health.allow_request()
+        assert health.state == HALF_OPEN
+        assert not health.allow_request()  # only one probe at a time
+
+        health.record_success(0.2)
+        assert health.state == CLOSED
+        assert health.error_rate == 0.0
+
+    @pytest.mark.asyncio
+    async def test_open_provider_is_skipped_without_waiting(self):
+        """Test a failing provider stops costing latency once its circuit opens."""
+        from swaperex.routing.health import get_provider_health
+
+        dead = _SlowRouter("dead", delay=0.05, fail=True)
+        healthy = _CountingRouter("healthy")
+        aggregator = RouteAggregator(providers=[dead, healthy])
+
+        for _ in range(get_provider_health("dead").min_calls):
+            result = await aggregator.collect_quotes("BTC", "ETH", Decimal("1"))
+            assert result.failed == ["dead"]
+
+        start = time.monotonic()
+        result = await aggregator.collect_quotes("BTC", "ETH", Decimal("1"))
+
+        assert result.skipped == ["dead"]
+        assert result.is_partial
+        assert [q.provider for q in result.quotes] == ["healthy"]
+        assert time.monotonic() - start < 0.05
+        assert [p.name for p in aggregator._eligible("BTC", "ETH")] == ["healthy", "dead"]
+
+    @pytest.mark.asyncio
+    async def test_fallback_quote_counts_as_failure(self):
+        """Test an upstream failure is recorded even when a fallback quote is served."""
+        from swaperex.routing.base import ProviderUnavailableError
+        from swaperex.routing.health import get_provider_health
+
+        class _FallbackRouter(_SlowRouter):
+            async def get_quote(self, from_asset, to_asset, amount, slippage_tolerance=Decimal("0.01")):
+                fallback = await super().get_quote(from_asset, to_asset, amount, slippage_tolerance)
+                raise ProviderUnavailableError("upstream 503", fallback=fallback)
+
+        aggregator = RouteAggregator(providers=[_FallbackRouter("flaky", delay=0.0)])
+
+        quotes = await aggregator.get_all_quotes("BTC", "ETH", Decimal("1"))
+
+        assert [q.provider for q in quotes] == ["flaky"]
+        assert get_provider_health("flaky").error_rate == 1.0
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_do_not_touch_health(self):
+        """Test cached quotes neither count as successes nor claim the half-open probe."""
+        from swaperex.routing.health import HALF_OPEN, get_provider_health
+
+        provider = _CountingRouter("p")
+        aggregator = RouteAggregator([provider], quote_cache=QuoteCache(ttl_seconds=60))
+        await aggregator.get_all_quotes("ETH", "USDT", Decimal("1.0"))
+
+        health = get_provider_health("p")
+        calls = health.calls
+        health.state = HALF_OPEN
+
+        for _ in range(3):
+            quotes = await aggregator.get_all_quotes("ETH", "USDT", Decimal("1.0"))
+            assert [q.provider for q in quotes] == ["p"]
+
+        assert provider.calls == 1
+        assert health.calls == calls
+        assert health.allow_request()  # the probe is still available
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_is_released_without_an_outcome(self):
+        """Test the outer deadline frees the probe, while provider_timeout counts as failure."""
+        from swaperex.routing.health import HALF_OPEN, OPEN, get_provider_health
+
+        health = get_provider_health("slow")
+        health.state = HALF_OPEN
+        cooldown = health.cooldown
+
+        aggregator = RouteAggregator([_SlowRouter("slow", delay=5.0)], total_timeout=0.05)
+        result = await aggregator.collect_quotes("BTC", "ETH", Decimal("1"))
+
+        assert result.timed_out == ["slow"]
+        assert (health.state, health.cooldown, health.calls) == (HALF_OPEN, cooldown, 0)
+
+        aggregator = RouteAggregator([_SlowRouter("slow", delay=5.0)], provider_timeout=0.05)
+        result = await aggregator.collect_quotes("BTC", "ETH", Decimal("1"))
+
+        assert result.timed_out == ["slow"]
+        assert (health.state, health.cooldown, health.calls) == (OPEN, cooldown * 2, 1)
+
+
+class TestProviderRegistry:
+    """Tests for shared, hot-reloadable routing providers."""
+
+    def test_providers_are_shared_and_rebuilt_on_config_change(self, monkeypatch):
+        """Test one instance per provider key until the API keys change."""
+        from swaperex.routing.registry import ProviderRegistry
+
+        registry = ProviderRegistry()
+        uniswap = registry.get_chain_aggregator("uniswap")
+
+        assert registry.get_chain_aggregator("UNISWAP") is uniswap
+        production = registry.get_production_aggregator()
+        assert uniswap.providers[0] in production.providers
+        assert registry.stats()["builds"] == len(production.providers)
+
+        monkeypatch.setenv("ONEINCH_API_KEY", "rotated-key")
+        rebuilt = registry.get_chain_aggregator("uniswap")
+
+        assert rebuilt is not uniswap
+        assert rebuilt.providers[0] is not uniswap.providers[0]
+        assert registry.reloads == 1
+
+    def test_settings_change_rebuilds_aggregators(self, monkeypatch):
+        """Test an edited setting is read again and yields a rebuilt aggregator."""
+        from swaperex.config import get_settings
+        from swaperex.routing.registry import ProviderRegistry
+
+        registry = ProviderRegistry(reload_check_seconds=0)
+        aggregator = registry.get_chain_aggregator("uniswap")
+        assert registry.get_chain_aggregator("uniswap") is aggregator
+
+        monkeypatch.setenv("QUOTE_TOTAL_TIMEOUT", "7.5")
+        try:
+            rebuilt = registry.get_chain_aggregator("uniswap")
+        finally:
+            monkeypatch.undo()
+            get_settings.cache_clear()
+
+        assert rebuilt is not aggregator
+        assert rebuilt.total_timeout == 7.5
+        assert registry.reloads == 1
+
+
+class TestQuoteLadder:
+    """Tests for precomputed quote ladders."""
+
+    def test_estimate_interpolates_between_rungs(self):
+        """Test display quotes interpolate the rate and stop at the top rung."""
+        from swaperex.routing.base import Quote
+        from swaperex.routing.ladder import QuoteLadder, is_ladder_estimate
+
+        def rung(amount, rate):
+            return Quote(
+                provider="dex", from_asset="BNB", to_asset="USDT",
+                from_amount=Decimal(amount), to_amount=Decimal(amount) * Decimal(rate),
+                fee_asset="BNB", fee_amount=Decimal("0.001"),
+                slippage_percent=Decimal("1"), estimated_time_seconds=15,
+            )
+
+        ladder = QuoteLadder("pancakeswap", "BNB", "USDT", [rung("1", "600"), rung("11", "580")])
+
+        mid = ladder.estimate(Decimal("6"))
+        assert mid.to_amount == Decimal("6") * Decimal("590")
+        assert is_ladder_estimate(mid.route_details)
+        assert ladder.estimate(Decimal("0.5")).to_amount == Decimal("300")
+        assert ladder.estimate(Decimal("12")) is None
+
+    @pytest.mark.asyncio
+    async def test_precomputer_ladders_seed_pairs(self, monkeypatch):
+        """Test refresh quotes every USD tier of each pair once."""
+        from swaperex.prices import PriceOracle
+        from swaperex.routing.ladder import QuoteLadderPrecomputer
+
+        oracle = PriceOracle(seed={"BNB": Decimal("500")})
+        monkeypatch.setattr("swaperex.prices.get_price_oracle", lambda: oracle)
+        router = _CountingRouter("dex")
+        aggregator = RouteAggregator(providers=[router])
+        precomputer = QuoteLadderPrecomputer(
+            tiers_usd=[Decimal("100"), Decimal("1000")],
+            seed_pairs=[("pancakeswap", "BNB", "USDT")],
+            aggregator_for=lambda chain: aggregator,
+        )
+
+        async def seed_pairs_only():
+            return precomputer.seed_pairs
+
+        precomputer.select_pairs = seed_pairs_only
+
+        assert await precomputer.refresh() == 1
+
+        ladder = precomputer.get_ladder("PancakeSwap", "bnb", "usdt")
+        assert [r.from_amount for r in ladder.rungs] == [Decimal("0.2"), Decimal("2")]
+        assert router.calls == 2
+        assert precomputer.estimate("pancakeswap", "BNB", "USDT", Decimal("1")) is not None
+        assert precomputer.estimate("uniswap", "ETH", "USDT", Decimal("1")) is None